@@ -207,6 +207,36 @@ class TestWebServer:
             assert response.status_code == 200
             mock_send.assert_called_once()
 
+    def test_dmx_telemetry_without_provider(self):
+        response = self.client.get("/api/dmx_telemetry")
+        assert response.status_code == 200
+        assert json.loads(response.data) == {"universes": {}}
+
+    def test_dmx_telemetry_uses_provider(self):
+        import parrot.api.web_server as web_server_module
+
+        web_server_module.dmx_telemetry_provider = lambda: {
+            "default": {"frames_sent": 5, "achieved_hz": 30.0}
+        }
+        try:
+            response = self.client.get("/api/dmx_telemetry")
+        finally:
+            web_server_module.dmx_telemetry_provider = None
+        data = json.loads(response.data)
+        assert data["universes"]["default"]["frames_sent"] == 5
+
+    def test_latency_report(self):
+        from parrot.utils.latency import latency_tracker
+
+        latency_tracker.reset()
+        latency_tracker.record("dmx_output", capture_time=1.0, now=1.02)
+        response = self.client.get("/api/latency")
+        latency_tracker.reset()
+
+        data = json.loads(response.data)
+        assert data["stages"]["dmx_output"]["count"] == 1
+        assert set(data["output_delays_ms"]) == {"dmx", "vj"}
+
     def test_config_route(self):
         response = self.client.get("/api/config")
         assert response.status_code == 200
@@ -2,10 +2,12 @@ import os
 import socket
 import threading
 import logging
+from typing import Callable, Optional
 from flask import Flask, jsonify, request, send_from_directory
 from parrot.director.mode import MODES_BY_HYPE, Mode, mode_key
 from parrot.vj.vj_mode import VJMode
 from parrot.state import State
+from parrot.utils.latency import latency_tracker, output_delays_seconds
 
 # Create Flask app
 app = Flask(__name__)
@@ -13,6 +15,8 @@ app = Flask(__name__)
 # Global reference to the state object
 state_instance = None
 editor_port_value = 4041
+# Returns ``SwitchController.telemetry_snapshot()`` for the live DMX controller.
+dmx_telemetry_provider: Optional[Callable[[], dict[str, dict[str, object]]]] = None
 
 
 def get_local_ip():
@@ -188,6 +192,28 @@ def set_vj_mode():
         )
 
 
+@app.route("/api/dmx_telemetry", methods=["GET"])
+def get_dmx_telemetry():
+    """Per-universe DMX output health (frame rate, write timing, drops)."""
+    if dmx_telemetry_provider is None:
+        return jsonify({"universes": {}})
+    return jsonify({"universes": dmx_telemetry_provider()})
+
+
+@app.route("/api/latency", methods=["GET"])
+def get_latency():
+    """Mic-to-output latency per pipeline stage plus configured output delays."""
+    return jsonify(
+        {
+            "stages": latency_tracker.report(),
+            "output_delays_ms": {
+                output: delay * 1000.0
+                for output, delay in output_delays_seconds().items()
+            },
+        }
+    )
+
+
 @app.route("/api/config", methods=["GET"])
 def get_config():
     return jsonify({"editor_port": editor_port_value})
@@ -199,11 +225,13 @@ def start_web_server(
     port=5000,
     threaded=True,
     editor_port=4041,
+    dmx_telemetry=None,
 ):
     """Start the web server in a separate thread or return the app for main thread integration."""
-    global state_instance, editor_port_value
+    global state_instance, editor_port_value, dmx_telemetry_provider
     state_instance = state
     editor_port_value = editor_port
+    dmx_telemetry_provider = dmx_telemetry
 
     # Suppress Flask/Werkzeug logs
     log = logging.getLogger("werkzeug")
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import sys
 import time
 import pyaudio
 import numpy as np
@@ -11,6 +10,13 @@ from typing import Optional, Dict, Callable
 from parrot.director.frame import Frame, FrameSignal
 from parrot.director.signal_states import SignalStates
 from parrot.audio.beat_tracker import BeatTracker
+from parrot.audio.filterbank import THREE_BAND_BINS, FilterBank, RangeNormalizer
+from parrot.audio.tempo_estimator import TEMPO_CONFIDENCE_MIN, OnsetTempoEstimator
+from parrot.utils.latency import (
+    STAGE_ANALYSIS,
+    STAGE_DMX_OUTPUT,
+    latency_tracker,
+)
 
 # Audio constants
 THRESHOLD = 0  # dB
@@ -20,6 +26,8 @@ INPUT_FRAMES_PER_BLOCK = int(RATE * INPUT_BLOCK_TIME)
 SPECTOGRAPH_BUFFER_SIZE = 275 * 3  # SPECTOGRAPH_AVG_RATE * 3
 SIGNAL_STAT_PERIOD_SECONDS = 10
 SIGNAL_STAT_BUFFER_SIZE = round((60) / SIGNAL_STAT_PERIOD_SECONDS)
+# Signals derived from THREE_BAND_BINS, in the same order
+THREE_BAND_SIGNALS = (FrameSignal.freq_all, FrameSignal.freq_high, FrameSignal.freq_low)
 
 
 @beartype
@@ -38,7 +46,12 @@ class AudioAnalyzer:
             signal_states: Optional signal states to include in frames
         """
         self.signal_states = signal_states or SignalStates()
-        self.beat_tracker = BeatTracker()
+        self.tempo_estimator = OnsetTempoEstimator()
+        self.tempo_estimator.start()
+        # Same range as the estimator, so its hints (e.g. 174 BPM DnB) aren't clipped
+        self.beat_tracker = BeatTracker(max_bpm=self.tempo_estimator.max_bpm)
+        self.filterbank = FilterBank(bin_ranges=THREE_BAND_BINS)
+        self._last_onset_count = 0
 
         # PyAudio setup
         self.pa = pyaudio.PyAudio()
@@ -52,17 +65,15 @@ class AudioAnalyzer:
             FrameSignal.sustained_high: [],
         }
 
-        # Signal statistics for normalization
-        self.signal_stat_buffer = {
-            **{
-                key: {
-                    "max": [],
-                    "min": [],
-                }
-                for key in FrameSignal
-            },
-        }
-        self.signal_stat_last = 0
+        # Rolling freq_all / freq_high / freq_low sums and their normalization
+        self.three_band = RangeNormalizer(
+            len(THREE_BAND_SIGNALS),
+            SPECTOGRAPH_BUFFER_SIZE,
+            SIGNAL_STAT_PERIOD_SECONDS,
+            SIGNAL_STAT_BUFFER_SIZE,
+        )
+        # perf_counter() when the last block finished arriving from the mic
+        self.last_capture_time: Optional[float] = None
 
     def find_input_device(self) -> Optional[int]:
         """Find a suitable microphone input device"""
@@ -118,6 +129,7 @@ class AudioAnalyzer:
                 total = total + count
                 frame_buffer.append(np.frombuffer(raw_block, dtype=np.int16))
 
+        self.last_capture_time = time.perf_counter()
         return np.hstack(frame_buffer)
 
     def analyze_audio(self) -> Optional[Frame]:
@@ -133,6 +145,8 @@ class AudioAnalyzer:
             # Compute spectrogram
             f, t, Sxx = signal.spectrogram(snd_block)
 
+            self.tempo_estimator.submit(Sxx)
+
             # Update spectrogram buffer
             if self.spectrogram_buffer is None:
                 self.spectrogram_buffer = Sxx
@@ -146,7 +160,11 @@ class AudioAnalyzer:
             ]
 
             # Process the spectrogram into a frame
-            return self.process_spectrogram(self.spectrogram_buffer, len(t))
+            return self.process_spectrogram(
+                self.spectrogram_buffer,
+                len(t),
+                capture_time=self.last_capture_time,
+            )
 
         except Exception as e:
             print(f"Error analyzing audio: {e}")
@@ -157,73 +175,28 @@ class AudioAnalyzer:
         spectrogram_block: np.ndarray,
         num_idx_added: int,
         now: float | None = None,
+        capture_time: float | None = None,
     ) -> Frame:
         """Process spectrogram data into a Frame with signal values
 
         Args:
             spectrogram_block: Spectrogram array
             num_idx_added: Number of time indices added in this block
+            capture_time: perf_counter() when the audio block was captured
 
         Returns:
             Frame with analyzed signal values
         """
-        # Define frequency ranges for analysis
-        ranges = {
-            FrameSignal.freq_all: (0, 129),
-            FrameSignal.freq_high: (30, 129),
-            FrameSignal.freq_low: (0, 30),
-        }
-
-        values = {}
-        timeseries = {}
-
-        # Check if we should capture signal statistics for normalization
-        should_capture_signal_stats = (
-            time.time() - self.signal_stat_last > SIGNAL_STAT_PERIOD_SECONDS
+        # New columns go through the filterbank and the three-band ranges in
+        # one matmul; the first call seeds the range history from the block.
+        new_columns = (
+            spectrogram_block
+            if self.three_band.sums.shape[1] == 0
+            else spectrogram_block[:, spectrogram_block.shape[1] - num_idx_added :]
         )
-        if should_capture_signal_stats:
-            self.signal_stat_last = time.time()
-
-        # Process each frequency range
-        for name, rg in ranges.items():
-            x = np.sum(np.abs(spectrogram_block[rg[0] : rg[1], :]), axis=0)
-
-            # Smooth with convolution
-            N = 3
-            x = np.convolve(x, np.ones(N) / N, mode="valid")
-
-            # Calculate percentiles for normalization
-            x_min = np.percentile(x, 5)
-            x_max = np.percentile(x, 95)
-
-            # Update signal statistics buffer
-            if should_capture_signal_stats:
-                self.signal_stat_buffer[name]["max"].append(x_max)
-                self.signal_stat_buffer[name]["min"].append(x_min)
-                self.signal_stat_buffer[name]["max"] = self.signal_stat_buffer[name][
-                    "max"
-                ][-SIGNAL_STAT_BUFFER_SIZE:]
-                self.signal_stat_buffer[name]["min"] = self.signal_stat_buffer[name][
-                    "min"
-                ][-SIGNAL_STAT_BUFFER_SIZE:]
-
-            # Use historical statistics for normalization
-            x_min = np.min(
-                np.concatenate([self.signal_stat_buffer[name]["min"], [x_min]])
-            )
-            x_max = np.max(
-                np.concatenate([self.signal_stat_buffer[name]["max"], [x_max]])
-            )
-
-            # Normalize to 0-1 range
-            x = (x - x_min) / (x_max - x_min + sys.float_info.epsilon)
-            x = np.clip(x, 0, 1)
-
-            timeseries[name] = x
-            v = x[-1]
-            if np.isnan(v):
-                v = 0
-            values[name] = v
+        bands, range_sums = self.filterbank.process_with_ranges(new_columns)
+        timeseries = dict(zip(THREE_BAND_SIGNALS, self.three_band.update(range_sums)))
+        values = {name: x[-1] for name, x in timeseries.items()}
 
         # Calculate sustained signals (averaged over longer time)
         for src, dest in [
@@ -237,6 +210,17 @@ class AudioAnalyzer:
                 -SPECTOGRAPH_BUFFER_SIZE:
             ]
 
+        # Fire predicted beats early by the measured mic-to-DMX latency so
+        # effects land on the audible beat rather than one pipeline late.
+        output_latency = latency_tracker.median_seconds(STAGE_DMX_OUTPUT)
+        if output_latency is not None:
+            self.beat_tracker.lead_seconds = output_latency
+        tempo = self.tempo_estimator.latest()
+        self.beat_tracker.set_tempo_hint(
+            tempo.bpm if tempo.confidence >= TEMPO_CONFIDENCE_MIN else None
+        )
+        onset = tempo.onset_count != self._last_onset_count
+        self._last_onset_count = tempo.onset_count
         beat_state = self.beat_tracker.update(values[FrameSignal.freq_low], now=now)
 
         # Create frame with audio values
@@ -246,7 +230,19 @@ class AudioAnalyzer:
             beat=beat_state.beat,
             beat_count=beat_state.beat_count,
             bar_progress=beat_state.bar_progress,
+            capture_time=capture_time,
+            next_beat_ms=(
+                None
+                if beat_state.next_beat_in is None
+                else beat_state.next_beat_in * 1000.0
+            ),
+            predicted_beat=beat_state.predicted_beat,
+            bands=bands,
+            onset=onset,
+            onset_strength=tempo.onset_strength if onset else 0.0,
+            tempo_confidence=tempo.confidence,
         )
+        latency_tracker.record(STAGE_ANALYSIS, capture_time)
 
         # Add signal states to the frame
         frame.extend(self.signal_states.get_states())
@@ -267,6 +263,7 @@ class AudioAnalyzer:
 
     def cleanup(self):
         """Clean up audio resources"""
+        self.tempo_estimator.stop()
         if hasattr(self, "stream") and self.stream:
             self.stream.stop_stream()
             self.stream.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import time
 from dataclasses import dataclass
 
@@ -14,6 +15,11 @@ class BeatState:
     beat: bool
     beat_count: int
     bar_progress: float
+    # Seconds until the next beat on the phase-locked grid; None until locked.
+    next_beat_in: float | None = None
+    # True once per predicted beat, on the first update within ``lead_seconds``
+    # of it, so effects can be fired early enough to land on the beat.
+    predicted_beat: bool = False
 
 
 @beartype
@@ -26,6 +32,8 @@ class BeatTracker:
         max_bpm: float = 160.0,
         default_bpm: float = 120.0,
         history_seconds: float = 6.0,
+        lead_seconds: float = 0.05,
+        phase_gain: float = 0.35,
     ):
         self.min_bpm = min_bpm
         self.max_bpm = max_bpm
@@ -40,6 +48,14 @@ class BeatTracker:
         self._last_beat_time: float | None = None
         self._beat_count = -1
         self._bpm = 0.0
+        # Phase-locked beat grid: a time on the grid plus the BPM period.
+        # Detected beats nudge the anchor by ``phase_gain`` of their error.
+        self.lead_seconds = lead_seconds
+        self.phase_gain = phase_gain
+        self._phase_anchor: float | None = None
+        self._last_predicted_beat: float | None = None
+        # External tempo (e.g. autocorrelation estimate); wins over intervals.
+        self._tempo_hint: float | None = None
 
     def update(self, low_energy: float, now: float | None = None) -> BeatState:
         now = time.perf_counter() if now is None else now
@@ -63,13 +79,51 @@ class BeatTracker:
         if beat:
             self._record_beat(now)
 
+        next_beat = self.predict_next_beat(now)
+        predicted_beat = False
+        if next_beat is not None and next_beat - now <= self.lead_seconds:
+            period = 60.0 / self._bpm
+            if (
+                self._last_predicted_beat is None
+                or next_beat - self._last_predicted_beat > period * 0.5
+            ):
+                predicted_beat = True
+                self._last_predicted_beat = next_beat
+
         return BeatState(
             bpm=self._bpm,
             beat=beat,
             beat_count=max(self._beat_count, 0),
             bar_progress=self._bar_progress(now),
+            next_beat_in=None if next_beat is None else next_beat - now,
+            predicted_beat=predicted_beat,
         )
 
+    def set_tempo_hint(self, bpm: float | None) -> None:
+        """Use ``bpm`` instead of the beat-interval median until cleared."""
+        if bpm is None or bpm <= 0.0:
+            self._tempo_hint = None
+            return
+        self._tempo_hint = float(np.clip(bpm, self.min_bpm, self.max_bpm))
+        self._bpm = self._tempo_hint
+
+    def predict_next_beat(self, now: float) -> float | None:
+        """Time of the next beat on the locked grid, or None without a lock.
+
+        The lock is dropped once no beat has been detected for four periods
+        (breakdowns, track changes) so we never flash on a stale tempo.
+        """
+        if self._phase_anchor is None or self._bpm <= 0.0:
+            return None
+        period = 60.0 / self._bpm
+        if self._last_beat_time is None or now - self._last_beat_time > period * 4.0:
+            return None
+        periods_ahead = max(0, math.ceil((now - self._phase_anchor) / period))
+        next_beat = self._phase_anchor + periods_ahead * period
+        if next_beat < now:
+            next_beat += period
+        return next_beat
+
     def _remember_energy(self, now: float, energy: float) -> None:
         self._energy_history.append((now, energy))
         cutoff = now - self.history_seconds
@@ -103,10 +157,28 @@ class BeatTracker:
                 while measured_bpm > self.max_bpm:
                     measured_bpm *= 0.5
                 self._bpm = float(np.clip(measured_bpm, self.min_bpm, self.max_bpm))
+        if self._tempo_hint is not None:
+            self._bpm = self._tempo_hint
 
+        self._lock_phase(now)
         self._last_beat_time = now
         self._beat_count = (self._beat_count + 1) % 64
 
+    def _lock_phase(self, beat_time: float) -> None:
+        if self._phase_anchor is None or self._bpm <= 0.0:
+            self._phase_anchor = beat_time
+            return
+        period = 60.0 / self._bpm
+        nearest = self._phase_anchor + round(
+            (beat_time - self._phase_anchor) / period
+        ) * period
+        error = beat_time - nearest
+        if abs(error) > period * 0.35:
+            # Too far off the grid to be jitter: re-lock on this beat.
+            self._phase_anchor = beat_time
+        else:
+            self._phase_anchor = nearest + error * self.phase_gain
+
     def _bar_progress(self, now: float) -> float:
         if self._last_beat_time is None or self._beat_count < 0:
             return 0.0
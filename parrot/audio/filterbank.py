@@ -0,0 +1,204 @@
+import sys
+import time
+from typing import Literal, Mapping, Optional, Sequence
+
+import numpy as np
+from beartype import beartype
+
+# scipy.signal.spectrogram defaults: 256-sample segments -> 129 one-sided bins.
+SPECTROGRAM_BINS = 129
+SAMPLE_RATE = 44100
+
+BandScale = Literal["mel", "log"]
+
+# Spectrogram bin ranges behind the freq_all / freq_high / freq_low signals.
+THREE_BAND_BINS = ((0, SPECTROGRAM_BINS), (30, SPECTROGRAM_BINS), (0, 30))
+
+# Named band layouts computed for every analysed block and attached to
+# ``Frame.bands``. Register extra layouts before the analyzer is created.
+band_layouts: dict[str, tuple[int, BandScale]] = {
+    "mel8": (8, "mel"),
+    "mel16": (16, "mel"),
+    "mel32": (32, "mel"),
+}
+
+
+@beartype
+def register_band_layout(name: str, num_bands: int, scale: BandScale = "mel") -> None:
+    if num_bands < 1:
+        raise ValueError(f"num_bands must be positive, got {num_bands}")
+    band_layouts[name] = (num_bands, scale)
+
+
+def _hz_to_mel(hz: np.ndarray) -> np.ndarray:
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _mel_to_hz(mel: np.ndarray) -> np.ndarray:
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+
+@beartype
+def build_filterbank(
+    num_bands: int,
+    scale: BandScale = "mel",
+    num_bins: int = SPECTROGRAM_BINS,
+    sample_rate: int = SAMPLE_RATE,
+    fmin: float = 30.0,
+    fmax: Optional[float] = None,
+) -> np.ndarray:
+    """Triangular filters as a ``(num_bands, num_bins)`` matrix.
+
+    Each row sums to 1 so band energy is the mean power under its triangle.
+    Narrow low bands that fall between FFT bins collapse onto the nearest bin
+    rather than coming out empty.
+    """
+    fmax = sample_rate / 2.0 if fmax is None else fmax
+    bin_hz = np.linspace(0.0, sample_rate / 2.0, num_bins)
+    if scale == "mel":
+        edges = _mel_to_hz(
+            np.linspace(
+                _hz_to_mel(np.array(fmin)), _hz_to_mel(np.array(fmax)), num_bands + 2
+            )
+        )
+    else:
+        edges = np.geomspace(fmin, fmax, num_bands + 2)
+
+    lower, centre, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bin_hz - lower) / np.maximum(centre - lower, 1e-9)
+    falling = (upper - bin_hz) / np.maximum(upper - centre, 1e-9)
+    matrix = np.clip(np.minimum(rising, falling), 0.0, None)
+
+    empty = matrix.sum(axis=1) == 0.0
+    if np.any(empty):
+        nearest = np.abs(bin_hz[None, :] - centre[empty]).argmin(axis=1)
+        matrix[np.flatnonzero(empty), nearest] = 1.0
+
+    matrix /= matrix.sum(axis=1, keepdims=True)
+    return matrix.astype(np.float32)
+
+
+@beartype
+class FilterBank:
+    """Every registered band layout, applied to new spectrogram columns in one matmul.
+
+    Bands are log-compressed and normalised per band against a slowly decaying
+    peak and a slowly rising floor, so quiet high bands still use the full
+    0-1 range without the percentile scans the three-band path needs.
+    ``bin_ranges`` add 0/1 rows to the same matrix whose raw per-column sums
+    ``process_with_ranges`` returns for that three-band path.
+    """
+
+    def __init__(
+        self,
+        layouts: Optional[Mapping[str, tuple[int, BandScale]]] = None,
+        num_bins: int = SPECTROGRAM_BINS,
+        sample_rate: int = SAMPLE_RATE,
+        peak_decay_db: float = 0.05,
+        floor_rise_db: float = 0.02,
+        min_range_db: float = 12.0,
+        bin_ranges: Sequence[tuple[int, int]] = (),
+    ):
+        layouts = band_layouts if layouts is None else layouts
+        self.names = list(layouts)
+        matrices = [
+            build_filterbank(num_bands, scale, num_bins, sample_rate)
+            for num_bands, scale in layouts.values()
+        ]
+        self.matrix = np.vstack(matrices)
+        range_rows = np.zeros((len(bin_ranges), num_bins), dtype=np.float32)
+        for row, (start, stop) in zip(range_rows, bin_ranges):
+            row[start:stop] = 1.0
+        self._stacked = np.vstack([self.matrix, range_rows])
+        self._slices: dict[str, slice] = {}
+        start = 0
+        for name, matrix in zip(self.names, matrices):
+            self._slices[name] = slice(start, start + matrix.shape[0])
+            start += matrix.shape[0]
+
+        self.peak_decay_db = peak_decay_db
+        self.floor_rise_db = floor_rise_db
+        self.min_range_db = min_range_db
+        self._peak_db: Optional[np.ndarray] = None
+        self._floor_db: Optional[np.ndarray] = None
+
+    def process(self, spectrogram_columns: np.ndarray) -> dict[str, np.ndarray]:
+        """Normalised band energies for the newest ``(bins, n)`` spectrogram columns."""
+        return self.process_with_ranges(spectrogram_columns)[0]
+
+    def process_with_ranges(
+        self, spectrogram_columns: np.ndarray
+    ) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        """Band energies plus the ``(len(bin_ranges), n)`` per-column range sums."""
+        num_bands = self.matrix.shape[0]
+        if spectrogram_columns.shape[1] == 0:
+            return {
+                name: np.zeros(s.stop - s.start, dtype=np.float32)
+                for name, s in self._slices.items()
+            }, np.zeros((self._stacked.shape[0] - num_bands, 0))
+        stacked = self._stacked @ np.abs(spectrogram_columns)
+        energy_db = 10.0 * np.log10(stacked[:num_bands].mean(axis=1) + 1e-12)
+
+        if self._peak_db is None or self._floor_db is None:
+            self._peak_db = energy_db.copy()
+            self._floor_db = energy_db - self.min_range_db
+        else:
+            self._peak_db = np.maximum(energy_db, self._peak_db - self.peak_decay_db)
+            self._floor_db = np.minimum(energy_db, self._floor_db + self.floor_rise_db)
+        span = np.maximum(self._peak_db - self._floor_db, self.min_range_db)
+        normalised = np.clip((energy_db - self._floor_db) / span, 0.0, 1.0).astype(
+            np.float32
+        )
+        return {
+            name: normalised[s] for name, s in self._slices.items()
+        }, stacked[num_bands:]
+
+
+@beartype
+class RangeNormalizer:
+    """Rolling per-column range sums, smoothed and scaled to 0-1 together.
+
+    Each row is normalised between its 5th and 95th percentile over the
+    buffer, widened by the extremes snapshotted every ``stat_period_seconds``
+    for the last ``stat_buffer_size`` snapshots.
+    """
+
+    def __init__(
+        self,
+        num_ranges: int,
+        buffer_size: int,
+        stat_period_seconds: float | int = 10.0,
+        stat_buffer_size: int = 6,
+        smoothing: int = 3,
+    ):
+        self.buffer_size = buffer_size
+        self.stat_period_seconds = stat_period_seconds
+        self.stat_buffer_size = stat_buffer_size
+        self.smoothing = smoothing
+        self.sums = np.zeros((num_ranges, 0))
+        self.stat_min: list[np.ndarray] = []
+        self.stat_max: list[np.ndarray] = []
+        self.stat_last = 0.0
+
+    def update(self, range_sums: np.ndarray) -> np.ndarray:
+        """Append new ``(ranges, n)`` sums; return the normalised buffer."""
+        self.sums = np.concatenate([self.sums, range_sums], axis=1)[
+            :, -self.buffer_size :
+        ]
+        x = self.sums
+        if x.shape[1] == 0:
+            return np.zeros((x.shape[0], 1))
+        if x.shape[1] >= self.smoothing:
+            c = np.cumsum(np.pad(x, ((0, 0), (1, 0))), axis=1)
+            x = (c[:, self.smoothing :] - c[:, : -self.smoothing]) / self.smoothing
+
+        x_min, x_max = np.percentile(x, [5, 95], axis=1)
+        if time.time() - self.stat_last > self.stat_period_seconds:
+            self.stat_last = time.time()
+            self.stat_min = [*self.stat_min, x_min][-self.stat_buffer_size :]
+            self.stat_max = [*self.stat_max, x_max][-self.stat_buffer_size :]
+        x_min = np.min([*self.stat_min, x_min], axis=0)
+        x_max = np.max([*self.stat_max, x_max], axis=0)
+
+        x = (x - x_min[:, None]) / (x_max - x_min + sys.float_info.epsilon)[:, None]
+        return np.nan_to_num(np.clip(x, 0, 1))
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+from beartype import beartype
+
+# scipy.signal.spectrogram defaults at 44.1 kHz: 256-sample segments with a
+# 32-sample hop, i.e. ~1378 columns per second.
+COLUMN_RATE = 44100 / 32
+# Columns folded into one onset-envelope sample (~172 Hz envelope).
+ENVELOPE_DECIMATION = 8
+# Drop queued columns beyond this backlog rather than fall further behind.
+MAX_PENDING_SECONDS = 2.0
+# Below this autocorrelation confidence the beat tracker keeps its own BPM.
+TEMPO_CONFIDENCE_MIN = 0.3
+
+
+@beartype
+@dataclass(frozen=True)
+class TempoEstimate:
+    bpm: float
+    # Autocorrelation peak relative to zero lag; ~0 for noise, ~1 for a click.
+    confidence: float
+    onset_count: int
+    onset_strength: float
+    updated_at: float
+
+
+@beartype
+class OnsetTempoEstimator:
+    """Spectral-flux onsets and autocorrelation tempo on a worker thread.
+
+    The audio loop hands over each block's new spectrogram columns with
+    ``submit``; the worker turns them into an onset envelope, picks onsets
+    with an adaptive threshold and re-estimates tempo every
+    ``estimate_interval`` seconds. ``latest()`` is a lock-protected read of
+    the most recent result so the audio loop never waits on the FFTs.
+    ``process_columns`` and ``estimate_tempo`` can also be driven directly
+    (offline, tests); they publish to ``latest()`` the same way.
+    """
+
+    def __init__(
+        self,
+        min_bpm: float = 60.0,
+        max_bpm: float = 180.0,
+        prior_bpm: float = 120.0,
+        history_seconds: float = 8.0,
+        estimate_interval: float = 0.5,
+        column_rate: float = COLUMN_RATE,
+        decimation: int = ENVELOPE_DECIMATION,
+    ):
+        self.min_bpm = min_bpm
+        self.max_bpm = max_bpm
+        self.prior_bpm = prior_bpm
+        self.estimate_interval = estimate_interval
+        self.envelope_rate = column_rate / decimation
+        self.decimation = decimation
+        self._max_pending_columns = int(column_rate * MAX_PENDING_SECONDS)
+
+        self._envelope: deque[float] = deque(
+            maxlen=int(history_seconds * self.envelope_rate)
+        )
+        self._previous_magnitude: np.ndarray | None = None
+        self._flux_remainder = np.zeros(0, dtype=np.float64)
+        self._last_onset_index = -(10**9)
+        self._envelope_index = 0
+        self._onset_count = 0
+        self._onset_strength = 0.0
+        self._last_estimate_time = 0.0
+        self._bpm = 0.0
+        self._confidence = 0.0
+
+        self._cond = threading.Condition()
+        self._pending: deque[np.ndarray] = deque()
+        self._pending_columns = 0
+        self.dropped_columns = 0
+        self._latest = TempoEstimate(0.0, 0.0, 0, 0.0, 0.0)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="onset-tempo-estimator"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def submit(self, spectrogram_columns: np.ndarray) -> None:
+        """Queue a ``(bins, n)`` block of new spectrogram columns."""
+        with self._cond:
+            self._pending.append(spectrogram_columns)
+            self._pending_columns += spectrogram_columns.shape[1]
+            while self._pending_columns > self._max_pending_columns:
+                dropped = self._pending.popleft()
+                self._pending_columns -= dropped.shape[1]
+                self.dropped_columns += dropped.shape[1]
+            self._cond.notify()
+
+    def latest(self) -> TempoEstimate:
+        with self._cond:
+            return self._latest
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            with self._cond:
+                while not self._pending and not self._stop_event.is_set():
+                    self._cond.wait(timeout=0.25)
+                blocks = list(self._pending)
+                self._pending.clear()
+                self._pending_columns = 0
+            for block in blocks:
+                self.process_columns(block)
+            now = time.perf_counter()
+            if now - self._last_estimate_time >= self.estimate_interval:
+                self._last_estimate_time = now
+                self.estimate_tempo()
+
+    def _publish(self) -> None:
+        estimate = TempoEstimate(
+            bpm=self._bpm,
+            confidence=self._confidence,
+            onset_count=self._onset_count,
+            onset_strength=self._onset_strength,
+            updated_at=time.perf_counter(),
+        )
+        with self._cond:
+            self._latest = estimate
+
+    def process_columns(self, spectrogram_columns: np.ndarray) -> None:
+        """Extend the onset envelope with spectral flux of the given columns."""
+        magnitude = np.log1p(1000.0 * np.abs(spectrogram_columns))
+        if self._previous_magnitude is None:
+            previous = magnitude[:, :1]
+        else:
+            previous = self._previous_magnitude[:, None]
+        stacked = np.concatenate([previous, magnitude], axis=1)
+        flux = np.maximum(np.diff(stacked, axis=1), 0.0).sum(axis=0)
+        self._previous_magnitude = magnitude[:, -1]
+
+        flux = np.concatenate([self._flux_remainder, flux])
+        usable = len(flux) - len(flux) % self.decimation
+        self._flux_remainder = flux[usable:]
+        for value in flux[:usable].reshape(-1, self.decimation).max(axis=1):
+            self._push_envelope(float(value))
+        self._publish()
+
+    def _push_envelope(self, value: float) -> None:
+        recent_len = max(4, int(self.envelope_rate * 0.5))
+        recent = list(self._envelope)[-recent_len:]
+        self._envelope.append(value)
+        self._envelope_index += 1
+        if len(recent) < recent_len:
+            return
+        recent_array = np.array(recent)
+        threshold = recent_array.mean() + 1.5 * recent_array.std()
+        refractory = int(self.envelope_rate * 0.1)
+        if (
+            value > threshold
+            and value > recent_array[-1]
+            and self._envelope_index - self._last_onset_index > refractory
+        ):
+            self._last_onset_index = self._envelope_index
+            self._onset_count += 1
+            self._onset_strength = float(
+                np.clip((value - threshold) / (threshold + 1e-9), 0.0, 1.0)
+            )
+
+    def estimate_tempo(self) -> None:
+        """Autocorrelate the onset envelope and pick the prior-weighted peak lag."""
+        envelope = np.array(self._envelope)
+        min_lag = int(np.floor(60.0 * self.envelope_rate / self.max_bpm))
+        max_lag = int(np.ceil(60.0 * self.envelope_rate / self.min_bpm))
+        if len(envelope) < max_lag * 3:
+            return
+        envelope = envelope - envelope.mean()
+        spectrum = np.fft.rfft(envelope, 2 * len(envelope))
+        autocorr = np.fft.irfft(np.abs(spectrum) ** 2)[: len(envelope)]
+        if autocorr[0] <= 0.0:
+            self._confidence = 0.0
+            self._publish()
+            return
+
+        lags = np.arange(max(min_lag, 1), max_lag + 1)
+        bpms = 60.0 * self.envelope_rate / lags
+        # Log-Gaussian tempo prior keeps us off half/double-time octaves.
+        prior = np.exp(-0.5 * (np.log2(bpms / self.prior_bpm) / 0.9) ** 2)
+        scores = np.maximum(autocorr[lags], 0.0) * prior
+        peak_lag = int(lags[int(np.argmax(scores))])
+        # The prior pulls fast tempos (drum & bass) down an octave; take the
+        # half lag whenever it correlates nearly as well as the chosen one.
+        half_lag = int(round(peak_lag / 2))
+        if half_lag > min_lag:
+            half_lag += int(np.argmax(autocorr[half_lag - 1 : half_lag + 2])) - 1
+            if autocorr[half_lag] >= 0.7 * autocorr[peak_lag]:
+                peak_lag = half_lag
+
+        lag = float(peak_lag)
+        left, centre, right = autocorr[peak_lag - 1 : peak_lag + 2]
+        denominator = left - 2.0 * centre + right
+        if denominator < 0.0:
+            lag += 0.5 * (left - right) / denominator
+
+        bpm = 60.0 * self.envelope_rate / lag
+        self._bpm = float(np.clip(bpm, self.min_bpm, self.max_bpm))
+        confidence = autocorr[peak_lag] / autocorr[0]
+        self._confidence = float(np.clip(confidence, 0.0, 1.0))
+        self._publish()
@@ -7,6 +7,7 @@ from beartype import beartype
 
 from parrot.audio.audio_analyzer import AudioAnalyzer
 from parrot.audio.beat_tracker import BeatState, BeatTracker
+from parrot.audio.tempo_estimator import OnsetTempoEstimator
 from parrot.director.signal_states import SignalStates
 from parrot.director.frame import Frame, FrameSignal
 from scripts.calibrate_bpm import OfflineLowFrequencyAnalyzer
@@ -84,6 +85,15 @@ class TestAudioAnalyzer:
         assert frame.bar_progress == 0.5
         analyzer.beat_tracker.update.assert_called_once()
 
+    def test_process_spectrogram_carries_capture_time(self, mock_pyaudio):
+        analyzer = AudioAnalyzer()
+
+        frame = analyzer.process_spectrogram(
+            np.random.rand(129, 100), 10, capture_time=42.0
+        )
+
+        assert frame.capture_time == 42.0
+
     def test_beat_tracker_measures_house_tempo(self):
         tracker = BeatTracker()
         interval = 60.0 / 132.0
@@ -123,6 +133,50 @@ class TestAudioAnalyzer:
         assert state.bpm == pytest.approx(120.0, abs=1.0)
         assert state.bar_progress == pytest.approx(0.375, abs=0.02)
 
+    def test_beat_tracker_predicts_next_beat_ahead_of_detection(self):
+        tracker = BeatTracker(lead_seconds=0.06)
+        interval = 0.5
+        for beat_idx in range(8):
+            beat_time = 1.0 + beat_idx * interval
+            tracker.update(0.1, now=beat_time - 0.03)
+            tracker.update(1.0, now=beat_time)
+
+        state = tracker.update(0.1, now=4.7)
+        assert state.next_beat_in == pytest.approx(0.3, abs=0.01)
+        assert state.predicted_beat is False
+
+        state = tracker.update(0.1, now=4.95)
+        assert state.predicted_beat is True
+        assert tracker.update(0.1, now=4.97).predicted_beat is False
+
+    def test_beat_tracker_drops_prediction_after_silence(self):
+        tracker = BeatTracker()
+        for beat_idx in range(4):
+            beat_time = 1.0 + beat_idx * 0.5
+            tracker.update(0.1, now=beat_time - 0.03)
+            tracker.update(1.0, now=beat_time)
+
+        assert tracker.update(0.1, now=5.0).next_beat_in is None
+
+    def test_beat_tracker_prefers_tempo_hint(self):
+        tracker = BeatTracker()
+        tracker.set_tempo_hint(174.0)
+        for beat_idx in range(6):
+            beat_time = 1.0 + beat_idx * 0.6
+            tracker.update(0.1, now=beat_time - 0.03)
+            state = tracker.update(1.0, now=beat_time)
+
+        assert state.bpm == pytest.approx(160.0)
+        tracker.set_tempo_hint(None)
+        tracker.update(0.1, now=4.57)
+        assert tracker.update(1.0, now=4.6).bpm == pytest.approx(100.0, abs=1.0)
+
+    def test_beat_tracker_in_estimator_range_keeps_dnb_hint(self):
+        tracker = BeatTracker(max_bpm=OnsetTempoEstimator().max_bpm)
+        tracker.set_tempo_hint(174.0)
+        tracker.update(0.1, now=0.97)
+        assert tracker.update(1.0, now=1.0).bpm == pytest.approx(174.0)
+
     def test_offline_low_frequency_analyzer_returns_bounded_energy(self):
         analyzer = OfflineLowFrequencyAnalyzer()
         block = np.sin(np.linspace(0.0, np.pi * 8.0, 1323))
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from parrot.audio.filterbank import (
+    SPECTROGRAM_BINS,
+    THREE_BAND_BINS,
+    FilterBank,
+    RangeNormalizer,
+    build_filterbank,
+)
+from parrot.director.frame import Frame
+
+
+@pytest.mark.parametrize("scale", ["mel", "log"])
+def test_build_filterbank_rows_are_normalised(scale):
+    matrix = build_filterbank(24, scale)
+
+    assert matrix.shape == (24, SPECTROGRAM_BINS)
+    assert np.allclose(matrix.sum(axis=1), 1.0)
+    centres = (matrix * np.arange(SPECTROGRAM_BINS)).sum(axis=1)
+    assert np.all(np.diff(centres) >= 0.0)
+
+
+def test_filterbank_returns_each_layout_in_unit_range():
+    bank = FilterBank({"coarse": (8, "mel"), "fine": (32, "log")})
+    columns = np.random.default_rng(0).random((SPECTROGRAM_BINS, 3))
+
+    bands = bank.process(columns)
+
+    assert set(bands) == {"coarse", "fine"}
+    assert bands["coarse"].shape == (8,)
+    assert bands["fine"].shape == (32,)
+    assert all(np.all((b >= 0.0) & (b <= 1.0)) for b in bands.values())
+
+
+def test_filterbank_tone_lights_its_band():
+    bank = FilterBank({"mel16": (16, "mel")})
+    quiet = np.full((SPECTROGRAM_BINS, 2), 1e-6)
+    for _ in range(10):
+        bank.process(quiet)
+
+    tone = quiet.copy()
+    tone[60, :] = 1.0
+    bands = bank.process(tone)["mel16"]
+
+    matrix = build_filterbank(16, "mel")
+    assert int(np.argmax(bands)) == int(np.argmax(matrix[:, 60]))
+    assert bands.max() == pytest.approx(1.0)
+
+
+def test_filterbank_range_sums_share_the_band_matmul():
+    bank = FilterBank({"mel8": (8, "mel")}, bin_ranges=THREE_BAND_BINS)
+    columns = np.random.default_rng(1).random((SPECTROGRAM_BINS, 4))
+
+    bands, sums = bank.process_with_ranges(columns)
+
+    assert bands["mel8"].shape == (8,)
+    assert sums.shape == (3, 4)
+    for row, (start, stop) in zip(sums, THREE_BAND_BINS):
+        assert np.allclose(row, columns[start:stop].sum(axis=0), rtol=1e-5)
+
+
+def test_range_normalizer_matches_smoothed_percentile_scaling():
+    sums = np.random.default_rng(2).random((3, 50))
+    normalizer = RangeNormalizer(3, buffer_size=40)
+
+    normalizer.update(sums[:, :30])
+    x = normalizer.update(sums[:, 30:])
+
+    def smooth(raw):
+        return np.convolve(raw, np.ones(3) / 3, mode="valid")
+
+    for row, first, current in zip(x, sums[:, :30], sums[:, -40:]):
+        # The first update's percentiles were snapshotted into the stats
+        lo = min(np.percentile(smooth(first), 5), np.percentile(smooth(current), 5))
+        hi = max(np.percentile(smooth(first), 95), np.percentile(smooth(current), 95))
+        expected = np.clip((smooth(current) - lo) / (hi - lo), 0.0, 1.0)
+        assert np.allclose(row, expected)
+
+
+def test_frame_band_energies_resamples_a_layout():
+    frame = Frame({}, bands={"mel8": np.linspace(0.0, 1.0, 8)})
+
+    assert frame.band_energies("mel32") is None
+    assert frame.band_energies("mel8").shape == (8,)
+    resampled = frame.band_energies("mel8", 15)
+    assert resampled.shape == (15,)
+    assert resampled[0] == 0.0 and resampled[-1] == 1.0
+    assert resampled[7] == pytest.approx(0.5)
@@ -0,0 +1,64 @@
+import time
+
+import numpy as np
+import pytest
+
+from parrot.audio.tempo_estimator import (
+    COLUMN_RATE,
+    TEMPO_CONFIDENCE_MIN,
+    OnsetTempoEstimator,
+)
+
+
+def _click_track(bpm: float, seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    columns = int(seconds * COLUMN_RATE)
+    spectrogram = rng.random((129, columns)) * 1e-4
+    period = 60.0 / bpm * COLUMN_RATE
+    for beat in np.arange(0.0, columns, period):
+        start = int(beat)
+        spectrogram[:40, start : start + 20] += 0.05
+    return spectrogram
+
+
+def _feed(estimator: OnsetTempoEstimator, spectrogram: np.ndarray) -> None:
+    for start in range(0, spectrogram.shape[1], 41):
+        estimator.process_columns(spectrogram[:, start : start + 41])
+
+
+@pytest.mark.parametrize("bpm", [98.0, 128.0, 174.0])
+def test_estimates_tempo_of_click_track(bpm):
+    estimator = OnsetTempoEstimator()
+    _feed(estimator, _click_track(bpm, 8.0))
+
+    estimator.estimate_tempo()
+
+    estimate = estimator.latest()
+    assert estimate.bpm == pytest.approx(bpm, abs=2.0)
+    assert estimate.confidence > TEMPO_CONFIDENCE_MIN
+
+
+def test_counts_onsets():
+    estimator = OnsetTempoEstimator()
+    _feed(estimator, _click_track(120.0, 6.0))
+
+    # 12 clicks; the first half-second only seeds the adaptive threshold.
+    estimate = estimator.latest()
+    assert 10 <= estimate.onset_count <= 12
+    assert 0.0 < estimate.onset_strength <= 1.0
+
+
+def test_worker_publishes_latest_estimate():
+    estimator = OnsetTempoEstimator(estimate_interval=0.0)
+    estimator.start()
+    track = _click_track(128.0, 8.0)
+    for start in range(0, track.shape[1], 41):
+        estimator.submit(track[:, start : start + 41])
+        time.sleep(0.001)
+
+    deadline = time.perf_counter() + 5.0
+    while estimator.latest().bpm == 0.0 and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    estimator.stop()
+
+    assert estimator.latest().bpm == pytest.approx(128.0, abs=2.0)
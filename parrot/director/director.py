@@ -26,6 +26,7 @@ from parrot.venue_runtime import (
     replace_fixture_leaf_in_runtime_patch,
 )
 from parrot.director.interpretation_blend import InterpretationBlend
+from parrot.utils.latency import STAGE_DIRECTOR_STEP, latency_tracker
 
 SHIFT_AFTER = 60
 WARMUP_SECONDS = max(int(os.environ.get("WARMUP_TIME", "1")), 1)
@@ -97,6 +98,7 @@ class Director:
         interpretation_tree_publisher: (
             Callable[[dict[str, object]], None] | None
         ) = None,
+        pixel_mapper=None,
     ):
         self.scheme = LerpAnimator(random.choice(color_schemes), 2)
         self.last_shift_time = time.time()
@@ -104,6 +106,8 @@ class Director:
         self.start_time = time.time()
         self.state = state
         self.vj_director = vj_director
+        self.pixel_mapper = pixel_mapper
+        self.last_frame: Frame | None = None
         self._interpretation_tree_publisher = interpretation_tree_publisher
 
         # Initialize position manager first (so fixtures have positions before interpreters are created)
@@ -573,6 +577,7 @@ class Director:
                     )
 
         self._apply_named_position_programming_overrides(scheme)
+        latency_tracker.record(STAGE_DIRECTOR_STEP, frame.capture_time)
 
         # Pass frame and scheme to VJ system for rendering
         if self.vj_director:
@@ -614,7 +619,15 @@ class Director:
             else:
                 self.resolve_output_fixture(item).render(dmx)
 
-        dmx.submit()
+        # Pixel-mapped bulbs follow the VJ frame instead of their interpreters
+        if self.pixel_mapper is not None:
+            self.pixel_mapper.apply(dmx)
+
+        dmx.submit(
+            capture_time=(
+                self.last_frame.capture_time if self.last_frame is not None else None
+            )
+        )
 
     def on_mode_change(self, mode):
         """Handle mode changes, including those from the web interface."""
@@ -28,14 +28,36 @@ class Frame:
         beat: bool = False,
         beat_count: int = 0,
         bar_progress: float = 0.0,
+        capture_time: float | None = None,
+        next_beat_ms: float | None = None,
+        predicted_beat: bool = False,
+        bands: dict[str, np.ndarray] | None = None,
+        onset: bool = False,
+        onset_strength: float = 0.0,
+        tempo_confidence: float = 0.0,
     ):
         self.time = time.perf_counter()
+        # perf_counter() when the newest audio sample behind this frame arrived;
+        # used to measure mic-to-photon latency. None for synthetic frames.
+        self.capture_time = capture_time
         self.values = values
         self.timeseries: dict[str, Union[list[float], np.ndarray]] = timeseries
         self.bpm = bpm
         self.beat = beat
         self.beat_count = beat_count
         self.bar_progress = bar_progress
+        # Phase-locked forecast: "beat in N ms" (None until the tracker locks)
+        # and a one-shot flag raised early enough to land effects on the beat.
+        self.next_beat_ms = next_beat_ms
+        self.predicted_beat = predicted_beat
+        # Normalised filterbank energies keyed by layout name (e.g. "mel32"),
+        # low to high frequency. See parrot.audio.filterbank.band_layouts.
+        self.bands: dict[str, np.ndarray] = {} if bands is None else bands
+        # Spectral-flux onset since the previous frame, and how periodic the
+        # onset envelope is (autocorrelation peak, 0-1) behind ``bpm``.
+        self.onset = onset
+        self.onset_strength = onset_strength
+        self.tempo_confidence = tempo_confidence
 
     def extend(self, additional_signals: dict[FrameSignal, float]):
         self.values.update(additional_signals)
@@ -45,6 +67,17 @@ class Frame:
             return self.values.get(__name, 0.0)
         return self.values.get(__name, 0.0)
 
+    def band_energies(self, layout: str, size: int | None = None) -> np.ndarray | None:
+        """Energies of filterbank ``layout``, linearly resampled to ``size``
+        points when given; None if the analyzer produced none."""
+        bands = self.bands.get(layout)
+        if bands is None or len(bands) == 0:
+            return None
+        if size is None or size == len(bands):
+            return bands
+        positions = np.linspace(0.0, float(len(bands) - 1), size)
+        return np.interp(positions, np.arange(len(bands)), bands)
+
     def __mul__(self, factor):
         return Frame(
             {k: v * factor for k, v in self.values.items()},
@@ -53,4 +86,11 @@ class Frame:
             self.beat,
             self.beat_count,
             self.bar_progress,
+            self.capture_time,
+            self.next_beat_ms,
+            self.predicted_beat,
+            self.bands,
+            self.onset,
+            self.onset_strength,
+            self.tempo_confidence,
         )
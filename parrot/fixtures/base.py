@@ -152,6 +152,13 @@ class FixtureBase:
         """Deep copy for interpretation blending (incoming / lerp_result tracks)."""
         return copy.deepcopy(self)
 
+    def state_snapshot(self) -> "FixtureBase":
+        """Shallow copy with its own DMX values: this frame's output, safe to
+        read from another thread while the live fixture keeps rendering."""
+        snapshot = copy.copy(self)
+        snapshot.values = list(self.values)
+        return snapshot
+
     @beartype
     def lerp_into(self, a: "FixtureBase", b: "FixtureBase", t: float) -> None:
         """Write a linear blend of ``a`` (outgoing / primary) and ``b`` (incoming) into self."""
@@ -214,6 +221,11 @@ class FixtureWithBulbs(FixtureBase):
             bulb.render_values(self.values)
         super().render(dmx)
 
+    def state_snapshot(self) -> FixtureBase:
+        snapshot = super().state_snapshot()
+        snapshot.bulbs = [bulb.state_snapshot() for bulb in self.bulbs]
+        return snapshot
+
     def lerp_into(self, a: FixtureBase, b: FixtureBase, t: float) -> None:
         super().lerp_into(a, b, t)
         if not isinstance(a, FixtureWithBulbs) or not isinstance(b, FixtureWithBulbs):
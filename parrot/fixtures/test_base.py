@@ -244,6 +244,17 @@ class TestFixtureWithBulbs:
         for bulb in self.bulbs:
             assert bulb.get_strobe() == 0
 
+    def test_state_snapshot_is_unaffected_by_later_output(self):
+        self.fixture.values = [1, 2, 3, 4, 5, 6]
+        self.fixture.set_dimmer(100)
+        snapshot = self.fixture.state_snapshot()
+        self.fixture.values[0] = 255
+        self.fixture.set_dimmer(10)
+        assert snapshot.values == [1, 2, 3, 4, 5, 6]
+        assert snapshot.get_dimmer() == 100
+        assert [bulb.get_dimmer() for bulb in snapshot.get_bulbs()] == [100, 100]
+        assert snapshot.get_bulbs()[0] is not self.bulb1
+
 
 class TestFixtureGroup:
     def setup_method(self):
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import io
 import time
 from urllib.parse import urlparse
 import moderngl_window as mglw
@@ -11,12 +10,18 @@ from typing import Any
 
 from parrot.audio.audio_analyzer import AudioAnalyzer
 from parrot.director.director import Director
-from parrot.director.frame import Frame, FrameSignal
 from parrot.director.mode import MODES_BY_HYPE
 from parrot.gl_display_mode import EditorDisplayMode
+from parrot.lighting_pipeline import DEFAULT_LIGHTING_FPS, LightingPipeline
 from parrot.state import State
-from parrot.utils.dmx_utils import Universe, get_controller
+from parrot.utils.dmx_utils import get_controller
 from parrot.vj.dmx_heatmap_renderer import DmxHeatmapRenderer
+from parrot.vj.pixel_map import PixelMapper
+from parrot.vj.preview_readback import PreviewReadback, encode_jpeg
+from parrot.vj.multi_output import parse_vj_output
+from parrot.vj.shared_frame_output import SharedFrameOutput
+from parrot.vj.profiler import vj_profiler
+from parrot.vj.program_cache import enable_shader_disk_cache
 from parrot.vj.vj_director import VJDirector
 from parrot.utils.overlay_ui import OverlayUI
 from parrot.keyboard_handler import KeyboardHandler
@@ -38,8 +43,6 @@ def _encode_texture_rgb_as_jpeg(tex: Any) -> bytes | None:
     texture shears every row and produces an interlaced/striped preview in the
     web client.
     """
-    from PIL import Image
-
     w, h = tex.size
     if w < 2 or h < 2:
         return None
@@ -54,22 +57,17 @@ def _encode_texture_rgb_as_jpeg(tex: Any) -> bytes | None:
         # Unsupported channel count (e.g. 2-channel RG); skip rather than shear.
         return None
     raw = tex.read(alignment=1)
-    img = Image.frombuffer(mode, (w, h), raw, "raw", mode, 0, 1)
-    if mode != "RGB":
-        img = img.convert("RGB")
     # moderngl returns this VJ FBO's bytes already top-down, so no vertical flip
     # is needed to get a naturally-oriented JPEG for the web preview.
-    max_w = 1280
-    if w > max_w:
-        nh = max(2, int(round(h * (max_w / w))))
-        img = img.resize((max_w, nh), Image.Resampling.LANCZOS)
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=85, optimize=True)
-    return buf.getvalue()
+    return encode_jpeg(raw, (w, h), mode)
 
 
 def run_gl_window_app(args):
     """Run Party Parrot with modern GL window"""
+    # The driver reads this when the context is created
+    if not getattr(args, "no_shader_disk_cache", False):
+        enable_shader_disk_cache()
+
     # Create window using moderngl_window
     window_cls = mglw.get_local_window_cls("pyglet")
     window = window_cls(
@@ -104,9 +102,18 @@ def run_gl_window_app(args):
     audio_analyzer = AudioAnalyzer(signal_states)
 
     # Initialize VJ system
-    vj_director = VJDirector(state)
+    vj_outputs = [parse_vj_output(spec) for spec in getattr(args, "vj_output", [])]
+    vj_director = VJDirector(
+        state,
+        prewarm_budget_bytes=getattr(args, "vj_prewarm_budget_mb", 256) * 1024 * 1024,
+        target_fps=getattr(args, "vj_target_fps", 60.0),
+        outputs=vj_outputs,
+    )
     vj_director.setup(ctx)
 
+    # Bulb colours sampled from the VJ frame, written by the director's DMX pass
+    pixel_mapper = PixelMapper(state) if getattr(args, "pixel_map", False) else None
+
     # Initialize director first (creates position manager)
     director = Director(
         state,
@@ -116,6 +123,7 @@ def run_gl_window_app(args):
             if runtime_client is not None
             else None
         ),
+        pixel_mapper=pixel_mapper,
     )
 
     # Remote control "shift" buttons come in over websocket; State queues
@@ -124,6 +132,26 @@ def run_gl_window_app(args):
     state.events.on_shift_color_scheme_request += director.shift_color_scheme
     state.events.on_shift_vj_only_request += director.shift_vj_only
 
+    # Initialize DMX with venue-specific configuration
+    dmx_ref = {"controller": get_controller(state.venue)}
+
+    def refresh_dmx_controller(_):
+        dmx_ref["controller"] = get_controller(state.venue)
+
+    state.events.on_venue_change += refresh_dmx_controller
+
+    # Audio, director and DMX run on their own thread; rendering below reads
+    # the snapshots it publishes, so vsync never throttles DMX output. Only
+    # the individual GUI mutations below take its lock, never a whole frame.
+    lighting = LightingPipeline(
+        state,
+        director,
+        audio_analyzer.analyze_audio,
+        lambda: dmx_ref["controller"],
+        runtime_client=runtime_client,
+        fps=getattr(args, "lighting_fps", DEFAULT_LIGHTING_FPS),
+    )
+
     # Initialize fixture renderer (uses director's position manager)
     from parrot.vj.nodes.fixture_visualization import FixtureVisualization
 
@@ -134,20 +162,13 @@ def run_gl_window_app(args):
         width=1920,
         height=1080,
         director=director,
+        snapshots=lighting.snapshots,
     )
     fixture_renderer.enter(ctx)
 
     dmx_heatmap_renderer = DmxHeatmapRenderer()
     dmx_heatmap_renderer.enter(ctx)
 
-    # Initialize DMX with venue-specific configuration
-    dmx_ref = {"controller": get_controller(state.venue)}
-
-    def refresh_dmx_controller(_):
-        dmx_ref["controller"] = get_controller(state.venue)
-
-    state.events.on_venue_change += refresh_dmx_controller
-
     # Setup display shader
     vertex_shader = """
     #version 330
@@ -238,12 +259,9 @@ def run_gl_window_app(args):
             port=getattr(args, "web_port", 4040),
             threaded=False,  # Run in main thread
             editor_port=editor_port or 4041,
+            dmx_telemetry=lambda: dmx_ref["controller"].telemetry_snapshot(),
         )
 
-    # Timing
-    last_audio_update = time.perf_counter()
-    audio_update_interval = 0.03
-
     # Check if we're in debug frame capture mode
     debug_frame_mode = getattr(args, "debug_frame", False)
 
@@ -257,7 +275,12 @@ def run_gl_window_app(args):
         break
 
     # Initialize overlay UI
-    overlay = OverlayUI(pyglet_window, state)
+    overlay = OverlayUI(
+        pyglet_window,
+        state,
+        dmx_telemetry=lambda: dmx_ref["controller"].telemetry_snapshot(),
+        lock=lighting.lock,
+    )
 
     # Check for start-with-overlay flag
     if getattr(args, "start_with_overlay", False):
@@ -347,7 +370,8 @@ def run_gl_window_app(args):
                     tag = sender.tag()
                     if 0 <= tag < len(self.modes):
                         selected_mode = self.modes[tag]
-                        self.state.set_mode(selected_mode)
+                        with lighting.lock:
+                            self.state.set_mode(selected_mode)
                         self.updateModeCheckmarks()
                         print(f"🎵 Mode changed to: {selected_mode.name}")
 
@@ -355,7 +379,8 @@ def run_gl_window_app(args):
                     tag = sender.tag()
                     if 0 <= tag < len(self.vj_modes):
                         selected_vj_mode = self.vj_modes[tag]
-                        self.state.set_vj_mode(selected_vj_mode)
+                        with lighting.lock:
+                            self.state.set_vj_mode(selected_vj_mode)
                         self.updateVJModeCheckmarks()
                         print(f"📺 VJ Mode changed to: {selected_vj_mode.value}")
 
@@ -363,7 +388,8 @@ def run_gl_window_app(args):
                     tag = sender.tag()
                     if 0 <= tag < len(self.venues_list):
                         selected_venue = self.venues_list[tag]
-                        self.state.set_venue(selected_venue)
+                        with lighting.lock:
+                            self.state.set_venue(selected_venue)
                         self.updateVenueCheckmarks()
                         print(f"🏛️  Venue changed to: {selected_venue.name}")
 
@@ -371,7 +397,8 @@ def run_gl_window_app(args):
                     tag = sender.tag()
                     if 0 <= tag < len(self.themes):
                         selected_theme = self.themes[tag]
-                        self.state.set_theme(selected_theme)
+                        with lighting.lock:
+                            self.state.set_theme(selected_theme)
                         self.updateThemeCheckmarks()
                         print(f"🎨 Theme changed to: {selected_theme.name}")
 
@@ -501,6 +528,7 @@ def run_gl_window_app(args):
         signal_states,
         state,
         show_fixture_mode_callback=cycle_display_mode,
+        lock=lighting.lock,
     )
 
     # Setup mouse handler for input events
@@ -569,13 +597,41 @@ def run_gl_window_app(args):
 
     # Track window size for resize detection
     last_window_size = window.size
-    # VJ preview push cadence: ~5 fps. The actual HTTP upload is async on a
-    # background thread inside `RuntimeVenueClient`, so this interval only
-    # governs how often we pay the GPU readback + JPEG encode cost on the GL
-    # thread. 0.2s feels live in the browser without saturating the network.
-    _VJ_PREVIEW_PUSH_INTERVAL_SEC = 0.2
+    # VJ preview push cadence: ~10 fps. The GL thread only pays a small GPU
+    # downsample; readback is asynchronous (collected next frame), JPEG
+    # encoding runs on `PreviewReadback`'s worker and the HTTP upload on
+    # `RuntimeVenueClient`'s, so this interval mostly bounds network use.
+    _VJ_PREVIEW_PUSH_INTERVAL_SEC = 0.1
     last_vj_preview_push_mono = -1000.0
+    vj_preview_readback = (
+        PreviewReadback(runtime_client.queue_vj_preview_jpeg)
+        if runtime_client is not None
+        else None
+    )
+    # Every VJ frame, full size, for local consumers (e.g. OBS, Resolume)
+    vj_shm_name = getattr(args, "vj_shm_name", None)
+    vj_shm_output = (
+        SharedFrameOutput(
+            vj_shm_name,
+            args.vj_shm_width,
+            args.vj_shm_height,
+            pixel_format=args.vj_shm_format,
+        )
+        if vj_shm_name
+        else None
+    )
+    # Each extra --vj-output gets its own ring, e.g. parrot-vj-wall
+    vj_output_rings = {
+        output.name: SharedFrameOutput(
+            f"{vj_shm_name or 'parrot-vj'}-{output.name}",
+            output.width,
+            output.height,
+            pixel_format=getattr(args, "vj_shm_format", "rgba"),
+        )
+        for output in vj_outputs
+    }
 
+    lighting.start()
     while not window.is_closing:
         current_time = time.perf_counter()
 
@@ -599,26 +655,16 @@ def run_gl_window_app(args):
         # Drain venue/runtime queues every frame. Do not tie this to audio frames: when the
         # analyzer returns None (no mic, silence, or startup), queued WebSocket snapshots would
         # otherwise never apply and the 3D room would stay on Room3DRenderer defaults (10×10).
-        state.process_gui_updates()
-
-        # Update audio at intervals
-        if time.perf_counter() - last_audio_update >= audio_update_interval:
-            frame = audio_analyzer.analyze_audio()
-            if frame:
-                director.step(frame)
-                director.render(dmx_ref["controller"])
-                if runtime_client is not None:
-                    runtime_client.maybe_push_fixture_runtime_state(
-                        director.scheme.render(),
-                        output_override_by_spec_id=director.output_fixture_overrides_by_spec_id(),
-                    )
-            last_audio_update = time.perf_counter()
+        # Each update takes the lighting lock: the handlers mutate the director.
+        state.process_gui_updates(lock=lighting.lock)
 
-        # Get VJ frame data
+        # Audio, director and DMX step on the lighting thread; draw its latest
+        # snapshot, with VJ frames delayed by the configured VJ offset.
+        snapshot = lighting.snapshots.read()
         frame_data, scheme_data = vj_director.get_latest_frame_data()
         if not frame_data:
-            frame_data = Frame({signal: 0.0 for signal in FrameSignal})
-            scheme_data = director.scheme.render()
+            frame_data = snapshot.frame
+            scheme_data = snapshot.scheme
 
         # Get current window size
         window_width, window_height = window.size
@@ -634,27 +680,35 @@ def run_gl_window_app(args):
         # is due, we render the VJ pipeline into its offscreen FBO for the
         # upload even if the screen is showing something else. When the
         # desktop *is* in VJ mode we render VJ unconditionally and reuse that
-        # FBO for both the on-screen blit and the web preview.
+        # FBO for both the on-screen blit and the web preview. Shared-memory
+        # output and pixel mapping want every VJ frame, so they keep VJ
+        # rendering in every view.
         now_mono = time.perf_counter()
         vj_preview_due = (
             runtime_client is not None
             and (now_mono - last_vj_preview_push_mono) >= _VJ_PREVIEW_PUSH_INTERVAL_SEC
         )
+        vj_offscreen_due = (
+            vj_preview_due
+            or vj_shm_output is not None
+            or pixel_mapper is not None
+            or bool(vj_output_rings)
+        )
         vj_preview_fbo = None
 
         if state.editor_display_mode == EditorDisplayMode.FIXTURE_SCENE:
             rendered_fbo = fixture_renderer.render(frame_data, scheme_data, ctx)
-            if vj_preview_due:
+            if vj_offscreen_due:
                 vj_preview_fbo = vj_director.render(ctx, frame_data, scheme_data)
         elif state.editor_display_mode == EditorDisplayMode.VJ:
             rendered_fbo = vj_director.render(ctx, frame_data, scheme_data)
             vj_preview_fbo = rendered_fbo
         else:
-            snap = dmx_ref["controller"].snapshot_universe(Universe.default)
+            universes = dmx_ref["controller"].snapshot_universes()
             rendered_fbo = dmx_heatmap_renderer.render(
-                ctx, snap, window_width, window_height
+                ctx, universes, window_width, window_height
             )
-            if vj_preview_due:
+            if vj_offscreen_due:
                 vj_preview_fbo = vj_director.render(ctx, frame_data, scheme_data)
 
         # Bind the window's default framebuffer (screen) and render to it
@@ -691,29 +745,46 @@ def run_gl_window_app(args):
             except Exception as e:
                 print(f"Error displaying to screen: {e}")
 
-        if (
-            runtime_client is not None
-            and vj_preview_due
-            and vj_preview_fbo is not None
-            and vj_preview_fbo.color_attachments
-        ):
-            jpeg = _encode_texture_rgb_as_jpeg(vj_preview_fbo.color_attachments[0])
-            if jpeg is not None:
-                runtime_client.queue_vj_preview_jpeg(jpeg)
-            # Advance the cadence timer whether or not encoding succeeded so a
-            # pathological frame (e.g. zero-size texture) doesn't cause us to
-            # hammer the encoder every tick.
-            last_vj_preview_push_mono = now_mono
+        if vj_preview_readback is not None:
+            # Collect last frame's readback before starting a new one
+            vj_preview_readback.poll()
+            if (
+                vj_preview_due
+                and vj_preview_fbo is not None
+                and vj_preview_fbo.color_attachments
+            ):
+                vj_preview_readback.capture(ctx, vj_preview_fbo.color_attachments[0])
+                # Advance the cadence timer whether or not the capture started so
+                # a pathological frame (e.g. zero-size texture) doesn't cause us
+                # to retry every tick.
+                last_vj_preview_push_mono = now_mono
+
+        if vj_shm_output is not None:
+            vj_shm_output.poll()
+            if vj_preview_fbo is not None and vj_preview_fbo.color_attachments:
+                vj_shm_output.capture(ctx, vj_preview_fbo.color_attachments[0])
+
+        for name, ring in vj_output_rings.items():
+            ring.poll()
+            output_fbo = vj_director.output_frames.get(name)
+            if vj_preview_fbo is not None and output_fbo is not None:
+                ring.capture(ctx, output_fbo.color_attachments[0])
+
+        if pixel_mapper is not None:
+            pixel_mapper.poll()
+            if vj_preview_fbo is not None and vj_preview_fbo.color_attachments:
+                pixel_mapper.capture(ctx, vj_preview_fbo.color_attachments[0])
 
         # Restore viewport before rendering overlay (imgui manages its own viewport)
         ctx.viewport = (0, 0, window_width, window_height)
 
-        # Render overlay UI
+        # Render overlay UI (its controls take the lighting lock to change state)
         overlay.render()
 
         # Swap buffers and poll events
+        # No ctx.finish(): vsync paces the loop, and the VJ resolution
+        # governor reads its GPU timers a couple of frames late instead.
         window.swap_buffers()
-        window.ctx.finish()  # Wait for rendering to complete
 
         # Debug frame capture mode (after swap so we see what's displayed)
         if debug_frame_mode:
@@ -771,11 +842,24 @@ def run_gl_window_app(args):
     # Cleanup. Runtime state (mode/vj_mode/venue) is persisted by parrot_cloud's
     # control_state DB, so there's nothing to write locally on shutdown.
     print("\n👋 Shutting down...")
+    lighting.stop()
     audio_analyzer.cleanup()
+    if vj_preview_readback is not None:
+        vj_preview_readback.release()
+    if vj_shm_output is not None:
+        vj_shm_output.release()
+    for ring in vj_output_rings.values():
+        ring.release()
+    if pixel_mapper is not None:
+        pixel_mapper.release()
     vj_director.cleanup()
+    trace_path = vj_profiler.write_trace()
+    if trace_path is not None:
+        print(f"🧵 VJ trace written to {trace_path}")
 
     # Cleanup fixture renderer
     fixture_renderer.exit()
+    dmx_heatmap_renderer.exit()
 
     # Shutdown overlay before destroying window to avoid OpenGL context issues
     overlay.shutdown()
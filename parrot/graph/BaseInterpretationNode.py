@@ -1,7 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import random
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Generic, Hashable, List, Optional, Type, TypeVar
 from dataclasses import dataclass
 
 from parrot.director.frame import Frame
@@ -61,6 +61,7 @@ class BaseInterpretationNode(ABC, Generic[C, RI, RR]):
         Recursively enters this node and all its input nodes.
         Calls enter() on this node, then enter_recursive() on all nodes in all_inputs.
         """
+        self.invalidate()
         self.enter(context)
         for input_node in self.all_inputs:
             input_node.enter_recursive(context)
@@ -114,6 +115,35 @@ class BaseInterpretationNode(ABC, Generic[C, RI, RR]):
         """
         pass
 
+    # Key the output was last rendered with (see cache_key)
+    _rendered_cache_key: Hashable | None = None
+
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        """
+        Everything this node's own output depends on for this frame: its
+        parameters plus whichever frame signals / scheme colours it reads.
+        Returning None (the default) means the output changes every frame.
+        """
+        return None
+
+    def output_unchanged(self, frame: Frame, scheme: ColorScheme) -> bool:
+        """
+        True if re-rendering would reproduce the last output: this node's
+        cache key matches the one it last rendered with and no input is dirty.
+        """
+        key = self.cache_key(frame, scheme)
+        if key is None or key != self._rendered_cache_key:
+            return False
+        return all(node.output_unchanged(frame, scheme) for node in self.all_inputs)
+
+    def mark_rendered(self, frame: Frame, scheme: ColorScheme):
+        """Record the key the current output was rendered with; call after render."""
+        self._rendered_cache_key = self.cache_key(frame, scheme)
+
+    def invalidate(self):
+        """Force the next render to redraw (e.g. after GL resources were recreated)."""
+        self._rendered_cache_key = None
+
     def print_self(self) -> str:
         """
         Return a string representation of this node for tree printing.
@@ -275,13 +305,18 @@ class RandomOperation(BaseInterpretationNode[C, RR, RR]):
                 self.current_operation.enter_recursive(self._context)
             self.current_operation.generate_recursive(vibe)
 
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        return id(self.current_operation)
+
     def render(
         self,
         frame: Frame,
         scheme: ColorScheme,
         context: C,
     ) -> RR:
-        return self.current_operation.render(frame, scheme, context)
+        result = self.current_operation.render(frame, scheme, context)
+        self.mark_rendered(frame, scheme)
+        return result
 
 
 class RandomChild(BaseInterpretationNode[C, RI, RR]):
@@ -338,6 +373,9 @@ class RandomChild(BaseInterpretationNode[C, RI, RR]):
         self._context = None
         self._child_entered = False
 
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        return id(self._current_child)
+
     def generate(self, vibe: Vibe):
         # Select a child at random (if any), and re-enter it fresh every time.
         if not self.child_options:
@@ -383,4 +421,6 @@ class RandomChild(BaseInterpretationNode[C, RI, RR]):
             raise RuntimeError(
                 "RandomChild has no selected child. Call generate() before render()."
             )
-        return self._current_child.render(frame, scheme, context)
+        result = self._current_child.render(frame, scheme, context)
+        self.mark_rendered(frame, scheme)
+        return result
@@ -57,9 +57,9 @@ class HeadlessDmxBridge:
             editor_port = urlparse(venue_service_url).port if venue_service_url else 4041
             start_web_server(
                 self.state,
-                director=self.director,
                 port=getattr(self.args, "web_port", 4040),
                 editor_port=editor_port or 4041,
+                dmx_telemetry=lambda: self.dmx.telemetry_snapshot(),
             )
 
     def _refresh_dmx_controller(self) -> None:
@@ -1,5 +1,7 @@
 """Keyboard handler for Party Parrot GL window"""
 
+from contextlib import nullcontext
+
 import pyglet
 from beartype import beartype
 
@@ -23,12 +25,15 @@ class KeyboardHandler:
         signal_states: SignalStates,
         state: State,
         show_fixture_mode_callback=None,
+        lock=None,
     ):
         self.director = director
         self.overlay = overlay
         self.signal_states = signal_states
         self.state = state
         self.show_fixture_mode_callback = show_fixture_mode_callback
+        # Held while a key changes state or the director (the lighting lock)
+        self.lock = lock if lock is not None else nullcontext()
 
         # Get list of VJ modes in enum order (blackout is lowest/first)
         self.vj_modes = list(VJMode)
@@ -45,6 +50,15 @@ class KeyboardHandler:
 
     def on_key_press(self, symbol: int, modifiers: int) -> bool:
         """Handle key press events"""
+        with self.lock:
+            return self._handle_key_press(symbol)
+
+    def on_key_release(self, symbol: int, modifiers: int) -> bool:
+        """Handle key release events"""
+        with self.lock:
+            return self._handle_key_release(symbol)
+
+    def _handle_key_press(self, symbol: int) -> bool:
         # VJ mode navigation
         if symbol == pyglet.window.key.LEFT:
             self._navigate_vj_mode_previous()
@@ -91,8 +105,7 @@ class KeyboardHandler:
 
         return False
 
-    def on_key_release(self, symbol: int, modifiers: int) -> bool:
-        """Handle key release events"""
+    def _handle_key_release(self, symbol: int) -> bool:
         # Signal buttons (release)
         if symbol == pyglet.window.key.I or symbol == pyglet.window.key._1:
             self.signal_states.set_signal(FrameSignal.rainbow, 0.0)
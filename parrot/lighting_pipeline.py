@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Optional
+
+from beartype import beartype
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.director import Director
+from parrot.director.frame import Frame, FrameSignal
+from parrot.fixtures.base import FixtureBase
+from parrot.runtime_venue_client import RuntimeVenueClient
+from parrot.state import State
+from parrot.utils.triple_buffer import TripleBuffer
+from parrot.venue_runtime import runtime_leaf_fixtures
+from parrot.vj.profiler import vj_profiler
+
+logger = logging.getLogger(__name__)
+
+# Audio analysis, director step and DMX output rate, independent of the display
+DEFAULT_LIGHTING_FPS = 33.0
+
+
+@beartype
+@dataclass(frozen=True)
+class LightingSnapshot:
+    """One lighting step's output, safe to read on any thread.
+
+    ``fixtures`` holds ``state_snapshot`` copies of each leaf fixture's
+    output (the interpretation-blend fixture while a blend runs), keyed by
+    ``runtime_slot_key``.
+    """
+
+    frame: Frame
+    scheme: ColorScheme
+    fixtures: Mapping[str, FixtureBase]
+    sequence: int = 0
+
+
+@beartype
+class LightingPipeline:
+    """Runs audio analysis, ``Director.step`` and DMX output on its own thread.
+
+    Each step publishes a ``LightingSnapshot`` to ``snapshots`` for the
+    render thread, so a display waiting on vsync never holds back DMX.
+    Each mutation of the director from another thread (a GUI update, a key
+    or control change) must hold ``lock``, and only for that mutation, not
+    for drawing; a step holds it from ``Director.step`` until the snapshot
+    is taken, never while waiting on audio.
+    """
+
+    def __init__(
+        self,
+        state: State,
+        director: Director,
+        analyze_audio: Callable[[], Optional[Frame]],
+        dmx_controller: Callable[[], Any],
+        runtime_client: Optional[RuntimeVenueClient] = None,
+        fps: float | int = DEFAULT_LIGHTING_FPS,
+    ):
+        self.state = state
+        self.director = director
+        self.analyze_audio = analyze_audio
+        self.dmx_controller = dmx_controller
+        self.runtime_client = runtime_client
+        self.interval = 1.0 / fps
+        self.lock = threading.RLock()
+        self._sequence = 0
+        with self.lock:
+            idle = Frame({signal: 0.0 for signal in FrameSignal})
+            initial = self.capture(idle, self.director.scheme.render())
+        self.snapshots: TripleBuffer[LightingSnapshot] = TripleBuffer(initial)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="lighting-pipeline"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def step(self) -> bool:
+        """Analyze, step, output DMX and publish; False when no audio frame came."""
+        with vj_profiler.profile("audio_analyze", track="lighting"):
+            frame = self.analyze_audio()
+        if frame is None:
+            return False
+        with self.lock:
+            with vj_profiler.profile("director_step", track="lighting"):
+                self.director.step(frame)
+            with vj_profiler.profile("dmx_render", track="lighting"):
+                self.director.render(self.dmx_controller())
+            scheme = self.director.scheme.render()
+            if self.runtime_client is not None:
+                self.runtime_client.maybe_push_fixture_runtime_state(
+                    scheme,
+                    output_override_by_spec_id=self.director.output_fixture_overrides_by_spec_id(),
+                )
+            snapshot = self.capture(frame, scheme)
+        self.snapshots.publish(snapshot)
+        return True
+
+    def capture(self, frame: Frame, scheme: ColorScheme) -> LightingSnapshot:
+        """Snapshot the director's current fixture output (call under ``lock``)."""
+        self._sequence += 1
+        fixtures = {
+            key: self.director.resolve_output_fixture(fixture).state_snapshot()
+            for key, fixture in runtime_leaf_fixtures(self.state).items()
+        }
+        return LightingSnapshot(frame, scheme, fixtures, self._sequence)
+
+    def _run(self) -> None:
+        next_step = time.perf_counter()
+        while not self._stop_event.is_set():
+            try:
+                self.step()
+            except Exception:
+                logger.exception("Lighting step failed")
+            next_step += self.interval
+            delay = next_step - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                # Behind schedule: carry on from now instead of bursting
+                next_step = time.perf_counter()
@@ -1,7 +1,6 @@
 #!/usr/bin/env ipython
 
 import os
-import sys
 import tracemalloc
 from urllib.parse import urlparse
 import pyaudio
@@ -11,12 +10,14 @@ import matplotlib
 import time
 import threading
 
-import math
 from beartype import beartype
 
 from parrot.director.director import Director
 from parrot.director.frame import Frame, FrameSignal
 from parrot.audio.beat_tracker import BeatTracker
+from parrot.audio.audio_analyzer import THREE_BAND_SIGNALS
+from parrot.audio.filterbank import THREE_BAND_BINS, FilterBank, RangeNormalizer
+from parrot.audio.tempo_estimator import TEMPO_CONFIDENCE_MIN, OnsetTempoEstimator
 from parrot.director.mode import Mode
 from parrot.utils.dmx_utils import get_controller
 
@@ -71,20 +72,21 @@ class MicToDmx(object):
             FrameSignal.sustained_high: [],
         }
 
-        self.signal_stat_buffer = {
-            **{
-                key: {
-                    "max": [],
-                    "min": [],
-                }
-                for key in FrameSignal
-            },
-        }
-        self.signal_stat_last = 0
+        self.three_band = RangeNormalizer(
+            len(THREE_BAND_SIGNALS),
+            SPECTOGRAPH_BUFFER_SIZE,
+            SIGNAL_STAT_PERIOD_SECONDS,
+            SIGNAL_STAT_BUFFER_SIZE,
+        )
 
         self.state = State()
         self.signal_states = SignalStates()
-        self.beat_tracker = BeatTracker()
+        self.tempo_estimator = OnsetTempoEstimator()
+        self.tempo_estimator.start()
+        # Same range as the estimator, so its hints (e.g. 174 BPM DnB) aren't clipped
+        self.beat_tracker = BeatTracker(max_bpm=self.tempo_estimator.max_bpm)
+        self.filterbank = FilterBank(bin_ranges=THREE_BAND_BINS)
+        self._last_onset_count = 0
         self.runtime_client = None
 
         venue_service_url = getattr(args, "venue_service_url", None)
@@ -140,6 +142,7 @@ class MicToDmx(object):
     def quit(self):
         # State is persisted by parrot_cloud's control_state DB; no local save needed.
         self.should_stop = True
+        self.tempo_estimator.stop()
 
         if self.runtime_client is not None:
             self.runtime_client.stop()
@@ -235,6 +238,8 @@ class MicToDmx(object):
         #     to the segment times.
         f, t, Sxx = signal.spectrogram(snd_block)
 
+        self.tempo_estimator.submit(Sxx)
+
         # self.spectrogram_rate = len(t) / time_elapsed
 
         if self.spectrogram_buffer is None:
@@ -248,64 +253,16 @@ class MicToDmx(object):
         self.process_block(self.spectrogram_buffer, len(t))
 
     def process_block(self, spectrogram_block, num_idx_added):
-        ranges = {
-            FrameSignal.freq_all: (0, 129),
-            FrameSignal.freq_high: (30, 129),
-            FrameSignal.freq_low: (0, 30),
-        }
-
-        values = {}
-        timeseries = {}
-
-        raw_timeseries = {}
-
-        # print(
-        #     f"spectrogram {spectrogram_block.shape} max: {np.max(spectrogram_block):.3f}, sum: {np.sum(spectrogram_block):.3f}, mean: {np.mean(spectrogram_block):.3f}"
-        # )
-
-        should_capture_signal_stats = (
-            time.time() - self.signal_stat_last > SIGNAL_STAT_PERIOD_SECONDS
+        # New columns go through the filterbank and the three-band ranges in
+        # one matmul; the first call seeds the range history from the block.
+        new_columns = (
+            spectrogram_block
+            if self.three_band.sums.shape[1] == 0
+            else spectrogram_block[:, spectrogram_block.shape[1] - num_idx_added :]
         )
-        if should_capture_signal_stats:
-            self.signal_stat_last = time.time()
-
-        for name, rg in ranges.items():
-            x = np.sum(np.abs(spectrogram_block[rg[0] : rg[1], :]), axis=0)
-            raw_timeseries[name] = x
-
-            # N = round(RATE / 50000)
-            N = 3
-            x = np.convolve(x, np.ones(N) / N, mode="valid")
-
-            # Discard outliers and clamp to 0-1
-            x_min = np.percentile(x, 5)
-            x_max = np.percentile(x, 95)
-
-            if should_capture_signal_stats:
-                self.signal_stat_buffer[name]["max"].append(x_max)
-                self.signal_stat_buffer[name]["min"].append(x_min)
-                self.signal_stat_buffer[name]["max"] = self.signal_stat_buffer[name][
-                    "max"
-                ][-SIGNAL_STAT_BUFFER_SIZE:]
-                self.signal_stat_buffer[name]["min"] = self.signal_stat_buffer[name][
-                    "min"
-                ][-SIGNAL_STAT_BUFFER_SIZE:]
-
-            x_min = np.min(
-                np.concatenate([self.signal_stat_buffer[name]["min"], [x_min]])
-            )
-            x_max = np.max(
-                np.concatenate([self.signal_stat_buffer[name]["max"], [x_max]])
-            )
-
-            x = (x - x_min) / (x_max - x_min + sys.float_info.epsilon)
-            x = np.clip(x, 0, 1)
-
-            timeseries[name] = x
-            v = x[-1]
-            if math.isnan(v):
-                v = 0
-            values[name] = v
+        bands, range_sums = self.filterbank.process_with_ranges(new_columns)
+        timeseries = dict(zip(THREE_BAND_SIGNALS, self.three_band.update(range_sums)))
+        values = {name: x[-1] for name, x in timeseries.items()}
 
         for src, dest in [
             (FrameSignal.freq_high, FrameSignal.sustained_high),
@@ -318,6 +275,12 @@ class MicToDmx(object):
                 -SPECTOGRAPH_BUFFER_SIZE:
             ]
 
+        tempo = self.tempo_estimator.latest()
+        self.beat_tracker.set_tempo_hint(
+            tempo.bpm if tempo.confidence >= TEMPO_CONFIDENCE_MIN else None
+        )
+        onset = tempo.onset_count != self._last_onset_count
+        self._last_onset_count = tempo.onset_count
         beat_state = self.beat_tracker.update(
             values[FrameSignal.freq_low], now=time.perf_counter()
         )
@@ -329,6 +292,16 @@ class MicToDmx(object):
             beat=beat_state.beat,
             beat_count=beat_state.beat_count,
             bar_progress=beat_state.bar_progress,
+            next_beat_ms=(
+                None
+                if beat_state.next_beat_in is None
+                else beat_state.next_beat_in * 1000.0
+            ),
+            predicted_beat=beat_state.predicted_beat,
+            bands=bands,
+            onset=onset,
+            onset_strength=tempo.onset_strength if onset else 0.0,
+            tempo_confidence=tempo.confidence,
         )
 
         # Add signal states to the frame
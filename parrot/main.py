@@ -41,6 +41,58 @@ def parse_arguments():
         action="store_true",
         help="Start with overlay UI visible",
     )
+    parser.add_argument(
+        "--no-shader-disk-cache",
+        action="store_true",
+        help="Don't persist compiled shaders between runs",
+    )
+    parser.add_argument(
+        "--vj-prewarm-budget-mb",
+        type=int,
+        default=256,
+        help="GPU memory per mode switch for keeping inactive VJ modes loaded (0 disables)",
+    )
+    parser.add_argument(
+        "--vj-target-fps",
+        type=float,
+        default=60.0,
+        help="Frame rate the VJ render lowers backdrop resolution to hold (0 disables)",
+    )
+    parser.add_argument(
+        "--lighting-fps",
+        type=float,
+        default=33.0,
+        help="Rate of the audio, director and DMX thread, independent of the display",
+    )
+    parser.add_argument(
+        "--vj-shm-name",
+        default=None,
+        help="Publish VJ frames to a shared-memory ring of this name for local apps",
+    )
+    parser.add_argument(
+        "--vj-shm-format",
+        choices=["rgba", "yuv420"],
+        default="rgba",
+        help="Pixel format of the shared-memory VJ frames",
+    )
+    parser.add_argument(
+        "--pixel-map",
+        action="store_true",
+        help="Drive LED-bulb fixtures (motion strips, COLORband) from the VJ frame",
+    )
+    parser.add_argument(
+        "--vj-output",
+        action="append",
+        default=[],
+        metavar="NAME:WIDTHxHEIGHT[:SOURCE[:FIT[:X,Y,W,H]]]",
+        help=(
+            "Extra VJ display cut from the same render (source stage or scene, "
+            "fit cover, contain or stretch), published to shared memory as "
+            "<--vj-shm-name or parrot-vj>-NAME; repeat for more"
+        ),
+    )
+    parser.add_argument("--vj-shm-width", type=int, default=1920)
+    parser.add_argument("--vj-shm-height", type=int, default=1080)
     return parser.parse_args()
 
 
@@ -1,5 +1,6 @@
 import queue
 import threading
+from contextlib import AbstractContextManager, nullcontext
 from typing import Callable, Optional, cast
 from events import Events
 from beartype import beartype
@@ -390,33 +391,38 @@ class State:
             EditorDisplayMode.FIXTURE_SCENE if value else EditorDisplayMode.DMX_HEATMAP
         )
 
-    def process_gui_updates(self):
+    def process_gui_updates(self, lock: Optional[AbstractContextManager] = None):
         """Drain queued runtime updates on the main thread.
 
         Called every frame by the GL loop so WebSocket/bootstrap events land
-        on the main thread (where OpenGL + pyglet are safe to touch).
+        on the main thread (where OpenGL + pyglet are safe to touch). ``lock``
+        is held around each update, so an empty queue never takes it.
         """
+        if lock is None:
+            lock = nullcontext()
         try:
             while True:
                 update_type, value = self._gui_update_queue.get_nowait()
-
-                if update_type == "runtime_bootstrap":
-                    self.apply_runtime_bootstrap(value)
-                elif update_type == "runtime_venues":
-                    self._apply_runtime_venue_summaries(list(value))
-                elif update_type == "runtime_snapshot":
-                    self._apply_runtime_snapshot(value)
-                elif update_type == "runtime_control_state":
-                    self._apply_control_state(value)
-                elif update_type == "runtime_effect":
-                    eff, val = cast(tuple[str, Optional[float]], value)
-                    self.set_effect_thread_safe(eff, value=val)
-                elif update_type == "runtime_shift":
-                    self._dispatch_shift(value)
-                elif update_type == "runtime_named_position_override":
-                    self.apply_named_position_programming_override(dict(value))
-
+                with lock:
+                    self._apply_gui_update(update_type, value)
                 self._gui_update_queue.task_done()
 
         except queue.Empty:
             pass
+
+    def _apply_gui_update(self, update_type: str, value: object) -> None:
+        if update_type == "runtime_bootstrap":
+            self.apply_runtime_bootstrap(value)
+        elif update_type == "runtime_venues":
+            self._apply_runtime_venue_summaries(list(value))
+        elif update_type == "runtime_snapshot":
+            self._apply_runtime_snapshot(value)
+        elif update_type == "runtime_control_state":
+            self._apply_control_state(value)
+        elif update_type == "runtime_effect":
+            eff, val = cast(tuple[str, Optional[float]], value)
+            self.set_effect_thread_safe(eff, value=val)
+        elif update_type == "runtime_shift":
+            self._dispatch_shift(value)
+        elif update_type == "runtime_named_position_override":
+            self.apply_named_position_programming_override(dict(value))
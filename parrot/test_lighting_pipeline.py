@@ -0,0 +1,49 @@
+import time
+
+from parrot.director.director import Director
+from parrot.director.frame import Frame, FrameSignal
+from parrot.lighting_pipeline import LightingPipeline
+from parrot.state import State
+from parrot.utils.dmx_utils import SwitchController, Universe
+from parrot.utils.mock_controller import MockDmxController
+from parrot.venue_runtime import runtime_leaf_fixtures
+
+
+def _frame(value: float) -> Frame:
+    return Frame({signal: value for signal in FrameSignal})
+
+
+def _dmx() -> SwitchController:
+    return SwitchController({Universe.default: MockDmxController()})
+
+
+def test_step_publishes_frozen_fixture_output():
+    state = State()
+    director = Director(state)
+    frames = iter([_frame(0.8), None])
+    pipeline = LightingPipeline(state, director, lambda: next(frames), _dmx)
+    leaves = runtime_leaf_fixtures(state)
+    assert set(pipeline.snapshots.read().fixtures) == set(leaves)
+
+    assert pipeline.step()
+    snapshot = pipeline.snapshots.read()
+    assert snapshot.frame[FrameSignal.freq_low] == 0.8
+    key, live = next(iter(leaves.items()))
+    published = list(snapshot.fixtures[key].values)
+    live.values[0] = 255 - published[0]
+    assert snapshot.fixtures[key].values == published
+
+    assert not pipeline.step()  # no audio: nothing new is published
+    assert pipeline.snapshots.read() is snapshot
+
+
+def test_thread_steps_at_its_own_rate():
+    state = State()
+    director = Director(state)
+    pipeline = LightingPipeline(state, director, lambda: _frame(0.5), _dmx, fps=200)
+    pipeline.start()
+    deadline = time.perf_counter() + 5.0
+    while pipeline.snapshots.published < 5 and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    pipeline.stop()
+    assert pipeline.snapshots.read().sequence > 5
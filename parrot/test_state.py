@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from parrot.gl_display_mode import EditorDisplayMode
@@ -189,6 +191,21 @@ class TestState:
         color_handler.assert_called_once_with()
         vj_handler.assert_called_once_with()
 
+    def test_process_gui_updates_holds_lock_per_update_only(self):
+        state = State()
+        lock = threading.RLock()
+        held = []
+        state.events.on_shift_vj_only_request += lambda: held.append(
+            lock._is_owned()
+        )
+
+        state.process_gui_updates(lock=lock)  # empty queue: lock untouched
+        state.queue_runtime_shift("vj_only")
+        state.process_gui_updates(lock=lock)
+
+        assert held == [True]
+        assert not lock._is_owned()
+
     def test_process_gui_updates_runtime_venues_notifies_listeners(self):
         state = State()
         handler = Mock()
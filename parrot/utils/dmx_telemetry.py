@@ -0,0 +1,86 @@
+from collections import deque
+
+import numpy as np
+from beartype import beartype
+
+# Upper edges (ms) of the write-duration histogram buckets. The final bucket
+# catches everything slower than the last edge.
+WRITE_DURATION_BUCKETS_MS = (0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0)
+
+# Rolling window used for achieved Hz and inter-frame jitter.
+TELEMETRY_WINDOW_SECONDS = 2.0
+
+
+@beartype
+class UniverseTelemetry:
+    """Output health counters for one DMX universe / backend.
+
+    ``SwitchController`` feeds this with one ``record_submit`` per frame so we
+    can tell at a show whether the Enttec is keeping up, how long serial /
+    Art-Net writes take, and how steady the frame cadence is.
+    """
+
+    def __init__(self, backend: str):
+        self.backend = backend
+        self.frames_sent = 0
+        self.dropped_frames = 0
+        self.reconnect_attempts = 0
+        self.last_write_ms = 0.0
+        self.max_write_ms = 0.0
+        self.write_histogram = [0] * (len(WRITE_DURATION_BUCKETS_MS) + 1)
+        self._submit_times: deque[float] = deque()
+        self._last_submit_time: float | None = None
+
+    def record_submit(self, started: float, finished: float, ok: bool) -> None:
+        """Record one ``submit()`` call that ran from ``started`` to ``finished``."""
+        if not ok:
+            self.dropped_frames += 1
+            return
+
+        duration_ms = max(0.0, finished - started) * 1000.0
+        self.frames_sent += 1
+        self.last_write_ms = duration_ms
+        self.max_write_ms = max(self.max_write_ms, duration_ms)
+        bucket = int(np.searchsorted(WRITE_DURATION_BUCKETS_MS, duration_ms))
+        self.write_histogram[bucket] += 1
+
+        self._submit_times.append(started)
+        cutoff = started - TELEMETRY_WINDOW_SECONDS
+        while self._submit_times and self._submit_times[0] < cutoff:
+            self._submit_times.popleft()
+        self._last_submit_time = started
+
+    def record_reconnect_attempt(self) -> None:
+        self.reconnect_attempts += 1
+
+    def achieved_hz(self) -> float:
+        """Frames per second over the rolling window."""
+        if len(self._submit_times) < 2:
+            return 0.0
+        span = self._submit_times[-1] - self._submit_times[0]
+        if span <= 0.0:
+            return 0.0
+        return (len(self._submit_times) - 1) / span
+
+    def jitter_ms(self) -> float:
+        """Standard deviation of inter-frame intervals over the rolling window."""
+        if len(self._submit_times) < 3:
+            return 0.0
+        intervals = np.diff(np.array(self._submit_times))
+        return float(np.std(intervals) * 1000.0)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "backend": self.backend,
+            "frames_sent": self.frames_sent,
+            "achieved_hz": round(self.achieved_hz(), 2),
+            "jitter_ms": round(self.jitter_ms(), 3),
+            "last_write_ms": round(self.last_write_ms, 3),
+            "max_write_ms": round(self.max_write_ms, 3),
+            "write_histogram_ms": {
+                "buckets": list(WRITE_DURATION_BUCKETS_MS),
+                "counts": list(self.write_histogram),
+            },
+            "reconnect_attempts": self.reconnect_attempts,
+            "dropped_frames": self.dropped_frames,
+        }
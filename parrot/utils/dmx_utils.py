@@ -2,9 +2,17 @@ from DMXEnttecPro import Controller
 import math
 import os
 import enum
+import time
 from serial.serialutil import SerialException
 
 from beartype import beartype
+from parrot.utils.dmx_telemetry import UniverseTelemetry
+from parrot.utils.latency import (
+    STAGE_DMX_OUTPUT,
+    DelayLine,
+    latency_tracker,
+    output_delays_seconds,
+)
 from parrot.utils.mock_controller import MockDmxController
 from .math import clamp
 from stupidArtnet import StupidArtnet
@@ -114,19 +122,40 @@ class ArtNetController:
 class SwitchController:
     """Routes DMX commands to the appropriate controller based on universe"""
 
-    def __init__(self, controller_map):
+    def __init__(self, controller_map, output_delay_seconds: float = 0.0):
         """
         Initialize with a mapping of Universe -> controller
 
         Args:
             controller_map: Dict mapping Universe enum values to controller instances
+            output_delay_seconds: Hold each frame this long before transmitting,
+                to align DMX with slower outputs (e.g. a projector)
         """
         self.controller_map = controller_map
-        self._shadow: dict[Universe, list[int]] = {
-            u: [0] * 512 for u in controller_map
-        }
+        # When delayed, set_channel only writes the shadow buffers; submit()
+        # queues a copy and transmits whichever frame has become due.
+        self._delay_line: DelayLine | None = (
+            DelayLine(output_delay_seconds) if output_delay_seconds > 0.0 else None
+        )
+        # Every universe is allocated up front so the lighting thread's writes
+        # never resize these dicts while the render thread snapshots them.
+        self._shadow: dict[Universe, list[int]] = {u: [0] * 512 for u in Universe}
+        self._written: dict[Universe, bool] = {u: u in controller_map for u in Universe}
         # Track which universes use Entec controllers for reconnection
         self._entec_universes = set()
+        self.telemetry: dict[Universe, UniverseTelemetry] = {
+            u: UniverseTelemetry(type(c).__name__) for u, c in controller_map.items()
+        }
+
+    def _telemetry_for(self, universe: Universe) -> UniverseTelemetry:
+        controller = self.controller_map.get(universe)
+        backend = type(controller).__name__
+        telemetry = self.telemetry.get(universe)
+        if telemetry is None:
+            telemetry = UniverseTelemetry(backend)
+            self.telemetry[universe] = telemetry
+        telemetry.backend = backend
+        return telemetry
 
     def _mark_entec_universe(self, universe):
         """Mark a universe as using an Entec controller"""
@@ -134,10 +163,11 @@ class SwitchController:
 
     def set_channel(self, channel, value, universe=Universe.default):
         """Set a channel value on the specified universe"""
-        if universe not in self._shadow:
-            self._shadow[universe] = [0] * 512
+        self._written[universe] = True
         if 1 <= channel <= 512:
             self._shadow[universe][channel - 1] = dmx_clamp(value)
+        if self._delay_line is not None:
+            return
         controller = self.controller_map.get(universe)
         if controller:
             controller.set_channel(channel, value)
@@ -146,11 +176,20 @@ class SwitchController:
         """Last values routed through this controller (for DMX heatmap UI)."""
         return list(self._shadow.get(universe, [0] * 512))
 
+    def snapshot_universes(self) -> dict[str, list[int]]:
+        """Every universe's last values keyed by name (for the DMX heatmap)."""
+        return {
+            universe.value: list(self._shadow[universe])
+            for universe in Universe
+            if self._written[universe]
+        }
+
     def _reconnect_entec(self, universe):
         """Attempt to reconnect the Entec controller for a universe"""
         if universe not in self._entec_universes:
             return False
 
+        self._telemetry_for(universe).record_reconnect_attempt()
         try:
             new_controller = get_entec_controller()
             if isinstance(new_controller, Controller):
@@ -168,15 +207,54 @@ class SwitchController:
             self._entec_universes.discard(universe)
             return False
 
-    def submit(self):
-        """Submit all controllers"""
-        for universe, controller in self.controller_map.items():
+    def submit(self, capture_time: float | None = None):
+        """Submit all controllers
+
+        Args:
+            capture_time: Audio capture time of the frame being sent, for
+                mic-to-DMX latency measurement
+        """
+        if self._delay_line is not None:
+            self._delay_line.push(
+                (capture_time, {u: list(self._shadow[u]) for u in self.controller_map})
+            )
+            due = self._delay_line.pop_due()
+            if due is None:
+                return
+            capture_time, universes = due
+            for universe, values in universes.items():
+                controller = self.controller_map.get(universe)
+                if controller:
+                    for channel, value in enumerate(values, start=1):
+                        controller.set_channel(channel, value)
+
+        if self._submit_controllers():
+            latency_tracker.record(STAGE_DMX_OUTPUT, capture_time)
+
+    def _submit_controllers(self) -> bool:
+        """Submit every universe; False if any of them failed."""
+        ok = True
+        for universe, controller in list(self.controller_map.items()):
+            telemetry = self._telemetry_for(universe)
+            started = time.perf_counter()
             try:
                 controller.submit()
             except (SerialException, OSError) as e:
+                telemetry.record_submit(started, time.perf_counter(), ok=False)
                 print(f"⚠️  DMX submit failed ({universe.value}): {e}")
                 if universe in self._entec_universes:
                     self._reconnect_entec(universe)
+                ok = False
+                continue
+            telemetry.record_submit(started, time.perf_counter(), ok=True)
+        return ok
+
+    def telemetry_snapshot(self) -> dict[str, dict[str, object]]:
+        """Per-universe output health, keyed by universe name (for API/overlay)."""
+        return {
+            universe.value: self._telemetry_for(universe).snapshot()
+            for universe in self.controller_map
+        }
 
 
 # Per-venue Art-Net configuration
@@ -225,7 +303,9 @@ def get_entec_controller():
 def get_controller(venue=None):
     """Get DMX controller with universe routing based on venue"""
     controller_map = {}
-    switch_controller = SwitchController(controller_map)
+    switch_controller = SwitchController(
+        controller_map, output_delay_seconds=output_delays_seconds()["dmx"]
+    )
 
     # Always add primary DMX controller (Entec or mock) as default universe
     entec = get_entec_controller()
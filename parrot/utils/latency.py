@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Generic, Mapping, Optional, TypeVar
+
+import numpy as np
+from beartype import beartype
+
+T = TypeVar("T")
+
+# Stages recorded against a Frame's ``capture_time`` (seconds, perf_counter).
+STAGE_ANALYSIS = "analysis"
+STAGE_DIRECTOR_STEP = "director_step"
+STAGE_DMX_OUTPUT = "dmx_output"
+STAGE_VJ_RENDER = "vj_render"
+
+OUTPUT_OFFSET_ENV = {
+    "dmx": "DMX_OUTPUT_OFFSET_MS",
+    "vj": "VJ_OUTPUT_OFFSET_MS",
+}
+
+
+@beartype
+class LatencyTracker:
+    """Mic-to-photon latency, measured per pipeline stage.
+
+    Each stage records ``now - frame.capture_time`` where ``capture_time`` is
+    when the newest audio sample of the analysed block arrived. ``report()``
+    aggregates the last few hundred samples per stage.
+    """
+
+    def __init__(self, max_samples: int = 300):
+        self.samples: dict[str, deque] = defaultdict(lambda: deque(maxlen=max_samples))
+
+    def record(
+        self, stage: str, capture_time: Optional[float], now: Optional[float] = None
+    ) -> None:
+        if capture_time is None:
+            return
+        now = time.perf_counter() if now is None else now
+        self.samples[stage].append(max(0.0, now - capture_time))
+
+    def report(self) -> dict[str, dict[str, float | int]]:
+        report: dict[str, dict[str, float | int]] = {}
+        for stage, samples in self.samples.items():
+            if not samples:
+                continue
+            ms = np.array(samples) * 1000.0
+            report[stage] = {
+                "count": int(ms.size),
+                "mean_ms": round(float(ms.mean()), 2),
+                "p50_ms": round(float(np.percentile(ms, 50)), 2),
+                "p95_ms": round(float(np.percentile(ms, 95)), 2),
+                "max_ms": round(float(ms.max()), 2),
+            }
+        return report
+
+    def median_seconds(self, stage: str) -> Optional[float]:
+        samples = self.samples.get(stage)
+        if not samples:
+            return None
+        return float(np.median(np.array(samples)))
+
+    def reset(self) -> None:
+        self.samples.clear()
+
+
+@beartype
+def output_delays_seconds(
+    environ: Optional[Mapping[str, str]] = None,
+) -> dict[str, float]:
+    """Per-output delay from ``DMX_OUTPUT_OFFSET_MS`` / ``VJ_OUTPUT_OFFSET_MS``.
+
+    Offsets may be negative to advance an output relative to the others. We
+    cannot emit anything earlier than the pipeline produces it, so advancing
+    one output is realised by delaying every other output by that amount.
+    """
+    environ = os.environ if environ is None else environ
+    offsets = {
+        output: float(environ.get(env_name, "0") or 0.0) / 1000.0
+        for output, env_name in OUTPUT_OFFSET_ENV.items()
+    }
+    base = min(0.0, *offsets.values())
+    return {output: offset - base for output, offset in offsets.items()}
+
+
+@beartype
+class DelayLine(Generic[T]):
+    """Hold items for ``delay_seconds`` before releasing them (newest due wins).
+
+    Items a newer due item supersedes are dropped on ``push``, so the line
+    stays about one delay long even when nothing pops it. ``push`` and
+    ``pop_due`` may run on different threads (lighting vs render).
+    """
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = max(0.0, delay_seconds)
+        self._items: deque[tuple[float, T]] = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def push(self, item: T, now: Optional[float] = None) -> None:
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            self._items.append((now, item))
+            while (
+                len(self._items) > 1
+                and now - self._items[1][0] >= self.delay_seconds
+            ):
+                self._items.popleft()
+
+    def pop_due(self, now: Optional[float] = None) -> Optional[T]:
+        """Return the newest item that has waited long enough, dropping older ones."""
+        now = time.perf_counter() if now is None else now
+        due: Optional[T] = None
+        with self._lock:
+            while self._items and now - self._items[0][0] >= self.delay_seconds:
+                due = self._items.popleft()[1]
+        return due
+
+
+latency_tracker = LatencyTracker()
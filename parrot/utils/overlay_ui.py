@@ -1,5 +1,8 @@
 """Overlay UI for Party Parrot using ImGui"""
 
+from contextlib import AbstractContextManager, nullcontext
+from typing import Callable, Optional
+
 import imgui
 from imgui.integrations.pyglet import create_renderer
 from beartype import beartype
@@ -14,8 +17,17 @@ from parrot.venue_runtime import get_runtime_venues
 class OverlayUI:
     """ImGui overlay UI for mode selection and control"""
 
-    def __init__(self, pyglet_window, state: State):
+    def __init__(
+        self,
+        pyglet_window,
+        state: State,
+        dmx_telemetry: Optional[Callable[[], dict[str, dict[str, object]]]] = None,
+        lock: Optional[AbstractContextManager] = None,
+    ):
         self.state = state
+        self.dmx_telemetry = dmx_telemetry
+        # Held around each control's state change (the lighting pipeline lock)
+        self.lock = lock if lock is not None else nullcontext()
         self.visible = False
         self.pyglet_window = pyglet_window
         self._first_render = True
@@ -29,7 +41,7 @@ class OverlayUI:
 
         # UI dimensions (doubled from original 250x200, increased for venue/theme/vj_mode)
         self.window_width = 500
-        self.window_height = 630
+        self.window_height = 760
         self.button_width = 440
         self.button_height = 60
 
@@ -125,7 +137,8 @@ class OverlayUI:
                 if imgui.button(
                     mode.name.upper(), self.button_width, self.button_height
                 ):
-                    self.state.set_mode(mode)
+                    with self.lock:
+                        self.state.set_mode(mode)
                     print(f"🎵 Mode changed to: {mode.name}")
 
                 if is_selected:
@@ -144,7 +157,8 @@ class OverlayUI:
                 "##vj_mode", current_vj_mode_idx, vj_mode_names
             )
             if clicked and new_vj_mode_idx != current_vj_mode_idx:
-                self.state.set_vj_mode(vj_modes[new_vj_mode_idx])
+                with self.lock:
+                    self.state.set_vj_mode(vj_modes[new_vj_mode_idx])
                 print(f"🎬 VJ Mode changed to: {vj_mode_names[new_vj_mode_idx]}")
 
             imgui.spacing()
@@ -164,7 +178,8 @@ class OverlayUI:
                 "##venue", current_venue_idx, venue_names
             )
             if clicked and new_venue_idx != current_venue_idx:
-                self.state.set_venue(runtime_venues[new_venue_idx])
+                with self.lock:
+                    self.state.set_venue(runtime_venues[new_venue_idx])
                 print(f"🏛️  Venue changed to: {venue_names[new_venue_idx]}")
 
             imgui.spacing()
@@ -177,15 +192,38 @@ class OverlayUI:
                 "##theme", current_theme_idx, theme_names
             )
             if clicked and new_theme_idx != current_theme_idx:
-                self.state.set_theme(themes[new_theme_idx])
+                with self.lock:
+                    self.state.set_theme(themes[new_theme_idx])
                 print(f"🎨 Color scheme changed to: {theme_names[new_theme_idx]}")
 
+            if self.dmx_telemetry is not None:
+                imgui.spacing()
+                imgui.separator()
+                imgui.spacing()
+                self._render_dmx_telemetry()
+
         imgui.end()
 
         # Render ImGui
         imgui.render()
         self.renderer.render(imgui.get_draw_data())
 
+    def _render_dmx_telemetry(self):
+        """One line per universe: achieved Hz, jitter, write time, drops/reconnects."""
+        imgui.text("DMX Output")
+        for universe, stats in self.dmx_telemetry().items():
+            imgui.text(
+                f"{universe} ({stats['backend']}): "
+                f"{stats['achieved_hz']:.1f} Hz, "
+                f"jitter {stats['jitter_ms']:.1f} ms"
+            )
+            imgui.text(
+                f"  write {stats['last_write_ms']:.2f} ms "
+                f"(max {stats['max_write_ms']:.2f}), "
+                f"dropped {stats['dropped_frames']}, "
+                f"reconnects {stats['reconnect_attempts']}"
+            )
+
     def _render_mode_label(self):
         """Top-left, always-visible current lighting mode name at ~20pt."""
         # ImGui's default font is 13px; scale so the rendered text reads ~20pt.
@@ -0,0 +1,51 @@
+import pytest
+
+from parrot.utils.dmx_telemetry import UniverseTelemetry
+
+
+def test_achieved_hz_and_jitter_from_steady_cadence():
+    telemetry = UniverseTelemetry("Controller")
+    for i in range(31):
+        start = 10.0 + i / 30.0
+        telemetry.record_submit(start, start + 0.003, ok=True)
+
+    assert telemetry.achieved_hz() == pytest.approx(30.0, rel=1e-6)
+    assert telemetry.jitter_ms() == pytest.approx(0.0, abs=1e-6)
+    assert telemetry.snapshot()["last_write_ms"] == pytest.approx(3.0, abs=1e-3)
+
+
+def test_jitter_reflects_uneven_intervals():
+    telemetry = UniverseTelemetry("ArtNetController")
+    t = 0.0
+    for interval in [0.02, 0.04] * 10:
+        telemetry.record_submit(t, t, ok=True)
+        t += interval
+
+    assert telemetry.jitter_ms() == pytest.approx(10.0, rel=0.1)
+
+
+def test_rolling_window_drops_old_frames():
+    telemetry = UniverseTelemetry("Controller")
+    for i in range(10):
+        telemetry.record_submit(float(i) * 0.01, float(i) * 0.01, ok=True)
+    # A long stall pushes the early burst out of the window.
+    telemetry.record_submit(5.0, 5.0, ok=True)
+    telemetry.record_submit(5.5, 5.5, ok=True)
+
+    assert telemetry.achieved_hz() == pytest.approx(2.0)
+    assert telemetry.frames_sent == 12
+
+
+def test_write_histogram_buckets_and_drops():
+    telemetry = UniverseTelemetry("Controller")
+    telemetry.record_submit(0.0, 0.0002, ok=True)  # 0.2 ms
+    telemetry.record_submit(1.0, 1.003, ok=True)  # 3 ms
+    telemetry.record_submit(2.0, 2.100, ok=True)  # 100 ms, overflow bucket
+    telemetry.record_submit(3.0, 3.5, ok=False)
+
+    counts = telemetry.snapshot()["write_histogram_ms"]["counts"]
+    assert counts[0] == 1
+    assert counts[3] == 1
+    assert counts[-1] == 1
+    assert telemetry.dropped_frames == 1
+    assert telemetry.max_write_ms == pytest.approx(100.0)
@@ -327,3 +327,58 @@ class TestDmxUtils:
         assert len(snap) == 512
         assert snap[0] == 200
         assert snap[511] == 42
+
+    def test_switch_controller_records_submit_telemetry(self):
+        sc = SwitchController({Universe.default: MockDmxController()})
+        for _ in range(3):
+            sc.submit()
+        stats = sc.telemetry_snapshot()["default"]
+        assert stats["backend"] == "MockDmxController"
+        assert stats["frames_sent"] == 3
+        assert sum(stats["write_histogram_ms"]["counts"]) == 3
+        assert stats["dropped_frames"] == 0
+
+    def test_switch_controller_counts_dropped_frames_and_reconnects(self):
+        from serial.serialutil import SerialException
+
+        failing = Mock()
+        failing.submit.side_effect = SerialException("unplugged")
+        sc = SwitchController({Universe.default: failing})
+        sc._mark_entec_universe(Universe.default)
+
+        with patch(
+            "parrot.utils.dmx_utils.get_entec_controller",
+            return_value=MockDmxController(),
+        ):
+            sc.submit()
+
+        stats = sc.telemetry_snapshot()["default"]
+        assert stats["dropped_frames"] == 1
+        assert stats["reconnect_attempts"] == 1
+        assert stats["frames_sent"] == 0
+        assert stats["backend"] == "MockDmxController"
+
+    def test_snapshot_universes_while_another_thread_writes(self):
+        import threading
+
+        sc = SwitchController({Universe.default: MockDmxController()})
+        assert list(sc.snapshot_universes()) == ["default"]
+
+        stop = threading.Event()
+
+        def write():
+            while not stop.is_set():
+                sc.set_channel(1, 200, Universe.art1)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(1000):
+                sc.snapshot_universes()
+        finally:
+            stop.set()
+            writer.join()
+
+        snapshot = sc.snapshot_universes()
+        assert list(snapshot) == ["default", "art1"]
+        assert snapshot["art1"][0] == 200
@@ -0,0 +1,150 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from parrot.director.frame import Frame, FrameSignal
+from parrot.utils.dmx_utils import SwitchController, Universe
+from parrot.utils.latency import (
+    DelayLine,
+    LatencyTracker,
+    output_delays_seconds,
+)
+from parrot.utils.mock_controller import MockDmxController
+
+
+def test_latency_tracker_reports_per_stage_ms():
+    tracker = LatencyTracker()
+    for i in range(10):
+        tracker.record("dmx_output", capture_time=1.0, now=1.0 + 0.010 + i * 0.001)
+    tracker.record("vj_render", capture_time=None, now=5.0)
+
+    report = tracker.report()
+    assert set(report) == {"dmx_output"}
+    assert report["dmx_output"]["count"] == 10
+    assert report["dmx_output"]["p50_ms"] == pytest.approx(14.5, abs=0.01)
+    assert report["dmx_output"]["max_ms"] == pytest.approx(19.0, abs=0.01)
+
+
+def test_output_offsets_turn_advance_into_delay_of_other_outputs():
+    assert output_delays_seconds({}) == {"dmx": 0.0, "vj": 0.0}
+    assert output_delays_seconds({"DMX_OUTPUT_OFFSET_MS": "40"}) == pytest.approx(
+        {"dmx": 0.04, "vj": 0.0}
+    )
+    # Advancing the projector by 50 ms means holding DMX back by 50 ms.
+    assert output_delays_seconds({"VJ_OUTPUT_OFFSET_MS": "-50"}) == pytest.approx(
+        {"dmx": 0.05, "vj": 0.0}
+    )
+
+
+def test_delay_line_releases_newest_due_item():
+    line: DelayLine[str] = DelayLine(0.05)
+    line.push("a", now=0.00)
+    line.push("b", now=0.01)
+    line.push("c", now=0.04)
+
+    assert line.pop_due(now=0.03) is None
+    assert line.pop_due(now=0.065) == "b"
+    assert line.pop_due(now=0.2) == "c"
+    assert line.pop_due(now=0.3) is None
+
+
+def test_delay_line_stays_bounded_when_never_popped():
+    line: DelayLine[int] = DelayLine(0.05)
+    for i in range(1000):
+        line.push(i, now=i * 0.01)
+    assert len(line) <= 7
+    assert line.pop_due(now=999 * 0.01) == 994
+
+
+def test_delay_line_push_and_pop_on_separate_threads():
+    # The lighting thread pushes while the render thread pops; switch threads
+    # as often as possible so an unguarded check-then-popleft would race.
+    line: DelayLine[int] = DelayLine(1e-5)
+    errors: list[Exception] = []
+    stop = threading.Event()
+
+    def run(step):
+        try:
+            while not stop.is_set():
+                step()
+        except Exception as e:
+            errors.append(e)
+
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [
+        threading.Thread(target=run, args=(lambda: line.push(0),)),
+        threading.Thread(target=run, args=(line.pop_due,)),
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        deadline = time.perf_counter() + 2.0
+        while not errors and time.perf_counter() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(previous)
+
+    assert errors == []
+
+
+def test_failed_submit_records_no_latency(monkeypatch):
+    from parrot.utils import dmx_utils
+
+    class _Unplugged:
+        def set_channel(self, channel, value, universe=None):
+            pass
+
+        def submit(self):
+            raise OSError("unplugged")
+
+    tracker = LatencyTracker()
+    monkeypatch.setattr(dmx_utils, "latency_tracker", tracker)
+    sc = SwitchController({Universe.default: _Unplugged()})
+    sc.submit(capture_time=time.perf_counter())
+    assert tracker.report() == {}
+
+    sc.controller_map[Universe.default] = MockDmxController()
+    sc.submit(capture_time=time.perf_counter())
+    assert tracker.report()["dmx_output"]["count"] == 1
+
+
+def test_delayed_switch_controller_transmits_older_frame():
+    sent: list[int] = []
+
+    class _Backend:
+        def __init__(self):
+            self.values = [0] * 512
+
+        def set_channel(self, channel, value, universe=None):
+            self.values[channel - 1] = value
+
+        def submit(self):
+            sent.append(self.values[0])
+
+    sc = SwitchController({Universe.default: _Backend()}, output_delay_seconds=0.05)
+
+    sc.set_channel(1, 10)
+    sc.submit()
+    sc.set_channel(1, 20)
+    sc.submit()
+    assert sent == []
+
+    time.sleep(0.06)
+    sc.set_channel(1, 30)
+    sc.submit()
+
+    # The newest frame that has waited out the delay goes on the wire; the
+    # heatmap shadow still shows the live value.
+    assert sent == [20]
+    assert sc.snapshot_universe(Universe.default)[0] == 30
+
+
+def test_frame_scaling_keeps_capture_time():
+    frame = Frame({FrameSignal.freq_low: 1.0}, capture_time=12.5)
+    assert (frame * 0.5).capture_time == 12.5
@@ -0,0 +1,33 @@
+import threading
+
+from parrot.utils.triple_buffer import TripleBuffer
+
+
+def test_reader_gets_newest_and_keeps_it_until_the_next_publish():
+    buffer: TripleBuffer[str] = TripleBuffer("initial")
+    assert buffer.read() == "initial"
+    buffer.publish("a")
+    buffer.publish("b")
+    assert buffer.read() == "b"
+    assert buffer.read() == "b"
+    buffer.publish("c")
+    assert buffer.read() == "c"
+    assert buffer.published == 3
+
+
+def test_concurrent_reader_only_sees_increasing_values():
+    buffer: TripleBuffer[int] = TripleBuffer(0)
+
+    def write():
+        for i in range(1, 20001):
+            buffer.publish(i)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    seen = [buffer.read()]
+    while writer.is_alive():
+        seen.append(buffer.read())
+    writer.join()
+    seen.append(buffer.read())
+    assert seen == sorted(seen)
+    assert seen[-1] == 20000
@@ -0,0 +1,40 @@
+import threading
+from typing import Generic, TypeVar
+
+from beartype import beartype
+
+T = TypeVar("T")
+
+
+@beartype
+class TripleBuffer(Generic[T]):
+    """Hands the newest value from one writer thread to one reader thread.
+
+    The writer fills the back slot and ``publish`` swaps it with the middle
+    one; ``read`` swaps the middle slot to the front when something new was
+    published. The swaps are the only shared step, so neither side waits on
+    the other's work, the reader's front value is never the one being
+    written, and values published faster than they are read are skipped.
+    """
+
+    def __init__(self, initial: T):
+        self._slots: list[T] = [initial, initial, initial]
+        self._back, self._middle, self._front = 0, 1, 2
+        self._fresh = False
+        self._swap_lock = threading.Lock()
+        self.published = 0
+
+    def publish(self, value: T) -> None:
+        self._slots[self._back] = value
+        with self._swap_lock:
+            self._back, self._middle = self._middle, self._back
+            self._fresh = True
+            self.published += 1
+
+    def read(self) -> T:
+        """The newest published value (the previous one if nothing is new)."""
+        with self._swap_lock:
+            if self._fresh:
+                self._front, self._middle = self._middle, self._front
+                self._fresh = False
+        return self._slots[self._front]
@@ -38,6 +38,30 @@ def get_runtime_manual_group(state: State):
     return get_manual_group(state.venue)
 
 
+@beartype
+def runtime_slot_key(fixture: FixtureBase) -> str:
+    """Stable key for a logical fixture (survives runtime object replacement)."""
+    cid = getattr(fixture, "cloud_spec_id", None)
+    return str(cid) if cid is not None else fixture.id
+
+
+@beartype
+def runtime_leaf_fixtures(state: State) -> dict[str, FixtureBase]:
+    """Leaf fixtures of the live patch and manual group, by ``runtime_slot_key``."""
+    out: dict[str, FixtureBase] = {}
+    for item in get_runtime_fixtures(state):
+        if isinstance(item, FixtureGroup):
+            for fixture in item.fixtures:
+                out[runtime_slot_key(fixture)] = fixture
+        else:
+            out[runtime_slot_key(item)] = item
+    manual_group = get_runtime_manual_group(state)
+    if manual_group is not None:
+        for fixture in manual_group.fixtures:
+            out[runtime_slot_key(fixture)] = fixture
+    return out
+
+
 def get_runtime_venues(state: State):
     if state.available_venues:
         return state.available_venues
@@ -0,0 +1,128 @@
+"""Average colour of a texture via a tiny GPU reduction and async readback."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+# Reduction target edge; each texel averages a grid of taps over its cell.
+REDUCTION_SIZE = 4
+TAPS_PER_AXIS = 8
+
+_VERTEX_SHADER = """
+#version 330 core
+in vec2 in_position;
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+}
+"""
+
+_REDUCE_SHADER = f"""
+#version 330 core
+out vec3 color;
+uniform sampler2D source_texture;
+const int TAPS = {TAPS_PER_AXIS};
+const float CELLS = {float(REDUCTION_SIZE)};
+void main() {{
+    vec2 cell_origin = floor(gl_FragCoord.xy) / CELLS;
+    vec3 total = vec3(0.0);
+    for (int y = 0; y < TAPS; y++) {{
+        for (int x = 0; x < TAPS; x++) {{
+            vec2 offset = (vec2(x, y) + 0.5) / float(TAPS) / CELLS;
+            total += texture(source_texture, cell_origin + offset).rgb;
+        }}
+    }}
+    color = total / float(TAPS * TAPS);
+}}
+"""
+
+
+@beartype
+class AverageColorProbe:
+    """Tracks the mean RGB of a texture without a full-frame readback.
+
+    ``sample`` reduces the texture to a 4x4 target on the GPU every
+    ``interval_frames`` calls and starts an asynchronous readback of those
+    48 bytes into a pixel buffer; the next call maps it (the GPU finished it
+    a frame ago) and updates ``average``. In between, the last result is
+    reused. Returns None until the first readback lands.
+    """
+
+    def __init__(self, interval_frames: int = 4):
+        self.interval_frames = interval_frames
+        self.average: Optional[np.ndarray] = None
+        self._frames_until_capture = 0
+        self._pending = False
+        self._context: Optional[mgl.Context] = None
+        self._program: Optional[mgl.Program] = None
+        self._vbo: Optional[mgl.Buffer] = None
+        self._vao: Optional[mgl.VertexArray] = None
+        self._texture: Optional[mgl.Texture] = None
+        self._framebuffer: Optional[mgl.Framebuffer] = None
+        self._pixel_buffer: Optional[mgl.Buffer] = None
+
+    def sample(self, context: mgl.Context, texture: Any) -> Optional[np.ndarray]:
+        """RGB average in 0..1 (possibly a few frames old)."""
+        if context is not self._context:
+            self.release()
+            self._create_resources(context)
+
+        if self._pending:
+            raw = self._pixel_buffer.read()
+            texels = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+            self.average = texels.mean(axis=0) / 255.0
+            self._pending = False
+
+        self._frames_until_capture -= 1
+        if self._frames_until_capture <= 0:
+            self._capture(context, texture)
+            self._frames_until_capture = self.interval_frames
+        return self.average
+
+    def release(self) -> None:
+        for resource in (
+            self._vao,
+            self._vbo,
+            self._program,
+            self._framebuffer,
+            self._texture,
+            self._pixel_buffer,
+        ):
+            if resource is not None:
+                resource.release()
+        self._vao = self._vbo = self._program = None
+        self._framebuffer = self._texture = self._pixel_buffer = None
+        self._context = None
+        self._pending = False
+
+    def _capture(self, context: mgl.Context, texture: Any) -> None:
+        previous_framebuffer, previous_viewport = context.fbo, context.viewport
+        self._framebuffer.use()
+        context.viewport = (0, 0, REDUCTION_SIZE, REDUCTION_SIZE)
+        texture.use(0)
+        self._program["source_texture"] = 0
+        self._vao.render(mgl.TRIANGLE_STRIP)
+        self._framebuffer.read_into(self._pixel_buffer, components=3, alignment=1)
+        # Standalone (headless) contexts have no bound default framebuffer
+        if previous_framebuffer is not None:
+            previous_framebuffer.use()
+        context.viewport = previous_viewport
+        self._pending = True
+
+    def _create_resources(self, context: mgl.Context) -> None:
+        self._context = context
+        self._program = context.program(
+            vertex_shader=_VERTEX_SHADER, fragment_shader=_REDUCE_SHADER
+        )
+        quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype="f4")
+        self._vbo = context.buffer(quad.tobytes())
+        self._vao = context.vertex_array(
+            self._program, [(self._vbo, "2f", "in_position")]
+        )
+        size = (REDUCTION_SIZE, REDUCTION_SIZE)
+        self._texture = context.texture(size, 3)
+        self._framebuffer = context.framebuffer(color_attachments=[self._texture])
+        self._pixel_buffer = context.buffer(reserve=REDUCTION_SIZE * REDUCTION_SIZE * 3)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""Headless per-node VJ benchmark: ms/frame, GPU time, texture memory and GL
+allocations for every node and every VJMode scene, printed as a table.
+
+Runs on a standalone context, so a software rasterizer (llvmpipe) works on CI:
+
+    python -m parrot.vj.benchmark --frames 30 --sizes 640x360,1280x720
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame, FrameSignal
+from parrot.director.mode import Mode
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
+from parrot.utils.colour import Color
+from parrot.vj.nodes.beat_hue_shift import BeatHueShift
+from parrot.vj.nodes.black import Black
+from parrot.vj.nodes.bloom_filter import BloomFilter
+from parrot.vj.nodes.bright_glow import BrightGlow
+from parrot.vj.nodes.brightness_pulse import BrightnessPulse
+from parrot.vj.nodes.camera_shake import CameraShake
+from parrot.vj.nodes.camera_zoom import CameraZoom
+from parrot.vj.nodes.circle_rainbow_background import CircleRainbowBackground
+from parrot.vj.nodes.circular_mask import CircularMask
+from parrot.vj.nodes.color_strobe import ColorStrobe
+from parrot.vj.nodes.concert_stage import ConcertStage
+from parrot.vj.nodes.crt_mask import CRTMask
+from parrot.vj.nodes.datamosh_effect import DatamoshEffect
+from parrot.vj.nodes.glow_effect import GlowEffect
+from parrot.vj.nodes.hot_sparks_effect import HotSparksEffect
+from parrot.vj.nodes.infinite_zoom_effect import InfiniteZoomEffect
+from parrot.vj.nodes.laser_scan_heads import LaserScanHeads
+from parrot.vj.nodes.layer_compose import BlendMode, LayerCompose, LayerSpec
+from parrot.vj.nodes.mode_switch import gpu_bytes
+from parrot.vj.nodes.multiply_compose import MultiplyCompose
+from parrot.vj.nodes.noise_effect import NoiseEffect
+from parrot.vj.nodes.nyancat_background import NyancatBackground
+from parrot.vj.nodes.oscilloscope_effect import OscilloscopeEffect
+from parrot.vj.nodes.pixelate_effect import PixelateEffect
+from parrot.vj.nodes.rgb_shift_effect import RGBShiftEffect
+from parrot.vj.nodes.saturation_pulse import SaturationPulse
+from parrot.vj.nodes.scanlines_effect import ScanlinesEffect
+from parrot.vj.nodes.sepia_effect import SepiaEffect
+from parrot.vj.nodes.sparkle_field_effect import SparkleFieldEffect
+from parrot.vj.nodes.stage_blinders import StageBlinders
+from parrot.vj.nodes.static_color import StaticColor
+from parrot.vj.nodes.text_color_pulse import TextColorPulse
+from parrot.vj.nodes.text_renderer import TextRenderer
+from parrot.vj.nodes.vintage_film_mask import VintageFilmMask
+from parrot.vj.profiler import gpu_timer
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.vj_mode import VJMode
+
+DEFAULT_FRAMES = 30
+DEFAULT_SIZES = ((640, 360), (1280, 720), (1920, 1080))
+
+NodeFactory = Callable[[int, int], BaseInterpretationNode]
+
+# Context methods that allocate a GL object; counted while warm frames render
+_ALLOCATING_METHODS = (
+    "buffer",
+    "texture",
+    "depth_texture",
+    "texture_array",
+    "texture3d",
+    "renderbuffer",
+    "depth_renderbuffer",
+    "framebuffer",
+    "simple_framebuffer",
+    "vertex_array",
+    "simple_vertex_array",
+    "program",
+)
+
+
+def _source(width: int, height: int) -> BaseInterpretationNode:
+    """Input for post-process nodes: a flat colour costs next to nothing."""
+    return StaticColor(color=(0.8, 0.4, 0.2), width=width, height=height)
+
+
+# Generators take the size directly; post-process nodes take it from their
+# input, so each node's row measures that node at that size.
+NODE_FACTORIES: dict[str, NodeFactory] = {
+    "Black": lambda w, h: Black(width=w, height=h),
+    "StaticColor": _source,
+    "CircleRainbowBackground": lambda w, h: CircleRainbowBackground(w, h),
+    "NyancatBackground": lambda w, h: NyancatBackground(w, h),
+    "SparkleFieldEffect": lambda w, h: SparkleFieldEffect(w, h),
+    "HotSparksEffect": lambda w, h: HotSparksEffect(w, h),
+    "LaserScanHeads": lambda w, h: LaserScanHeads(w, h),
+    "StageBlinders": lambda w, h: StageBlinders(w, h),
+    "OscilloscopeEffect": lambda w, h: OscilloscopeEffect(w, h),
+    "ColorStrobe": lambda w, h: ColorStrobe(width=w, height=h),
+    "TextRenderer": lambda w, h: TextRenderer(text="parrot", width=w, height=h),
+    "BeatHueShift": lambda w, h: BeatHueShift(_source(w, h)),
+    "BloomFilter": lambda w, h: BloomFilter(_source(w, h)),
+    "BrightGlow": lambda w, h: BrightGlow(_source(w, h)),
+    "BrightnessPulse": lambda w, h: BrightnessPulse(_source(w, h)),
+    "CameraShake": lambda w, h: CameraShake(_source(w, h)),
+    "CameraZoom": lambda w, h: CameraZoom(_source(w, h)),
+    "CircularMask": lambda w, h: CircularMask(_source(w, h)),
+    "CRTMask": lambda w, h: CRTMask(_source(w, h)),
+    "DatamoshEffect": lambda w, h: DatamoshEffect(_source(w, h)),
+    "GlowEffect": lambda w, h: GlowEffect(_source(w, h)),
+    "InfiniteZoomEffect": lambda w, h: InfiniteZoomEffect(_source(w, h)),
+    "NoiseEffect": lambda w, h: NoiseEffect(_source(w, h)),
+    "PixelateEffect": lambda w, h: PixelateEffect(_source(w, h)),
+    "RGBShiftEffect": lambda w, h: RGBShiftEffect(_source(w, h)),
+    "SaturationPulse": lambda w, h: SaturationPulse(_source(w, h)),
+    "ScanlinesEffect": lambda w, h: ScanlinesEffect(_source(w, h)),
+    "SepiaEffect": lambda w, h: SepiaEffect(_source(w, h)),
+    "TextColorPulse": lambda w, h: TextColorPulse(_source(w, h)),
+    "VintageFilmMask": lambda w, h: VintageFilmMask(_source(w, h)),
+    "LayerCompose": lambda w, h: LayerCompose(
+        LayerSpec(_source(w, h)),
+        LayerSpec(SparkleFieldEffect(w, h), BlendMode.ADDITIVE),
+        width=w,
+        height=h,
+    ),
+    "MultiplyCompose": lambda w, h: MultiplyCompose(
+        _source(w, h), SparkleFieldEffect(w, h), width=w, height=h
+    ),
+}
+
+
+@beartype
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """One node (or scene) rendered ``frames`` warm frames at one size."""
+
+    name: str
+    width: int
+    height: int
+    frames: int
+    cold_ms: float  # enter + generate + first render, GPU work finished
+    ms_per_frame: float  # warm render wall time, GPU work finished
+    gpu_ms_per_frame: float  # warm render GPU time from timer queries
+    texture_bytes: int  # node-held GPU memory plus render targets pooled
+    allocations_per_frame: float  # GL objects created per warm frame
+
+
+@beartype
+def synthetic_frame(index: int) -> Frame:
+    """A deterministic frame with every signal moving, so beat-driven nodes
+    do their work."""
+    values = {}
+    for offset, signal in enumerate(FrameSignal):
+        values[signal] = 0.5 + 0.5 * math.sin(0.37 * index + offset)
+    return Frame(values)
+
+
+@contextmanager
+def _count_allocations(context: mgl.Context):
+    """Count GL object creations on ``context``; yields a one-item list."""
+    count = [0]
+
+    def counting(method):
+        def wrapper(*args, **kwargs):
+            count[0] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for name in _ALLOCATING_METHODS:
+        setattr(context, name, counting(getattr(context, name)))
+    try:
+        yield count
+    finally:
+        for name in _ALLOCATING_METHODS:
+            delattr(context, name)
+
+
+@beartype
+def benchmark_node(
+    context: mgl.Context,
+    name: str,
+    node: BaseInterpretationNode,
+    vibe: Vibe,
+    frames: int = DEFAULT_FRAMES,
+) -> BenchmarkResult:
+    """Enter ``node``, render ``frames`` warm frames and exit it again."""
+    random.seed(0)
+    np.random.seed(0)
+    scheme = ColorScheme(Color("white"), Color("black"), Color("red"))
+    pool = render_target_pool(context)
+    timer = gpu_timer(context)
+    pool.clear()
+    # Nodes restore whatever was bound; make that a target of our own rather
+    # than one freed with the previous node
+    home = context.simple_framebuffer((1, 1))
+    home.use()
+
+    start = time.perf_counter()
+    node.enter_recursive(context)
+    node.generate_recursive(vibe)
+    output = node.render(synthetic_frame(0), scheme, context)
+    context.finish()
+    cold_ms = 1000 * (time.perf_counter() - start)
+    width, height = output.size if output is not None else (0, 0)
+    pool.release(output)
+    pool.end_frame()
+
+    with _count_allocations(context) as allocations:
+        start = time.perf_counter()
+        for index in range(1, frames + 1):
+            with timer.section(name):
+                output = node.render(synthetic_frame(index), scheme, context)
+            pool.release(output)
+            pool.end_frame()
+        context.finish()
+        wall_seconds = time.perf_counter() - start
+    gpu_seconds = sum(frame.gpu_seconds for frame in timer.collect(wait=True))
+
+    texture_bytes = gpu_bytes(node) + pool.stats()["allocated_bytes"]
+    node.exit_recursive()
+    pool.clear()
+    home.release()
+    warm = max(1, frames)
+    return BenchmarkResult(
+        name=name,
+        width=width,
+        height=height,
+        frames=frames,
+        cold_ms=cold_ms,
+        ms_per_frame=1000 * wall_seconds / warm,
+        gpu_ms_per_frame=1000 * gpu_seconds / warm,
+        texture_bytes=texture_bytes,
+        allocations_per_frame=allocations[0] / warm,
+    )
+
+
+@beartype
+def benchmark_nodes(
+    context: mgl.Context,
+    sizes: tuple[tuple[int, int], ...] = DEFAULT_SIZES,
+    frames: int = DEFAULT_FRAMES,
+    only: Optional[str] = None,
+) -> list[BenchmarkResult]:
+    results = []
+    for name, factory in NODE_FACTORIES.items():
+        if only and only.lower() not in name.lower():
+            continue
+        for width, height in sizes:
+            node = factory(width, height)
+            results.append(
+                benchmark_node(context, name, node, Vibe(Mode.rave), frames)
+            )
+    return results
+
+
+@beartype
+def benchmark_scenes(
+    context: mgl.Context, frames: int = DEFAULT_FRAMES, only: Optional[str] = None
+) -> list[BenchmarkResult]:
+    """The full ConcertStage in each VJMode, at its own output size."""
+    results = []
+    for vj_mode in VJMode:
+        name = f"scene:{vj_mode.name}"
+        if only and only.lower() not in name.lower():
+            continue
+        stage = ConcertStage()
+        results.append(benchmark_node(context, name, stage, Vibe(vj_mode), frames))
+    return results
+
+
+@beartype
+def format_table(results: list[BenchmarkResult]) -> str:
+    header = (
+        f"{'Node':<28} {'Size':>10} {'Cold(ms)':>9} {'ms/frame':>9} "
+        f"{'GPU ms':>8} {'Tex(MB)':>8} {'Allocs/f':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<28} {f'{r.width}x{r.height}':>10} {r.cold_ms:>9.1f} "
+            f"{r.ms_per_frame:>9.2f} {r.gpu_ms_per_frame:>8.2f} "
+            f"{r.texture_bytes / (1024 * 1024):>8.1f} "
+            f"{r.allocations_per_frame:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_sizes(text: str) -> tuple[tuple[int, int], ...]:
+    sizes = []
+    for item in text.split(","):
+        width, height = item.lower().split("x")
+        sizes.append((int(width), int(height)))
+    return tuple(sizes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=DEFAULT_SIZES,
+        help="Comma-separated WxH list for node rows (scenes use their own size)",
+    )
+    parser.add_argument("--only", help="Only rows whose name contains this")
+    parser.add_argument("--no-scenes", action="store_true")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    try:
+        context = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        context = mgl.create_context(standalone=True)
+    print(f"GL renderer: {context.info['GL_RENDERER']}")
+
+    results = benchmark_nodes(context, args.sizes, args.frames, args.only)
+    if not args.no_scenes:
+        results += benchmark_scenes(context, args.frames, args.only)
+    print(format_table(results))
+    if args.json:
+        with open(args.json, "w") as out:
+            json.dump([asdict(r) for r in results], out, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Bloom through a dual Kawase mip chain, shared by every node that glows."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.shaders import dual_kawase
+
+# Half, quarter, eighth and sixteenth resolution: a ~30 px glow at 1080p
+DEFAULT_LEVELS = 4
+
+
+@beartype
+class DualKawaseBloom:
+    """Blurs a texture by downsampling it through half, quarter, eighth...
+    resolution targets and filtering back up the same chain.
+
+    Every pass after the first runs at a quarter of the previous one's pixel
+    count or less, so the whole blur costs about as much as one pass at
+    half resolution however wide the glow is. ``spread`` scales the tap
+    offsets; ``threshold`` bright-passes the source on the first step.
+
+    ``blur`` returns the glow: ``target`` when given (the last upsample
+    writes straight into it), otherwise a half-resolution framebuffer
+    borrowed from the context's ``RenderTargetPool`` that the caller
+    releases once sampled. Linear filtering lets a composite sample the
+    half-resolution glow directly. Intermediates come from the pool too, so
+    nodes blooming at the same size share them.
+    """
+
+    def __init__(
+        self, levels: int = DEFAULT_LEVELS, spread: float = 1.0, dtype: str = "f2"
+    ):
+        self.levels = levels
+        self.spread = spread
+        self.dtype = dtype
+        self._context: Optional[mgl.Context] = None
+        self._down_program: Optional[mgl.Program] = None
+        self._up_program: Optional[mgl.Program] = None
+        self._vbo: Optional[mgl.Buffer] = None
+        self._down_vao: Optional[mgl.VertexArray] = None
+        self._up_vao: Optional[mgl.VertexArray] = None
+
+    def blur(
+        self,
+        context: mgl.Context,
+        source: Any,
+        threshold: float = 0.0,
+        target: Optional[mgl.Framebuffer] = None,
+    ) -> mgl.Framebuffer:
+        if context is not self._context:
+            self.release()
+            self._create_resources(context)
+
+        pool = render_target_pool(context)
+        width, height = source.size
+        chain = []
+        while len(chain) < max(1, self.levels) and min(width, height) >= 2:
+            width, height = width // 2, height // 2
+            chain.append(pool.acquire(width, height, 3, self.dtype))
+
+        current = source
+        for level, framebuffer in enumerate(chain):
+            self._down_program["threshold"] = threshold if level == 0 else 0.0
+            self._draw(self._down_program, self._down_vao, current, framebuffer)
+            current = framebuffer.color_attachments[0]
+        for framebuffer in reversed(chain[:-1]):
+            self._draw(self._up_program, self._up_vao, current, framebuffer)
+            current = framebuffer.color_attachments[0]
+
+        result = chain[0] if chain else target
+        if target is not None:
+            self._draw(self._up_program, self._up_vao, current, target)
+            result = target
+        for framebuffer in chain:
+            if framebuffer is not result:
+                pool.release(framebuffer)
+        assert result is not None, "source too small to blur without a target"
+        return result
+
+    def release(self) -> None:
+        for resource in (self._down_vao, self._up_vao, self._vbo):
+            if resource is not None:
+                resource.release()
+        release_program(self._down_program)
+        release_program(self._up_program)
+        self._down_vao = self._up_vao = self._vbo = None
+        self._down_program = self._up_program = None
+        self._context = None
+
+    def _draw(
+        self,
+        program: mgl.Program,
+        vao: mgl.VertexArray,
+        texture: Any,
+        framebuffer: mgl.Framebuffer,
+    ) -> None:
+        framebuffer.use()
+        texture.use(0)
+        width, height = texture.size
+        program["inputTexture"] = 0
+        program["halfPixel"] = (0.5 * self.spread / width, 0.5 * self.spread / height)
+        vao.render(mgl.TRIANGLE_STRIP)
+
+    def _create_resources(self, context: mgl.Context) -> None:
+        self._context = context
+        cache = program_cache(context)
+        self._down_program = cache.acquire(
+            dual_kawase.get_vertex_shader(), dual_kawase.get_downsample_shader()
+        )
+        self._up_program = cache.acquire(
+            dual_kawase.get_vertex_shader(), dual_kawase.get_upsample_shader()
+        )
+        quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype="f4")
+        self._vbo = context.buffer(quad.tobytes())
+        self._down_vao = context.vertex_array(
+            self._down_program, [(self._vbo, "2f", "in_position")]
+        )
+        self._up_vao = context.vertex_array(
+            self._up_program, [(self._vbo, "2f", "in_position")]
+        )
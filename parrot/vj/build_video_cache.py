@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Pre-transcode media/videos clips to the VJ output size for VideoPlayer."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from parrot.vj.constants import DEFAULT_FPS, DEFAULT_HEIGHT, DEFAULT_WIDTH
+from parrot.vj.utils.video_cache import CACHE_ROOT, VIDEO_ROOT, VideoCache
+
+
+def build_video_cache(
+    groups: list[str] | None = None,
+    width: int = DEFAULT_WIDTH,
+    height: int = DEFAULT_HEIGHT,
+    fps: float | int = DEFAULT_FPS,
+    max_seconds: float | None = None,
+    video_root: str = VIDEO_ROOT,
+    cache_root: str = CACHE_ROOT,
+    force: bool = False,
+) -> dict[str, int]:
+    """Transcode new or changed clips; returns built/skipped/failed/pruned counts."""
+    cache = VideoCache(video_root, cache_root)
+    counts = {"built": 0, "skipped": 0, "failed": 0, "pruned": 0}
+    for source in cache.sources(groups):
+        if not force and cache.is_current(source, width, height, fps):
+            counts["skipped"] += 1
+            continue
+        start = time.perf_counter()
+        index = cache.build(source, width, height, fps, max_seconds)
+        if index is None:
+            print(f"Error: Could not open video {source}")
+            counts["failed"] += 1
+            continue
+        counts["built"] += 1
+        print(
+            f"{source}: {index.frame_count} frames "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+    counts["pruned"] = len(cache.prune())
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("groups", nargs="*", help="fn_groups to build (default: all)")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH)
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT)
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Only cache the first N seconds of each clip (raw frames are large)",
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild every clip")
+    args = parser.parse_args()
+    counts = build_video_cache(
+        groups=args.groups or None,
+        width=args.width,
+        height=args.height,
+        fps=args.fps,
+        max_seconds=args.max_seconds,
+        force=args.force,
+    )
+    print(", ".join(f"{count} {name}" for name, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
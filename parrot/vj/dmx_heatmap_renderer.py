@@ -1,39 +1,58 @@
-"""512-channel DMX grid heatmap (32×16) for the desktop GL editor."""
+"""DMX heatmap for the desktop GL editor: every universe as a 32×16 grid.
+
+All universes' channel values go up as one R8 texture (512 × universes) per
+frame; a single fragment shader lays out the grids, colours the cells and
+prints each value with digit glyphs from the shared glyph atlas. Universe
+names and row-start addresses are atlas glyph quads rebuilt only when the
+layout changes, so a frame costs one small upload whatever the values.
+"""
 
 from __future__ import annotations
 
-import colorsys
+import math
 import os
 import struct
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 
 import moderngl as mgl
+import numpy as np
 from beartype import beartype
 from PIL import Image, ImageDraw, ImageFont
 
+from parrot.vj.glyph_atlas import AtlasFont, GlyphAtlas, GlyphBatch, glyph_atlas
+from parrot.vj.program_cache import program_cache, release_program
+
 GRID_W = 32
 GRID_H = 16
+CHANNELS = GRID_W * GRID_H
 
 # Top band as a fraction of framebuffer height (title + subtitle).
 HEADER_HEIGHT_FRAC = 0.11
 
-# Grid quad in NDC: shrink and center below the header (1 = full width/height of grid band).
-HEATMAP_NDC_SCALE = 0.68
+# Share of the band below the header given to the universe grids (centred).
+HEATMAP_AREA_FRAC = 0.9
 
 # Per-cell: fraction of cell left as background gap on each side (square fill is centered).
 CELL_GAP_FRAC = 0.09
 
-# Fraction of the heatmap quad reserved on the left for row-start address labels
-# (e.g. "1", "33", "65", …). The 32 data cells sit in the remaining width.
+# Fraction of each universe block reserved on the left for row-start address
+# labels (e.g. "1", "33", "65", …) and on top for the universe name.
 ROW_HEADER_WIDTH_FRAC = 0.07
+TITLE_HEIGHT_FRAC = 0.09
+# Space between universe blocks, as a fraction of a block
+BLOCK_GAP_FRAC = 0.04
 
+# Labels are rasterized once at this size and scaled to fit the layout.
+LABEL_FONT_PX = 32
+# Below this height (pixels) cell values and row labels are left out
+MIN_TEXT_PX = 6.0
 
-def _channel_rgb(value: int) -> tuple[float, float, float]:
-    x = max(0, min(255, int(value))) / 255.0
-    r, g, b = colorsys.hsv_to_rgb((1.0 - x) * (220.0 / 360.0), 0.82, 0.15 + 0.85 * x)
-    return (r, g, b)
+_BG_COLOR = (0.02, 0.02, 0.06)
+_LABEL_COLOR = (190 / 255, 196 / 255, 220 / 255)
 
 
-def _pick_font(size: int) -> ImageFont.ImageFont:
+def _pick_font(size: int) -> AtlasFont:
     for path in (
         "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
         "/System/Library/Fonts/Supplemental/Arial.ttf",
@@ -42,7 +61,7 @@ def _pick_font(size: int) -> ImageFont.ImageFont:
     ):
         if os.path.exists(path):
             return ImageFont.truetype(path, size)
-    return ImageFont.load_default()
+    return ImageFont.load_default(size)
 
 
 def _build_header_rgb_image(width: int, header_h: int) -> Image.Image:
@@ -80,177 +99,278 @@ def _build_header_rgb_image(width: int, header_h: int) -> Image.Image:
     return img.transpose(Image.FLIP_TOP_BOTTOM)
 
 
-def _build_overlay_rgba_image(
-    overlay_w: int,
-    overlay_h: int,
-    row_header_w: int,
-    snapshot_512: list[int],
-) -> Image.Image:
-    """RGBA overlay drawn over the heatmap quad: row-start addresses + per-cell values.
+@beartype
+@dataclass(frozen=True)
+class HeatmapLayout:
+    """Universe blocks in pixels, y down from the top of the framebuffer.
 
-    The overlay reserves ``row_header_w`` pixels on the left for the row labels
-    (DMX start address of each row: 1, 33, 65, …, 481) and lays out the 32×16
-    cells in the remaining width. Cells are transparent so the GL heatmap shows
-    through; only the white digit glyphs and the dim gutter background paint.
+    Blocks fill ``columns`` × ``rows`` row-major from ``origin``; each has a
+    title band and a row-label gutter before its 32×16 cells.
     """
-    img = Image.new("RGBA", (max(1, overlay_w), max(1, overlay_h)), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    # Dim background strip behind the row labels so the text stays readable
-    # regardless of what's happening on the GL heatmap behind it.
-    if row_header_w > 0:
-        draw.rectangle(
-            [(0, 0), (row_header_w - 1, overlay_h - 1)],
-            fill=(10, 12, 20, 220),
+    columns: int
+    rows: int
+    origin: tuple[float, float]
+    block: tuple[float, float]
+    title_height: float
+    gutter_width: float
+    cell: tuple[float, float]
+
+
+@beartype
+def heatmap_layout(universe_count: int, width: int, height: int) -> HeatmapLayout:
+    """The block grid that gives ``universe_count`` grids the largest cells."""
+    header_h = max(1, int(round(height * HEADER_HEIGHT_FRAC)))
+    area_w = width * HEATMAP_AREA_FRAC
+    area_h = (height - header_h) * HEATMAP_AREA_FRAC
+    count = max(1, universe_count)
+
+    def cell_for(columns: int) -> tuple[float, float]:
+        rows = math.ceil(count / columns)
+        block_w = area_w / columns * (1.0 - BLOCK_GAP_FRAC)
+        block_h = area_h / rows * (1.0 - BLOCK_GAP_FRAC)
+        return (
+            block_w * (1.0 - ROW_HEADER_WIDTH_FRAC) / GRID_W,
+            block_h * (1.0 - TITLE_HEIGHT_FRAC) / GRID_H,
         )
 
-    grid_w_px = max(1, overlay_w - row_header_w)
-    cell_w = grid_w_px / float(GRID_W)
-    cell_h = overlay_h / float(GRID_H)
-
-    # Per-cell value font: target ~55% of cell height, clamped so 3 digits
-    # still fit horizontally inside one cell with a small padding.
-    value_font_px = max(7, int(min(cell_h * 0.55, cell_w * 0.42)))
-    value_font = _pick_font(value_font_px)
-
-    # Row labels target the full row height; clamp to the gutter width too.
-    row_font_px = max(8, int(min(cell_h * 0.50, row_header_w * 0.62)))
-    row_font = _pick_font(row_font_px)
-
-    for row in range(GRID_H):
-        # DMX addresses are 1-based; row 0 starts at channel 1, row 1 at 33, etc.
-        start_addr = row * GRID_W + 1
-        if row_header_w > 0:
-            draw.text(
-                (row_header_w - max(2, row_header_w // 8), int((row + 0.5) * cell_h)),
-                str(start_addr),
-                font=row_font,
-                fill=(190, 196, 220, 255),
-                anchor="rm",
-            )
+    columns = max(range(1, count + 1), key=lambda c: min(cell_for(c)))
+    rows = math.ceil(count / columns)
+    block = (area_w / columns, area_h / rows)
+    inner_w = block[0] * (1.0 - BLOCK_GAP_FRAC)
+    inner_h = block[1] * (1.0 - BLOCK_GAP_FRAC)
+    return HeatmapLayout(
+        columns=columns,
+        rows=rows,
+        origin=((width - area_w) / 2, header_h + (height - header_h - area_h) / 2),
+        block=block,
+        title_height=inner_h * TITLE_HEIGHT_FRAC,
+        gutter_width=inner_w * ROW_HEADER_WIDTH_FRAC,
+        cell=cell_for(columns),
+    )
 
-        for col in range(GRID_W):
-            idx = row * GRID_W + col
-            if idx >= 512:
-                break
-            value = snapshot_512[idx] if idx < len(snapshot_512) else 0
-            cx = row_header_w + (col + 0.5) * cell_w
-            cy = (row + 0.5) * cell_h
-            # Brighter values get darker text (yellow on bright BG would wash out);
-            # dim cells get bright white text. The cutoff matches the cell's
-            # luminance from _channel_rgb so digits stay legible across the ramp.
-            ink = (16, 18, 28, 255) if value >= 170 else (244, 248, 255, 230)
-            draw.text(
-                (cx, cy),
-                str(int(value)),
-                font=value_font,
-                fill=ink,
-                anchor="mm",
-            )
 
-    # OpenGL expects first row = bottom of image for upload without UV flip.
-    return img.transpose(Image.FLIP_TOP_BOTTOM)
+_VERTEX_SHADER = """
+#version 330
+in vec2 in_pos;
+in vec2 in_uv;
+out vec2 v_uv;
+void main() {
+    gl_Position = vec4(in_pos, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+# Cells and their values. Pixel coordinates run y down from the top of the
+# framebuffer, like the layout; ``digits`` holds each digit's atlas texel
+# rect and ``digit_offsets`` its left / top relative to the pen on the
+# baseline, all scaled by ``digit_scale`` into pixels.
+_CELLS_FRAGMENT = """
+#version 330
+out vec4 out_color;
+uniform sampler2D dmx_values;
+uniform sampler2D glyph_atlas;
+uniform int universe_count;
+uniform int columns;
+uniform float target_height;
+uniform vec2 origin;
+uniform vec2 block;
+uniform vec2 label_space;
+uniform vec2 cell;
+uniform float cell_gap;
+uniform vec4 digits[10];
+uniform vec2 digit_offsets[10];
+uniform float digit_advance;
+uniform float digit_top;
+uniform float digit_height;
+uniform float digit_scale;
+
+vec3 hsv2rgb(vec3 c) {
+    vec3 p = abs(fract(c.xxx + vec3(1.0, 2.0 / 3.0, 1.0 / 3.0)) * 6.0 - 3.0);
+    return c.z * mix(vec3(1.0), clamp(p - 1.0, 0.0, 1.0), c.y);
+}
+
+float digit_coverage(int value, vec2 p) {
+    int count = value >= 100 ? 3 : (value >= 10 ? 2 : 1);
+    vec2 q = p / digit_scale
+        + vec2(float(count) * digit_advance * 0.5, digit_height * 0.5);
+    int index = int(floor(q.x / digit_advance));
+    if (q.y < 0.0 || q.y >= digit_height || q.x < 0.0 || index >= count) {
+        return 0.0;
+    }
+    int power = count - 1 - index;
+    int digit = (value / (power == 2 ? 100 : (power == 1 ? 10 : 1))) % 10;
+    vec4 rect = digits[digit];
+    vec2 glyph = vec2(
+        q.x - float(index) * digit_advance - digit_offsets[digit].x,
+        q.y + digit_top - digit_offsets[digit].y
+    );
+    vec2 size = rect.zw - rect.xy;
+    if (any(lessThan(glyph, vec2(0.0))) || any(greaterThanEqual(glyph, size))) {
+        return 0.0;
+    }
+    vec2 atlas_size = vec2(textureSize(glyph_atlas, 0));
+    return texture(glyph_atlas, (rect.xy + glyph) / atlas_size).r;
+}
+
+void main() {
+    vec2 p = vec2(gl_FragCoord.x, target_height - gl_FragCoord.y) - origin;
+    ivec2 block_index = ivec2(floor(p / block));
+    int universe = block_index.y * columns + block_index.x;
+    if (p.x < 0.0 || p.y < 0.0 || block_index.x >= columns
+            || universe >= universe_count) {
+        discard;
+    }
+    vec2 local = p - vec2(block_index) * block - label_space;
+    vec2 grid = local / cell;
+    if (any(lessThan(grid, vec2(0.0))) || grid.x >= 32.0 || grid.y >= 16.0) {
+        discard;
+    }
+    vec2 f = fract(grid);
+    if (any(lessThan(f, vec2(cell_gap))) || any(greaterThan(f, vec2(1.0 - cell_gap)))) {
+        discard;
+    }
+    ivec2 c = ivec2(grid);
+    int channel = c.y * 32 + c.x;
+    float level = texelFetch(dmx_values, ivec2(channel, universe), 0).r;
+    int value = int(level * 255.0 + 0.5);
+    float x = float(value) / 255.0;
+    vec3 color = hsv2rgb(vec3((1.0 - x) * (220.0 / 360.0), 0.82, 0.15 + 0.85 * x));
+    if (digit_scale > 0.0) {
+        // Bright cells get dark digits so they stay legible across the ramp
+        vec4 ink = value >= 170
+            ? vec4(0.063, 0.071, 0.11, 1.0)
+            : vec4(0.957, 0.973, 1.0, 0.9);
+        float coverage = digit_coverage(value, (f - 0.5) * cell);
+        color = mix(color, ink.rgb, coverage * ink.a);
+    }
+    out_color = vec4(color, 1.0);
+}
+"""
+
+_HEADER_FRAGMENT = """
+#version 330
+in vec2 v_uv;
+out vec3 out_color;
+uniform sampler2D header_tex;
+void main() {
+    out_color = texture(header_tex, v_uv).rgb;
+}
+"""
+
+_LABEL_VERTEX = """
+#version 330
+in vec2 in_corner;
+in vec4 in_rect;
+in vec4 in_uv;
+uniform vec2 target_size;
+uniform sampler2D glyph_atlas;
+out vec2 uv;
+void main() {
+    vec2 position = mix(in_rect.xy, in_rect.zw, in_corner) / target_size;
+    gl_Position = vec4(position.x * 2.0 - 1.0, 1.0 - position.y * 2.0, 0.0, 1.0);
+    uv = mix(in_uv.xy, in_uv.zw, in_corner) / vec2(textureSize(glyph_atlas, 0));
+}
+"""
+
+_LABEL_FRAGMENT = """
+#version 330
+in vec2 uv;
+out vec4 out_color;
+uniform sampler2D glyph_atlas;
+uniform vec3 text_color;
+void main() {
+    out_color = vec4(text_color, texture(glyph_atlas, uv).r);
+}
+"""
+
+
+@beartype
+def _placed_quads(
+    atlas: GlyphAtlas, text: str, scale: float, x: float, baseline: float
+) -> np.ndarray:
+    """Quads for ``text`` scaled and centred on ``x`` at ``baseline``."""
+    quads = atlas.layout(text).quads.copy()
+    quads[:, [0, 2]] = quads[:, [0, 2]] * scale + x
+    quads[:, [1, 3]] = quads[:, [1, 3]] * scale + baseline
+    return quads
 
 
 @beartype
 class DmxHeatmapRenderer:
-    """Renders a single-universe DMX snapshot to an offscreen RGB framebuffer."""
+    """Renders DMX universes' snapshots to an offscreen RGB framebuffer."""
 
     def __init__(self) -> None:
         self._ctx: mgl.Context | None = None
         self._prog: mgl.Program | None = None
         self._header_prog: mgl.Program | None = None
-        self._overlay_prog: mgl.Program | None = None
+        self._label_prog: mgl.Program | None = None
         self._vao: mgl.VertexArray | None = None
         self._header_vao: mgl.VertexArray | None = None
-        self._overlay_vao: mgl.VertexArray | None = None
         self._vbo: mgl.Buffer | None = None
         self._header_vbo: mgl.Buffer | None = None
-        self._overlay_vbo: mgl.Buffer | None = None
+        self._labels: GlyphBatch | None = None
+        self._atlas: GlyphAtlas | None = None
         self._data_tex: mgl.Texture | None = None
         self._header_tex: mgl.Texture | None = None
-        self._overlay_tex: mgl.Texture | None = None
         self._out_tex: mgl.Texture | None = None
         self._fbo: mgl.Framebuffer | None = None
+        self._data = np.zeros((0, CHANNELS), dtype=np.uint8)
         self._width = 0
         self._height = 0
         self._cached_header_key: tuple[int, int] | None = None
-        # Cache key for the overlay texture: (overlay_w, overlay_h, row_header_w,
-        # tuple(snapshot)). The overlay is expensive to redraw on the CPU so we
-        # skip the rebuild whenever the DMX values haven't moved.
-        self._cached_overlay_key: tuple[int, int, int, tuple[int, ...]] | None = None
+        # Labels depend only on the universe names and the framebuffer size
+        self._cached_label_key: tuple[tuple[str, ...], int, int] | None = None
+        self._layout: HeatmapLayout | None = None
 
     def enter(self, context: mgl.Context) -> None:
         self._ctx = context
-        vertex = """
-        #version 330
-        in vec2 in_pos;
-        in vec2 in_uv;
-        out vec2 v_uv;
-        void main() {
-            gl_Position = vec4(in_pos, 0.0, 1.0);
-            v_uv = in_uv;
-        }
-        """
-        fragment = """
-        #version 330
-        in vec2 v_uv;
-        out vec3 out_color;
-        uniform sampler2D data_tex;
-        uniform vec2 grid_size;
-        uniform vec3 bg_color;
-        uniform float cell_gap;
-        void main() {
-            // Match PIL/header orientation: CPU row 0 is top of grid; GL v_uv.y=0 is bottom of quad.
-            vec2 uv = vec2(v_uv.x, 1.0 - v_uv.y);
-            vec2 cell = floor(uv * grid_size);
-            vec2 f = fract(uv * grid_size);
-            if (f.x < cell_gap || f.x > 1.0 - cell_gap || f.y < cell_gap || f.y > 1.0 - cell_gap) {
-                out_color = bg_color;
-            } else {
-                vec2 center = (cell + 0.5) / grid_size;
-                out_color = texture(data_tex, center).rgb;
-            }
-        }
-        """
-        self._prog = context.program(vertex_shader=vertex, fragment_shader=fragment)
-        header_fragment = """
-        #version 330
-        in vec2 v_uv;
-        out vec3 out_color;
-        uniform sampler2D header_tex;
-        void main() {
-            out_color = texture(header_tex, v_uv).rgb;
-        }
-        """
-        self._header_prog = context.program(
-            vertex_shader=vertex, fragment_shader=header_fragment
+        cache = program_cache(context)
+        self._prog = cache.acquire(
+            vertex_shader=_VERTEX_SHADER, fragment_shader=_CELLS_FRAGMENT
+        )
+        self._header_prog = cache.acquire(
+            vertex_shader=_VERTEX_SHADER, fragment_shader=_HEADER_FRAGMENT
         )
-        # Alpha-blended overlay for per-cell DMX values + row-start address labels.
-        overlay_fragment = """
-        #version 330
-        in vec2 v_uv;
-        out vec4 out_color;
-        uniform sampler2D overlay_tex;
-        void main() {
-            out_color = texture(overlay_tex, v_uv);
-        }
-        """
-        self._overlay_prog = context.program(
-            vertex_shader=vertex, fragment_shader=overlay_fragment
+        self._label_prog = cache.acquire(
+            vertex_shader=_LABEL_VERTEX, fragment_shader=_LABEL_FRAGMENT
         )
+        self._labels = GlyphBatch(self._label_prog)
+        self._atlas = glyph_atlas(context, _pick_font(LABEL_FONT_PX))
         self._vbo = context.buffer(reserve=64)
         self._header_vbo = context.buffer(reserve=64)
-        self._overlay_vbo = context.buffer(reserve=64)
-        self._vao = context.vertex_array(
-            self._prog, [(self._vbo, "2f 2f", "in_pos", "in_uv")]
-        )
+        self._write_quad_vbo(self._vbo, -1.0, -1.0, 1.0, 1.0)
+        # The cell shader works in framebuffer pixels, so it skips the uvs
+        self._vao = context.vertex_array(self._prog, [(self._vbo, "2f 8x", "in_pos")])
         self._header_vao = context.vertex_array(
             self._header_prog, [(self._header_vbo, "2f 2f", "in_pos", "in_uv")]
         )
-        self._overlay_vao = context.vertex_array(
-            self._overlay_prog, [(self._overlay_vbo, "2f 2f", "in_pos", "in_uv")]
-        )
+
+    def exit(self) -> None:
+        """Release GL resources; the shared glyph atlas stays with the context."""
+        if self._labels is not None:
+            self._labels.release()
+        for resource in (
+            self._vao,
+            self._header_vao,
+            self._vbo,
+            self._header_vbo,
+            self._data_tex,
+            self._header_tex,
+            self._fbo,
+            self._out_tex,
+        ):
+            if resource is not None:
+                resource.release()
+        for program in (self._prog, self._header_prog, self._label_prog):
+            release_program(program)
+        self._prog = self._header_prog = self._label_prog = None
+        self._vao = self._header_vao = self._vbo = self._header_vbo = None
+        self._data_tex = self._header_tex = self._out_tex = self._fbo = None
+        self._labels = self._atlas = self._layout = self._ctx = None
+        self._data = np.zeros((0, CHANNELS), dtype=np.uint8)
+        self._width = self._height = 0
+        self._cached_header_key = self._cached_label_key = None
 
     def resize(self, context: mgl.Context, width: int, height: int) -> None:
         if width <= 0 or height <= 0:
@@ -266,7 +386,7 @@ class DmxHeatmapRenderer:
         self._out_tex = context.texture((width, height), 3)
         self._fbo = context.framebuffer(color_attachments=[self._out_tex])
         self._cached_header_key = None
-        self._cached_overlay_key = None
+        self._cached_label_key = None
 
     def _ensure_header_texture(self, context: mgl.Context, width: int, height: int) -> None:
         header_h = max(1, int(round(height * HEADER_HEIGHT_FRAC)))
@@ -280,25 +400,94 @@ class DmxHeatmapRenderer:
         self._header_tex = context.texture((width, header_h), 3, data=data)
         self._cached_header_key = key
 
-    def _ensure_overlay_texture(
-        self,
-        context: mgl.Context,
-        overlay_w: int,
-        overlay_h: int,
-        row_header_w: int,
-        snapshot_512: list[int],
+    def _upload_values(
+        self, context: mgl.Context, universes: Mapping[str, Sequence[int]]
     ) -> None:
-        """Build/upload the digits+row-headers RGBA overlay, skipping no-op rebuilds."""
-        snapshot_key = tuple(snapshot_512[:512]) + (0,) * max(0, 512 - len(snapshot_512))
-        key = (overlay_w, overlay_h, row_header_w, snapshot_key)
-        if self._overlay_tex is not None and self._cached_overlay_key == key:
+        if self._data.shape[0] != len(universes):
+            self._data = np.zeros((len(universes), CHANNELS), dtype=np.uint8)
+            if self._data_tex is not None:
+                self._data_tex.release()
+            self._data_tex = context.texture((CHANNELS, len(universes)), 1)
+            self._data_tex.filter = (mgl.NEAREST, mgl.NEAREST)
+        for row, values in enumerate(universes.values()):
+            count = min(len(values), CHANNELS)
+            self._data[row, :count] = values[:count]
+            self._data[row, count:] = 0
+        self._data_tex.write(self._data.tobytes())
+
+    def _ensure_labels(self, names: tuple[str, ...], width: int, height: int) -> None:
+        """Universe names and row-start addresses as atlas quads, per layout."""
+        key = (names, width, height)
+        if self._cached_label_key == key:
+            return
+        self._cached_label_key = key
+        layout = heatmap_layout(len(names), width, height)
+        self._layout = layout
+        if self._atlas is None or self._labels is None:
+            return
+        atlas = self._atlas
+        quads = []
+        title_scale = min(layout.title_height * 0.8, layout.cell[1] * 0.7) / (
+            atlas.ascent + atlas.descent
+        )
+        row_scale = min(layout.cell[1] * 0.5 / atlas.ascent, 1.0)
+        for index, name in enumerate(names):
+            x0 = layout.origin[0] + (index % layout.columns) * layout.block[0]
+            y0 = layout.origin[1] + (index // layout.columns) * layout.block[1]
+            title = atlas.layout(name)
+            quads.append(
+                _placed_quads(
+                    atlas,
+                    name,
+                    title_scale,
+                    x0 + layout.gutter_width + title.width * title_scale / 2,
+                    y0 + layout.title_height * 0.8,
+                )
+            )
+            if layout.cell[1] * 0.5 < MIN_TEXT_PX:
+                continue
+            for row in range(GRID_H):
+                # DMX addresses are 1-based; row 0 starts at channel 1, row 1 at 33…
+                label = str(row * GRID_W + 1)
+                label_width = atlas.layout(label).width * row_scale
+                quads.append(
+                    _placed_quads(
+                        atlas,
+                        label,
+                        row_scale,
+                        x0 + layout.gutter_width * 0.9 - label_width / 2,
+                        y0
+                        + layout.title_height
+                        + (row + 0.5) * layout.cell[1]
+                        + atlas.ascent * row_scale / 2,
+                    )
+                )
+        self._labels.set_quads(np.concatenate(quads) if quads else np.zeros((0, 8)))
+
+    def _set_digit_uniforms(self, layout: HeatmapLayout) -> None:
+        assert self._prog is not None
+        atlas = self._atlas
+        if atlas is None:
+            self._prog["digit_scale"].value = 0.0
             return
-        if self._overlay_tex is not None:
-            self._overlay_tex.release()
-        img = _build_overlay_rgba_image(overlay_w, overlay_h, row_header_w, snapshot_512)
-        self._overlay_tex = context.texture((overlay_w, overlay_h), 4, data=img.tobytes())
-        self._overlay_tex.filter = (mgl.LINEAR, mgl.LINEAR)
-        self._cached_overlay_key = key
+        glyphs = [atlas.glyph(str(digit)) for digit in range(10)]
+        top = min(glyph.top for glyph in glyphs)
+        height = max(glyph.top + glyph.height for glyph in glyphs) - top
+        advance = max(glyph.advance for glyph in glyphs)
+        # ~55% of the cell height, narrowed so three digits fit across a cell
+        scale = min(
+            layout.cell[1] * 0.55 / height, layout.cell[0] * 0.72 / (3 * advance)
+        )
+        if height * scale < MIN_TEXT_PX:
+            scale = 0.0
+        self._prog["digits"].value = [
+            glyph.atlas_rect or (0, 0, 0, 0) for glyph in glyphs
+        ]
+        self._prog["digit_offsets"].value = [(g.left, g.top) for g in glyphs]
+        self._prog["digit_advance"].value = float(advance)
+        self._prog["digit_top"].value = float(top)
+        self._prog["digit_height"].value = float(height)
+        self._prog["digit_scale"].value = float(scale)
 
     def _write_quad_vbo(
         self, vbo: mgl.Buffer, x0: float, y0: float, x1: float, y1: float
@@ -307,99 +496,68 @@ class DmxHeatmapRenderer:
         verts = (x0, y0, 0.0, 0.0, x1, y0, 1.0, 0.0, x0, y1, 0.0, 1.0, x1, y1, 1.0, 1.0)
         vbo.write(struct.pack("16f", *verts))
 
-    @staticmethod
-    def _grid_quad_ndc_centered(y_split: float, scale: float) -> tuple[float, float, float, float]:
-        """NDC bounds (x0, y0, x1, y1) for the heatmap, centered in [-1,1] × [-1, y_split]."""
-        x_lo, x_hi = -1.0, 1.0
-        y_lo, y_hi = -1.0, y_split
-        cx = (x_lo + x_hi) * 0.5
-        cy = (y_lo + y_hi) * 0.5
-        half_w = (x_hi - x_lo) * 0.5 * scale
-        half_h = (y_hi - y_lo) * 0.5 * scale
-        return cx - half_w, cy - half_h, cx + half_w, cy + half_h
-
     def render(
-        self, context: mgl.Context, snapshot_512: list[int], width: int, height: int
+        self,
+        context: mgl.Context,
+        universes: Mapping[str, Sequence[int]],
+        width: int,
+        height: int,
     ) -> mgl.Framebuffer | None:
+        """Draw ``universes`` (name → channel values, 512 each) as grids."""
         if (
             self._prog is None
             or self._vao is None
             or self._header_prog is None
-            or self._overlay_prog is None
-            or self._overlay_vao is None
+            or self._labels is None
+            or not universes
         ):
             return None
         self.resize(context, width, height)
-        if self._data_tex is None:
-            self._data_tex = context.texture((GRID_W, GRID_H), 3, dtype="f4")
-        data = bytearray(GRID_W * GRID_H * 3 * 4)
-        for i in range(512):
-            v = snapshot_512[i] if i < len(snapshot_512) else 0
-            r, g, b = _channel_rgb(v)
-            row = i // GRID_W
-            col = i % GRID_W
-            idx = (row * GRID_W + col) * 12
-            packed = struct.pack("fff", r, g, b)
-            data[idx : idx + 12] = packed
-        self._data_tex.write(data)
-
+        self._upload_values(context, universes)
+        self._ensure_header_texture(context, width, height)
+        self._ensure_labels(tuple(universes), width, height)
         assert self._fbo is not None
-        assert self._vbo is not None
         assert self._header_vbo is not None
-        assert self._overlay_vbo is not None
+        assert self._header_tex is not None
+        assert self._layout is not None
+        layout = self._layout
 
         header_h = max(1, int(round(height * HEADER_HEIGHT_FRAC)))
         y_split = 1.0 - (2.0 * header_h / float(height))
-
-        # Outer "heatmap area" NDC quad — includes the row-header gutter on the left.
-        ax0, ay0, ax1, ay1 = self._grid_quad_ndc_centered(y_split, HEATMAP_NDC_SCALE)
-        area_w_ndc = ax1 - ax0
-        gutter_w_ndc = area_w_ndc * ROW_HEADER_WIDTH_FRAC
-
-        # Heatmap cell-grid quad (no gutter) — what the GL cell shader paints.
-        gx0 = ax0 + gutter_w_ndc
-        gx1 = ax1
-        gy0 = ay0
-        gy1 = ay1
-        self._write_quad_vbo(self._vbo, gx0, gy0, gx1, gy1)
         self._write_quad_vbo(self._header_vbo, -1.0, y_split, 1.0, 1.0)
-        # Overlay covers the full heatmap area (gutter + cells).
-        self._write_quad_vbo(self._overlay_vbo, ax0, ay0, ax1, ay1)
-
-        # Pixel sizes drive the PIL overlay resolution (one texel per output pixel).
-        area_w_px = max(1, int(round(0.5 * area_w_ndc * float(width))))
-        area_h_px = max(1, int(round(0.5 * (ay1 - ay0) * float(height))))
-        gutter_w_px = max(1, int(round(area_w_px * ROW_HEADER_WIDTH_FRAC)))
-
-        self._ensure_header_texture(context, width, height)
-        self._ensure_overlay_texture(
-            context, area_w_px, area_h_px, gutter_w_px, snapshot_512
-        )
-        assert self._header_tex is not None
-        assert self._overlay_tex is not None
 
-        bg = (0.02, 0.02, 0.06)
         self._fbo.use()
-        self._fbo.clear(*bg)
+        context.viewport = (0, 0, width, height)
+        self._fbo.clear(*_BG_COLOR)
 
         self._data_tex.use(0)
-        self._prog["data_tex"].value = 0
-        self._prog["grid_size"].value = (float(GRID_W), float(GRID_H))
-        self._prog["bg_color"].value = bg
+        self._prog["dmx_values"].value = 0
+        if self._atlas is not None:
+            self._atlas.texture.use(1)
+            self._prog["glyph_atlas"].value = 1
+        self._prog["universe_count"].value = len(universes)
+        self._prog["columns"].value = layout.columns
+        self._prog["target_height"].value = float(height)
+        self._prog["origin"].value = layout.origin
+        self._prog["block"].value = layout.block
+        self._prog["label_space"].value = (layout.gutter_width, layout.title_height)
+        self._prog["cell"].value = layout.cell
         self._prog["cell_gap"].value = float(CELL_GAP_FRAC)
+        self._set_digit_uniforms(layout)
         self._vao.render(mgl.TRIANGLE_STRIP)
 
         self._header_tex.use(0)
         self._header_prog["header_tex"].value = 0
         self._header_vao.render(mgl.TRIANGLE_STRIP)
 
-        # Per-cell DMX values + row-start labels, alpha-blended over the heatmap.
-        context.enable(mgl.BLEND)
-        context.blend_func = (mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA)
-        try:
-            self._overlay_tex.use(0)
-            self._overlay_prog["overlay_tex"].value = 0
-            self._overlay_vao.render(mgl.TRIANGLE_STRIP)
-        finally:
-            context.disable(mgl.BLEND)
+        # Universe names + row-start labels, alpha-blended over the grids.
+        if self._atlas is not None:
+            context.enable(mgl.BLEND)
+            context.blend_func = (mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA)
+            try:
+                self._label_prog["target_size"].value = (float(width), float(height))
+                self._label_prog["text_color"].value = _LABEL_COLOR
+                self._labels.draw(self._atlas)
+            finally:
+                context.disable(mgl.BLEND)
         return self._fbo
@@ -0,0 +1,294 @@
+"""Fonts rasterized once into a shared texture atlas, drawn as instanced quads.
+
+``glyph_atlas(context, font)`` returns the atlas for a font at its size,
+shared by every node rendering with ``context``. ``GlyphAtlas.layout`` turns
+a string into one quad per visible glyph (pixel rect + atlas rect), and a
+``GlyphBatch`` draws those quads in one instanced call with whatever program
+the caller supplies. Text colour is left to the caller's shader, so changing
+text or colour costs a few bytes of upload instead of a PIL rasterization.
+Bitmap fonts (``ImageFont.load_default()`` without FreeType) work too, with
+the bottom of their character cell as the baseline.
+
+Programs used with ``GlyphBatch`` declare::
+
+    in vec2 in_corner;  // per vertex, (0,0)..(1,1)
+    in vec4 in_rect;    // per glyph, x0 y0 x1 y1
+    in vec4 in_uv;      // per glyph, atlas texels u0 v0 u1 v1
+    uniform sampler2D glyph_atlas;  // coverage in .r
+
+and divide ``in_uv`` by ``textureSize(glyph_atlas, 0)``; texel coordinates
+stay valid when the atlas grows to fit glyphs outside the initial charset.
+"""
+
+from __future__ import annotations
+
+import math
+import weakref
+from dataclasses import dataclass
+from typing import Hashable, Optional, Union
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+from PIL import Image, ImageDraw, ImageFont
+
+# Rasterized up front; anything else is added the first time it is laid out.
+DEFAULT_CHARSET = "".join(chr(code) for code in range(32, 127))
+# Empty texels around each glyph so bilinear filtering never bleeds
+GLYPH_PADDING = 1
+# Extra space between lines, matching PIL's multiline default
+LINE_SPACING = 4
+
+# x0, y0, x1, y1, u0, v0, u1, v1 per glyph
+QUAD_FLOATS = 8
+
+AtlasFont = Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+
+
+@dataclass(frozen=True)
+class Glyph:
+    """Placement of one character, in pixels relative to the pen on the
+    baseline (y grows downwards, like PIL)."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    advance: float
+    # Atlas texel rect, or None for blank glyphs such as space
+    atlas_rect: Optional[tuple[int, int, int, int]]
+
+
+@dataclass(frozen=True)
+class TextLayout:
+    """Glyph quads for a string with the first baseline at y = 0."""
+
+    quads: np.ndarray
+    width: float
+    top: float
+    bottom: float
+
+
+@beartype
+class GlyphAtlas:
+    """One font at one size, shelf-packed into a single-channel texture."""
+
+    def __init__(
+        self,
+        context: mgl.Context,
+        font: AtlasFont,
+        charset: str = DEFAULT_CHARSET,
+    ):
+        self.context = context
+        self.font = font
+        self._freetype = isinstance(font, ImageFont.FreeTypeFont)
+        if self._freetype:
+            self.ascent, self.descent = font.getmetrics()
+            cap_height = font.getbbox("A", anchor="lt")[3]
+        else:
+            self.ascent, self.descent = font.getbbox("A")[3], 0
+            cap_height = self.ascent
+        self.line_spacing = cap_height + LINE_SPACING
+        self._glyphs: dict[str, Glyph] = {}
+        self._layouts: dict[str, TextLayout] = {}
+
+        boxes = [self._baseline_box(ch) for ch in charset]
+        area = sum(
+            (r - l + 2 * GLYPH_PADDING) * (b - t + 2 * GLYPH_PADDING)
+            for l, t, r, b in boxes
+        )
+        widest = max((r - l for l, _, r, _ in boxes), default=0)
+        width = 2 ** math.ceil(math.log2(max(64, widest + 2, math.sqrt(area) * 1.2)))
+        self._image = np.zeros((width // 4, width), dtype=np.uint8)
+        self._cursor_x = 0
+        self._cursor_y = 0
+        self._row_height = 0
+        self.texture: Optional[mgl.Texture] = None
+        for ch in charset:
+            self._add(ch)
+        self._upload()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        height, width = self._image.shape
+        return width, height
+
+    def glyph(self, ch: str) -> Glyph:
+        glyph = self._glyphs.get(ch)
+        if glyph is None:
+            glyph = self._add(ch)
+            self._upload()
+        return glyph
+
+    def layout(self, text: str) -> TextLayout:
+        """Quads for ``text``; lines are centred on x = 0 and advance down."""
+        cached = self._layouts.get(text)
+        if cached is not None:
+            return cached
+
+        quads = []
+        lines = text.split("\n")
+        width = 0.0
+        for line_index, line in enumerate(lines):
+            glyphs = [self.glyph(ch) for ch in line]
+            line_width = self.font.getlength(line) if line else 0.0
+            width = max(width, line_width)
+            start_x = -line_width / 2
+            baseline = line_index * self.line_spacing
+            for index, glyph in enumerate(glyphs):
+                if glyph.atlas_rect is None:
+                    continue
+                # Pen position from the prefix length picks up kerning; glyphs
+                # snap to whole pixels like PIL's own anchoring
+                x0 = math.floor(start_x + self.font.getlength(line[:index])) + glyph.left
+                y0 = baseline + glyph.top
+                quads.append(
+                    (x0, y0, x0 + glyph.width, y0 + glyph.height, *glyph.atlas_rect)
+                )
+
+        layout = TextLayout(
+            quads=np.array(quads, dtype=np.float32).reshape(-1, QUAD_FLOATS),
+            width=width,
+            top=-float(self.ascent),
+            bottom=(len(lines) - 1) * self.line_spacing + float(self.descent),
+        )
+        self._layouts[text] = layout
+        return layout
+
+    def release(self) -> None:
+        if self.texture is not None:
+            self.texture.release()
+            self.texture = None
+
+    def _baseline_box(self, ch: str) -> tuple[int, int, int, int]:
+        """``ch``'s ink box relative to the pen on the baseline."""
+        if self._freetype:
+            return self.font.getbbox(ch, anchor="ls")
+        # Bitmap fonts only report their cell; the mask has the ink
+        ink = self.font.getmask(ch).getbbox() or (0, 0, 0, 0)
+        return ink[0], ink[1] - self.ascent, ink[2], ink[3] - self.ascent
+
+    def _add(self, ch: str) -> Glyph:
+        left, top, right, bottom = self._baseline_box(ch)
+        width, height = right - left, bottom - top
+        atlas_rect = None
+        if width > 0 and height > 0:
+            x, y = self._place(width + 2 * GLYPH_PADDING, height + 2 * GLYPH_PADDING)
+            x += GLYPH_PADDING
+            y += GLYPH_PADDING
+            bitmap = Image.new("L", (width, height), 0)
+            draw = ImageDraw.Draw(bitmap)
+            if self._freetype:
+                draw.text((-left, -top), ch, fill=255, font=self.font, anchor="ls")
+            else:
+                draw.text((-left, -top - self.ascent), ch, fill=255, font=self.font)
+            self._image[y : y + height, x : x + width] = np.asarray(bitmap)
+            atlas_rect = (x, y, x + width, y + height)
+        glyph = Glyph(left, top, width, height, self.font.getlength(ch), atlas_rect)
+        self._glyphs[ch] = glyph
+        return glyph
+
+    def _place(self, width: int, height: int) -> tuple[int, int]:
+        atlas_height, atlas_width = self._image.shape
+        if self._cursor_x + width > atlas_width:
+            self._cursor_x = 0
+            self._cursor_y += self._row_height
+            self._row_height = 0
+        while self._cursor_y + height > atlas_height:
+            # Grow downwards only, so existing texel rects stay valid
+            atlas_height *= 2
+            grown = np.zeros((atlas_height, atlas_width), dtype=np.uint8)
+            grown[: self._image.shape[0]] = self._image
+            self._image = grown
+        x, y = self._cursor_x, self._cursor_y
+        self._cursor_x += width
+        self._row_height = max(self._row_height, height)
+        return x, y
+
+    def _upload(self) -> None:
+        if self.texture is None or self.texture.size != self.size:
+            self.release()
+            self.texture = self.context.texture(self.size, 1)
+            self.texture.filter = (mgl.LINEAR, mgl.LINEAR)
+        self.texture.write(np.ascontiguousarray(self._image).tobytes())
+
+
+_atlases: "weakref.WeakKeyDictionary[mgl.Context, dict[Hashable, GlyphAtlas]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@beartype
+def glyph_atlas(context: mgl.Context, font: AtlasFont) -> GlyphAtlas:
+    """The atlas for ``font`` at its size, shared by every user of ``context``."""
+    atlases = _atlases.setdefault(context, {})
+    # Bitmap fonts have no name or size to share by
+    key: Hashable = (
+        (font.getname(), font.size)
+        if isinstance(font, ImageFont.FreeTypeFont)
+        else font
+    )
+    atlas = atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(context, font)
+        atlases[key] = atlas
+    return atlas
+
+
+@beartype
+class GlyphBatch:
+    """Draws laid-out glyph quads as instances of one unit quad."""
+
+    def __init__(self, program: mgl.Program):
+        self.program = program
+        context = program.ctx
+        corners = np.array([0, 0, 1, 0, 0, 1, 1, 1], dtype=np.float32)
+        self._corners = context.buffer(corners.tobytes())
+        self._instances: Optional[mgl.Buffer] = None
+        self._vao: Optional[mgl.VertexArray] = None
+        self._capacity = 0
+        self.count = 0
+
+    def set_quads(self, quads: np.ndarray) -> None:
+        """Upload quads (as from ``GlyphAtlas.layout``); drawn until replaced."""
+        self.count = len(quads)
+        if self.count == 0:
+            return
+        if self.count > self._capacity:
+            self._release_instances()
+            self._capacity = 2 ** math.ceil(math.log2(self.count))
+            context = self.program.ctx
+            self._instances = context.buffer(
+                reserve=self._capacity * QUAD_FLOATS * 4, dynamic=True
+            )
+            self._vao = context.vertex_array(
+                self.program,
+                [
+                    (self._corners, "2f", "in_corner"),
+                    (self._instances, "4f 4f/i", "in_rect", "in_uv"),
+                ],
+            )
+        else:
+            self._instances.orphan()
+        self._instances.write(np.ascontiguousarray(quads, dtype=np.float32).tobytes())
+
+    def draw(self, atlas: GlyphAtlas, location: int = 0) -> None:
+        if self.count == 0:
+            return
+        atlas.texture.use(location)
+        self.program["glyph_atlas"] = location
+        self._vao.render(mgl.TRIANGLE_STRIP, instances=self.count)
+
+    def release(self) -> None:
+        self._release_instances()
+        self._corners.release()
+        self._capacity = 0
+        self.count = 0
+
+    def _release_instances(self) -> None:
+        if self._vao is not None:
+            self._vao.release()
+            self._vao = None
+        if self._instances is not None:
+            self._instances.release()
+            self._instances = None
@@ -0,0 +1,204 @@
+"""Drive several displays from one evaluation of the VJ node graph."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal, Mapping, Optional, Sequence
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.shaders import output_fit
+
+FitMode = Literal["cover", "contain", "stretch"]
+FIT_MODES: tuple[str, ...] = ("cover", "contain", "stretch")
+
+# Source names ConcertStage.output_sources provides
+OUTPUT_SOURCES: tuple[str, ...] = ("stage", "scene")
+
+
+@beartype
+@dataclass(frozen=True)
+class VJOutput:
+    """One display (projector, LED wall, side screen) fed by the VJ graph.
+
+    ``source`` names a node from the stage's ``output_sources``; ``crop`` is
+    the part of it to show as uv ``(x, y, width, height)``. ``cover`` fills
+    the output and trims the crop to its aspect, ``contain`` letterboxes,
+    ``stretch`` distorts.
+    """
+
+    name: str
+    width: int
+    height: int
+    source: str = "stage"
+    crop: tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)
+    fit: FitMode = "cover"
+
+
+@beartype
+def parse_vj_output(spec: str) -> VJOutput:
+    """``NAME:WIDTHxHEIGHT[:SOURCE[:FIT[:X,Y,W,H]]]``, e.g.
+    ``wall:1024x256:scene:cover:0,0.25,1,0.5`` (the ``--vj-output`` flag)."""
+    parts = spec.split(":")
+    if len(parts) < 2 or len(parts) > 5 or not parts[0]:
+        raise ValueError(
+            f"VJ output {spec!r} is not NAME:WIDTHxHEIGHT[:SOURCE[:FIT[:CROP]]]"
+        )
+    width, _, height = parts[1].partition("x")
+    if not (width.isdigit() and height.isdigit()) or not int(width) or not int(height):
+        raise ValueError(f"VJ output {spec!r} has no WIDTHxHEIGHT size")
+    fit = parts[3] if len(parts) > 3 else "cover"
+    if fit not in FIT_MODES:
+        raise ValueError(f"VJ output {spec!r}: fit must be one of {FIT_MODES}")
+    crop = (0.0, 0.0, 1.0, 1.0)
+    if len(parts) > 4:
+        values = tuple(float(value) for value in parts[4].split(","))
+        if len(values) != 4:
+            raise ValueError(f"VJ output {spec!r}: crop is X,Y,WIDTH,HEIGHT")
+        if not all(0.0 <= value <= 1.0 for value in values) or min(values[2:]) <= 0:
+            raise ValueError(
+                f"VJ output {spec!r}: crop values must be within 0..1, "
+                "with WIDTH and HEIGHT above 0"
+            )
+        crop = values
+    return VJOutput(
+        parts[0],
+        int(width),
+        int(height),
+        source=parts[2] if len(parts) > 2 else "stage",
+        crop=crop,
+        fit=fit,
+    )
+
+
+@beartype
+def fit_output(
+    output: VJOutput, source_size: tuple[int, int]
+) -> tuple[tuple[float, float], tuple[float, float], tuple[int, int, int, int]]:
+    """The uv offset and scale to sample and the viewport to draw into."""
+    x, y, crop_width, crop_height = output.crop
+    viewport = (0, 0, output.width, output.height)
+    if output.fit == "stretch":
+        return (x, y), (crop_width, crop_height), viewport
+
+    region_aspect = (crop_width * source_size[0]) / (crop_height * source_size[1])
+    output_aspect = output.width / output.height
+    if output.fit == "cover":
+        if region_aspect > output_aspect:
+            trimmed = crop_width * output_aspect / region_aspect
+            x += (crop_width - trimmed) / 2
+            crop_width = trimmed
+        else:
+            trimmed = crop_height * region_aspect / output_aspect
+            y += (crop_height - trimmed) / 2
+            crop_height = trimmed
+    elif region_aspect > output_aspect:
+        height = max(1, round(output.width / region_aspect))
+        viewport = (0, (output.height - height) // 2, output.width, height)
+    else:
+        width = max(1, round(output.height * region_aspect))
+        viewport = ((output.width - width) // 2, 0, width, output.height)
+    return (x, y), (crop_width, crop_height), viewport
+
+
+@beartype
+class MultiOutputRenderer:
+    """Renders every ``VJOutput`` from one pass over the node graph.
+
+    Each source node renders once however many outputs show it, and nested
+    ``SharedNode`` subtrees render once however many sources contain them;
+    only the crop and fit into each output's framebuffer is repeated.
+    Outputs are pooled framebuffers the caller releases once displayed.
+    """
+
+    def __init__(
+        self,
+        outputs: Sequence[VJOutput],
+        source_names: Sequence[str] = OUTPUT_SOURCES,
+    ):
+        names = [output.name for output in outputs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"VJ output names must be unique: {names}")
+        for output in outputs:
+            if output.source not in source_names:
+                raise ValueError(
+                    f"VJ output {output.name!r} shows unknown source "
+                    f"{output.source!r}; expected one of {tuple(source_names)}"
+                )
+        self.outputs = tuple(outputs)
+        self._context: Optional[mgl.Context] = None
+        self._program: Optional[mgl.Program] = None
+        self._vbo: Optional[mgl.Buffer] = None
+        self._vao: Optional[mgl.VertexArray] = None
+
+    def render(
+        self,
+        frame: Frame,
+        scheme: ColorScheme,
+        context: mgl.Context,
+        sources: Mapping[
+            str, BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
+        ],
+        rendered: Optional[Mapping[str, Optional[mgl.Framebuffer]]] = None,
+    ) -> dict[str, mgl.Framebuffer]:
+        """Outputs by name. Sources already in ``rendered`` this frame are
+        reused, not rendered again, and stay owned by the caller."""
+        if context is not self._context:
+            self.release()
+            self._create_resources(context)
+
+        pool = render_target_pool(context)
+        given = dict(rendered or {})
+        rendered = dict(given)
+        results: dict[str, mgl.Framebuffer] = {}
+        for output in self.outputs:
+            if output.source not in rendered:
+                rendered[output.source] = sources[output.source].render(
+                    frame, scheme, context
+                )
+            source = rendered[output.source]
+            target = pool.acquire(output.width, output.height)
+            target.use()
+            context.clear(0.0, 0.0, 0.0)
+            if source is not None and source.color_attachments:
+                self._draw(context, output, source.color_attachments[0])
+            results[output.name] = target
+        for name, source in rendered.items():
+            if name not in given:
+                pool.release(source)
+        return results
+
+    def release(self) -> None:
+        for resource in (self._vao, self._vbo):
+            if resource is not None:
+                resource.release()
+        release_program(self._program)
+        self._vao = self._vbo = self._program = None
+        self._context = None
+
+    def _draw(self, context: mgl.Context, output: VJOutput, texture: Any) -> None:
+        offset, scale, viewport = fit_output(output, texture.size)
+        context.viewport = viewport
+        texture.use(0)
+        self._program["inputTexture"] = 0
+        self._program["uvOffset"] = offset
+        self._program["uvScale"] = scale
+        self._vao.render(mgl.TRIANGLE_STRIP)
+
+    def _create_resources(self, context: mgl.Context) -> None:
+        self._context = context
+        self._program = program_cache(context).acquire(
+            output_fit.get_vertex_shader(), output_fit.get_fragment_shader()
+        )
+        quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype="f4")
+        self._vbo = context.buffer(quad.tobytes())
+        self._vao = context.vertex_array(
+            self._program, [(self._vbo, "2f", "in_position")]
+        )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import moderngl as mgl
-from typing import Optional
+from typing import Hashable, Optional
 from beartype import beartype
 
 from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
@@ -35,6 +35,7 @@ class Black(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
 
     def exit(self):
         """Clean up resources"""
+        self.invalidate()
         if self.framebuffer:
             self.framebuffer.release()
             self.framebuffer = None
@@ -47,15 +48,21 @@ class Black(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         """Nothing to generate for black background"""
         pass
 
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        return (self.width, self.height)
+
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> Optional[mgl.Framebuffer]:
         """Render solid black"""
         if not self.framebuffer:
             return None
+        if self.output_unchanged(frame, scheme):
+            return self.framebuffer
 
         # Clear to solid black
         self.framebuffer.use()
         context.clear(0.0, 0.0, 0.0, 1.0)  # Solid black with full alpha
 
+        self.mark_rendered(frame, scheme)
         return self.framebuffer
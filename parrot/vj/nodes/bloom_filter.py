@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import random
+import moderngl as mgl
 from beartype import beartype
 
 from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
@@ -8,6 +9,7 @@ from parrot.graph.BaseInterpretationNode import format_node_status
 from parrot.director.frame import Frame, FrameSignal
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.nodes.canvas_effect_base import PostProcessEffectBase
+from parrot.vj.bloom import DualKawaseBloom
 from parrot.vj.utils.signal_utils import get_random_frame_signal
 
 
@@ -16,7 +18,7 @@ class BloomFilter(PostProcessEffectBase):
     """
     A gentle bloom filter effect that creates a soft, dreamy glow around bright areas.
     Designed specifically for gentle and chill modes with low frequency signal sensitivity.
-    Uses a multi-pass gaussian blur approach for high-quality bloom.
+    Bright areas are blurred through a reduced-resolution dual Kawase mip chain.
     """
 
     def __init__(
@@ -37,7 +39,7 @@ class BloomFilter(PostProcessEffectBase):
             bloom_radius: Radius of the bloom effect in pixels (gentle: 2-6)
             threshold: Brightness threshold for bloom (0.0 = all pixels bloom, 1.0 = only white pixels)
             signal: Which frame signal modulates the bloom intensity
-            blur_passes: Number of blur passes for smoother bloom (1-3 for gentle effect)
+            blur_passes: Extra mip levels for a wider, smoother bloom (1-3 for gentle effect)
         """
         super().__init__(input_node)
         self.base_intensity = base_intensity
@@ -46,6 +48,7 @@ class BloomFilter(PostProcessEffectBase):
         self.threshold = threshold
         self.signal = signal
         self.blur_passes = blur_passes
+        self.bloom = DualKawaseBloom()
 
     def generate(self, vibe: Vibe):
         """Configure bloom parameters based on the vibe"""
@@ -74,92 +77,18 @@ class BloomFilter(PostProcessEffectBase):
         )
 
     def _get_fragment_shader(self) -> str:
-        """Fragment shader for gentle bloom effect using multi-pass gaussian blur"""
+        """Fragment shader that adds the blurred bright areas back over the input"""
         return """
         #version 330 core
         in vec2 uv;
         out vec3 color;
         uniform sampler2D input_texture;
+        uniform sampler2D bloom_texture;  // Bright areas blurred through the mip chain
         uniform float bloom_intensity;
-        uniform float bloom_radius;
-        uniform float bloom_threshold;
-        uniform vec2 texture_size;
-        uniform int blur_passes;
-        
-        // High-quality gaussian blur weights for 13-tap blur
-        const float weights[13] = float[](
-            0.0044, 0.0175, 0.0540, 0.1295, 0.2420, 0.3521, 0.3989,
-            0.3521, 0.2420, 0.1295, 0.0540, 0.0175, 0.0044
-        );
-        
-        // Extract bright areas above threshold
-        vec3 extractBrightAreas(vec3 input_color) {
-            float luminance = dot(input_color, vec3(0.299, 0.587, 0.114));
-            
-            if (luminance > bloom_threshold) {
-                // Smooth falloff near threshold for gentle transition
-                float falloff = smoothstep(bloom_threshold - 0.1, bloom_threshold + 0.1, luminance);
-                return input_color * falloff;
-            }
-            
-            return vec3(0.0);
-        }
-        
-        // Perform gaussian blur in one direction
-        vec3 gaussianBlur(vec2 direction) {
-            vec2 texel_size = 1.0 / texture_size;
-            vec2 blur_offset = texel_size * bloom_radius * direction;
-            
-            vec3 blur_sum = vec3(0.0);
-            float weight_sum = 0.0;
-            
-            // 13-tap gaussian blur
-            for (int i = -6; i <= 6; i++) {
-                vec2 sample_uv = uv + float(i) * blur_offset;
-                
-                // Clamp to texture bounds
-                if (sample_uv.x >= 0.0 && sample_uv.x <= 1.0 && 
-                    sample_uv.y >= 0.0 && sample_uv.y <= 1.0) {
-                    
-                    vec3 sample_color = texture(input_texture, sample_uv).rgb;
-                    vec3 bright_areas = extractBrightAreas(sample_color);
-                    
-                    float weight = weights[i + 6];
-                    blur_sum += bright_areas * weight;
-                    weight_sum += weight;
-                }
-            }
-            
-            return weight_sum > 0.0 ? blur_sum / weight_sum : vec3(0.0);
-        }
         
         void main() {
             vec3 input_color = texture(input_texture, uv).rgb;
-            
-            // Create bloom by blurring bright areas
-            vec3 bloom_color = vec3(0.0);
-            
-            // Multi-pass blur for smoother bloom
-            if (blur_passes >= 1) {
-                // Horizontal blur pass
-                bloom_color += gaussianBlur(vec2(1.0, 0.0));
-            }
-            
-            if (blur_passes >= 2) {
-                // Vertical blur pass
-                bloom_color += gaussianBlur(vec2(0.0, 1.0));
-                bloom_color *= 0.5; // Average the two passes
-            }
-            
-            if (blur_passes >= 3) {
-                // Diagonal blur passes for extra smoothness
-                bloom_color += gaussianBlur(normalize(vec2(1.0, 1.0)));
-                bloom_color += gaussianBlur(normalize(vec2(1.0, -1.0)));
-                bloom_color *= 0.25; // Average all four passes
-            }
-            
-            // Apply bloom intensity
-            bloom_color *= bloom_intensity;
+            vec3 bloom_color = texture(bloom_texture, uv).rgb * bloom_intensity;
             
             // Combine original with bloom using gentle additive blending
             vec3 final_color = input_color + bloom_color;
@@ -175,6 +104,39 @@ class BloomFilter(PostProcessEffectBase):
         }
         """
 
+    def render(
+        self, frame: Frame, scheme: ColorScheme, context: mgl.Context
+    ) -> mgl.Framebuffer:
+        """Blur the input's bright areas at reduced resolution, then composite"""
+        input_framebuffer = self._get_input_framebuffer(frame, scheme, context)
+        if not input_framebuffer or not input_framebuffer.color_attachments:
+            return self._render_black_framebuffer(context)
+
+        self._setup_gl_resources(context)
+        # bloom_radius is in pixels of the old 13-tap blur; each pass adds a mip level
+        self.bloom.levels = 2 + self.blur_passes
+        self.bloom.spread = self.bloom_radius / 4.0
+        input_texture = input_framebuffer.color_attachments[0]
+        glow = self.bloom.blur(context, input_texture, threshold=self.threshold)
+
+        self._acquire_output(context, input_framebuffer.width, input_framebuffer.height)
+        self.framebuffer.use()
+        context.clear(0.0, 0.0, 0.0)
+        input_texture.use(0)
+        glow.color_attachments[0].use(1)
+        self.shader_program["input_texture"] = 0
+        self.shader_program["bloom_texture"] = 1
+        self._set_effect_uniforms(frame, scheme)
+        self.quad_vao.render(mgl.TRIANGLE_STRIP)
+
+        self._release_input(context, glow)
+        self._release_input(context, input_framebuffer)
+        return self.framebuffer
+
+    def exit(self):
+        self.bloom.release()
+        super().exit()
+
     def _set_effect_uniforms(self, frame: Frame, scheme: ColorScheme):
         """Set bloom effect uniforms"""
         # Get signal value (0.0 to 1.0)
@@ -188,17 +150,4 @@ class BloomFilter(PostProcessEffectBase):
             + (self.max_intensity - self.base_intensity) * signal_curve
         )
 
-        # Set uniforms
         self.shader_program["bloom_intensity"] = dynamic_intensity
-        self.shader_program["bloom_radius"] = self.bloom_radius
-        self.shader_program["bloom_threshold"] = self.threshold
-        self.shader_program["blur_passes"] = self.blur_passes
-
-        # Set texture size for proper blur sampling
-        if self.framebuffer:
-            self.shader_program["texture_size"] = (
-                float(self.framebuffer.width),
-                float(self.framebuffer.height),
-            )
-        else:
-            self.shader_program["texture_size"] = (1920.0, 1080.0)
@@ -21,6 +21,9 @@ class CameraShake(PostProcessEffectBase):
     The low frequencies cause camera position jitter with motion blur that correlates with shake intensity.
     """
 
+    # Renders into its own target, resized to the input, rather than a pooled one
+    pooled_output = False
+
     def __init__(
         self,
         input_node: BaseInterpretationNode,
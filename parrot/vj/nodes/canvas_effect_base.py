@@ -9,6 +9,8 @@ from beartype import beartype
 from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.program_cache import program_cache, release_program
 
 
 @beartype
@@ -18,14 +20,23 @@ class CanvasEffectBase(
     """
     Base class for canvas effects that work with framebuffers.
     Provides common OpenGL resource management and shader utilities.
+
+    With ``pooled_output`` set, ``self.framebuffer`` is borrowed from the
+    context's ``RenderTargetPool`` for each render instead of being allocated
+    per node; the consumer releases it once it has sampled it.
     """
 
+    pooled_output = False
+
     def __init__(self, input_node: Optional[BaseInterpretationNode] = None):
         """
         Args:
             input_node: Optional input node that provides a framebuffer
         """
         super().__init__([input_node] if input_node else [])
+        # Bumped whenever the node is rewired, so compiled render plans can
+        # check they are still current without re-inspecting the node
+        self.structure_version = 0
         self.input_node = input_node
 
         # Common OpenGL resources
@@ -34,6 +45,15 @@ class CanvasEffectBase(
         self.shader_program: Optional[mgl.Program] = None
         self.quad_vao: Optional[mgl.VertexArray] = None
 
+    @property
+    def input_node(self) -> Optional[BaseInterpretationNode]:
+        return self._input_node
+
+    @input_node.setter
+    def input_node(self, node: Optional[BaseInterpretationNode]) -> None:
+        self._input_node = node
+        self.structure_version += 1
+
     def enter(self, context: mgl.Context):
         """Initialize OpenGL resources"""
         self._setup_gl_resources(context)
@@ -44,6 +64,10 @@ class CanvasEffectBase(
 
     def _cleanup_gl_resources(self):
         """Clean up all OpenGL resources"""
+        self.invalidate()
+        if self.pooled_output:
+            # Pool-owned; whoever holds the last reference returns it.
+            self.framebuffer = None
         if self.framebuffer:
             self.framebuffer.release()
             self.framebuffer = None
@@ -51,7 +75,7 @@ class CanvasEffectBase(
             self.texture.release()
             self.texture = None
         if self.shader_program:
-            self.shader_program.release()
+            release_program(self.shader_program)
             self.shader_program = None
         if self.quad_vao:
             self.quad_vao.release()
@@ -61,14 +85,14 @@ class CanvasEffectBase(
         self, context: mgl.Context, width: int = 1920, height: int = 1080
     ):
         """Setup OpenGL resources for rendering"""
-        if not self.texture:
+        if not self.texture and not self.pooled_output:
             self.texture = context.texture((width, height), 3)  # RGB texture
             self.framebuffer = context.framebuffer(color_attachments=[self.texture])
 
         if not self.shader_program:
             vertex_shader = self._get_vertex_shader()
             fragment_shader = self._get_fragment_shader()
-            self.shader_program = context.program(
+            self.shader_program = program_cache(context).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
@@ -120,6 +144,11 @@ class CanvasEffectBase(
         )
 
         vbo = context.buffer(vertices.tobytes())
+        if self.shader_program.get("in_texcoord", None) is None:
+            # Shaders that work from gl_FragCoord let the driver strip it
+            return context.vertex_array(
+                self.shader_program, [(vbo, "2f 8x", "in_position")]
+            )
         return context.vertex_array(
             self.shader_program, [(vbo, "2f 2f", "in_position", "in_texcoord")]
         )
@@ -145,6 +174,10 @@ class CanvasEffectBase(
 
     def _ensure_framebuffer_size(self, context: mgl.Context, width: int, height: int):
         """Ensure framebuffer matches the specified size, recreating if necessary"""
+        if self.pooled_output:
+            # The pool owns the target; borrow one of the right size instead
+            self._acquire_output(context, width, height)
+            return
         if (
             not self.framebuffer
             or self.framebuffer.width != width
@@ -170,9 +203,26 @@ class CanvasEffectBase(
             return self.input_node.render(frame, scheme, context)
         return None
 
+    def _acquire_output(
+        self, context: mgl.Context, width: int = 1920, height: int = 1080
+    ):
+        """Borrow this render's output target from the context's pool, or
+        size the node's own target when its output is not pooled"""
+        if self.pooled_output:
+            self.framebuffer = render_target_pool(context).acquire(width, height)
+        else:
+            self._ensure_framebuffer_size(context, width, height)
+        return self.framebuffer
+
+    def _release_input(self, context: mgl.Context, framebuffer) -> None:
+        """Hand back an input once sampled (no-op for non-pooled producers)"""
+        render_target_pool(context).release(framebuffer)
+
     def _render_black_framebuffer(self, context: mgl.Context) -> mgl.Framebuffer:
         """Render a black framebuffer as fallback"""
-        if not self.framebuffer:
+        if self.pooled_output:
+            self._acquire_output(context)
+        elif not self.framebuffer:
             self._setup_gl_resources(context)
         self.framebuffer.use()
         context.clear(0.0, 0.0, 0.0)
@@ -207,8 +257,14 @@ class CanvasEffectBase(
 class PostProcessEffectBase(CanvasEffectBase):
     """
     Base class for post-processing effects that take an input framebuffer and apply an effect.
+    Outputs are pooled: chain intermediates share a handful of render targets.
+    When ``compile_render_graph`` made this node the head of a fused chain,
+    the whole chain renders as one pass from here.
     """
 
+    pooled_output = True
+    fused_chain = None
+
     def __init__(self, input_node: BaseInterpretationNode):
         """
         Args:
@@ -223,16 +279,21 @@ class PostProcessEffectBase(CanvasEffectBase):
         Render the post-processing effect.
         Gets input from input_node, applies effect, returns result framebuffer.
         """
+        if self.fused_chain is not None and self.fused_chain.is_current():
+            fused_result = self.fused_chain.render(frame, scheme, context)
+            if fused_result is not None:
+                return fused_result
+
         # Get the input framebuffer
         input_framebuffer = self._get_input_framebuffer(frame, scheme, context)
 
         if not input_framebuffer or not input_framebuffer.color_attachments:
             return self._render_black_framebuffer(context)
 
-        # Ensure our framebuffer matches input size
-        input_width = input_framebuffer.width
-        input_height = input_framebuffer.height
-        self._ensure_framebuffer_size(context, input_width, input_height)
+        self._setup_gl_resources(context)
+        self._acquire_output(
+            context, input_framebuffer.width, input_framebuffer.height
+        )
 
         # Render the effect
         self.framebuffer.use()
@@ -248,6 +309,7 @@ class PostProcessEffectBase(CanvasEffectBase):
         # Render
         self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
+        self._release_input(context, input_framebuffer)
         return self.framebuffer
 
     @abstractmethod
@@ -285,6 +347,9 @@ class GenerativeEffectBase(CanvasEffectBase):
         """
         if not self.framebuffer:
             self._setup_gl_resources(context, self.width, self.height)
+        elif self.output_unchanged(frame, scheme):
+            # Subclasses declaring a cache_key skip redrawing identical frames
+            return self.framebuffer
 
         self.framebuffer.use()
         context.clear(0.0, 0.0, 0.0)
@@ -295,6 +360,7 @@ class GenerativeEffectBase(CanvasEffectBase):
         # Render
         self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
+        self.mark_rendered(frame, scheme)
         return self.framebuffer
 
     @abstractmethod
@@ -12,11 +12,19 @@ from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.constants import DEFAULT_HEIGHT, DEFAULT_WIDTH
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.resolution_governor import ScalableResolution
 
 
 @beartype
-class CircleRainbowBackground(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
-    """Ping-pong feedback shader: rainbow dots on an oscillating ring with temporal blur."""
+class CircleRainbowBackground(
+    ScalableResolution, BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
+):
+    """Ping-pong feedback shader: rainbow dots on an oscillating ring with temporal blur.
+
+    Renders at ``scaled_size()``. On a resize the first frame feeds back from
+    the old-size texture, so the trails carry over at the new resolution.
+    """
 
     def __init__(self, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT):
         super().__init__([])
@@ -38,15 +46,9 @@ class CircleRainbowBackground(BaseInterpretationNode[mgl.Context, None, mgl.Fram
             context.clear(0.0, 0.0, 0.0, 1.0)
 
     def exit(self) -> None:
-        for i in (0, 1):
-            if self._framebuffers[i]:
-                self._framebuffers[i].release()
-                self._framebuffers[i] = None
-            if self._textures[i]:
-                self._textures[i].release()
-                self._textures[i] = None
+        self._release_targets()
         if self.shader_program:
-            self.shader_program.release()
+            release_program(self.shader_program)
             self.shader_program = None
         if self.quad_vao:
             self.quad_vao.release()
@@ -55,10 +57,19 @@ class CircleRainbowBackground(BaseInterpretationNode[mgl.Context, None, mgl.Fram
     def generate(self, vibe: Vibe) -> None:
         pass
 
+    def _release_targets(self) -> None:
+        for i in (0, 1):
+            if self._framebuffers[i]:
+                self._framebuffers[i].release()
+                self._framebuffers[i] = None
+            if self._textures[i]:
+                self._textures[i].release()
+                self._textures[i] = None
+
     def _setup_gl_resources(self, context: mgl.Context) -> None:
         for i in (0, 1):
             if self._textures[i] is None:
-                tex = context.texture((self.width, self.height), 4)
+                tex = context.texture(self.scaled_size(), 4)
                 tex.filter = (mgl.LINEAR, mgl.LINEAR)
                 tex.repeat_x = False
                 tex.repeat_y = False
@@ -132,7 +143,7 @@ class CircleRainbowBackground(BaseInterpretationNode[mgl.Context, None, mgl.Fram
                 }
             }
             """
-            self.shader_program = context.program(
+            self.shader_program = program_cache(context).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
@@ -159,11 +170,19 @@ class CircleRainbowBackground(BaseInterpretationNode[mgl.Context, None, mgl.Fram
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> mgl.Framebuffer:
+        # On a resize, feed back from the old-size texture for one frame
+        stale: Optional[tuple[mgl.Texture, mgl.Framebuffer]] = None
+        current = self._textures[self._read_idx]
+        if current is not None and current.size != self.scaled_size():
+            stale = (current, self._framebuffers[self._read_idx])
+            self._textures[self._read_idx] = None
+            self._framebuffers[self._read_idx] = None
+            self._release_targets()
         if self._textures[0] is None or self.shader_program is None or self.quad_vao is None:
             self._setup_gl_resources(context)
 
         write_idx = 1 - self._read_idx
-        read_tex = self._textures[self._read_idx]
+        read_tex = stale[0] if stale else self._textures[self._read_idx]
         write_fb = self._framebuffers[write_idx]
         assert read_tex is not None and write_fb is not None
 
@@ -179,5 +198,8 @@ class CircleRainbowBackground(BaseInterpretationNode[mgl.Context, None, mgl.Fram
         self.shader_program["iTime"] = float(i_time)
         self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
+        if stale is not None:
+            stale[1].release()
+            stale[0].release()
         self._read_idx = write_idx
         return write_fb
@@ -11,6 +11,7 @@ from parrot.director.frame import Frame, FrameSignal
 from parrot.director.color_scheme import ColorScheme
 from parrot.director.mode import Mode
 from parrot.vj.constants import DEFAULT_WIDTH, DEFAULT_HEIGHT
+from parrot.vj.program_cache import program_cache, release_program
 
 
 @beartype
@@ -70,7 +71,7 @@ class ColorStrobe(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             self.texture.release()
             self.texture = None
         if self.shader_program:
-            self.shader_program.release()
+            release_program(self.shader_program)
             self.shader_program = None
         if self.quad_vao:
             self.quad_vao.release()
@@ -107,7 +108,7 @@ class ColorStrobe(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             }
             """
 
-            self.shader_program = context.program(
+            self.shader_program = program_cache(context).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
@@ -13,6 +13,7 @@ from parrot.director.color_scheme import ColorScheme
 from parrot.director.mode import Mode
 from parrot.vj.nodes.black import Black
 from parrot.vj.nodes.mode_switch import ModeSwitch
+from parrot.vj.nodes.shared_node import SharedNode
 from parrot.vj.nodes.color_strobe import ColorStrobe
 from parrot.vj.nodes.layer_compose import LayerCompose, LayerSpec, BlendMode
 from parrot.vj.nodes.hot_sparks_effect import HotSparksEffect
@@ -246,6 +247,9 @@ class ConcertStage(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             blackout=Black(),
             **prom_scene_nodes,
         )
+        # The scene without overlays, for outputs that show only the backdrop;
+        # shared so the composition below doesn't draw it a second time.
+        self.scene = SharedNode(mode_switch)
 
         laser_scan_heads = _blackout_aware_overlay(
             LaserScanHeads(
@@ -285,7 +289,7 @@ class ConcertStage(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.stage_blinders = stage_blinders
 
         final_composition = LayerCompose(
-            LayerSpec(mode_switch, BlendMode.NORMAL),
+            LayerSpec(self.scene, BlendMode.NORMAL),
             LayerSpec(hot_sparks, BlendMode.ADDITIVE, opacity=0.9),
             LayerSpec(laser_scan_heads, BlendMode.ADDITIVE, opacity=1.0),
             LayerSpec(stage_blinders, BlendMode.ADDITIVE, opacity=1.0),
@@ -339,6 +343,13 @@ class ConcertStage(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             camera_up=self.camera_up,
         )
 
+    def output_sources(
+        self,
+    ) -> dict[str, BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]]:
+        """Nodes a ``VJOutput`` may show, by its ``source`` name (the
+        ``OUTPUT_SOURCES`` that ``MultiOutputRenderer`` accepts)."""
+        return {"stage": self, "scene": self.scene}
+
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> Optional[mgl.Framebuffer]:
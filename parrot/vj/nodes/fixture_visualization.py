@@ -5,6 +5,8 @@ from beartype import beartype
 from parrot.graph.BaseInterpretationNode import Vibe
 from parrot.graph.BaseInterpretationNode import format_node_status
 from parrot.director.director import Director
+from parrot.lighting_pipeline import LightingSnapshot
+from parrot.utils.triple_buffer import TripleBuffer
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.nodes.canvas_effect_base import GenerativeEffectBase
@@ -20,13 +22,21 @@ from parrot.vj.renderers.motionstrip import MotionstripRenderer
 from parrot.vj.renderers.laser import LaserRenderer
 from parrot.state import State
 from parrot.fixtures.position_manager import FixturePositionManager
-from parrot.vj.shaders import kawase_blur, composite
+from parrot.vj.shaders import composite
+from parrot.vj.bloom import DualKawaseBloom
+from parrot.vj.render_target_pool import render_target_pool
 from parrot.vj.vj_director import VJDirector
+from parrot.vj.average_color import AverageColorProbe
 from typing import Optional
 import moderngl as mgl
 import numpy as np
 import math
-from parrot.venue_runtime import get_runtime_fixtures, get_runtime_manual_group
+from parrot.venue_runtime import (
+    get_runtime_fixtures,
+    get_runtime_manual_group,
+    runtime_leaf_fixtures,
+    runtime_slot_key,
+)
 
 # Extra offset upstage (−venue y) beyond the table’s upstage face; 0 = silhouette flush to that edge.
 DJ_SILHOUETTE_BEHIND_TABLE_EXTRA_M = 0.0
@@ -52,6 +62,7 @@ class FixtureVisualization(GenerativeEffectBase):
         canvas_width: int = 1200,
         canvas_height: int = 1200,
         director: Optional[Director] = None,
+        snapshots: Optional[TripleBuffer[LightingSnapshot]] = None,
     ):
         """
         Args:
@@ -63,12 +74,15 @@ class FixtureVisualization(GenerativeEffectBase):
             canvas_width: Width of the fixture canvas (legacy GUI coordinate space)
             canvas_height: Height of the fixture canvas (legacy GUI coordinate space)
             director: Optional director (interpretation-blend output routing for previews)
+            snapshots: Optional lighting snapshots to draw fixture output from
+                instead of the live fixtures (when the director steps on another thread)
         """
         super().__init__(width, height)
         self.state = state
         self.position_manager = position_manager
         self.vj_director = vj_director
         self._director = director
+        self.snapshots = snapshots
         self.canvas_width = canvas_width
         self.canvas_height = canvas_height
 
@@ -85,22 +99,21 @@ class FixtureVisualization(GenerativeEffectBase):
         self.bloom_alpha = (
             4.0  # Bloom contribution (increased for visibility, emissive removed)
         )
-        self.kawase_iterations = 5  # Number of blur passes
+        # Mip levels the emissive pass is blurred through (half, quarter, ...)
+        self.bloom = DualKawaseBloom(levels=4)
 
         # Additional framebuffers for multi-pass rendering
         self.opaque_texture: Optional[mgl.Texture] = None  # Keep opaque pass separate
         self.opaque_framebuffer: Optional[mgl.Framebuffer] = None
         self.emissive_framebuffer: Optional[mgl.Framebuffer] = None
         self.emissive_texture: Optional[mgl.Texture] = None
-        self.bloom_framebuffer: Optional[mgl.Framebuffer] = None
-        self.bloom_texture: Optional[mgl.Texture] = None
-        self.bloom_temp_framebuffer: Optional[mgl.Framebuffer] = None
-        self.bloom_temp_texture: Optional[mgl.Texture] = None
 
         # Shader programs for post-processing
-        self.kawase_shader: Optional[mgl.Program] = None
         self.composite_shader: Optional[mgl.Program] = None
 
+        # GPU reduction of the VJ output for ambient / video wall lighting
+        self._ambient_probe = AverageColorProbe()
+
         self._load_fixtures()
 
     def _setup_gl_resources(
@@ -136,21 +149,6 @@ class FixtureVisualization(GenerativeEffectBase):
                 depth_attachment=self.depth_texture,  # Share depth from opaque pass
             )
 
-            # Bloom framebuffers for ping-pong blur
-            self.bloom_texture = context.texture((width, height), 3)
-            self.bloom_texture.repeat_x = False
-            self.bloom_texture.repeat_y = False
-            self.bloom_framebuffer = context.framebuffer(
-                color_attachments=[self.bloom_texture]
-            )
-
-            self.bloom_temp_texture = context.texture((width, height), 3)
-            self.bloom_temp_texture.repeat_x = False
-            self.bloom_temp_texture.repeat_y = False
-            self.bloom_temp_framebuffer = context.framebuffer(
-                color_attachments=[self.bloom_temp_texture]
-            )
-
         if not self.shader_program:
             vertex_shader = self._get_vertex_shader()
             fragment_shader = self._get_fragment_shader()
@@ -158,13 +156,6 @@ class FixtureVisualization(GenerativeEffectBase):
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
-        if not self.kawase_shader:
-            # Kawase blur shader for bloom effect
-            self.kawase_shader = context.program(
-                vertex_shader=kawase_blur.get_vertex_shader(),
-                fragment_shader=kawase_blur.get_fragment_shader(),
-            )
-
         if not self.composite_shader:
             # Composite shader for final image
             self.composite_shader = context.program(
@@ -174,10 +165,7 @@ class FixtureVisualization(GenerativeEffectBase):
 
         if not self.quad_vao:
             self.quad_vao = self._create_fullscreen_quad(context)
-            # Create separate VAOs for kawase and composite shaders
-            self.kawase_quad_vao = self._create_quad_for_shader(
-                context, self.kawase_shader
-            )
+            # Create a separate VAO for the composite shader
             self.composite_quad_vao = self._create_quad_for_shader(
                 context, self.composite_shader
             )
@@ -360,32 +348,28 @@ class FixtureVisualization(GenerativeEffectBase):
     @staticmethod
     def _runtime_slot_key(f: FixtureBase) -> str:
         """Stable key for a logical fixture (survives runtime object replacement)."""
-        cid = getattr(f, "cloud_spec_id", None)
-        return str(cid) if cid is not None else f.id
+        return runtime_slot_key(f)
 
     def _leaf_map_by_runtime_slot_key(self) -> dict[str, FixtureBase]:
         """Current leaf fixtures from the live patch, keyed for renderer binding."""
-        out: dict[str, FixtureBase] = {}
-        for item in get_runtime_fixtures(self.state):
-            if isinstance(item, FixtureGroup):
-                for f in item.fixtures:
-                    out[self._runtime_slot_key(f)] = f
-            else:
-                out[self._runtime_slot_key(item)] = item
-        manual_group = get_runtime_manual_group(self.state)
-        if manual_group is not None:
-            for f in manual_group.fixtures:
-                out[self._runtime_slot_key(f)] = f
-        return out
+        return runtime_leaf_fixtures(self.state)
 
     def _sync_renderer_output_fixtures(self) -> None:
         """Bind each renderer's ``fixture`` to the current output (lerp or primary).
 
         Looks up the live patch leaf by stable slot key every frame so that after an
         interpretation blend promotion, we follow the new ``FixtureBase`` instances.
+        With ``snapshots``, binds the latest snapshot's copies instead.
         """
         if not self.renderers or not self._renderer_slot_keys:
             return
+        if self.snapshots is not None:
+            outputs = self.snapshots.read().fixtures
+            for renderer, key in zip(self.renderers, self._renderer_slot_keys):
+                output = outputs.get(key)
+                if output is not None:
+                    renderer.fixture = output
+            return
         leaves = self._leaf_map_by_runtime_slot_key()
         for renderer, key in zip(self.renderers, self._renderer_slot_keys):
             primary = leaves.get(key)
@@ -607,36 +591,30 @@ class FixtureVisualization(GenerativeEffectBase):
             vj_fbo.color_attachments[0] if vj_fbo and vj_fbo.color_attachments else None
         )
 
-        # Extract average color from VJ texture for global lighting and video wall light
+        # Average color of the VJ output drives global lighting and the video
+        # wall light. Reduced on the GPU and read back a frame late, so this
+        # never stalls on the VJ texture.
         global_light_color = (0.15, 0.15, 0.15)  # Default dim white
         video_wall_color = None  # Will be (r, g, b, intensity) or None
 
-        if vj_texture:
-            try:
-                # Read texture data and compute average
-                raw_data = vj_texture.read()
-                pixels = np.frombuffer(raw_data, dtype=np.uint8).reshape(
-                    (vj_texture.height, vj_texture.width, 3)
-                )
-                # Downsample for performance (every 16th pixel)
-                sampled = pixels[::16, ::16, :]
-                avg_color = np.mean(sampled, axis=(0, 1)) / 255.0
-                # Scale down for subtle lighting effect
-                global_light_color = tuple(avg_color * 0.3)
-
-                # Calculate video wall light (stronger than ambient)
-                # Intensity based on brightness (luminance)
-                brightness = (
-                    0.299 * avg_color[0] + 0.587 * avg_color[1] + 0.114 * avg_color[2]
-                )
-                video_wall_color = (
-                    avg_color[0],
-                    avg_color[1],
-                    avg_color[2],
-                    brightness,
-                )
-            except Exception:
-                pass  # Fall back to default if reading fails
+        avg_color = (
+            self._ambient_probe.sample(context, vj_texture) if vj_texture else None
+        )
+        if avg_color is not None:
+            # Scale down for subtle lighting effect
+            global_light_color = tuple(float(c) * 0.3 for c in avg_color)
+
+            # Calculate video wall light (stronger than ambient)
+            # Intensity based on brightness (luminance)
+            brightness = (
+                0.299 * avg_color[0] + 0.587 * avg_color[1] + 0.114 * avg_color[2]
+            )
+            video_wall_color = (
+                float(avg_color[0]),
+                float(avg_color[1]),
+                float(avg_color[2]),
+                float(brightness),
+            )
 
         # Initialize room renderer if needed
         if self.room_renderer is None:
@@ -713,9 +691,10 @@ class FixtureVisualization(GenerativeEffectBase):
                 normal=wall_normal,
             )
 
-        # Render fixture bodies (Blinn-Phong materials)
-        for renderer in self.renderers:
-            renderer.render_opaque(context, canvas_size, frame)
+        # Render fixture bodies (Blinn-Phong materials), instanced in one draw
+        with self.room_renderer.batched():
+            for renderer in self.renderers:
+                renderer.render_opaque(context, canvas_size, frame)
 
         # === PASS 2: Render emissive materials (bulbs and beams, excluding lasers) ===
         self.emissive_framebuffer.use()
@@ -735,19 +714,21 @@ class FixtureVisualization(GenerativeEffectBase):
         context.blend_func = context.SRC_ALPHA, context.ONE
 
         # Render emissive materials (bulbs and beams, but skip lasers - they render sharp)
-        for renderer in self.renderers:
-            if not isinstance(renderer, LaserRenderer):
-                renderer.render_emissive(context, canvas_size, frame)
+        with self.room_renderer.batched():
+            for renderer in self.renderers:
+                if not isinstance(renderer, LaserRenderer):
+                    renderer.render_emissive(context, canvas_size, frame)
 
         # Restore depth writes
         context.depth_mask = True
         context.disable(context.BLEND)
 
-        # === PASS 3: Apply Kawase blur to create bloom ===
-        self._apply_kawase_blur(context)
+        # === PASS 3: Blur the emissive pass into bloom (half resolution) ===
+        bloom_framebuffer = self._apply_bloom(context)
 
         # === PASS 4: Composite final image ===
-        self._composite_final_image(context)
+        self._composite_final_image(context, bloom_framebuffer)
+        render_target_pool(context).release(bloom_framebuffer)
 
         # === PASS 5: Render sharp laser beams directly to final framebuffer (no blur) ===
         self.framebuffer.use()
@@ -759,9 +740,10 @@ class FixtureVisualization(GenerativeEffectBase):
         context.blend_func = context.SRC_ALPHA, context.ONE
 
         # Render lasers directly to final framebuffer (sharp, no blur)
-        for renderer in self.renderers:
-            if isinstance(renderer, LaserRenderer):
-                renderer.render_emissive(context, canvas_size, frame)
+        with self.room_renderer.batched():
+            for renderer in self.renderers:
+                if isinstance(renderer, LaserRenderer):
+                    renderer.render_emissive(context, canvas_size, frame)
 
         # Restore state
         context.depth_mask = True
@@ -770,48 +752,19 @@ class FixtureVisualization(GenerativeEffectBase):
 
         return self.framebuffer
 
-    def _apply_kawase_blur(self, context: mgl.Context):
-        """Apply iterative Kawase blur to emissive texture for bloom effect"""
-        if not self.kawase_shader or not self.emissive_texture:
-            return
-
-        # Ping-pong between bloom_framebuffer and bloom_temp_framebuffer
-        # Start with emissive texture as input
-        current_input = self.emissive_texture
-        current_output = self.bloom_framebuffer
-
-        texel_size = (1.0 / self.width, 1.0 / self.height)
+    def _apply_bloom(self, context: mgl.Context) -> mgl.Framebuffer:
+        """Blur the emissive texture through a reduced-resolution mip chain.
 
-        for i in range(self.kawase_iterations):
-            current_output.use()
-            context.clear(0.0, 0.0, 0.0)
-
-            # Bind input texture
-            current_input.use(0)
-
-            # Set uniforms
-            self.kawase_shader["inputTexture"] = 0
-            self.kawase_shader["texelSize"] = texel_size
-            # Offset increases more gradually with each iteration for smoother blur
-            # Start smaller and increase more gradually to avoid streaks
-            self.kawase_shader["offset"] = 1.0 + i * 2.0
-
-            # Render fullscreen quad
-            self.kawase_quad_vao.render(mgl.TRIANGLE_STRIP)
-
-            # Ping-pong: output becomes input for next iteration
-            if i < self.kawase_iterations - 1:
-                if current_output == self.bloom_framebuffer:
-                    current_input = self.bloom_texture
-                    current_output = self.bloom_temp_framebuffer
-                else:
-                    current_input = self.bloom_temp_texture
-                    current_output = self.bloom_framebuffer
-
-        # Final result is in bloom_framebuffer/bloom_texture
+        Returns the half-resolution glow, borrowed from the render target
+        pool; the caller releases it once composited.
+        """
+        return self.bloom.blur(context, self.emissive_texture)
 
-    def _composite_final_image(self, context: mgl.Context):
-        """Composite opaque, emissive, and bloom textures into final image"""
+    def _composite_final_image(
+        self, context: mgl.Context, bloom_framebuffer: mgl.Framebuffer
+    ):
+        """Composite opaque and bloom textures into final image; the composite
+        samples the half-resolution bloom with linear filtering"""
         if not self.composite_shader:
             return
 
@@ -821,7 +774,11 @@ class FixtureVisualization(GenerativeEffectBase):
 
         # Bind textures for composite
         self.opaque_texture.use(0)  # Opaque (Blinn-Phong)
-        self.bloom_texture.use(1)  # Bloom
+        bloom_texture = bloom_framebuffer.color_attachments[0]
+        # Clamp so the upsampled edges don't wrap to the opposite side
+        bloom_texture.repeat_x = False
+        bloom_texture.repeat_y = False
+        bloom_texture.use(1)  # Bloom
 
         # Set uniforms
         self.composite_shader["opaqueTexture"] = 0
@@ -862,6 +819,12 @@ class FixtureVisualization(GenerativeEffectBase):
             shader, [(vbo, "2f 2f", "in_position", "in_texcoord")]
         )
 
+    def exit(self):
+        """Clean up OpenGL resources, including the ambient color probe"""
+        self._ambient_probe.release()
+        self.bloom.release()
+        super().exit()
+
     def _set_effect_uniforms(self, frame: Frame, scheme: ColorScheme):
         """Not used - rendering is done in custom render() method"""
         pass
@@ -895,14 +858,6 @@ class FixtureVisualization(GenerativeEffectBase):
             self.emissive_framebuffer.release()
         if self.emissive_texture:
             self.emissive_texture.release()
-        if self.bloom_framebuffer:
-            self.bloom_framebuffer.release()
-        if self.bloom_texture:
-            self.bloom_texture.release()
-        if self.bloom_temp_framebuffer:
-            self.bloom_temp_framebuffer.release()
-        if self.bloom_temp_texture:
-            self.bloom_temp_texture.release()
 
         # Clear references
         self.opaque_framebuffer = None
@@ -912,10 +867,6 @@ class FixtureVisualization(GenerativeEffectBase):
         self.texture = None
         self.emissive_framebuffer = None
         self.emissive_texture = None
-        self.bloom_framebuffer = None
-        self.bloom_texture = None
-        self.bloom_temp_framebuffer = None
-        self.bloom_temp_texture = None
 
         # Recreate with new dimensions
         self._setup_gl_resources(context, width, height)
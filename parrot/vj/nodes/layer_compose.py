@@ -2,7 +2,7 @@
 
 import struct
 import moderngl as mgl
-from typing import List, Optional, Tuple
+from typing import Hashable, List, Optional, Tuple
 from enum import Enum
 from beartype import beartype
 
@@ -10,6 +10,8 @@ from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.constants import DEFAULT_WIDTH, DEFAULT_HEIGHT
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.program_cache import program_cache, release_program
 
 
 class BlendMode(Enum):
@@ -57,7 +59,8 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.width = width
         self.height = height
 
-        # GL resources
+        # GL resources. The final target is borrowed from the render target
+        # pool per render and released by whoever consumes it.
         self.final_framebuffer: Optional[mgl.Framebuffer] = None
         self.final_texture: Optional[mgl.Texture] = None
         self.quad_program: Optional[mgl.Program] = None
@@ -69,28 +72,31 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self._context = context
         self._create_fullscreen_quad(context)
 
-        # Create final compositing framebuffer
-        self.final_texture = context.texture((self.width, self.height), 4)  # RGBA
-        self.final_framebuffer = context.framebuffer(
-            color_attachments=[self.final_texture]
-        )
-
     def exit(self):
         """Clean up compositing resources"""
-        if self.final_framebuffer:
-            self.final_framebuffer.release()
-        if self.final_texture:
-            self.final_texture.release()
+        if self._context is not None:
+            render_target_pool(self._context).unpin(self.final_framebuffer)
+        self.final_framebuffer = None
+        self.final_texture = None
         if self.quad_program:
-            self.quad_program.release()
+            release_program(self.quad_program)
+            self.quad_program = None
         if self.quad_vao:
             self.quad_vao.release()
+            self.quad_vao = None
         self._context = None
 
     def generate(self, vibe: Vibe):
         """Generate all layers - handled by base class recursive call"""
         pass
 
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        return (
+            self.width,
+            self.height,
+            tuple((spec.node, spec.blend_mode, spec.opacity) for spec in self.layer_specs),
+        )
+
     def _create_fullscreen_quad(self, context: mgl.Context):
         """Create a fullscreen quad for texture compositing"""
         # Vertex shader for fullscreen quad
@@ -140,7 +146,7 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         """
 
         # Create shader program
-        self.quad_program = context.program(
+        self.quad_program = program_cache(context).acquire(
             vertex_shader=vertex_shader, fragment_shader=fragment_shader
         )
 
@@ -193,27 +199,30 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self,
         context: mgl.Context,
         texture: mgl.Texture,
-        blend_mode: BlendMode,
+        blend_mode: Optional[BlendMode],
         opacity: float,
     ):
-        """Composite a layer texture onto the final framebuffer"""
+        """Composite a layer texture onto the final framebuffer
+        (``blend_mode`` None replaces what is there, scaled to fit)"""
         if not self.quad_program or not self.quad_vao:
             return
 
-        # Get blend function
-        blend_src, blend_dst = self._get_blend_func(blend_mode)
-
         # Set up required GL state for compositing
         # No need to save/restore - we explicitly set what we need
         context.disable(mgl.DEPTH_TEST)
-        context.enable(mgl.BLEND)
-        context.blend_func = blend_src, blend_dst
+        if blend_mode is None:
+            context.disable(mgl.BLEND)
+        else:
+            context.enable(mgl.BLEND)
+            context.blend_func = self._get_blend_func(blend_mode)
 
         # Bind texture and set uniforms
         texture.use(location=0)
         self.quad_program["texture0"] = 0
         self.quad_program["opacity"] = opacity
-        self.quad_program["blend_mode"] = self._get_blend_mode_int(blend_mode)
+        self.quad_program["blend_mode"] = self._get_blend_mode_int(
+            blend_mode or BlendMode.NORMAL
+        )
 
         # Render to final framebuffer
         self.final_framebuffer.use()
@@ -224,13 +233,24 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> Optional[mgl.Framebuffer]:
         """Render all layers and composite them with their specified blend modes"""
-        if not self.final_framebuffer or not self.layer_specs:
+        if not self.quad_vao or not self.layer_specs:
             return None
 
+        # The last composite stays pinned in the pool; while no layer is
+        # dirty, hand it out again instead of re-rendering the subtree.
+        pool = render_target_pool(context)
+        previous = self.final_framebuffer
+        if pool.is_pinned(previous) and self.output_unchanged(frame, scheme):
+            pool.retain(previous)
+            return previous
+
         # Save GL state that we will modify
         saved_viewport = context.viewport
         saved_fbo = context.fbo
 
+        self.final_framebuffer = pool.acquire(self.width, self.height, 4)  # RGBA
+        self.final_texture = self.final_framebuffer.color_attachments[0]
+
         # Clear final framebuffer to transparent black
         self.final_framebuffer.use()
         context.viewport = (0, 0, self.width, self.height)
@@ -244,7 +264,12 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             if not layer_result or not layer_result.color_attachments:
                 continue
 
-            if i == 0:
+            if i == 0 and layer_result.size != self.final_framebuffer.size:
+                # Base layer rendered below full size: upscale it by drawing
+                self._composite_layer(
+                    context, layer_result.color_attachments[0], None, 1.0
+                )
+            elif i == 0:
                 # First layer: copy directly (base layer)
                 # Disable blending for base layer copy
                 context.disable(mgl.BLEND)
@@ -257,6 +282,7 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
                     layer_spec.blend_mode,
                     layer_spec.opacity,
                 )
+            pool.release(layer_result)
 
         # Restore GL state to be a good citizen
         # Leave blending disabled (expected by calling code)
@@ -265,4 +291,7 @@ class LayerCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             saved_fbo.use()
         context.viewport = saved_viewport
 
+        pool.unpin(previous)
+        pool.pin(self.final_framebuffer)
+        self.mark_rendered(frame, scheme)
         return self.final_framebuffer
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import logging
+import time
+from collections import OrderedDict, deque
 import moderngl as mgl
 from typing import Optional, Dict, Any
 from enum import Enum
@@ -11,9 +13,16 @@ from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.graph.BaseInterpretationNode import format_node_status
 from parrot.director.frame import Frame, FrameSignal
 from parrot.director.color_scheme import ColorScheme
+from parrot.vj.profiler import vj_profiler
 
 logger = logging.getLogger(__name__)
 
+# GPU memory each ModeSwitch may hold in entered-but-inactive mode subtrees.
+# 0 restores the old behaviour of exiting a mode as soon as it is left.
+DEFAULT_PREWARM_BUDGET_BYTES = 256 * 1024 * 1024
+# Switch latencies kept per kind ("warm" / "cold") for switch_latency_stats
+SWITCH_LATENCY_SAMPLES = 100
+
 
 @beartype
 class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
@@ -21,9 +30,15 @@ class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
     A node that switches between different child nodes based on the current mode.
     Users provide a node for each mode as keyword arguments (matching enum value names).
     The current_child is set during generate() and render() simply renders the current child.
-    Enter/exit lifecycle is called on each switch.
 
-    Works with any Enum type (e.g., Mode, VJMode).
+    Modes other than the current one can be kept entered ("warm") so switching
+    to them allocates nothing: a mode that was left stays warm, and
+    ``prewarm_next`` enters the others ahead of time, most recently shown
+    first, while the warm subtrees fit in ``prewarm_budget_bytes``. The least
+    recently used warm subtrees are exited once over budget.
+
+    Works with any Enum type (e.g., Mode, VJMode). Mode children must not
+    share nodes with each other unless they are the very same child.
     """
 
     def __init__(
@@ -41,23 +56,43 @@ class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.current_child = next(iter(self.mode_nodes.values()))
         self._context = None
 
+        self.prewarm_budget_bytes = DEFAULT_PREWARM_BUDGET_BYTES
+        # Entered children other than current_child → estimated GPU bytes,
+        # least recently used first
+        self._warm: OrderedDict[int, tuple[BaseInterpretationNode, int]] = (
+            OrderedDict()
+        )
+        # Child ids in the order they were last current, oldest first
+        self._recency: OrderedDict[int, None] = OrderedDict()
+        self._recency[id(self.current_child)] = None
+        # Set when the next candidate didn't fit; cleared on every switch
+        self._prewarm_full = False
+        self.switch_latencies: dict[str, deque] = {
+            "warm": deque(maxlen=SWITCH_LATENCY_SAMPLES),
+            "cold": deque(maxlen=SWITCH_LATENCY_SAMPLES),
+        }
+
     @property
     def all_inputs(self):
         """Return only the current child as input"""
         return [self.current_child] if self.current_child else []
 
+    @property
+    def warm_children(self) -> list[BaseInterpretationNode]:
+        return [node for node, _ in self._warm.values()]
+
     def enter(self, context: mgl.Context):
-        """Initialize the current child only"""
+        """Remember the context; enter_recursive enters the current child"""
         logger.debug("Entering ModeSwitch")
         self._context = context
-        if self.current_child is not None:
-            self.current_child.enter_recursive(context)
+        self._prewarm_full = False
 
     def exit(self):
-        """Clean up the current child only"""
+        """Exit warm children; exit_recursive exits the current child"""
         self._context = None
-        if self.current_child is not None:
-            self.current_child.exit_recursive()
+        for node, _ in self._warm.values():
+            node.exit_recursive()
+        self._warm.clear()
 
     def generate(self, vibe: Vibe):
         """Switch current child based on mode and handle enter/exit lifecycle"""
@@ -70,19 +105,89 @@ class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
 
         # If switching children, handle enter/exit lifecycle
         if new_child is not None and new_child != self.current_child:
-            # Exit the old child recursively
-            if self.current_child is not None:
-                self.current_child.exit_recursive()
-            # Switch to new child
-            self.current_child = new_child
-            # Enter the new child recursively
-            if self.current_child is not None and self._context is not None:
-                self.current_child.enter_recursive(self._context)
+            self._switch_to(new_child)
 
         # Generate for the current child recursively
         if self.current_child is not None:
             self.current_child.generate_recursive(vibe)
 
+    def _switch_to(self, new_child: BaseInterpretationNode) -> None:
+        start = time.perf_counter()
+        old_child = self.current_child
+        warm = self._warm.pop(id(new_child), None) is not None
+        self.current_child = new_child
+        self._recency.pop(id(new_child), None)
+        self._recency[id(new_child)] = None
+        self._prewarm_full = False
+
+        if self._context is not None:
+            if old_child is not None:
+                if self.prewarm_budget_bytes > 0:
+                    self._warm[id(old_child)] = (old_child, gpu_bytes(old_child))
+                else:
+                    old_child.exit_recursive()
+            if not warm:
+                new_child.enter_recursive(self._context)
+            self._evict_over_budget()
+
+            kind = "warm" if warm else "cold"
+            duration = time.perf_counter() - start
+            self.switch_latencies[kind].append(duration)
+            vj_profiler.record_timing(f"mode_switch_{kind}", duration)
+        elif old_child is not None:
+            old_child.exit_recursive()
+
+    def prewarm_next(self) -> bool:
+        """Enter the most likely next mode that isn't entered yet, if it fits
+        the budget. Returns True if a subtree was entered."""
+        if self._context is None or self._prewarm_full or self.prewarm_budget_bytes <= 0:
+            return False
+        candidate = self._prewarm_candidate()
+        if candidate is None:
+            return False
+
+        candidate.enter_recursive(self._context)
+        footprint = gpu_bytes(candidate)
+        if self._warm_bytes() + footprint > self.prewarm_budget_bytes:
+            candidate.exit_recursive()
+            self._prewarm_full = True
+            return False
+        # Never-shown modes are the first to go when something must
+        self._warm[id(candidate)] = (candidate, footprint)
+        self._warm.move_to_end(id(candidate), last=False)
+        return True
+
+    def _prewarm_candidate(self) -> Optional[BaseInterpretationNode]:
+        children = {id(node): node for node in self.mode_nodes.values()}
+        # Recently shown modes first (the remote tends to toggle back), then
+        # the rest in declaration order
+        ordered = [children[key] for key in reversed(self._recency) if key in children]
+        ordered += [node for key, node in children.items() if key not in self._recency]
+        for node in ordered:
+            if node is not self.current_child and id(node) not in self._warm:
+                return node
+        return None
+
+    def _warm_bytes(self) -> int:
+        return sum(footprint for _, footprint in self._warm.values())
+
+    def _evict_over_budget(self) -> None:
+        while self._warm and self._warm_bytes() > self.prewarm_budget_bytes:
+            _, (node, _) = self._warm.popitem(last=False)
+            node.exit_recursive()
+
+    def switch_latency_stats(self) -> dict[str, dict[str, float | int]]:
+        """Count, mean and worst switch time in ms for warm and cold switches."""
+        stats = {}
+        for kind, samples in self.switch_latencies.items():
+            times = list(samples)
+            stats[kind] = {
+                "count": len(times),
+                "avg_ms": 1000 * sum(times) / len(times) if times else 0.0,
+                "max_ms": 1000 * max(times) if times else 0.0,
+            }
+        return stats
+
     def print_self(self) -> str:
         """Return class name with current mode"""
         mode_name = None
@@ -96,6 +201,7 @@ class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             self.__class__.__name__,
             emoji="🔀",
             signal=mode_name,
+            warm=len(self._warm),
         )
 
     def render(
@@ -103,3 +209,74 @@ class ModeSwitch(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
     ) -> Optional[mgl.Framebuffer]:
         """Render the current child"""
         return self.current_child.render(frame, scheme, context)
+
+
+@beartype
+def mode_switches(root: BaseInterpretationNode) -> list[ModeSwitch]:
+    """Every ModeSwitch under ``root``, including ones in inactive modes."""
+    found: list[ModeSwitch] = []
+    seen: set[int] = set()
+
+    def visit(node: BaseInterpretationNode) -> None:
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        children = list(node.all_inputs)
+        if isinstance(node, ModeSwitch):
+            found.append(node)
+            children += list(node.mode_nodes.values())
+        for child in children:
+            visit(child)
+
+    visit(root)
+    return found
+
+
+_DTYPE_BYTES = {"1": 1, "2": 2, "4": 4}
+
+
+@beartype
+def gpu_bytes(root: BaseInterpretationNode) -> int:
+    """Estimate of the GPU memory held by ``root``'s subtree: textures,
+    renderbuffers and buffers found on node attributes (one level into
+    lists, tuples and dicts). Pooled render targets that aren't held on a
+    node are shared and not counted."""
+    seen: set[int] = set()
+    total = 0
+
+    def resource_bytes(value: Any) -> int:
+        if id(value) in seen:
+            return 0
+        if isinstance(value, (mgl.Texture, mgl.Renderbuffer)):
+            seen.add(id(value))
+            width, height = value.size
+            return width * height * value.components * _DTYPE_BYTES.get(value.dtype[-1], 4)
+        if isinstance(value, mgl.Buffer):
+            seen.add(id(value))
+            return value.size
+        if isinstance(value, mgl.Framebuffer):
+            seen.add(id(value))
+            attachments = list(value.color_attachments) + [value.depth_attachment]
+            return sum(resource_bytes(a) for a in attachments if a is not None)
+        return 0
+
+    def visit(node: BaseInterpretationNode) -> None:
+        nonlocal total
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        for value in vars(node).values():
+            if isinstance(value, (list, tuple)):
+                total += sum(resource_bytes(item) for item in value)
+            elif isinstance(value, dict):
+                total += sum(resource_bytes(item) for item in value.values())
+            else:
+                total += resource_bytes(value)
+        children = list(node.all_inputs)
+        if isinstance(node, ModeSwitch):
+            children += node.warm_children
+        for child in children:
+            visit(child)
+
+    visit(root)
+    return total
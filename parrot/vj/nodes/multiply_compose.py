@@ -9,6 +9,8 @@ from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.constants import DEFAULT_WIDTH, DEFAULT_HEIGHT
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.program_cache import program_cache, release_program
 
 
 @beartype
@@ -52,7 +54,7 @@ class MultiplyCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
             self.texture.release()
             self.texture = None
         if self.shader_program:
-            self.shader_program.release()
+            release_program(self.shader_program)
             self.shader_program = None
         if self.quad_vao:
             self.quad_vao.release()
@@ -100,7 +102,7 @@ class MultiplyCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
             }
             """
 
-            self.shader_program = context.program(
+            self.shader_program = program_cache(context).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
@@ -147,6 +149,8 @@ class MultiplyCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
 
         if not base_framebuffer or not mask_framebuffer:
             # If either layer is missing, return black
+            render_target_pool(context).release(base_framebuffer)
+            render_target_pool(context).release(mask_framebuffer)
             self.framebuffer.use()
             context.clear(0.0, 0.0, 0.0)
             return self.framebuffer
@@ -171,4 +175,7 @@ class MultiplyCompose(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
 
         self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
+        pool = render_target_pool(context)
+        pool.release(base_framebuffer)
+        pool.release(mask_framebuffer)
         return self.framebuffer
@@ -16,14 +16,22 @@ from parrot.graph.BaseInterpretationNode import Vibe
 from parrot.director.frame import Frame, FrameSignal
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.nodes.canvas_effect_base import GenerativeEffectBase
+from parrot.vj.resolution_governor import ScalableResolution
+
+# Filterbank layout (see parrot.audio.filterbank) drawn as the spectrum strip.
+SPECTRUM_BAND_LAYOUT = "mel32"
 
 # Match the published shader’s default (2×2 supersampling).
 _NYAN_QUALITY = 2
 
 
 @beartype
-class NyancatBackground(GenerativeEffectBase):
-    """Procedural starfield + rainbow trail; audio modulates zoom and shimmer (no sprite)."""
+class NyancatBackground(ScalableResolution, GenerativeEffectBase):
+    """Procedural starfield + rainbow trail; audio modulates zoom and shimmer (no sprite).
+
+    Renders at ``scaled_size()`` so a ``ResolutionGovernor`` can trade
+    resolution for frame time.
+    """
 
     def __init__(self, width: int = 1920, height: int = 1080) -> None:
         super().__init__(width, height)
@@ -46,8 +54,7 @@ class NyancatBackground(GenerativeEffectBase):
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> mgl.Framebuffer:
-        if not self.framebuffer:
-            self._setup_gl_resources(context, self.width, self.height)
+        self._ensure_framebuffer_size(context, *self.scaled_size())
         self._upload_spectrum(frame)
         assert self.framebuffer is not None
         assert self.shader_program is not None
@@ -79,7 +86,10 @@ class NyancatBackground(GenerativeEffectBase):
         g = np.zeros(256, dtype=np.float32)
         ts = getattr(frame, "timeseries", None) or {}
         fh = ts.get(FrameSignal.freq_high.name) if ts else None
-        if fh is not None and len(fh) > 0:
+        bands = frame.band_energies(SPECTRUM_BAND_LAYOUT, 256)
+        if bands is not None:
+            g = np.clip(bands, 0.0, 1.0)
+        elif fh is not None and len(fh) > 0:
             a = np.asarray(fh, dtype=np.float32)
             if len(a) >= 256:
                 idx = (np.linspace(0, len(a) - 1, 256)).astype(np.int64)
@@ -102,7 +112,9 @@ class NyancatBackground(GenerativeEffectBase):
     def _set_effect_uniforms(self, frame: Frame, scheme: ColorScheme) -> None:
         t = float(time.perf_counter() - self._t0)
         self._safe_set_uniform("iTime", t)
-        self._safe_set_uniform("iResolution", (float(self.width), float(self.height)))
+        assert self.framebuffer is not None
+        width, height = self.framebuffer.size
+        self._safe_set_uniform("iResolution", (float(width), float(height)))
 
     def _get_fragment_shader(self) -> str:
         q = _NYAN_QUALITY
@@ -14,6 +14,13 @@ from parrot.director.frame import Frame, FrameSignal
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.nodes.canvas_effect_base import GenerativeEffectBase
 from parrot.vj.utils.signal_utils import get_random_frame_signal
+from parrot.vj.bloom import DualKawaseBloom
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.render_target_pool import render_target_pool
+
+# Filterbank layout (see parrot.audio.filterbank) traced when the frame has no
+# timeseries for the chosen signal.
+WAVEFORM_BAND_LAYOUT = "mel32"
 
 
 @beartype
@@ -56,17 +63,19 @@ class OscilloscopeEffect(GenerativeEffectBase):
         self.waveform_history = []
         self.max_history_length = 200  # Keep enough history for smooth scrolling
 
-        # OpenGL resources for bloom effect
-        self.bloom_framebuffer: Optional[mgl.Framebuffer] = None
-        self.bloom_texture: Optional[mgl.Texture] = None
-        self.blur_program: Optional[mgl.Program] = None
+        # Bloom: the waveforms are drawn into a pooled target, blurred down a
+        # half-resolution mip chain and composited into self.framebuffer
+        self.bloom = DualKawaseBloom(levels=3)
         self.composite_program: Optional[mgl.Program] = None
+        self.composite_vbo: Optional[mgl.Buffer] = None
+        self.composite_vao: Optional[mgl.VertexArray] = None
+        self._waveform_texture: Optional[mgl.Texture] = None
 
     @beartype
     def enter(self, context: mgl.Context):
         """Initialize OpenGL resources including bloom effect"""
         self._setup_gl_resources(context, self.width, self.height)
-        self._setup_bloom_resources(context)
+        self._setup_composite_resources(context)
 
     @beartype
     def exit(self):
@@ -76,38 +85,43 @@ class OscilloscopeEffect(GenerativeEffectBase):
 
     def _cleanup_bloom_resources(self):
         """Clean up bloom-specific resources"""
-        if self.bloom_framebuffer:
-            self.bloom_framebuffer.release()
-            self.bloom_framebuffer = None
-        if self.bloom_texture:
-            self.bloom_texture.release()
-            self.bloom_texture = None
-        if self.blur_program:
-            self.blur_program.release()
-            self.blur_program = None
+        self.bloom.release()
+        if self.composite_vao:
+            self.composite_vao.release()
+            self.composite_vao = None
+        if self.composite_vbo:
+            self.composite_vbo.release()
+            self.composite_vbo = None
         if self.composite_program:
-            self.composite_program.release()
+            release_program(self.composite_program)
             self.composite_program = None
+        if self._waveform_texture:
+            self._waveform_texture.release()
+            self._waveform_texture = None
 
-    def _setup_bloom_resources(self, context: mgl.Context):
-        """Setup additional resources for bloom effect"""
-        if not self.bloom_texture:
-            self.bloom_texture = context.texture((self.width, self.height), 3)
-            self.bloom_framebuffer = context.framebuffer(
-                color_attachments=[self.bloom_texture]
-            )
-
-        if not self.blur_program:
-            self.blur_program = context.program(
-                vertex_shader=self._get_vertex_shader(),
-                fragment_shader=self._get_blur_fragment_shader(),
-            )
-
+    def _setup_composite_resources(self, context: mgl.Context):
+        """Setup the program that adds the blurred glow back onto the waveforms"""
         if not self.composite_program:
-            self.composite_program = context.program(
+            self.composite_program = program_cache(context).acquire(
                 vertex_shader=self._get_vertex_shader(),
                 fragment_shader=self._get_composite_fragment_shader(),
             )
+        if not self.composite_vao:
+            vertices = np.array(
+                [
+                    # Position  # TexCoord
+                    [-1.0, -1.0, 0.0, 0.0],
+                    [1.0, -1.0, 1.0, 0.0],
+                    [-1.0, 1.0, 0.0, 1.0],
+                    [1.0, 1.0, 1.0, 1.0],
+                ],
+                dtype=np.float32,
+            )
+            self.composite_vbo = context.buffer(vertices.tobytes())
+            self.composite_vao = context.vertex_array(
+                self.composite_program,
+                [(self.composite_vbo, "2f 2f", "in_position", "in_texcoord")],
+            )
 
     @beartype
     def generate(self, vibe: Vibe):
@@ -219,32 +233,6 @@ class OscilloscopeEffect(GenerativeEffectBase):
         }
         """
 
-    def _get_blur_fragment_shader(self) -> str:
-        """Fragment shader for bloom blur pass"""
-        return """
-        #version 330 core
-        in vec2 uv;
-        out vec3 color;
-        uniform sampler2D input_texture;
-        uniform vec2 blur_direction;
-        uniform float blur_strength;
-        
-        void main() {
-            vec3 result = vec3(0.0);
-            float totalWeight = 0.0;
-            
-            // Gaussian blur
-            for (int i = -4; i <= 4; i++) {
-                vec2 offset = blur_direction * float(i) * blur_strength;
-                float weight = exp(-float(i * i) / 8.0);
-                result += texture(input_texture, uv + offset).rgb * weight;
-                totalWeight += weight;
-            }
-            
-            color = result / totalWeight;
-        }
-        """
-
     def _get_composite_fragment_shader(self) -> str:
         """Fragment shader for compositing original with bloom"""
         return """
@@ -305,31 +293,25 @@ class OscilloscopeEffect(GenerativeEffectBase):
     @beartype
     def _update_waveform_history(self, frame: Frame):
         """Update the waveform history buffer with current audio data"""
-        # Get audio timeseries data
-        signal_name = self.signal.name
-        if (
-            hasattr(frame, "timeseries")
-            and frame.timeseries
-            and signal_name in frame.timeseries
-        ):
-            waveform_data = frame.timeseries[signal_name]
-            if isinstance(waveform_data, (list, np.ndarray)) and len(waveform_data) > 0:
-                # Normalize the data to -1 to 1 range
-                waveform_array = np.array(waveform_data, dtype=np.float32)
-                if len(waveform_array) > 0:
-                    # Normalize
-                    max_val = np.max(np.abs(waveform_array))
-                    if max_val > 0:
-                        waveform_array = waveform_array / max_val
-
-                    # Add to history
-                    self.waveform_history.extend(waveform_array)
-
-                    # Keep history at manageable size
-                    if len(self.waveform_history) > self.max_history_length:
-                        self.waveform_history = self.waveform_history[
-                            -self.max_history_length :
-                        ]
+        # Prefer the signal's timeseries, else trace the filterbank spectrum
+        waveform_data = (frame.timeseries or {}).get(self.signal.name)
+        if waveform_data is None or len(waveform_data) == 0:
+            waveform_data = frame.band_energies(WAVEFORM_BAND_LAYOUT)
+        if waveform_data is not None and len(waveform_data) > 0:
+            # Normalize the data to -1 to 1 range
+            waveform_array = np.array(waveform_data, dtype=np.float32)
+            max_val = np.max(np.abs(waveform_array))
+            if max_val > 0:
+                waveform_array = waveform_array / max_val
+
+            # Add to history
+            self.waveform_history.extend(waveform_array)
+
+            # Keep history at manageable size
+            if len(self.waveform_history) > self.max_history_length:
+                self.waveform_history = self.waveform_history[
+                    -self.max_history_length :
+                ]
 
         # If no data available, use a simple sine wave as fallback
         if not self.waveform_history:
@@ -344,20 +326,22 @@ class OscilloscopeEffect(GenerativeEffectBase):
         if not self.waveform_history:
             return
 
-        # Prepare waveform data as texture
+        # Single row, single channel texture of the waveform history
         waveform_array = np.array(self.waveform_history, dtype=np.float32)
 
-        # Create 1D texture
-        if hasattr(self, "_waveform_texture"):
-            self._waveform_texture.release()
-
-        # Create 2D texture data (single row, single channel for waveform data)
-        texture_data = waveform_array.astype(np.float32)
-
-        context = self.shader_program.ctx
-        self._waveform_texture = context.texture(
-            (len(waveform_array), 1), 1, texture_data.tobytes(), dtype="f4"
-        )
+        # Reuse the texture while the history length is unchanged
+        if (
+            self._waveform_texture is not None
+            and self._waveform_texture.width == len(waveform_array)
+        ):
+            self._waveform_texture.write(waveform_array.tobytes())
+        else:
+            if self._waveform_texture is not None:
+                self._waveform_texture.release()
+            context = self.shader_program.ctx
+            self._waveform_texture = context.texture(
+                (len(waveform_array), 1), 1, waveform_array.tobytes(), dtype="f4"
+            )
         self._waveform_texture.use(1)
 
         self.shader_program["waveform_data"] = 1
@@ -369,74 +353,33 @@ class OscilloscopeEffect(GenerativeEffectBase):
     ) -> mgl.Framebuffer:
         """
         Render the oscilloscope effect with bloom.
-        First renders the basic waveforms, then applies bloom post-processing.
+        Draws the waveforms once into a pooled target, blurs that through the
+        shared dual Kawase chain and composites both into the output.
         """
         if not self.framebuffer:
             self._setup_gl_resources(context, self.width, self.height)
-        if not self.bloom_framebuffer:
-            self._setup_bloom_resources(context)
+        if not self.composite_vao:
+            self._setup_composite_resources(context)
 
-        # Render main oscilloscope effect to main framebuffer
-        self.framebuffer.use()
+        # Render main oscilloscope effect to a pooled scene target
+        pool = render_target_pool(context)
+        scene = pool.acquire(self.width, self.height)
+        scene.use()
         context.clear(0.0, 0.0, 0.0)
-
-        # Set effect-specific uniforms
         self._set_effect_uniforms(frame, scheme)
-
-        # Render main effect
         self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
-        # Apply bloom effect
-        self._apply_bloom_effect(context, frame, scheme)
-
-        return self.framebuffer
-
-    @beartype
-    def _apply_bloom_effect(
-        self, context: mgl.Context, frame: Frame, scheme: ColorScheme
-    ):
-        """Apply bloom post-processing effect"""
-        if (
-            not self.bloom_framebuffer
-            or not self.blur_program
-            or not self.composite_program
-        ):
-            return
-
-        # First blur pass - horizontal
-        self.bloom_framebuffer.use()
-        context.clear(0.0, 0.0, 0.0)
-
-        self.framebuffer.color_attachments[0].use(0)
-        self.blur_program["input_texture"] = 0
-        self.blur_program["blur_direction"] = (1.0 / self.width, 0.0)
-        self.blur_program["blur_strength"] = 2.0
+        glow = self.bloom.blur(context, scene.color_attachments[0])
 
-        self.quad_vao.render(mgl.TRIANGLE_STRIP)
-
-        # Second blur pass - vertical (back to main framebuffer)
-        self.framebuffer.use()
-
-        self.bloom_framebuffer.color_attachments[0].use(0)
-        self.blur_program["blur_direction"] = (0.0, 1.0 / self.height)
-
-        self.quad_vao.render(mgl.TRIANGLE_STRIP)
-
-        # Composite original with bloom
-        # Store original in bloom buffer temporarily
-        self.bloom_framebuffer.use()
-        context.clear(0.0, 0.0, 0.0)
-        self._set_effect_uniforms(frame, scheme)  # Re-render original
-        self.quad_vao.render(mgl.TRIANGLE_STRIP)
-
-        # Final composite
+        # Additive composite of the waveforms and their glow
         self.framebuffer.use()
-
-        self.bloom_framebuffer.color_attachments[0].use(0)  # Original
-        self.framebuffer.color_attachments[0].use(1)  # Blurred
-
+        scene.color_attachments[0].use(0)
+        glow.color_attachments[0].use(1)
         self.composite_program["original_texture"] = 0
         self.composite_program["bloom_texture"] = 1
         self.composite_program["bloom_intensity"] = self.bloom_intensity
+        self.composite_vao.render(mgl.TRIANGLE_STRIP)
 
-        self.quad_vao.render(mgl.TRIANGLE_STRIP)
+        pool.release(glow)
+        pool.release(scene)
+        return self.framebuffer
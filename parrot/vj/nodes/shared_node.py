@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+from typing import Optional
+
+import moderngl as mgl
+from beartype import beartype
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode
+from parrot.vj.nodes.mode_switch import ModeSwitch
+from parrot.vj.render_target_pool import render_target_pool
+
+
+@beartype
+class SharedNode(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
+    """Renders its input once per render pass however many consumers read it.
+
+    Wrap a subtree that more than one output (or composition) draws from.
+    The first ``render`` of a pass draws the input and holds a pool
+    reference to its output; later ones with the same frame and scheme
+    ``retain`` and return that same framebuffer, so every consumer releases
+    it as usual. A pass ends at ``release_frame`` (``VJDirector`` calls it
+    after every render) or at the pool's ``end_frame``.
+    """
+
+    def __init__(
+        self, node: BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]
+    ):
+        super().__init__([node])
+        self.node = node
+        self._output: Optional[mgl.Framebuffer] = None
+        self._context: Optional[mgl.Context] = None
+        self._pass: Optional[tuple[Frame, ColorScheme, int]] = None
+
+    def render(
+        self, frame: Frame, scheme: ColorScheme, context: mgl.Context
+    ) -> Optional[mgl.Framebuffer]:
+        pool = render_target_pool(context)
+        if self._output is not None and self._in_pass(frame, scheme, context):
+            pool.retain(self._output)
+            return self._output
+        self.release_frame()
+        output = self.node.render(frame, scheme, context)
+        if output is not None:
+            pool.retain(output)  # the pass's hold, dropped by release_frame
+            self._output, self._context = output, context
+            self._pass = (frame, scheme, pool.frame_index)
+        return output
+
+    def release_frame(self) -> None:
+        if self._output is not None and self._context is not None:
+            render_target_pool(self._context).release(self._output)
+        self._output = self._context = self._pass = None
+
+    def _in_pass(
+        self, frame: Frame, scheme: ColorScheme, context: mgl.Context
+    ) -> bool:
+        if context is not self._context or self._pass is None:
+            return False
+        pass_frame, pass_scheme, frame_index = self._pass
+        return (
+            frame is pass_frame
+            and scheme is pass_scheme
+            and frame_index == render_target_pool(context).frame_index
+        )
+
+    def output_unchanged(self, frame: Frame, scheme: ColorScheme) -> bool:
+        return self.node.output_unchanged(frame, scheme)
+
+    def exit(self):
+        self.release_frame()
+
+
+@beartype
+def shared_nodes(root: BaseInterpretationNode) -> list[SharedNode]:
+    """Every SharedNode under ``root``, inactive modes included."""
+    found: list[SharedNode] = []
+    seen: set[int] = set()
+
+    def visit(node: BaseInterpretationNode) -> None:
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        if isinstance(node, SharedNode):
+            found.append(node)
+        children = list(node.all_inputs)
+        if isinstance(node, ModeSwitch):
+            children += list(node.mode_nodes.values())
+        for child in children:
+            visit(child)
+
+    visit(root)
+    return found
@@ -2,13 +2,14 @@
 
 import numpy as np
 import moderngl as mgl
-from beartype.typing import Tuple
+from beartype.typing import Hashable, Tuple
 from beartype import beartype
 
 from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.constants import DEFAULT_WIDTH, DEFAULT_HEIGHT
+from parrot.vj.program_cache import program_cache, release_program
 
 
 @beartype
@@ -44,6 +45,7 @@ class StaticColor(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
 
     def exit(self):
         """Clean up GL resources"""
+        self.invalidate()
         if self.framebuffer:
             self.framebuffer.release()
             self.framebuffer = None
@@ -51,7 +53,7 @@ class StaticColor(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             self.texture.release()
             self.texture = None
         if self.shader_program:
-            self.shader_program.release()
+            release_program(self.shader_program)
             self.shader_program = None
         if self.quad_vao:
             self.quad_vao.release()
@@ -87,7 +89,7 @@ class StaticColor(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             }
             """
 
-            self.shader_program = context.program(
+            self.shader_program = program_cache(context).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
@@ -112,12 +114,17 @@ class StaticColor(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
                 self.shader_program, [(vbo, "2f", "in_position")]
             )
 
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        return (tuple(self.color), self.width, self.height)
+
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> mgl.Framebuffer:
         """Render a solid color rectangle"""
         if not self.framebuffer:
             self._setup_gl_resources(context)
+        elif self.output_unchanged(frame, scheme):
+            return self.framebuffer
 
         self.framebuffer.use()
         context.clear(0.0, 0.0, 0.0)  # Clear to black
@@ -126,6 +133,7 @@ class StaticColor(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.shader_program["u_color"] = self.color
         self.quad_vao.render(mgl.TRIANGLE_STRIP)
 
+        self.mark_rendered(frame, scheme)
         return self.framebuffer
 
 
@@ -12,6 +12,7 @@ import shutil
 from unittest.mock import Mock
 
 from parrot.vj.nodes.fixture_visualization import FixtureVisualization
+from parrot.vj.render_target_pool import render_target_pool
 from parrot.vj.vj_director import VJDirector
 from parrot.director.frame import Frame, FrameSignal
 from parrot.director.color_scheme import ColorScheme
@@ -89,6 +90,16 @@ class TestBloomRendering:
         img.save(f"test_output/{filename}")
         return pixels
 
+    def read_bloom(self, renderer, context):
+        """Re-run the bloom on the last emissive pass; the glow is half
+        resolution and returned as 8-bit pixels (each covers 2x2 output pixels)"""
+        glow = renderer.bloom.blur(context, renderer.emissive_texture)
+        width, height = glow.size
+        data = np.frombuffer(glow.color_attachments[0].read(), dtype=np.float16)
+        render_target_pool(context).release(glow)
+        pixels = np.clip(data.reshape((height, width, 3)) * 255, 0, 255)
+        return pixels.astype(np.uint8)
+
     def test_bloom_effect_applied(self, gl_context, renderer):
         """Test that bloom effect is visible and properly applied"""
         renderer.enter(gl_context)
@@ -124,8 +135,9 @@ class TestBloomRendering:
         emissive_pixels = self.save_texture_to_png(
             renderer.emissive_texture, "bloom_test_2_emissive.png"
         )
-        bloom_pixels = self.save_texture_to_png(
-            renderer.bloom_texture, "bloom_test_3_bloom.png"
+        bloom_pixels = self.read_bloom(renderer, gl_context)
+        Image.fromarray(np.flipud(bloom_pixels)).save(
+            "test_output/bloom_test_3_bloom.png"
         )
         final_pixels = self.save_texture_to_png(
             fbo.color_attachments[0], "bloom_test_4_final.png"
@@ -143,7 +155,7 @@ class TestBloomRendering:
         assert emissive_non_black > 500, "Emissive pass should contain light sources"
 
         # Bloom pass should have glowing content (blurred emissive)
-        bloom_non_black = np.sum(bloom_pixels > 5)
+        bloom_non_black = 4 * np.sum(bloom_pixels > 5)
         bloom_max = np.max(bloom_pixels)
         print(f"✓ Bloom pixels (>5): {bloom_non_black}, max={bloom_max}")
         assert (
@@ -216,13 +228,10 @@ class TestBloomRendering:
         fbo = renderer.render(frame, scheme, gl_context)
 
         # Verify that bloom texture exists and contains blurred content
-        bloom_data = renderer.bloom_texture.read()
-        bloom_pixels = np.frombuffer(bloom_data, dtype=np.uint8).reshape(
-            (1080, 1920, 3)
-        )
+        bloom_pixels = self.read_bloom(renderer, gl_context)
 
         # Bloom should have spread the light (more pixels affected than original emissive)
-        bloom_non_zero = np.sum(bloom_pixels > 1)
+        bloom_non_zero = 4 * np.sum(bloom_pixels > 1)
         emissive_data = renderer.emissive_texture.read()
         emissive_pixels = np.frombuffer(emissive_data, dtype=np.uint8).reshape(
             (1080, 1920, 3)
@@ -331,15 +340,13 @@ class TestBloomRendering:
 
         # Render dim
         fbo = renderer.render(frame, scheme, gl_context)
-        dim_bloom = renderer.bloom_texture.read()
-        dim_bloom_pixels = np.frombuffer(dim_bloom, dtype=np.uint8)
+        dim_bloom_pixels = self.read_bloom(renderer, gl_context)
         dim_bloom_sum = np.sum(dim_bloom_pixels, dtype=np.int64)
 
         # Test with bright fixture
         fixture.set_dimmer(255)  # Bright
         fbo = renderer.render(frame, scheme, gl_context)
-        bright_bloom = renderer.bloom_texture.read()
-        bright_bloom_pixels = np.frombuffer(bright_bloom, dtype=np.uint8)
+        bright_bloom_pixels = self.read_bloom(renderer, gl_context)
         bright_bloom_sum = np.sum(bright_bloom_pixels, dtype=np.int64)
 
         # Bright should have more bloom
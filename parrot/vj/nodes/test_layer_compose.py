@@ -8,6 +8,7 @@ from unittest.mock import Mock
 from PIL import Image
 
 from parrot.vj.nodes.layer_compose import LayerCompose, LayerSpec, BlendMode
+from parrot.vj.render_target_pool import render_target_pool
 from parrot.vj.nodes.black import Black
 from parrot.vj.nodes.video_player import VideoPlayer
 from parrot.vj.nodes.text_renderer import TextRenderer
@@ -303,6 +304,36 @@ class TestLayerComposeRendering:
         print(f"✅ Saved render to: {out_path}")
         return out_path
 
+    def test_unchanged_layers_reuse_cached_composite(
+        self, gl_context, test_frame, test_scheme
+    ):
+        """A static composite is rendered once and redrawn only when dirtied"""
+        red = StaticColor(color=(1.0, 0.0, 0.0), width=32, height=16)
+        blue = StaticColor(color=(0.0, 0.0, 1.0), width=32, height=16)
+        compose = LayerCompose(
+            LayerSpec(red, BlendMode.NORMAL),
+            LayerSpec(blue, BlendMode.ADDITIVE),
+            width=32,
+            height=16,
+        )
+        compose.enter_recursive(gl_context)
+        pool = render_target_pool(gl_context)
+
+        first = compose.render(test_frame, test_scheme, gl_context)
+        pool.release(first)
+        pool.end_frame()
+        assert compose.render(test_frame, test_scheme, gl_context) is first
+        pool.release(first)
+
+        blue.color = (0.0, 1.0, 0.0)
+        second = compose.render(test_frame, test_scheme, gl_context)
+        assert second is not first
+        pixel = np.frombuffer(second.read(components=3), dtype=np.uint8)[:3]
+        assert list(pixel) == [255, 255, 0]
+        pool.release(second)
+        compose.exit_recursive()
+        assert not pool.owns(second)
+
     def test_normal_blend_two_colors(self, gl_context, test_frame, test_scheme):
         """Test normal blending with two colored layers"""
         # Create two colored layers
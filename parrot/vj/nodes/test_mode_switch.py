@@ -0,0 +1,78 @@
+import moderngl as mgl
+import pytest
+
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
+from parrot.vj.nodes.mode_switch import ModeSwitch, gpu_bytes, mode_switches
+from parrot.vj.vj_mode import VJMode
+
+
+class TextureNode(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
+    """Holds one 64x64 RGBA texture (16 KiB) while entered."""
+
+    def __init__(self):
+        super().__init__([])
+        self.texture = None
+        self.enters = 0
+
+    def enter(self, context):
+        self.enters += 1
+        self.texture = context.texture((64, 64), 4)
+
+    def exit(self):
+        self.texture.release()
+        self.texture = None
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def test_switching_back_to_a_warm_mode_enters_nothing(gl_context):
+    blackout, dmack = TextureNode(), TextureNode()
+    switch = ModeSwitch(blackout=blackout, prom_dmack=dmack)
+    switch.enter_recursive(gl_context)
+    assert blackout.enters == 1 and dmack.texture is None
+
+    switch.generate_recursive(Vibe(VJMode.prom_dmack))
+    switch.generate_recursive(Vibe(VJMode.blackout))
+    assert (blackout.enters, dmack.enters) == (1, 1)
+    assert dmack.texture is not None
+    assert switch.switch_latency_stats()["warm"]["count"] == 1
+    assert switch.switch_latency_stats()["cold"]["count"] == 1
+
+    switch.exit_recursive()
+    assert blackout.texture is None and dmack.texture is None
+
+
+def test_prewarm_enters_likely_modes_within_budget(gl_context):
+    nodes = {mode.name: TextureNode() for mode in VJMode}
+    switch = ModeSwitch(**nodes)
+    switch.prewarm_budget_bytes = 2 * 64 * 64 * 4
+    assert mode_switches(switch) == [switch]
+    switch.enter_recursive(gl_context)
+
+    while switch.prewarm_next():
+        pass
+    assert len(switch.warm_children) == 2
+    assert gpu_bytes(switch) == 3 * 64 * 64 * 4
+
+    # Leaving a mode keeps it warm; the least recently used warm one is exited
+    cold = next(n for n in nodes.values() if n.texture is None)
+    mode_name = next(name for name, n in nodes.items() if n is cold)
+    switch.generate_recursive(Vibe(VJMode[mode_name]))
+    assert len(switch.warm_children) == 2
+    assert sum(n.texture is not None for n in nodes.values()) == 3
+
+    switch.prewarm_budget_bytes = 0
+    switch.generate_recursive(Vibe(VJMode.blackout))
+    assert [n for n in nodes.values() if n.texture is not None] == [
+        nodes["blackout"]
+    ]
+    assert switch.warm_children == []
+    switch.exit_recursive()
@@ -99,6 +99,17 @@ def test_waveform_history_fallback():
     assert isinstance(effect.waveform_history[0], (float, np.floating))
 
 
+def test_waveform_history_traces_band_energies():
+    """Without a timeseries for the signal, the filterbank bands are traced"""
+    effect = OscilloscopeEffect()
+    bands = np.linspace(0.0, 0.5, 32)
+    frame = Frame(values={FrameSignal.freq_all: 0.5}, bands={"mel32": bands})
+
+    effect._update_waveform_history(frame)
+
+    assert np.allclose(effect.waveform_history, bands / 0.5)
+
+
 def test_waveform_history_max_length():
     """Test that waveform history is kept within max length"""
     effect = OscilloscopeEffect()
@@ -136,12 +147,6 @@ def test_shader_generation():
     assert "* 0.4" in fragment_shader  # Reduced core glow
     assert "* 0.05" in fragment_shader  # Reduced intensity contribution
 
-    # Test blur fragment shader
-    blur_shader = effect._get_blur_fragment_shader()
-    assert isinstance(blur_shader, str)
-    assert "#version 330 core" in blur_shader
-    assert "blur" in blur_shader.lower()
-
     # Test composite fragment shader
     composite_shader = effect._get_composite_fragment_shader()
     assert isinstance(composite_shader, str)
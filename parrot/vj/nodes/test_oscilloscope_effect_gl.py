@@ -11,11 +11,16 @@ from parrot.director.color_scheme import ColorScheme
 from parrot.director.mode import Mode
 from parrot.graph.BaseInterpretationNode import Vibe
 from parrot.utils.colour import Color
+from parrot.vj.render_target_pool import render_target_pool
 
 
 @pytest.fixture
 def gl_context():
     """Create a headless OpenGL context for testing"""
+    try:
+        return mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        pass
     try:
         return mgl.create_context(standalone=True, require=330)
     except Exception as e:
@@ -53,10 +58,8 @@ class TestOscilloscopeEffectGL:
         assert effect.texture is not None
         assert effect.shader_program is not None
         assert effect.quad_vao is not None
-        assert effect.bloom_framebuffer is not None
-        assert effect.bloom_texture is not None
-        assert effect.blur_program is not None
         assert effect.composite_program is not None
+        assert effect.composite_vao is not None
 
         # Test exit
         effect.exit()
@@ -66,10 +69,8 @@ class TestOscilloscopeEffectGL:
         assert effect.texture is None
         assert effect.shader_program is None
         assert effect.quad_vao is None
-        assert effect.bloom_framebuffer is None
-        assert effect.bloom_texture is None
-        assert effect.blur_program is None
         assert effect.composite_program is None
+        assert effect.composite_vao is None
 
     def test_shader_compilation(self, gl_context):
         """Test that all shaders compile successfully"""
@@ -81,10 +82,6 @@ class TestOscilloscopeEffectGL:
             assert effect.shader_program is not None
             assert effect.shader_program.ctx == gl_context
 
-            # Test blur shader program
-            assert effect.blur_program is not None
-            assert effect.blur_program.ctx == gl_context
-
             # Test composite shader program
             assert effect.composite_program is not None
             assert effect.composite_program.ctx == gl_context
@@ -261,12 +258,51 @@ class TestOscilloscopeEffectGL:
                 assert result.height == height
                 assert effect.framebuffer.width == width
                 assert effect.framebuffer.height == height
-                assert effect.bloom_framebuffer.width == width
-                assert effect.bloom_framebuffer.height == height
 
             finally:
                 effect.exit()
 
+    def test_bloom_runs_on_the_shared_mip_chain(
+        self, gl_context, test_frame, color_scheme
+    ):
+        """The glow is blurred at half resolution and drawn only once per frame"""
+        effect = OscilloscopeEffect(width=256, height=256)
+        effect.enter(gl_context)
+        pool = render_target_pool(gl_context)
+        sizes = []
+        acquire = pool.acquire
+
+        def record(width, height, *args):
+            sizes.append((width, height))
+            return acquire(width, height, *args)
+
+        pool.acquire = record
+        effect._set_effect_uniforms = Mock(wraps=effect._set_effect_uniforms)
+
+        try:
+            result = effect.render(test_frame, color_scheme, gl_context)
+
+            effect._set_effect_uniforms.assert_called_once()
+            assert sizes == [(256, 256), (128, 128), (64, 64), (32, 32)]
+            assert np.frombuffer(result.read(), dtype=np.uint8).max() > 0
+        finally:
+            del pool.acquire
+            effect.exit()
+
+    def test_waveform_texture_is_reused(self, gl_context, test_frame, color_scheme):
+        """Re-rendering with the same history length writes into the same texture"""
+        effect = OscilloscopeEffect(width=128, height=128)
+        effect.max_history_length = 100
+        effect.enter(gl_context)
+
+        try:
+            effect.render(test_frame, color_scheme, gl_context)
+            texture = effect._waveform_texture
+            effect.render(test_frame, color_scheme, gl_context)
+            assert effect._waveform_texture is texture
+        finally:
+            effect.exit()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,6 +3,7 @@
 import pytest
 import numpy as np
 import moderngl as mgl
+from PIL import ImageFont
 
 from parrot.vj.nodes.text_renderer import TextRenderer, WhiteText, BlackText, ColorText
 from parrot.director.frame import Frame, FrameSignal
@@ -57,6 +58,21 @@ class TestTextRendererGL:
         finally:
             text_node.exit()
 
+    def test_default_bitmap_font_still_draws(self, gl_context, color_scheme):
+        """Without a FreeType font the bitmap fallback still renders text"""
+        text_node = WhiteText("TEST", width=200, height=100)
+        text_node.enter(gl_context)
+        text_node.font = ImageFont.load_default_imagefont()
+        text_node._needs_update = True
+
+        try:
+            frame = Frame({FrameSignal.freq_low: 0.0})
+            result_framebuffer = text_node.render(frame, color_scheme, gl_context)
+            pixels = np.frombuffer(result_framebuffer.read(), dtype=np.uint8)
+            assert pixels.max() == 255, "Should have white text"
+        finally:
+            text_node.exit()
+
     def test_black_text_colors(self, gl_context, color_scheme):
         """Test that BlackText renders black text on white background"""
         text_node = BlackText("TEST", width=200, height=100)
@@ -1,18 +1,20 @@
 #!/usr/bin/env python3
 
+import math
 import os
 import random
 from pathlib import Path
-from typing import Optional, Union
-import numpy as np
+from typing import Hashable, Optional, Union
 import moderngl as mgl
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
 from beartype import beartype
 
 from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.constants import DEFAULT_WIDTH, DEFAULT_HEIGHT
+from parrot.vj.glyph_atlas import GlyphAtlas, GlyphBatch, glyph_atlas
+from parrot.vj.program_cache import program_cache, release_program
 
 
 @beartype
@@ -86,19 +88,20 @@ class TextRenderer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.text_color = text_color
         self.bg_color = bg_color
 
-        # OpenGL resources
-        self.source_texture: Optional[mgl.Texture] = None  # Contains PIL image data
+        # OpenGL resources. Glyphs come from the shared per-font atlas; only
+        # the quad list is re-uploaded when the text changes.
         self.target_texture: Optional[mgl.Texture] = (
             None  # Framebuffer color attachment
         )
         self.framebuffer: Optional[mgl.Framebuffer] = None
-        self.quad_vao: Optional[mgl.VertexArray] = None
         self.shader_program: Optional[mgl.Program] = None
+        self._glyphs: Optional[GlyphBatch] = None
+        self._atlas: Optional[GlyphAtlas] = None
         self._context: Optional[mgl.Context] = None
 
         # Font and rendering
         self.font: Optional[ImageFont.ImageFont] = None
-        self._text_image: Optional[Image.Image] = None
+        self._text_origin = (0.0, 0.0)
         self._needs_update = True
 
     def enter(self, context: mgl.Context):
@@ -110,9 +113,15 @@ class TextRenderer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
 
     def exit(self):
         """Clean up text rendering resources"""
-        if self.source_texture:
-            self.source_texture.release()
-            self.source_texture = None
+        self.invalidate()
+        if self._glyphs:
+            self._glyphs.release()
+            self._glyphs = None
+        if self.shader_program:
+            release_program(self.shader_program)
+            self.shader_program = None
+        self._atlas = None
+        self._needs_update = True
         if self.target_texture:
             self.target_texture.release()
             self.target_texture = None
@@ -171,11 +180,6 @@ class TextRenderer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         if not self._context:
             return
 
-        # Create separate textures for source (PIL image) and target (framebuffer)
-        if not self.source_texture:
-            self.source_texture = self._context.texture(
-                (self.width, self.height), 3
-            )  # RGB
         if not self.target_texture:
             self.target_texture = self._context.texture(
                 (self.width, self.height), 3
@@ -184,114 +188,102 @@ class TextRenderer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
                 color_attachments=[self.target_texture]
             )
 
-        # Create shader program
+        # Glyph quads are laid out in pixels (y down, matching PIL)
         if not self.shader_program:
             vertex_shader = """
             #version 330 core
-            in vec2 in_position;
-            in vec2 in_texcoord;
+            in vec2 in_corner;
+            in vec4 in_rect;
+            in vec4 in_uv;
+            uniform vec2 canvas_size;
+            uniform vec2 text_origin;
+            uniform sampler2D glyph_atlas;
             out vec2 uv;
-            
+
             void main() {
-                gl_Position = vec4(in_position, 0.0, 1.0);
-                uv = in_texcoord;
+                vec2 position = text_origin + mix(in_rect.xy, in_rect.zw, in_corner);
+                gl_Position = vec4(position / canvas_size * 2.0 - 1.0, 0.0, 1.0);
+                uv = mix(in_uv.xy, in_uv.zw, in_corner) / vec2(textureSize(glyph_atlas, 0));
             }
             """
 
             fragment_shader = """
             #version 330 core
             in vec2 uv;
-            out vec3 color;
-            uniform sampler2D text_texture;
-            
+            out vec4 color;
+            uniform sampler2D glyph_atlas;
+            uniform vec3 text_color;
+
             void main() {
-                color = texture(text_texture, uv).rgb;
+                color = vec4(text_color, texture(glyph_atlas, uv).r);
             }
             """
 
-            self.shader_program = self._context.program(
+            self.shader_program = program_cache(self._context).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
-
-        # Create fullscreen quad
-        if not self.quad_vao:
-            vertices = np.array(
-                [
-                    # Position  # TexCoord
-                    -1.0,
-                    -1.0,
-                    0.0,
-                    0.0,  # Bottom-left -> (0,0) in texture
-                    1.0,
-                    -1.0,
-                    1.0,
-                    0.0,  # Bottom-right -> (1,0) in texture
-                    -1.0,
-                    1.0,
-                    0.0,
-                    1.0,  # Top-left -> (0,1) in texture
-                    1.0,
-                    1.0,
-                    1.0,
-                    1.0,  # Top-right -> (1,1) in texture
-                ],
-                dtype=np.float32,
-            )
-
-            vbo = self._context.buffer(vertices.tobytes())
-            self.quad_vao = self._context.vertex_array(
-                self.shader_program, [(vbo, "2f 2f", "in_position", "in_texcoord")]
-            )
+            self._glyphs = GlyphBatch(self.shader_program)
 
     def _render_text(self):
-        """Render text to PIL image and upload to OpenGL texture"""
-        if not self.font or not self.source_texture:
+        """Lay out the current text from the glyph atlas and upload its quads"""
+        if self.font is None or not self._glyphs:
             return
 
-        # Create PIL image with background color
-        image = Image.new("RGB", (self.width, self.height), self.bg_color)
-        draw = ImageDraw.Draw(image)
+        self._atlas = glyph_atlas(self._context, self.font)
+        layout = self._atlas.layout(self.current_text)
+        self._glyphs.set_quads(layout.quads)
 
-        # Draw text centered using anchor parameter
-        # anchor='mm' means middle-middle (center both horizontally and vertically)
-        center_x = self.width // 2
-        center_y = self.height // 2
-        draw.text(
-            (center_x, center_y),
-            self.current_text,
-            fill=self.text_color,
-            font=self.font,
-            anchor="mm",
+        # Centre the block like PIL's anchor='mm': middle of the text width
+        # and halfway between the first ascender and last descender
+        self._text_origin = (
+            float(self.width // 2),
+            float(math.ceil(self.height // 2 - (layout.top + layout.bottom) / 2)),
         )
-
-        # Convert to numpy array and upload to texture
-        # PIL uses RGB, OpenGL expects RGB - texture coordinates handle orientation
-        image_array = np.array(image)
-
-        self.source_texture.write(image_array.tobytes())
         self._needs_update = False
 
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        return (
+            self.current_text,
+            self.font_name,
+            self.font_size,
+            self.text_color,
+            self.bg_color,
+            self.width,
+            self.height,
+        )
+
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> mgl.Framebuffer:
         """Render the text to framebuffer"""
-        if not self.framebuffer or not self.quad_vao or not self.shader_program:
+        if not self.framebuffer or not self.shader_program:
             raise RuntimeError(
                 "TextRenderer not properly initialized. Call enter() first."
             )
 
-        # Re-render text if needed
+        if self.output_unchanged(frame, scheme):
+            return self.framebuffer
+
+        # Re-layout text if needed
         if self._needs_update:
             self._render_text()
 
         # Render to framebuffer
         self.framebuffer.use()
-        context.clear(0.0, 0.0, 0.0)
-
-        self.source_texture.use(0)
-        self.shader_program["text_texture"] = 0
-        self.quad_vao.render(mgl.TRIANGLE_STRIP)
+        context.clear(*(channel / 255.0 for channel in self.bg_color))
+
+        if self._atlas is not None:
+            context.enable(mgl.BLEND)
+            context.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
+            self.shader_program["canvas_size"] = (float(self.width), float(self.height))
+            self.shader_program["text_origin"] = self._text_origin
+            self.shader_program["text_color"] = tuple(
+                channel / 255.0 for channel in self.text_color
+            )
+            self._glyphs.draw(self._atlas)
+            context.disable(mgl.BLEND)
 
+        self.mark_rendered(frame, scheme)
         return self.framebuffer
 
     def set_text(self, text: Union[str, list[str]]):
@@ -316,11 +308,9 @@ class TextRenderer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
     def set_colors(
         self, text_color: tuple[int, int, int], bg_color: tuple[int, int, int]
     ):
-        """Update text and background colors"""
-        if self.text_color != text_color or self.bg_color != bg_color:
-            self.text_color = text_color
-            self.bg_color = bg_color
-            self._needs_update = True
+        """Update text and background colors (uniforms; no re-layout)"""
+        self.text_color = text_color
+        self.bg_color = bg_color
 
 
 # Convenience factory functions
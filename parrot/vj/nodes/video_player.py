@@ -3,8 +3,7 @@
 import os
 import random
 import time
-from typing import List, Optional
-import cv2
+from typing import Hashable, List, Optional
 import numpy as np
 import moderngl as mgl
 from beartype import beartype
@@ -15,6 +14,9 @@ from parrot.graph.BaseInterpretationNode import BaseInterpretationNode, Vibe
 from parrot.director.frame import Frame
 from parrot.director.color_scheme import ColorScheme
 from parrot.vj.constants import DEFAULT_WIDTH, DEFAULT_HEIGHT
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.utils.video_cache import VideoCache
+from parrot.vj.utils.video_decoder import DecodedFrame, VideoDecoder
 
 
 @beartype
@@ -22,6 +24,11 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
     """
     A video player node that plays videos from a specified directory.
     Automatically cycles through videos in the selected video group.
+
+    Decoding runs on a ``VideoDecoder`` thread that also pre-opens the next
+    file; the render thread only streams ready RGB frames into a persistent
+    texture through a pixel buffer. Clips pre-transcoded to this node's size
+    by ``just build-video-cache`` are read from the cache instead of decoded.
     """
 
     def __init__(
@@ -37,10 +44,13 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
         self.width = width
         self.height = height
         self.current_video_path: Optional[str] = None
-        self.video_capture: Optional[cv2.VideoCapture] = None
+        self._decoder = VideoDecoder(cache=VideoCache(), output_size=(width, height))
         self.video_files: List[str] = []
         self.current_video_index = 0
         self.texture: Optional[mgl.Texture] = None
+        # Persistent upload target sized to the video, fed through a PBO
+        self.video_texture: Optional[mgl.Texture] = None
+        self._upload_buffer: Optional[mgl.Buffer] = None
         self.framebuffer: Optional[mgl.Framebuffer] = None
         self.quad_vao: Optional[mgl.VertexArray] = None
         self.shader_program: Optional[mgl.Program] = None
@@ -62,15 +72,20 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
 
     def exit(self):
         """Clean up video resources"""
-        if self.video_capture:
-            self.video_capture.release()
-            self.video_capture = None
+        self._decoder.stop()
+        self._release_video_texture()
         if self.texture:
             self.texture.release()
             self.texture = None
         if self.framebuffer:
             self.framebuffer.release()
             self.framebuffer = None
+        if self.quad_vao:
+            self.quad_vao.release()
+            self.quad_vao = None
+        if self.shader_program:
+            release_program(self.shader_program)
+            self.shader_program = None
         self._context = None
 
     def generate(self, vibe: Vibe):
@@ -138,50 +153,25 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             print(f"Warning: No video files found in {group_path}")
 
     def _load_next_video(self):
-        """Load the next video in the sequence"""
+        """Start decoding the current video and pre-open the one after it"""
         if not self.video_files:
             return
 
-        if self.video_capture:
-            self.video_capture.release()
-
         # Ensure current_video_index is within bounds
         if self.current_video_index >= len(self.video_files):
             self.current_video_index = 0
 
         video_path = self.video_files[self.current_video_index]
-        self.video_capture = cv2.VideoCapture(video_path)
-
-        if not self.video_capture.isOpened():
-            print(f"Error: Could not open video {video_path}")
-            if self.video_files:  # Only advance if we have videos
-                self.current_video_index = (self.current_video_index + 1) % len(
-                    self.video_files
-                )
-            return
-
-        # Get video properties
-        self.fps = self.video_capture.get(cv2.CAP_PROP_FPS) or 30
-        self.video_width = int(self.video_capture.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.video_height = int(self.video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-        # If the video is longer than one minute, jump to a random point that's at
-        # least one minute before the end to avoid always starting at the beginning.
-        total_frames = int(self.video_capture.get(cv2.CAP_PROP_FRAME_COUNT)) or 0
-        if self.fps and total_frames > 0:
-            duration_seconds = total_frames / self.fps
-            if duration_seconds > 60.0:
-                max_start_seconds = max(0.0, duration_seconds - 60.0)
-                start_seconds = random.uniform(0.0, max_start_seconds)
-                start_frame = int(start_seconds * self.fps)
-                # Seek by frame for better accuracy across codecs/containers
-                self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
-
-        # Calculate scaling to cover the target area while preserving aspect ratio
-        self._calculate_scaling()
-
+        self._decoder.play(video_path, next_path=self._following_video(video_path))
         self.current_video_path = video_path
 
+    def _following_video(self, video_path: str) -> Optional[str]:
+        """The file to continue with when ``video_path`` ends"""
+        if len(self.video_files) < 2 or video_path not in self.video_files:
+            return None
+        index = self.video_files.index(video_path)
+        return self.video_files[(index + 1) % len(self.video_files)]
+
     def _calculate_scaling(self):
         """Calculate scaling and offset to cover target area while preserving aspect ratio"""
         if self.video_width == 0 or self.video_height == 0:
@@ -264,7 +254,7 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             }
             """
 
-            self.shader_program = ctx.program(
+            self.shader_program = program_cache(ctx).acquire(
                 vertex_shader=vertex_shader, fragment_shader=fragment_shader
             )
 
@@ -299,56 +289,28 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
                 self.shader_program, [(vbo, "2f 2f", "in_position", "in_texcoord")]
             )
 
+    def _frame_due(self, current_time: float) -> bool:
+        return bool(self.video_files) and (
+            current_time - self.last_frame_time >= 1.0 / self.fps
+        )
+
+    def cache_key(self, frame: Frame, scheme: ColorScheme) -> Hashable | None:
+        # The output only changes when the next decoded frame is shown
+        if self._frame_due(time.time()):
+            return None
+        return (self.current_video_path, self.last_frame_time)
+
     def render(
         self, frame: Frame, scheme: ColorScheme, context: mgl.Context
     ) -> mgl.Framebuffer:
         """Render the current video frame"""
-        if not self.video_capture or not self.video_files:
-            # Return empty framebuffer or create a black one
-            if not self.framebuffer:
-                self.texture = context.texture((self.width, self.height), 3)
-                self.framebuffer = context.framebuffer(color_attachments=[self.texture])
-                # Clear it to black
-                self.framebuffer.use()
-                context.clear(0.0, 0.0, 0.0)
-            return self.framebuffer
-
         # Check if we need to advance to next frame based on FPS
         current_time = time.time()
-        frame_duration = 1.0 / self.fps
-
-        if current_time - self.last_frame_time >= frame_duration:
-            ret, cv_frame = self.video_capture.read()
-
-            if not ret:
-                # Video ended, load next video
-                if self.video_files:  # Only advance if we have videos
-                    self.current_video_index = (self.current_video_index + 1) % len(
-                        self.video_files
-                    )
-                    self._load_next_video()
-                    if self.video_capture:
-                        ret, cv_frame = self.video_capture.read()
-
-            if ret:
-                # Convert BGR to RGB
-                cv_frame = cv2.cvtColor(cv_frame, cv2.COLOR_BGR2RGB)
-
-                # Setup GL resources (using target dimensions)
-                self._setup_gl_resources(context)
-
-                # Create a temporary texture for the video frame
-                video_texture = context.texture(
-                    (self.video_width, self.video_height), 3
-                )
-                video_texture.write(cv_frame.tobytes())
-
-                # Render the scaled video to our framebuffer
-                self._render_scaled_video(context, video_texture)
-
-                # Clean up temporary texture
-                video_texture.release()
 
+        if self._frame_due(current_time):
+            decoded = self._decoder.poll()
+            if decoded is not None:
+                self._show_decoded_frame(context, decoded)
                 self.last_frame_time = current_time
 
         # Ensure we always have a framebuffer to return
@@ -359,8 +321,47 @@ class VideoPlayer(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
             self.framebuffer.use()
             context.clear(0.0, 0.0, 0.0)
 
+        self.mark_rendered(frame, scheme)
         return self.framebuffer
 
+    def _show_decoded_frame(self, context: mgl.Context, decoded: DecodedFrame):
+        """Upload a decoded frame and draw it scaled into the output"""
+        if decoded.path != self.current_video_path:
+            # The decoder rolled over to the pre-opened file; queue the next
+            self.current_video_path = decoded.path
+            self.current_video_index = self.video_files.index(decoded.path)
+            self._decoder.set_next(self._following_video(decoded.path))
+
+        self.fps = decoded.fps
+        height, width = decoded.rgb.shape[:2]
+        if width != self.video_width or height != self.video_height:
+            self.video_width = width
+            self.video_height = height
+            self._calculate_scaling()
+            self._release_video_texture()
+
+        # Setup GL resources (using target dimensions)
+        self._setup_gl_resources(context)
+
+        if self.video_texture is None:
+            self.video_texture = context.texture((width, height), 3)
+            self._upload_buffer = context.buffer(reserve=width * height * 3)
+
+        # Stage through the pixel buffer so the texture write is a GPU-side copy
+        self._upload_buffer.write(decoded.rgb)
+        self.video_texture.write(self._upload_buffer)
+
+        # Render the scaled video to our framebuffer
+        self._render_scaled_video(context, self.video_texture)
+
+    def _release_video_texture(self):
+        if self.video_texture:
+            self.video_texture.release()
+            self.video_texture = None
+        if self._upload_buffer:
+            self._upload_buffer.release()
+            self._upload_buffer = None
+
     def _render_scaled_video(self, context: mgl.Context, video_texture: mgl.Texture):
         """Render the video texture to the framebuffer with scaling and cropping"""
         if not self.framebuffer or not self.quad_vao or not self.shader_program:
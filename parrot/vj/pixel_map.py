@@ -0,0 +1,317 @@
+"""Drive LED-bulb fixtures from the VJ frame: GPU gather, async readback."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+from parrot.fixtures.base import FixtureBase, FixtureWithBulbs
+from parrot.fixtures.chauvet.colorband_pix import ColorBandPixZone
+from parrot.fixtures.motionstrip import MotionstripBulb
+from parrot.state import State
+from parrot.utils.dmx_utils import Universe
+from parrot.utils.triple_buffer import TripleBuffer
+from parrot.venue_runtime import runtime_leaf_fixtures
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.renderers.base import quaternion_rotate_vector
+
+
+@beartype
+@dataclass(frozen=True)
+class _BulbKind:
+    components: int  # 3 = RGB, 4 = RGBW
+    pitch: float  # metres between neighbouring bulbs along the fixture
+    # The fixture has no dimmer channel; its dimmer is baked into the colour
+    dimmer_in_color: bool = False
+
+
+# Bulbs whose channels are plain RGB(W) emitters; spacing matches the 3D view
+_BULB_KINDS: dict[type, _BulbKind] = {
+    MotionstripBulb: _BulbKind(4, 0.22),
+    ColorBandPixZone: _BulbKind(3, 0.08, dimmer_in_color=True),
+}
+
+_VERTEX_SHADER = """
+#version 330 core
+in vec2 in_position;
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+}
+"""
+
+# One output texel per bulb. Five taps over the bulb's footprint keep a
+# bulb from flickering on single bright pixels; RGBW bulbs send the common
+# part of r, g and b to the white emitter.
+_GATHER_SHADER = """
+#version 330 core
+out vec4 color;
+uniform sampler2D source_texture;
+uniform sampler2D targets;
+void main() {
+    vec4 target = texelFetch(targets, ivec2(gl_FragCoord.x, 0), 0);
+    vec2 d = vec2(target.z, 0.0);
+    vec3 rgb = 0.2 * (
+        texture(source_texture, target.xy).rgb +
+        texture(source_texture, target.xy - d.xy).rgb +
+        texture(source_texture, target.xy + d.xy).rgb +
+        texture(source_texture, target.xy - d.yx).rgb +
+        texture(source_texture, target.xy + d.yx).rgb
+    );
+    float white = target.w > 0.5 ? min(rgb.r, min(rgb.g, rgb.b)) : 0.0;
+    color = vec4(rgb - white, white);
+}
+"""
+
+
+@beartype
+@dataclass(frozen=True, eq=False)
+class PixelMapLayout:
+    """Where each mapped bulb samples the VJ frame and the DMX it drives.
+
+    ``targets`` is ``(bulbs, 4)`` float32: texture u, v (v = 0 is the top of
+    the frame), sample radius in u, and 1 for RGBW bulbs. ``channels`` is
+    ``(universe, first DMX channel, components)`` per bulb. ``dimmed_by``
+    is, per bulb, the fixture whose dimmer scales the written colour (for
+    fixtures without a dimmer channel), else None.
+    """
+
+    targets: np.ndarray
+    channels: tuple[tuple[Universe, int, int], ...]
+    dimmed_by: tuple[Optional[FixtureBase], ...]
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+
+EMPTY_PIXEL_MAP = PixelMapLayout(np.zeros((0, 4), dtype=np.float32), (), ())
+
+
+@beartype
+@dataclass(frozen=True, eq=False)
+class PixelMapColors:
+    """One readback: ``(bulbs, 4)`` uint8 RGBW for ``layout``."""
+
+    layout: PixelMapLayout
+    pixels: np.ndarray
+
+
+@beartype
+def build_pixel_map(
+    fixtures: Iterable[FixtureBase], room_width: float, room_height: float
+) -> PixelMapLayout:
+    """Map bulbs to the VJ frame seen as the room's back wall, from the
+    audience: venue x spans its width (centred), height its height."""
+    targets: list[tuple[float, float, float, float]] = []
+    channels: list[tuple[Universe, int, int]] = []
+    dimmed_by: list[Optional[FixtureBase]] = []
+    for fixture in fixtures:
+        if not isinstance(fixture, FixtureWithBulbs) or fixture.x is None:
+            continue
+        bulbs = fixture.get_bulbs()
+        for index, bulb in enumerate(bulbs):
+            kind = _BULB_KINDS.get(type(bulb))
+            if kind is None:
+                continue
+            along = (index - (len(bulbs) - 1) / 2) * kind.pitch
+            # Desktop space is Y-up: x is venue x, y is height
+            offset = quaternion_rotate_vector(
+                fixture.orientation, np.array([along, 0.0, 0.0], dtype=np.float32)
+            )
+            u = 0.5 + (float(fixture.x) + float(offset[0])) / room_width
+            height = float(fixture.z) + float(offset[1])
+            targets.append(
+                (
+                    min(max(u, 0.0), 1.0),
+                    min(max(1.0 - height / room_height, 0.0), 1.0),
+                    0.5 * kind.pitch / room_width,
+                    1.0 if kind.components == 4 else 0.0,
+                )
+            )
+            channels.append(
+                (fixture.universe, fixture.address + bulb.address, kind.components)
+            )
+            dimmed_by.append(fixture if kind.dimmer_in_color else None)
+    if not channels:
+        return EMPTY_PIXEL_MAP
+    return PixelMapLayout(
+        np.array(targets, dtype=np.float32), tuple(channels), tuple(dimmed_by)
+    )
+
+
+@dataclass(eq=False)
+class _ReadbackSlot:
+    texture: Any
+    framebuffer: Any
+    pixel_buffer: Any
+    layout: PixelMapLayout
+
+
+@beartype
+class PixelMapper:
+    """Pixel-maps the venue's LED bulbs (motion strips, COLORband zones) to
+    the VJ output.
+
+    The lighting thread calls ``apply`` just before DMX goes out; it keeps
+    the layout in step with the venue and overwrites mapped bulbs' channels
+    with the newest colours. The GL thread calls ``capture`` with each VJ
+    frame, a one-texel-per-bulb gather pass read back asynchronously, and
+    ``poll`` once per frame (before the next ``capture``) to hand finished
+    readbacks over through ``colors``. The only per-bulb Python work is the
+    DMX write itself.
+    """
+
+    def __init__(self, state: State):
+        self.state = state
+        self.layout = EMPTY_PIXEL_MAP
+        self.colors: TripleBuffer[PixelMapColors] = TripleBuffer(
+            PixelMapColors(EMPTY_PIXEL_MAP, np.zeros((0, 4), dtype=np.uint8))
+        )
+        self.skipped_captures = 0
+        self._layout_snapshot: Any = None
+        self._context: Optional[mgl.Context] = None
+        self._program: Optional[mgl.Program] = None
+        self._vbo: Optional[mgl.Buffer] = None
+        self._vao: Optional[mgl.VertexArray] = None
+        self._targets: Optional[mgl.Texture] = None
+        self._targets_layout: Optional[PixelMapLayout] = None
+        self._slots: list[_ReadbackSlot] = []
+        self._in_flight: deque[_ReadbackSlot] = deque()
+
+    def update_layout(self) -> PixelMapLayout:
+        """Rebuild the layout when the venue snapshot changed (lighting thread)."""
+        snapshot = self.state.runtime_venue_snapshot
+        if snapshot is not self._layout_snapshot:
+            self._layout_snapshot = snapshot
+            self.layout = (
+                EMPTY_PIXEL_MAP
+                if snapshot is None
+                else build_pixel_map(
+                    runtime_leaf_fixtures(self.state).values(),
+                    max(float(snapshot.floor_width), 0.5),
+                    max(float(snapshot.floor_height), 0.5),
+                )
+            )
+        return self.layout
+
+    def apply(self, dmx: Any) -> int:
+        """Write the newest colours for the current layout; returns bulbs written."""
+        layout = self.update_layout()
+        colors = self.colors.read()
+        if colors.layout is not layout:
+            return 0
+        pixels = colors.pixels
+        if any(fixture is not None for fixture in layout.dimmed_by):
+            # Blackout and dimming reach these fixtures only through colour
+            scale = np.array(
+                [
+                    1.0 if fixture is None else fixture.get_dimmer() / 255
+                    for fixture in layout.dimmed_by
+                ]
+            )
+            pixels = np.rint(pixels * scale[:, None]).astype(np.uint8)
+        for (universe, channel, components), rgbw in zip(
+            layout.channels, pixels.tolist()
+        ):
+            for component in range(components):
+                if channel + component <= 512:
+                    dmx.set_channel(
+                        channel + component, rgbw[component], universe=universe
+                    )
+        return len(layout)
+
+    def capture(self, context: mgl.Context, texture: Any) -> bool:
+        """Start sampling ``texture`` at every bulb of the current layout."""
+        layout = self.layout
+        if not len(layout):
+            return False
+        if context is not self._context:
+            self.release()
+            self._create_resources(context)
+        if layout is not self._targets_layout:
+            self._rebuild_targets(context, layout)
+        slot = next((s for s in self._slots if s not in self._in_flight), None)
+        if slot is None:
+            self.skipped_captures += 1
+            return False
+
+        previous_framebuffer, previous_viewport = context.fbo, context.viewport
+        slot.framebuffer.use()
+        context.viewport = (0, 0, len(layout), 1)
+        texture.use(0)
+        self._targets.use(1)
+        self._program["source_texture"] = 0
+        self._program["targets"] = 1
+        self._vao.render(mgl.TRIANGLE_STRIP)
+        slot.framebuffer.read_into(slot.pixel_buffer, components=4, alignment=1)
+        # Standalone (headless) contexts have no bound default framebuffer
+        if previous_framebuffer is not None:
+            previous_framebuffer.use()
+        context.viewport = previous_viewport
+        self._in_flight.append(slot)
+        return True
+
+    def poll(self) -> None:
+        """Publish finished readbacks to the lighting thread."""
+        while self._in_flight:
+            slot = self._in_flight.popleft()
+            pixels = np.frombuffer(slot.pixel_buffer.read(), dtype=np.uint8)
+            self.colors.publish(PixelMapColors(slot.layout, pixels.reshape(-1, 4)))
+
+    def release(self) -> None:
+        self._release_slots()
+        for resource in (self._vao, self._vbo):
+            if resource is not None:
+                resource.release()
+        release_program(self._program)
+        self._vao = self._vbo = self._program = None
+        self._context = None
+
+    def _create_resources(self, context: mgl.Context) -> None:
+        self._context = context
+        self._program = program_cache(context).acquire(
+            vertex_shader=_VERTEX_SHADER, fragment_shader=_GATHER_SHADER
+        )
+        quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype="f4")
+        self._vbo = context.buffer(quad.tobytes())
+        self._vao = context.vertex_array(
+            self._program, [(self._vbo, "2f", "in_position")]
+        )
+
+    def _rebuild_targets(self, context: mgl.Context, layout: PixelMapLayout) -> None:
+        # Readbacks in flight belong to the old layout; apply() drops them
+        self.poll()
+        self._release_slots()
+        bulbs = len(layout)
+        self._targets = context.texture(
+            (bulbs, 1), 4, layout.targets.tobytes(), dtype="f4"
+        )
+        self._targets.filter = (mgl.NEAREST, mgl.NEAREST)
+        self._targets_layout = layout
+        for _ in range(2):
+            output = context.texture((bulbs, 1), 4)
+            self._slots.append(
+                _ReadbackSlot(
+                    texture=output,
+                    framebuffer=context.framebuffer(color_attachments=[output]),
+                    pixel_buffer=context.buffer(reserve=bulbs * 4),
+                    layout=layout,
+                )
+            )
+
+    def _release_slots(self) -> None:
+        for slot in self._slots:
+            slot.framebuffer.release()
+            slot.texture.release()
+            slot.pixel_buffer.release()
+        if self._targets is not None:
+            self._targets.release()
+        self._slots = []
+        self._in_flight.clear()
+        self._targets = None
+        self._targets_layout = None
@@ -0,0 +1,238 @@
+"""Non-blocking VJ web preview: GPU downsample, async PBO readback, off-thread JPEG."""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+from PIL import Image
+
+# Widest preview we upload; the browser shows it in a panel, not fullscreen.
+PREVIEW_MAX_WIDTH = 1280
+PREVIEW_JPEG_QUALITY = 85
+
+_VERTEX_SHADER = """
+#version 330 core
+in vec2 in_position;
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+    uv = in_position * 0.5 + 0.5;
+}
+"""
+
+# Four bilinear taps a quarter output texel apart approximate a box filter for
+# downscales up to ~4x, where a single tap would alias.
+_DOWNSAMPLE_SHADER = """
+#version 330 core
+in vec2 uv;
+out vec3 color;
+uniform sampler2D source_texture;
+uniform vec2 texel;
+void main() {
+    vec2 d = texel * 0.25;
+    color = 0.25 * (
+        texture(source_texture, uv + vec2(-d.x, -d.y)).rgb +
+        texture(source_texture, uv + vec2( d.x, -d.y)).rgb +
+        texture(source_texture, uv + vec2(-d.x,  d.y)).rgb +
+        texture(source_texture, uv + vec2( d.x,  d.y)).rgb
+    );
+}
+"""
+
+
+@beartype
+def encode_jpeg(
+    raw: bytes,
+    size: tuple[int, int],
+    mode: str = "RGB",
+    max_width: int = PREVIEW_MAX_WIDTH,
+    quality: int = PREVIEW_JPEG_QUALITY,
+) -> bytes:
+    """Encode tightly packed ``mode`` pixels (rows top-down) as JPEG."""
+    img = Image.frombuffer(mode, size, raw, "raw", mode, 0, 1)
+    if mode != "RGB":
+        img = img.convert("RGB")
+    w, h = size
+    if w > max_width:
+        nh = max(2, int(round(h * (max_width / w))))
+        img = img.resize((max_width, nh), Image.Resampling.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+
+@dataclass(eq=False)
+class _ReadbackSlot:
+    texture: Any
+    framebuffer: Any
+    pixel_buffer: Any
+    size: tuple[int, int]
+
+
+@beartype
+class PreviewReadback:
+    """Turns VJ output textures into JPEGs without stalling the GL thread.
+
+    ``capture`` draws the texture into a small RGB target on the GPU and
+    starts an asynchronous readback into a pixel buffer. ``poll`` (called
+    once per frame, before the next ``capture``) maps readbacks started on
+    an earlier frame — by then the GPU has finished them — and hands the
+    bytes to an encoder thread, which calls ``on_jpeg``. Two slots ping-pong
+    so a capture never waits for the previous readback; if both are still
+    in flight the capture is skipped. Encoding is "latest wins".
+    """
+
+    def __init__(
+        self,
+        on_jpeg: Callable[[bytes], None],
+        max_width: int = PREVIEW_MAX_WIDTH,
+        quality: int = PREVIEW_JPEG_QUALITY,
+    ):
+        self.on_jpeg = on_jpeg
+        self.max_width = max_width
+        self.quality = quality
+        self.skipped_captures = 0
+        self._context: mgl.Context | None = None
+        self._program: mgl.Program | None = None
+        self._vao: mgl.VertexArray | None = None
+        self._vbo: mgl.Buffer | None = None
+        self._slots: list[_ReadbackSlot] = []
+        self._in_flight: deque[_ReadbackSlot] = deque()
+
+        self._cond = threading.Condition()
+        self._latest: tuple[bytes, tuple[int, int]] | None = None
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def capture(self, context: mgl.Context, texture: Any) -> bool:
+        """Start reading back a downsampled copy of ``texture``."""
+        w, h = texture.size
+        if w < 2 or h < 2:
+            return False
+        out_w = min(w, self.max_width)
+        out_h = max(2, int(round(h * out_w / w)))
+        slot = self._free_slot(context, (out_w, out_h))
+        if slot is None:
+            self.skipped_captures += 1
+            return False
+
+        previous_framebuffer, previous_viewport = context.fbo, context.viewport
+        slot.framebuffer.use()
+        context.viewport = (0, 0, out_w, out_h)
+        texture.use(0)
+        self._program["source_texture"] = 0
+        self._program["texel"] = (1.0 / out_w, 1.0 / out_h)
+        self._vao.render(mgl.TRIANGLE_STRIP)
+        slot.framebuffer.read_into(slot.pixel_buffer, components=3, alignment=1)
+        # Standalone (headless) contexts have no bound default framebuffer
+        if previous_framebuffer is not None:
+            previous_framebuffer.use()
+        context.viewport = previous_viewport
+        self._in_flight.append(slot)
+        return True
+
+    def poll(self) -> None:
+        """Hand finished readbacks to the encoder thread."""
+        while self._in_flight:
+            slot = self._in_flight.popleft()
+            raw = slot.pixel_buffer.read()
+            self._submit(raw, slot.size)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._encode_run, daemon=True, name="vj-preview-encoder"
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def release(self) -> None:
+        self.stop()
+        self._release_slots()
+        for resource in (self._vao, self._vbo, self._program):
+            if resource is not None:
+                resource.release()
+        self._vao = self._vbo = self._program = None
+        self._context = None
+
+    def _submit(self, raw: bytes, size: tuple[int, int]) -> None:
+        self.start()
+        with self._cond:
+            self._latest = (raw, size)
+            self._cond.notify()
+
+    def _encode_run(self) -> None:
+        while True:
+            with self._cond:
+                while self._latest is None and not self._stopping:
+                    self._cond.wait(timeout=0.5)
+                if self._stopping:
+                    return
+                raw, size = self._latest
+                self._latest = None
+            self.on_jpeg(
+                encode_jpeg(raw, size, max_width=self.max_width, quality=self.quality)
+            )
+
+    def _free_slot(
+        self, context: mgl.Context, size: tuple[int, int]
+    ) -> _ReadbackSlot | None:
+        if context is not self._context:
+            self.release()
+            self._context = context
+        if self._slots and self._slots[0].size != size:
+            # Source resized: flush what is in flight, then rebuild the slots
+            self.poll()
+            self._release_slots()
+        if not self._slots:
+            self._create_resources(context, size)
+        for slot in self._slots:
+            if slot not in self._in_flight:
+                return slot
+        return None
+
+    def _create_resources(self, context: mgl.Context, size: tuple[int, int]) -> None:
+        if self._program is None:
+            self._program = context.program(
+                vertex_shader=_VERTEX_SHADER, fragment_shader=_DOWNSAMPLE_SHADER
+            )
+            quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype="f4")
+            self._vbo = context.buffer(quad.tobytes())
+            self._vao = context.vertex_array(
+                self._program, [(self._vbo, "2f", "in_position")]
+            )
+        w, h = size
+        for _ in range(2):
+            texture = context.texture(size, 3)
+            self._slots.append(
+                _ReadbackSlot(
+                    texture=texture,
+                    framebuffer=context.framebuffer(color_attachments=[texture]),
+                    pixel_buffer=context.buffer(reserve=w * h * 3),
+                    size=size,
+                )
+            )
+
+    def _release_slots(self) -> None:
+        for slot in self._slots:
+            slot.framebuffer.release()
+            slot.texture.release()
+            slot.pixel_buffer.release()
+        self._slots = []
+        self._in_flight.clear()
@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 
+import json
 import os
 import sys
 import time
 from collections import defaultdict, deque
 from contextlib import contextmanager
+from dataclasses import dataclass
 from functools import wraps
 from itertools import count
 from threading import local
 from weakref import WeakKeyDictionary
 
 from beartype import beartype
-from beartype.typing import Any, Callable, Dict, List
+from beartype.typing import Any, Callable, Dict, List, Optional
 
 try:
     import moderngl as mgl  # type: ignore
@@ -26,13 +28,21 @@ _node_ids: WeakKeyDictionary[Any, int] = WeakKeyDictionary()
 _node_id_counter = count(1)
 _hook_installed = False
 
+# Frames a GPU timing stays in flight before it is read back, so reading the
+# query result doesn't wait on the GPU in steady state
+GPU_QUERY_LATENCY_FRAMES = 2
+# Trace events kept for export; the oldest are dropped first
+TRACE_EVENT_LIMIT = 200_000
+_TRACE_TRACKS = {"cpu": 1, "gpu": 2, "lighting": 3}
+
 
 @beartype
-def _record_render_timing(operation_name: str, duration: float) -> None:
+def _record_render_timing(operation_name: str, start: float, duration: float) -> None:
     if not vj_profiler.enabled:
         return
     vj_profiler.timings[operation_name].append(duration)
     vj_profiler.call_counts[operation_name] += 1
+    vj_profiler.add_trace_event(operation_name, start, duration)
     vj_profiler._maybe_report()
 
 
@@ -62,15 +72,20 @@ def _instrument_render_call(
         _node_ids[node] = node_id
 
     entry_name = f"node_render:{node.__class__.__name__}#{node_id}"
+    timer = _active_gpu_timer(context)
 
     start = time.perf_counter()
     stack.append(entry_name)
+    if timer is not None:
+        timer.begin(entry_name)
     try:
         return render_fn(node, frame, scheme, context)
     finally:
+        if timer is not None:
+            timer.end()
         end = time.perf_counter()
         stack.pop()
-        _record_render_timing(entry_name, end - start)
+        _record_render_timing(entry_name, start, end - start)
 
 
 @beartype
@@ -125,10 +140,23 @@ def _install_node_render_profiling() -> None:
 
 @beartype
 class VJProfiler:
-    """Runtime profiler that records timing metrics for VJ operations and nodes."""
+    """Runtime profiler that records timing metrics for VJ operations and nodes.
+
+    Setting ``PROFILE_VJ_TRACE`` to a path also keeps every timing as a trace
+    event; ``write_trace`` (called by the app at shutdown, never per frame)
+    writes them there in Chrome trace JSON (open in Perfetto or
+    chrome://tracing): CPU sections on one track, GPU node timings on another
+    and the lighting thread's steps on a third.
+    """
 
     def __init__(self) -> None:
-        self.enabled = os.getenv("PROFILE_VJ", "").lower() in ("true", "1", "yes")
+        self.trace_path = os.getenv("PROFILE_VJ_TRACE") or None
+        self.trace_events: Optional[deque] = (
+            deque(maxlen=TRACE_EVENT_LIMIT) if self.trace_path else None
+        )
+        self.enabled = self.trace_path is not None or os.getenv(
+            "PROFILE_VJ", ""
+        ).lower() in ("true", "1", "yes")
         self.timings: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
         self.call_counts: Dict[str, int] = defaultdict(int)
         self.last_report_time = time.time()
@@ -147,28 +175,40 @@ class VJProfiler:
                 f"🟢 VJ profiler enabled (reporting every {self.report_interval:.0f}s)"
             )
 
-        self.operation_stack: List[str] = []
+        # Lighting and render threads profile concurrently; each nests its own
+        self._thread_state = local()
         self.start_times: Dict[str, float] = {}
 
         _install_node_render_profiling()
 
+    @property
+    def operation_stack(self) -> List[str]:
+        """Operations open on the calling thread, innermost last."""
+        stack = getattr(self._thread_state, "stack", None)
+        if stack is None:
+            stack = self._thread_state.stack = []
+        return stack
+
     @contextmanager
-    def profile(self, operation_name: str):
+    def profile(self, operation_name: str, track: str = "cpu"):
         if not self.enabled:
             yield
             return
 
         start_time = time.perf_counter()
-        self.operation_stack.append(operation_name)
+        stack = self.operation_stack
+        stack.append(operation_name)
         try:
             yield
         finally:
             end_time = time.perf_counter()
             self.timings[operation_name].append(end_time - start_time)
             self.call_counts[operation_name] += 1
+            self.add_trace_event(
+                operation_name, start_time, end_time - start_time, track=track
+            )
 
-            if self.operation_stack and self.operation_stack[-1] == operation_name:
-                self.operation_stack.pop()
+            stack.pop()
 
             self._maybe_report()
 
@@ -177,8 +217,64 @@ class VJProfiler:
             return
         self.timings[operation_name].append(duration)
         self.call_counts[operation_name] += 1
+        self.add_trace_event(operation_name, time.perf_counter() - duration, duration)
+        self._maybe_report()
+
+    def record_gpu_frame(self, frame: "GpuFrame") -> None:
+        """Record the GPU time of every section in a read-back frame."""
+        if not self.enabled:
+            return
+        for span in frame.spans:
+            name = f"gpu:{span.name}"
+            self.timings[name].append(span.duration)
+            self.call_counts[name] += 1
+            self.add_trace_event(
+                span.name, frame.cpu_start + span.start, span.duration, track="gpu"
+            )
         self._maybe_report()
 
+    def add_trace_event(
+        self, name: str, start: float, duration: float, track: str = "cpu"
+    ) -> None:
+        """Keep a complete event (perf_counter seconds) for the trace export."""
+        if self.trace_events is None:
+            return
+        self.trace_events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": os.getpid(),
+                "tid": _TRACE_TRACKS[track],
+            }
+        )
+
+    def write_trace(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the kept trace events as Chrome trace JSON; returns the path."""
+        path = path or self.trace_path
+        if path is None or self.trace_events is None:
+            return None
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": track.upper()},
+            }
+            for track, tid in _TRACE_TRACKS.items()
+        ]
+        with open(path, "w") as trace_file:
+            json.dump(
+                {
+                    "traceEvents": metadata + list(self.trace_events),
+                    "displayTimeUnit": "ms",
+                },
+                trace_file,
+            )
+        return path
+
     def _maybe_report(self) -> None:
         current_time = time.time()
         if current_time - self.last_report_time >= self.report_interval:
@@ -305,10 +401,151 @@ class VJProfiler:
     def reset_stats(self) -> None:
         self.timings.clear()
         self.call_counts.clear()
+        if self.trace_events is not None:
+            self.trace_events.clear()
         self.last_report_time = time.time()
 
     def is_enabled(self) -> bool:
         return self.enabled
 
 
+@dataclass(frozen=True)
+class GpuSpan:
+    """One timed section of a frame. ``start`` is seconds after the frame's
+    first GPU work, with the frame's work laid back to back."""
+
+    name: str
+    start: float
+    duration: float
+    depth: int
+
+
+@dataclass(frozen=True)
+class GpuFrame:
+    """A root section's GPU timings, children before their parents."""
+
+    name: str
+    cpu_start: float
+    cpu_seconds: float
+    spans: tuple[GpuSpan, ...]
+
+    @property
+    def gpu_seconds(self) -> float:
+        return self.spans[-1].duration
+
+
+@beartype
+class GpuTimer:
+    """Times nested sections of GPU work on one context.
+
+    GL time-elapsed queries can't overlap, so the timer keeps one query
+    running for the innermost open section and switches to a new one
+    whenever a section begins or ends; a section's time is the sum of its
+    own segments and its children's. Results are read back
+    ``GPU_QUERY_LATENCY_FRAMES`` root sections later by ``collect``.
+    Node renders are timed while a section is open and the profiler is on.
+    """
+
+    def __init__(self, context: Any):
+        self.context = context
+        self._stack: List[str] = []
+        # Section names (begin), queries (segments) and None (end) in order
+        self._ops: List[Any] = []
+        self._segment: Any = None
+        self._idle: List[Any] = []
+        self._root_start = 0.0
+        self._pending: deque = deque()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._stack)
+
+    def begin(self, name: str) -> None:
+        if not self._stack:
+            self._root_start = time.perf_counter()
+        self._close_segment()
+        self._stack.append(name)
+        self._ops.append(name)
+        self._open_segment()
+
+    def end(self) -> None:
+        self._close_segment()
+        name = self._stack.pop()
+        self._ops.append(None)
+        if self._stack:
+            self._open_segment()
+            return
+        cpu_seconds = time.perf_counter() - self._root_start
+        self._pending.append((name, self._root_start, cpu_seconds, self._ops))
+        self._ops = []
+
+    @contextmanager
+    def section(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def collect(self, wait: bool = False) -> List[GpuFrame]:
+        """Root sections old enough to read without stalling (all of them,
+        waiting for the GPU, with ``wait``)."""
+        frames = []
+        latency = 0 if wait else GPU_QUERY_LATENCY_FRAMES
+        while len(self._pending) > latency:
+            frames.append(self._read(*self._pending.popleft()))
+        return frames
+
+    def _open_segment(self) -> None:
+        if self._idle:
+            self._segment = self._idle.pop()
+        else:
+            self._segment = self.context.query(time=True)
+        self._segment.__enter__()
+
+    def _close_segment(self) -> None:
+        if self._segment is None:
+            return
+        self._segment.__exit__(None, None, None)
+        self._ops.append(self._segment)
+        self._segment = None
+
+    def _read(
+        self, name: str, cpu_start: float, cpu_seconds: float, ops: List[Any]
+    ) -> GpuFrame:
+        clock = 0.0
+        open_sections: List[tuple[str, float]] = []
+        spans: List[GpuSpan] = []
+        for op in ops:
+            if isinstance(op, str):
+                open_sections.append((op, clock))
+            elif op is None:
+                section, start = open_sections.pop()
+                spans.append(GpuSpan(section, start, clock - start, len(open_sections)))
+            else:
+                clock += op.elapsed / 1e9
+                self._idle.append(op)
+        return GpuFrame(name, cpu_start, cpu_seconds, tuple(spans))
+
+
+_gpu_timers: WeakKeyDictionary[Any, GpuTimer] = WeakKeyDictionary()
+
+
+@beartype
+def gpu_timer(context: Any) -> GpuTimer:
+    """The context's GpuTimer, created on first use."""
+    timer = _gpu_timers.get(context)
+    if timer is None:
+        timer = _gpu_timers[context] = GpuTimer(context)
+    return timer
+
+
+@beartype
+def _active_gpu_timer(context: Any) -> Optional[GpuTimer]:
+    if mgl is None or not isinstance(context, mgl.Context):
+        return None
+    timer = _gpu_timers.get(context)
+    return timer if timer is not None and timer.active else None
+
+
 vj_profiler = VJProfiler()
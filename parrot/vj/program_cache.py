@@ -0,0 +1,165 @@
+"""Context-level cache of linked shader programs, shared by the VJ node graph.
+
+Effects that appear several times in a tree (or in several modes) used to
+compile identical GLSL once per node instance, and entering a new subtree
+on a mode switch compiled mid-show. ``program_cache(context).acquire``
+returns one program per distinct source, refcounted by ``release`` and
+freed when the last user lets go.
+
+Programs are shared, so nodes must set every uniform they rely on before
+each draw rather than once at setup.
+
+moderngl cannot create a program from a driver binary, so persistence
+between runs comes from the driver's own on-disk shader cache, which
+``enable_shader_disk_cache`` points at a project directory before the GL
+context is created.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import moderngl as mgl
+from beartype import beartype
+
+SHADER_DISK_CACHE_DIR = os.path.join(".cache", "shaders")
+
+
+@beartype
+def enable_shader_disk_cache(cache_dir: str = SHADER_DISK_CACHE_DIR) -> str:
+    """Ask the GL driver to persist compiled shaders under ``cache_dir``.
+
+    Must run before the first GL context is created. Settings already in
+    the environment win. Covers Mesa and NVIDIA; macOS caches on its own.
+    """
+    cache_dir = os.path.abspath(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Mesa (Linux, including the headless EGL path used by tests)
+    os.environ.setdefault("MESA_SHADER_CACHE_DISABLE", "false")
+    os.environ.setdefault("MESA_SHADER_CACHE_DIR", cache_dir)
+    # NVIDIA proprietary driver
+    os.environ.setdefault("__GL_SHADER_DISK_CACHE", "1")
+    os.environ.setdefault("__GL_SHADER_DISK_CACHE_PATH", cache_dir)
+    os.environ.setdefault("__GL_SHADER_DISK_CACHE_SKIP_CLEANUP", "1")
+    return cache_dir
+
+
+@beartype
+def program_key(
+    vertex_shader: str,
+    fragment_shader: Optional[str] = None,
+    geometry_shader: Optional[str] = None,
+) -> str:
+    digest = hashlib.sha1()
+    for source in (vertex_shader, fragment_shader, geometry_shader):
+        digest.update(b"\0" if source is None else source.encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+@dataclass
+class _CachedProgram:
+    key: str
+    program: Any
+    refcount: int = 0
+
+
+@beartype
+class ProgramCache:
+    """Linked programs keyed by a hash of their sources."""
+
+    def __init__(self, context: mgl.Context):
+        # Weak so the per-context registry below does not keep contexts alive.
+        self._context = weakref.ref(context)
+        self.compiled = 0
+        self.hits = 0
+        self._entries: dict[str, _CachedProgram] = {}
+        self._by_program: dict[int, _CachedProgram] = {}
+
+    def acquire(
+        self,
+        vertex_shader: str,
+        fragment_shader: Optional[str] = None,
+        geometry_shader: Optional[str] = None,
+    ):
+        """The program for these sources, compiling it on first use."""
+        key = program_key(vertex_shader, fragment_shader, geometry_shader)
+        entry = self._entries.get(key)
+        if entry is None:
+            context = self._context()
+            assert context is not None, "program cache outlived its context"
+            program = context.program(
+                vertex_shader=vertex_shader,
+                fragment_shader=fragment_shader,
+                geometry_shader=geometry_shader,
+            )
+            entry = _CachedProgram(key, program)
+            self._entries[key] = entry
+            self._by_program[id(program)] = entry
+            self.compiled += 1
+        else:
+            self.hits += 1
+        entry.refcount += 1
+        return entry.program
+
+    def owns(self, program) -> bool:
+        return program is not None and id(program) in self._by_program
+
+    def release(self, program) -> None:
+        """Drop one reference; programs the cache did not create are released."""
+        entry = self._by_program.get(id(program)) if program is not None else None
+        if entry is None:
+            if program is not None:
+                program.release()
+            return
+        entry.refcount -= 1
+        if entry.refcount <= 0:
+            self._evict(entry)
+
+    def clear(self) -> None:
+        """Release every program, including ones still referenced."""
+        for entry in list(self._entries.values()):
+            self._evict(entry)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "programs": len(self._entries),
+            "compiled": self.compiled,
+            "hits": self.hits,
+        }
+
+    def _evict(self, entry: _CachedProgram) -> None:
+        self._entries.pop(entry.key, None)
+        self._by_program.pop(id(entry.program), None)
+        entry.program.release()
+
+
+_caches: "weakref.WeakKeyDictionary[mgl.Context, ProgramCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@beartype
+def program_cache(context: mgl.Context) -> ProgramCache:
+    """The cache shared by every node rendering with ``context``."""
+    cache = _caches.get(context)
+    if cache is None:
+        cache = ProgramCache(context)
+        _caches[context] = cache
+    return cache
+
+
+def release_program(program: Optional[mgl.Program]) -> None:
+    """Return a program obtained from ``program_cache(...).acquire``; other
+    programs are simply released."""
+    if program is None:
+        return
+    for cache in list(_caches.values()):
+        if cache.owns(program):
+            cache.release(program)
+            return
+    program.release()
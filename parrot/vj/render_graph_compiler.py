@@ -0,0 +1,315 @@
+"""Fuses linear chains of per-pixel post-process effects into one shader pass.
+
+A ``PostProcessEffectBase`` whose fragment shader only reads its input as
+``texture(input_texture, uv)`` (no offsets, no other samplers) is a colour
+transform of that one texel, so a chain of them can run as a single pass:
+each stage's ``main`` becomes a function of the previous stage's colour,
+with its uniforms and helpers renamed under a per-stage prefix. Effects that
+sample neighbouring pixels (RGB shift, pixelate, blurs, distortion) or
+override ``render`` break the chain and keep their own pass.
+
+``compile_render_graph`` walks a node tree and attaches a ``FusedChain`` to
+the outermost node of every fusable run; ``PostProcessEffectBase.render``
+then draws the whole run at once. Re-run it after the tree changes
+(``VJDirector`` does so after every generate); chains whose links were
+rewired since are ignored.
+"""
+
+from __future__ import annotations
+
+import re
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode
+from parrot.vj.nodes.canvas_effect_base import CanvasEffectBase, PostProcessEffectBase
+
+_INPUT_SAMPLE = re.compile(r"texture\s*\(\s*input_texture\s*,\s*uv\s*\)")
+_UNIFORM = re.compile(r"\buniform\s+(\w+)\s+(\w+)\s*;")
+_FUNCTION = re.compile(
+    r"\b(?:void|bool|int|float|[biu]?vec[234]|mat[234])\s+(\w+)\s*\([^;{]*\)\s*\{"
+)
+_CONST = re.compile(r"\bconst\s+\w+\s+(\w+)")
+_MAIN = re.compile(r"\bvoid\s+main\s*\(\s*(?:void)?\s*\)\s*\{")
+_BOILERPLATE = re.compile(
+    r"#version[^\n]*\n"
+    r"|\bin\s+vec2\s+uv\s*;"
+    r"|\bout\s+vec3\s+color\s*;"
+    r"|\buniform\s+sampler2D\s+input_texture\s*;"
+)
+_RETURN = re.compile(r"\breturn\s*;")
+
+_VERTEX_SHADER = """
+#version 330 core
+in vec2 in_position;
+in vec2 in_texcoord;
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+    uv = in_texcoord;
+}
+"""
+
+
+@beartype
+@dataclass(frozen=True)
+class StageShader:
+    """One effect's fragment shader rewritten as ``vec3 <prefix>main(vec3, vec2)``."""
+
+    # Source with every stage-local identifier prefixed by "{prefix}"
+    template: str
+    uniforms: tuple[str, ...]
+
+    def render_source(self, prefix: str) -> str:
+        return self.template.replace("{prefix}", prefix)
+
+
+_stage_shader_cache: dict[str, Optional[StageShader]] = {}
+
+
+@beartype
+def stage_shader(fragment_shader: str) -> Optional[StageShader]:
+    """Rewrite a post-process shader as a fusable stage, or None if it isn't
+    a pure per-pixel transform of its input."""
+    if fragment_shader in _stage_shader_cache:
+        return _stage_shader_cache[fragment_shader]
+
+    stage: Optional[StageShader] = None
+    body = _BOILERPLATE.sub("", fragment_shader)
+    body = _INPUT_SAMPLE.sub("vec4({prefix}input, 1.0)", body)
+    declared = _UNIFORM.findall(body)
+    main = _MAIN.search(body)
+    if (
+        main is not None
+        and "input_texture" not in body
+        and "#define" not in body
+        and "gl_FragCoord" not in body
+        and all("sampler" not in glsl_type for glsl_type, _ in declared)
+    ):
+        uniforms = tuple(name for _, name in declared)
+        names = set(uniforms) | set(_CONST.findall(body))
+        names |= {name for name in _FUNCTION.findall(body) if name != "main"}
+        if names:
+            pattern = re.compile(r"\b(" + "|".join(sorted(names)) + r")\b")
+            body = pattern.sub(lambda m: "{prefix}" + m.group(1), body)
+        main = _MAIN.search(body)
+        close = _matching_brace(body, main.end() - 1)
+        if close is not None:
+            main_body = _RETURN.sub("return color;", body[main.end() : close])
+            body = (
+                body[: main.start()]
+                + "vec3 {prefix}main(vec3 {prefix}input, vec2 uv) {\n"
+                + "    vec3 color = vec3(0.0);\n"
+                + main_body
+                + "\n    return color;\n}"
+                + body[close + 1 :]
+            )
+            stage = StageShader(body, uniforms)
+
+    _stage_shader_cache[fragment_shader] = stage
+    return stage
+
+
+def _matching_brace(source: str, open_index: int) -> Optional[int]:
+    depth = 0
+    for index in range(open_index, len(source)):
+        if source[index] == "{":
+            depth += 1
+        elif source[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return None
+
+
+@beartype
+def fuse_fragment_shader(stages: list[StageShader]) -> str:
+    """One fragment shader applying ``stages`` in order (first = innermost).
+
+    Each stage's result is clamped like the 8-bit target it would otherwise
+    have been written to, so fused output matches multipass.
+    """
+    parts = [
+        "#version 330 core",
+        "in vec2 uv;",
+        "out vec3 color;",
+        "uniform sampler2D input_texture;",
+    ]
+    for index, stage in enumerate(stages):
+        parts.append(stage.render_source(f"s{index}_"))
+    parts.append("void main() {")
+    parts.append("    vec3 c = texture(input_texture, uv).rgb;")
+    for index in range(len(stages)):
+        parts.append(f"    c = clamp(s{index}_main(c, uv), 0.0, 1.0);")
+    parts.append("    color = c;")
+    parts.append("}")
+    return "\n".join(parts)
+
+
+@beartype
+class _StageUniforms:
+    """Stands in for a stage node's ``shader_program`` while it sets uniforms,
+    redirecting names to the stage's prefixed uniforms in the fused program."""
+
+    def __init__(self, program: mgl.Program, prefix: str, uniforms: tuple[str, ...]):
+        self.program = program
+        self.prefix = prefix
+        self.uniforms = uniforms
+
+    @property
+    def ctx(self) -> mgl.Context:
+        return self.program.ctx
+
+    def __getitem__(self, name: str):
+        return self.program[self.prefix + name]
+
+    def __setitem__(self, name: str, value) -> None:
+        prefixed = self.prefix + name
+        if self.program.get(prefixed, None) is not None:
+            self.program[prefixed] = value
+        elif name not in self.uniforms:
+            raise KeyError(name)
+        # else: declared but optimised out of the fused program
+
+
+@dataclass
+class _FusedProgram:
+    program: Optional[mgl.Program]
+    vao: Optional[mgl.VertexArray]
+
+
+_programs: "weakref.WeakKeyDictionary[mgl.Context, dict[tuple[str, ...], _FusedProgram]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _fused_program(context: mgl.Context, stages: list[StageShader]) -> _FusedProgram:
+    cache = _programs.setdefault(context, {})
+    key = tuple(stage.template for stage in stages)
+    fused = cache.get(key)
+    if fused is None:
+        try:
+            program = context.program(
+                vertex_shader=_VERTEX_SHADER,
+                fragment_shader=fuse_fragment_shader(stages),
+            )
+        except mgl.Error:
+            # A stage the rewrite can't express (e.g. a helper reading the
+            # global ``uv``); remembered so the chain falls back to multipass.
+            fused = _FusedProgram(None, None)
+        else:
+            quad = np.array(
+                [-1, -1, 0, 0, 1, -1, 1, 0, -1, 1, 0, 1, 1, 1, 1, 1], dtype="f4"
+            )
+            vao = context.vertex_array(
+                program,
+                [(context.buffer(quad.tobytes()), "2f 2f", "in_position", "in_texcoord")],
+            )
+            fused = _FusedProgram(program, vao)
+        cache[key] = fused
+    return fused
+
+
+@beartype
+class FusedChain:
+    """A run of fusable effects; ``stages[0]`` is the outermost (the head)."""
+
+    def __init__(self, stages: list[PostProcessEffectBase]):
+        self.stages = stages
+        self._versions = [node.structure_version for node in stages]
+
+    @property
+    def source(self) -> BaseInterpretationNode:
+        return self.stages[-1].input_node
+
+    def is_current(self) -> bool:
+        """False once any stage was rewired since the chain was compiled."""
+        for node, version in zip(self.stages, self._versions):
+            if node.structure_version != version:
+                return False
+        return True
+
+    def render(
+        self, frame: Frame, scheme: ColorScheme, context: mgl.Context
+    ) -> Optional[mgl.Framebuffer]:
+        """Draw every stage in one pass; None if the program didn't compile."""
+        innermost_first = list(reversed(self.stages))
+        shaders = [fusable_stage(node) for node in innermost_first]
+        fused = _fused_program(context, shaders)
+        if fused.program is None:
+            return None
+
+        head = self.stages[0]
+        input_framebuffer = self.source.render(frame, scheme, context)
+        if not input_framebuffer or not input_framebuffer.color_attachments:
+            return head._render_black_framebuffer(context)
+
+        output = head._acquire_output(
+            context, input_framebuffer.width, input_framebuffer.height
+        )
+        output.use()
+        context.clear(0.0, 0.0, 0.0)
+        input_framebuffer.color_attachments[0].use(0)
+        fused.program["input_texture"] = 0
+        for index, (node, shader) in enumerate(zip(innermost_first, shaders)):
+            own_program = node.shader_program
+            node.shader_program = _StageUniforms(
+                fused.program, f"s{index}_", shader.uniforms
+            )
+            try:
+                node._set_effect_uniforms(frame, scheme)
+            finally:
+                node.shader_program = own_program
+        fused.vao.render(mgl.TRIANGLE_STRIP)
+
+        head._release_input(context, input_framebuffer)
+        return output
+
+
+def fusable_stage(node: Any) -> Optional[StageShader]:
+    """The node's shader as a fusion stage, if the node is eligible."""
+    if not isinstance(node, PostProcessEffectBase) or node.input_node is None:
+        return None
+    node_type = type(node)
+    if (
+        node_type.render is not PostProcessEffectBase.render
+        or node_type._get_vertex_shader is not CanvasEffectBase._get_vertex_shader
+    ):
+        return None
+    return stage_shader(node._get_fragment_shader())
+
+
+@beartype
+def compile_render_graph(root: BaseInterpretationNode) -> list[FusedChain]:
+    """Attach a ``FusedChain`` to the head of every run of two or more
+    fusable effects under ``root``; returns the chains."""
+    chains: list[FusedChain] = []
+    visited: set[int] = set()
+
+    def visit(node: BaseInterpretationNode, parent_fuses_it: bool) -> None:
+        if id(node) in visited:
+            return
+        visited.add(id(node))
+        fusable = fusable_stage(node) is not None
+        if fusable:
+            node.fused_chain = None
+        if fusable and not parent_fuses_it:
+            run = [node]
+            while fusable_stage(run[-1].input_node) is not None:
+                run.append(run[-1].input_node)
+            if len(run) >= 2:
+                chain = FusedChain(run)
+                node.fused_chain = chain
+                chains.append(chain)
+        for child in node.all_inputs:
+            visit(child, fusable and fusable_stage(child) is not None)
+
+    visit(root, False)
+    return chains
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import moderngl as mgl
+from beartype import beartype
+
+# Free targets unused for this many frames are released back to the driver.
+MAX_IDLE_FRAMES = 120
+
+_DTYPE_BYTES = {"f1": 1, "f2": 2, "f4": 4}
+
+
+@dataclass
+class _PooledTarget:
+    key: tuple[int, int, int, str]
+    framebuffer: Any
+    texture: Any
+    refcount: int = 0
+    last_used_frame: int = 0
+    pinned: bool = False
+
+    @property
+    def nbytes(self) -> int:
+        width, height, components, dtype = self.key
+        return width * height * components * _DTYPE_BYTES.get(dtype, 4)
+
+
+@beartype
+class RenderTargetPool:
+    """Frame-scoped colour render targets shared by the VJ node graph.
+
+    A node ``acquire``s a target for its output during ``render`` and hands it
+    to its consumer with one reference; the consumer ``release``s it once it
+    has sampled the texture, at which point any other node of the same
+    size/components/dtype may draw into it. ``retain`` adds a reference for
+    outputs read by more than one consumer. ``release`` is a no-op for
+    framebuffers the pool does not own, so consumers can release every input
+    without caring whether the producer is pooled.
+
+    ``end_frame`` reclaims targets still referenced from before the previous
+    frame (a consumer forgot to release) and frees targets idle for
+    ``max_idle_frames``. A node that caches its output across frames ``pin``s
+    it: the pin holds a reference and exempts the target from reclaiming
+    until ``unpin``.
+    """
+
+    def __init__(self, context: mgl.Context, max_idle_frames: int = MAX_IDLE_FRAMES):
+        # Weak so the per-context registry below does not keep contexts alive.
+        self._context = weakref.ref(context)
+        self.max_idle_frames = max_idle_frames
+        self.frame_index = 0
+        self.leaked_targets = 0
+        self._free: dict[tuple[int, int, int, str], list[_PooledTarget]] = {}
+        self._in_use: dict[int, _PooledTarget] = {}
+
+    def acquire(
+        self, width: int, height: int, components: int = 3, dtype: str = "f1"
+    ):
+        key = (width, height, components, dtype)
+        free = self._free.get(key)
+        if free:
+            target = free.pop()
+        else:
+            context = self._context()
+            assert context is not None, "render target pool outlived its context"
+            texture = context.texture((width, height), components, dtype=dtype)
+            framebuffer = context.framebuffer(color_attachments=[texture])
+            target = _PooledTarget(key, framebuffer, texture)
+        target.refcount = 1
+        target.last_used_frame = self.frame_index
+        self._in_use[id(target.framebuffer)] = target
+        return target.framebuffer
+
+    def owns(self, framebuffer) -> bool:
+        return framebuffer is not None and id(framebuffer) in self._in_use
+
+    def retain(self, framebuffer) -> None:
+        target = self._in_use.get(id(framebuffer)) if framebuffer is not None else None
+        if target is not None:
+            target.refcount += 1
+            target.last_used_frame = self.frame_index
+
+    def release(self, framebuffer) -> None:
+        target = self._in_use.get(id(framebuffer)) if framebuffer is not None else None
+        if target is None:
+            return
+        target.refcount -= 1
+        if target.refcount <= 0:
+            self._recycle(target)
+
+    def pin(self, framebuffer) -> None:
+        target = self._in_use.get(id(framebuffer)) if framebuffer is not None else None
+        if target is not None and not target.pinned:
+            target.pinned = True
+            target.refcount += 1
+
+    def unpin(self, framebuffer) -> None:
+        target = self._in_use.get(id(framebuffer)) if framebuffer is not None else None
+        if target is not None and target.pinned:
+            target.pinned = False
+            self.release(framebuffer)
+
+    def is_pinned(self, framebuffer) -> bool:
+        target = self._in_use.get(id(framebuffer)) if framebuffer is not None else None
+        return target is not None and target.pinned
+
+    def end_frame(self) -> None:
+        for target in list(self._in_use.values()):
+            if not target.pinned and target.last_used_frame < self.frame_index:
+                self.leaked_targets += 1
+                self._recycle(target)
+
+        self.frame_index += 1
+        cutoff = self.frame_index - self.max_idle_frames
+        for key, free in list(self._free.items()):
+            keep = []
+            for target in free:
+                if target.last_used_frame < cutoff:
+                    target.framebuffer.release()
+                    target.texture.release()
+                else:
+                    keep.append(target)
+            if keep:
+                self._free[key] = keep
+            else:
+                del self._free[key]
+
+    def clear(self) -> None:
+        """Release every target, including ones still referenced."""
+        for target in list(self._in_use.values()):
+            self._recycle(target)
+        for free in self._free.values():
+            for target in free:
+                target.framebuffer.release()
+                target.texture.release()
+        self._free.clear()
+
+    def stats(self) -> dict[str, int]:
+        free_targets = [t for free in self._free.values() for t in free]
+        return {
+            "in_use": len(self._in_use),
+            "free": len(free_targets),
+            "allocated_bytes": sum(
+                t.nbytes for t in [*self._in_use.values(), *free_targets]
+            ),
+            "leaked": self.leaked_targets,
+        }
+
+    def _recycle(self, target: _PooledTarget) -> None:
+        self._in_use.pop(id(target.framebuffer), None)
+        target.refcount = 0
+        target.pinned = False
+        target.last_used_frame = self.frame_index
+        self._free.setdefault(target.key, []).append(target)
+
+
+_pools: "weakref.WeakKeyDictionary[mgl.Context, RenderTargetPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@beartype
+def render_target_pool(context: mgl.Context) -> RenderTargetPool:
+    """The pool shared by every node rendering with ``context``."""
+    pool = _pools.get(context)
+    if pool is None:
+        pool = RenderTargetPool(context)
+        _pools[context] = pool
+    return pool
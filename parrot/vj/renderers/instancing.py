@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Static meshes drawn many times per frame from one array of per-instance rows.
+
+An ``InstancedMesh`` owns a vertex buffer that never changes and a growable
+per-instance buffer. Callers pack everything that varies between copies
+(model matrix, colour, shape parameters) into one float32 row per copy and
+``draw`` the whole array with a single upload and a single draw call.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+
+def _float_count(buffer_format: str) -> int:
+    """Floats per element in a moderngl buffer format such as ``"16f 4f"``."""
+    return sum(int(part.rstrip("f") or 1) for part in buffer_format.split())
+
+
+@beartype
+class InstancedMesh:
+    """Static geometry plus one per-instance attribute block."""
+
+    def __init__(
+        self,
+        program: mgl.Program,
+        vertices: np.ndarray,
+        vertex_format: str,
+        vertex_attributes: tuple[str, ...],
+        instance_format: str,
+        instance_attributes: tuple[str, ...],
+    ):
+        self.program = program
+        vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.vertex_count = vertices.size // _float_count(vertex_format)
+        self.floats_per_instance = _float_count(instance_format)
+        self._vertex_layout = (vertex_format, *vertex_attributes)
+        self._instance_layout = (f"{instance_format}/i", *instance_attributes)
+        self._vertices = program.ctx.buffer(vertices.tobytes())
+        self._instances: Optional[mgl.Buffer] = None
+        self._vao: Optional[mgl.VertexArray] = None
+        self._capacity = 0
+
+    def draw(self, rows: np.ndarray, mode: int = mgl.TRIANGLES) -> None:
+        """Upload ``rows`` (one per instance) and draw them all."""
+        count = len(rows)
+        if count == 0:
+            return
+        if count > self._capacity:
+            self._release_instances()
+            self._capacity = 2 ** math.ceil(math.log2(count))
+            context = self.program.ctx
+            self._instances = context.buffer(
+                reserve=self._capacity * self.floats_per_instance * 4, dynamic=True
+            )
+            self._vao = context.vertex_array(
+                self.program,
+                [
+                    (self._vertices, *self._vertex_layout),
+                    (self._instances, *self._instance_layout),
+                ],
+            )
+        else:
+            self._instances.orphan()
+        self._instances.write(np.ascontiguousarray(rows, dtype=np.float32).tobytes())
+        self._vao.render(mode, vertices=self.vertex_count, instances=count)
+
+    def release(self) -> None:
+        self._release_instances()
+        self._vertices.release()
+        self._capacity = 0
+
+    def _release_instances(self) -> None:
+        if self._vao is not None:
+            self._vao.release()
+            self._vao = None
+        if self._instances is not None:
+            self._instances.release()
+            self._instances = None
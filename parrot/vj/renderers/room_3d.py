@@ -10,15 +10,102 @@ import numpy as np
 import math
 from typing import Optional
 from contextlib import contextmanager
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageFont
 
 from parrot.fixtures.base import FixtureBase
+from parrot.vj.glyph_atlas import GlyphAtlas, glyph_atlas
 from parrot.vj.renderers.base import FixtureRenderer
+from parrot.vj.renderers.instancing import InstancedMesh
 from parrot.vj.venue_axis import venue_rotation_to_desktop_quaternion
 from parrot.director.frame import Frame
 from parrot.utils.input_events import InputEvents
 
 
+# Blinn-Phong with the fixtures' dynamic point lights; shared by the
+# per-vertex and instanced programs
+_LIT_FRAGMENT_SHADER = """
+#version 330 core
+in vec3 frag_pos;
+in vec4 frag_color;
+in vec3 frag_normal;
+
+out vec4 color;
+
+#define MAX_LIGHTS 64
+
+// Lighting uniforms
+uniform vec3 viewPos;
+uniform vec3 dirLightDir;
+uniform vec3 dirLightColor;
+uniform vec3 ambientColor;
+uniform float ambientStrength;
+uniform float specularStrength;
+uniform float shininess;
+uniform float emission;  // 0.0 = normal lighting, 1.0 = full emission
+
+// Dynamic point lights from fixtures
+uniform int numLights;
+uniform vec3 lightPositions[MAX_LIGHTS];
+uniform vec4 lightColors[MAX_LIGHTS];  // RGB + intensity
+
+void main() {
+    // If emission is high, just use the color directly (emissive)
+    if (emission >= 0.99) {
+        // Pure emission - use color directly without any lighting
+        color = frag_color;
+    } else {
+        // Normal lighting calculations
+        vec3 norm = normalize(frag_normal);
+        vec3 viewDir = normalize(viewPos - frag_pos);
+
+        // Ambient - affected by VJ billboard color
+        vec3 ambient = ambientStrength * ambientColor * frag_color.rgb;
+
+        // Directional light (Blinn-Phong) - subtle fill light
+        vec3 lightDir = normalize(-dirLightDir);
+        float diff = max(dot(norm, lightDir), 0.0);
+        vec3 diffuse = diff * dirLightColor * frag_color.rgb;
+
+        vec3 halfwayDir = normalize(lightDir + viewDir);
+        float spec = pow(max(dot(norm, halfwayDir), 0.0), shininess);
+        vec3 specular = specularStrength * spec * dirLightColor;
+
+        // Dynamic point lights from fixtures
+        vec3 dynamicDiffuse = vec3(0.0);
+        vec3 dynamicSpecular = vec3(0.0);
+
+        for (int i = 0; i < numLights && i < MAX_LIGHTS; i++) {
+            vec3 lightPos = lightPositions[i];
+            vec3 lightColor = lightColors[i].rgb;
+            float intensity = lightColors[i].a;
+
+            // Skip if intensity is too low
+            if (intensity < 0.01) continue;
+
+            vec3 lightDir = normalize(lightPos - frag_pos);
+            float distance = length(lightPos - frag_pos);
+
+            // Attenuation - slightly stronger falloff for more dramatic lighting
+            float attenuation = intensity / (1.0 + 0.15 * distance + 0.05 * distance * distance);
+
+            // Diffuse
+            float lightDiff = max(dot(norm, lightDir), 0.0);
+            dynamicDiffuse += lightDiff * lightColor * frag_color.rgb * attenuation;
+
+            // Specular
+            vec3 lightHalfway = normalize(lightDir + viewDir);
+            float lightSpec = pow(max(dot(norm, lightHalfway), 0.0), shininess);
+            dynamicSpecular += specularStrength * lightSpec * lightColor * attenuation;
+        }
+
+        // Combine all lighting
+        vec3 result = ambient + diffuse + specular + dynamicDiffuse + dynamicSpecular;
+        color = vec4(result, frag_color.a);
+    }
+}
+"""
+
+
 @beartype
 class Room3DRenderer:
     """3D room renderer with floor grid and 3D fixture cubes"""
@@ -101,7 +188,7 @@ class Room3DRenderer:
         self.rotation_stack: list[np.ndarray] = [self._identity_quaternion()]
 
         # Text rendering cache
-        self._text_texture_cache: dict[str, mgl.Texture] = {}
+        self._text_label_cache: dict[tuple[str, float], np.ndarray] = {}
         self._text_font: Optional[ImageFont.ImageFont] = None
         self._load_text_font()
 
@@ -109,22 +196,20 @@ class Room3DRenderer:
         self._dj_texture: Optional[mgl.Texture] = None
         self._load_dj_texture()
 
-        # Geometry cache for reusable shapes
-        self._cube_cache: dict[
-            float, tuple[mgl.Buffer, mgl.Buffer, mgl.Buffer, mgl.VertexArray, int]
-        ] = {}
-        self._circle_cache: dict[
-            tuple[float, int],
-            tuple[mgl.Buffer, mgl.Buffer, mgl.Buffer, mgl.VertexArray, int],
-        ] = {}
-        self._emission_circle_cache: dict[
-            tuple[float, int],
-            tuple[mgl.Buffer, mgl.Buffer, mgl.VertexArray, int],
-        ] = {}  # Circles for emission shader (no normals)
-        self._cone_cache: dict[
-            tuple[float, float, int],
-            tuple[mgl.Buffer, mgl.Buffer, mgl.VertexArray, int, np.ndarray],
-        ] = {}
+        # Static unit meshes drawn as instances (discs and cones per segment count)
+        self._box_mesh: Optional[InstancedMesh] = None
+        self._disc_meshes: dict[int, InstancedMesh] = {}
+        self._cone_meshes: dict[int, InstancedMesh] = {}
+
+        # Instance rows queued until flush(); see batched()
+        self._batch_depth = 0
+        self._queued_bodies: list[np.ndarray] = []
+        self._queued_discs: dict[int, list[np.ndarray]] = {}
+        self._queued_cones: dict[int, list[np.ndarray]] = {}
+        self._queued_labels: list[
+            tuple[str, tuple[float, float, float], tuple[float, float, float], float, np.ndarray]
+        ] = []
+        self.last_batch_draw_calls = 0
 
     def _build_default_scene_layout(self) -> dict[str, dict[str, float | tuple[float, float, float]]]:
         return {
@@ -208,106 +293,75 @@ class Room3DRenderer:
                     frag_normal = mat3(model) * normal;
                 }
             """,
-            fragment_shader="""
+            fragment_shader=_LIT_FRAGMENT_SHADER,
+        )
+        # Same lighting for fixture bodies drawn as instances of a unit box
+        self.instanced_shader = self.ctx.program(
+            vertex_shader="""
                 #version 330 core
-                in vec3 frag_pos;
-                in vec4 frag_color;
-                in vec3 frag_normal;
-                
-                out vec4 color;
-                
-                #define MAX_LIGHTS 64
-                
-                // Lighting uniforms
-                uniform vec3 viewPos;
-                uniform vec3 dirLightDir;
-                uniform vec3 dirLightColor;
-                uniform vec3 ambientColor;
-                uniform float ambientStrength;
-                uniform float specularStrength;
-                uniform float shininess;
-                uniform float emission;  // 0.0 = normal lighting, 1.0 = full emission
-                
-                // Dynamic point lights from fixtures
-                uniform int numLights;
-                uniform vec3 lightPositions[MAX_LIGHTS];
-                uniform vec4 lightColors[MAX_LIGHTS];  // RGB + intensity
-                
+                in vec3 position;
+                in vec3 normal;
+                in mat4 in_model;
+                in vec4 in_color;
+
+                uniform mat4 view_proj;
+
+                out vec3 frag_pos;
+                out vec4 frag_color;
+                out vec3 frag_normal;
+
                 void main() {
-                    // If emission is high, just use the color directly (emissive)
-                    if (emission >= 0.99) {
-                        // Pure emission - use color directly without any lighting
-                        color = frag_color;
-                    } else {
-                        // Normal lighting calculations
-                        vec3 norm = normalize(frag_normal);
-                        vec3 viewDir = normalize(viewPos - frag_pos);
-                        
-                        // Ambient - affected by VJ billboard color
-                        vec3 ambient = ambientStrength * ambientColor * frag_color.rgb;
-                        
-                        // Directional light (Blinn-Phong) - subtle fill light
-                        vec3 lightDir = normalize(-dirLightDir);
-                        float diff = max(dot(norm, lightDir), 0.0);
-                        vec3 diffuse = diff * dirLightColor * frag_color.rgb;
-                        
-                        vec3 halfwayDir = normalize(lightDir + viewDir);
-                        float spec = pow(max(dot(norm, halfwayDir), 0.0), shininess);
-                        vec3 specular = specularStrength * spec * dirLightColor;
-                        
-                        // Dynamic point lights from fixtures
-                        vec3 dynamicDiffuse = vec3(0.0);
-                        vec3 dynamicSpecular = vec3(0.0);
-                        
-                        for (int i = 0; i < numLights && i < MAX_LIGHTS; i++) {
-                            vec3 lightPos = lightPositions[i];
-                            vec3 lightColor = lightColors[i].rgb;
-                            float intensity = lightColors[i].a;
-                            
-                            // Skip if intensity is too low
-                            if (intensity < 0.01) continue;
-                            
-                            vec3 lightDir = normalize(lightPos - frag_pos);
-                            float distance = length(lightPos - frag_pos);
-                            
-                            // Attenuation - slightly stronger falloff for more dramatic lighting
-                            float attenuation = intensity / (1.0 + 0.15 * distance + 0.05 * distance * distance);
-                            
-                            // Diffuse
-                            float lightDiff = max(dot(norm, lightDir), 0.0);
-                            dynamicDiffuse += lightDiff * lightColor * frag_color.rgb * attenuation;
-                            
-                            // Specular
-                            vec3 lightHalfway = normalize(lightDir + viewDir);
-                            float lightSpec = pow(max(dot(norm, lightHalfway), 0.0), shininess);
-                            dynamicSpecular += specularStrength * lightSpec * lightColor * attenuation;
-                        }
-                        
-                        // Combine all lighting
-                        vec3 result = ambient + diffuse + specular + dynamicDiffuse + dynamicSpecular;
-                        color = vec4(result, frag_color.a);
-                    }
+                    vec4 world = in_model * vec4(position, 1.0);
+                    vec4 pos = view_proj * world;
+                    pos.y = -pos.y;  // Flip Y axis
+                    gl_Position = pos;
+                    frag_pos = world.xyz;
+                    frag_color = in_color;
+                    frag_normal = mat3(in_model) * normal;
                 }
             """,
+            fragment_shader=_LIT_FRAGMENT_SHADER,
         )
 
     def _setup_emission_shader(self):
-        """Setup pure emission shader with NO lighting calculations"""
+        """Setup pure emission shader with NO lighting calculations.
+
+        Draws instances of unit discs and cones: ``in_unit`` is (cos, sin, z)
+        on a ring at z = 0 (source) or z = 1 (far end), scaled by the
+        instance's start/end radius. Beams darken and fade along their length
+        with a subtle hot core at the lens; discs are flat colour.
+        """
         self.emission_shader = self.ctx.program(
             vertex_shader="""
                 #version 330 core
-                in vec3 position;
-                in vec4 color;
-                
-                uniform mat4 mvp;
-                
+                in vec3 in_unit;
+                in mat4 in_model;
+                in vec4 in_color;
+                in vec3 in_shape;  // start radius, end radius, beam gradient (0/1)
+
+                uniform mat4 view_proj;
+
                 out vec4 frag_color;
-                
+
+                // Near-source highlight; kept small so saturated colours
+                // (e.g. red) don't read as pink/white at the lens.
+                const float HOT_CORE_PEAK = 0.2;
+                const float HOT_CORE_EXTENT = 0.15;
+
                 void main() {
-                    vec4 pos = mvp * vec4(position, 1.0);
+                    float z = in_unit.z;
+                    vec3 local = vec3(in_unit.xy * mix(in_shape.x, in_shape.y, z), z);
+                    vec4 pos = view_proj * in_model * vec4(local, 1.0);
                     pos.y = -pos.y;  // Flip Y axis
                     gl_Position = pos;
-                    frag_color = color;  // Just pass through color
+
+                    // Brightness 1.0 -> 0.3 and alpha 1.0 -> 0.1 along beams
+                    float t = in_shape.z * z;
+                    vec3 rgb = in_color.rgb * (1.0 - t * 0.7);
+                    float hot_core = in_shape.z * HOT_CORE_PEAK
+                        * max(0.0, 1.0 - t / HOT_CORE_EXTENT);
+                    rgb += (1.0 - rgb) * hot_core;
+                    frag_color = vec4(rgb, in_color.a * (1.0 - t * 0.9));
                 }
             """,
             fragment_shader="""
@@ -371,40 +425,59 @@ class Room3DRenderer:
         )
 
     def _setup_text_shader(self):
-        """Setup shader for text rendering with texture"""
+        """Setup instanced shader for text labels drawn from the glyph atlas
+
+        Every glyph of every queued label is one instance carrying its
+        label's model matrix, origin and colour, so all labels draw at once.
+        """
         self.text_shader = self.ctx.program(
             vertex_shader="""
                 #version 330 core
-                in vec3 position;
-                in vec2 texcoord;
-                
-                uniform mat4 mvp;
-                
+                in vec2 in_corner;
+                in vec4 in_rect;
+                in vec4 in_uv;
+                in mat4 in_model;
+                in vec3 in_origin;
+                in vec3 in_color;
+
+                uniform mat4 view_proj;
+                uniform sampler2D glyph_atlas;
+
                 out vec2 uv;
-                
+                out vec3 text_color;
+
                 void main() {
-                    vec4 pos = mvp * vec4(position, 1.0);
+                    vec2 local = mix(in_rect.xy, in_rect.zw, in_corner);
+                    vec4 pos = view_proj * in_model * vec4(in_origin + vec3(local, 0.0), 1.0);
                     pos.y = -pos.y;  // Flip Y axis
                     gl_Position = pos;
-                    uv = texcoord;
+                    uv = mix(in_uv.xy, in_uv.zw, in_corner) / vec2(textureSize(glyph_atlas, 0));
+                    text_color = in_color;
                 }
             """,
             fragment_shader="""
                 #version 330 core
                 in vec2 uv;
+                in vec3 text_color;
                 out vec4 color;
-                
-                uniform sampler2D text_texture;
-                uniform vec3 text_color;
-                
+
+                uniform sampler2D glyph_atlas;
+
                 void main() {
-                    // Sample text alpha from texture (white text on black background)
-                    float alpha = texture(text_texture, uv).r;
-                    // Output colored text with transparency
+                    // Glyph coverage from the atlas is the label's alpha
+                    float alpha = texture(glyph_atlas, uv).r;
                     color = vec4(text_color, alpha);
                 }
             """,
         )
+        self._label_mesh = InstancedMesh(
+            self.text_shader,
+            np.array([0, 0, 1, 0, 0, 1, 1, 1], dtype=np.float32),
+            "2f",
+            ("in_corner",),
+            "4f 4f 16f 3f 3f",
+            ("in_rect", "in_uv", "in_model", "in_origin", "in_color"),
+        )
 
     def _load_text_font(self):
         """Load a simple font for text rendering"""
@@ -733,8 +806,8 @@ class Room3DRenderer:
         # Camera angle is now controlled by mouse drag
         pass
 
-    def _set_dynamic_lights_uniforms(self):
-        """Set dynamic light uniforms in the shader"""
+    def _set_dynamic_lights_uniforms(self, program: mgl.Program):
+        """Set dynamic light uniforms in a lit program"""
         num_lights = min(len(self.dynamic_lights), 64)  # Max 64 lights
 
         if num_lights > 0:
@@ -753,18 +826,18 @@ class Room3DRenderer:
                 colors.extend([0.0, 0.0, 0.0, 0.0])
 
             # Set uniforms
-            self.shader["numLights"] = num_lights
+            program["numLights"] = num_lights
 
             # Set arrays as flat arrays
             positions_array = np.array(positions, dtype=np.float32)
             colors_array = np.array(colors, dtype=np.float32)
 
             # Write the entire array at once using tuple conversion
-            self.shader["lightPositions"].write(positions_array.tobytes())
-            self.shader["lightColors"].write(colors_array.tobytes())
+            program["lightPositions"].write(positions_array.tobytes())
+            program["lightColors"].write(colors_array.tobytes())
         else:
             # No lights
-            self.shader["numLights"] = 0
+            program["numLights"] = 0
 
     # Transform stack methods
 
@@ -1102,7 +1175,7 @@ class Room3DRenderer:
         self.shader["emission"] = 0.0  # Floor uses normal lighting
 
         # Set dynamic lights
-        self._set_dynamic_lights_uniforms()
+        self._set_dynamic_lights_uniforms(self.shader)
 
         # Render dark floor quad
         self.floor_vao.render(mgl.TRIANGLES)
@@ -1110,114 +1183,233 @@ class Room3DRenderer:
         # Render grey grid lines on top
         # self.grid_vao.render(mgl.LINES)
 
-    def _create_cube_geometry(self, size: float):
-        """Create reusable cube geometry at origin"""
-        half_size = size / 2.0
-
-        # Define cube faces with normals (at origin, no position offset)
-        front_normal = [0.0, 0.0, -1.0]
-        back_normal = [0.0, 0.0, 1.0]
-        left_normal = [-1.0, 0.0, 0.0]
-        right_normal = [1.0, 0.0, 0.0]
-        top_normal = [0.0, 1.0, 0.0]
-        bottom_normal = [0.0, -1.0, 0.0]
-
-        # Front face
-        front = [
-            [-half_size, 0, -half_size],
-            [half_size, 0, -half_size],
-            [-half_size, size, -half_size],
-            [half_size, 0, -half_size],
-            [half_size, size, -half_size],
-            [-half_size, size, -half_size],
-        ]
-
-        # Back face
-        back = [
-            [-half_size, 0, half_size],
-            [-half_size, size, half_size],
-            [half_size, 0, half_size],
-            [half_size, 0, half_size],
-            [-half_size, size, half_size],
-            [half_size, size, half_size],
-        ]
-
-        # Left face
-        left = [
-            [-half_size, 0, -half_size],
-            [-half_size, size, -half_size],
-            [-half_size, 0, half_size],
-            [-half_size, 0, half_size],
-            [-half_size, size, -half_size],
-            [-half_size, size, half_size],
-        ]
+    def _unit_box_mesh(self) -> InstancedMesh:
+        """Unit box x, z in [-0.5, 0.5], y in [0, 1] for the instanced lit shader"""
+        if self._box_mesh is not None:
+            return self._box_mesh
 
-        # Right face
-        right = [
-            [half_size, 0, -half_size],
-            [half_size, 0, half_size],
-            [half_size, size, -half_size],
-            [half_size, size, -half_size],
-            [half_size, 0, half_size],
-            [half_size, size, half_size],
-        ]
-
-        # Top face
-        top = [
-            [-half_size, size, -half_size],
-            [half_size, size, -half_size],
-            [-half_size, size, half_size],
-            [half_size, size, -half_size],
-            [half_size, size, half_size],
-            [-half_size, size, half_size],
+        # Six faces, two triangles each, with the face normal per vertex
+        faces = [
+            ((0.0, 0.0, -1.0), [(-1, 0, -1), (1, 0, -1), (-1, 1, -1), (1, 0, -1), (1, 1, -1), (-1, 1, -1)]),
+            ((0.0, 0.0, 1.0), [(-1, 0, 1), (-1, 1, 1), (1, 0, 1), (1, 0, 1), (-1, 1, 1), (1, 1, 1)]),
+            ((-1.0, 0.0, 0.0), [(-1, 0, -1), (-1, 1, -1), (-1, 0, 1), (-1, 0, 1), (-1, 1, -1), (-1, 1, 1)]),
+            ((1.0, 0.0, 0.0), [(1, 0, -1), (1, 0, 1), (1, 1, -1), (1, 1, -1), (1, 0, 1), (1, 1, 1)]),
+            ((0.0, 1.0, 0.0), [(-1, 1, -1), (1, 1, -1), (-1, 1, 1), (1, 1, -1), (1, 1, 1), (-1, 1, 1)]),
+            ((0.0, -1.0, 0.0), [(-1, 0, -1), (-1, 0, 1), (1, 0, -1), (1, 0, -1), (-1, 0, 1), (1, 0, 1)]),
         ]
-
-        # Bottom face
-        bottom = [
-            [-half_size, 0, -half_size],
-            [-half_size, 0, half_size],
-            [half_size, 0, -half_size],
-            [half_size, 0, -half_size],
-            [-half_size, 0, half_size],
-            [half_size, 0, half_size],
+        vertices = [
+            (x * 0.5, y, z * 0.5, *normal)
+            for normal, corners in faces
+            for x, y, z in corners
         ]
+        self._box_mesh = InstancedMesh(
+            self.instanced_shader,
+            np.array(vertices, dtype=np.float32),
+            "3f 3f",
+            ("position", "normal"),
+            "16f 4f",
+            ("in_model", "in_color"),
+        )
+        return self._box_mesh
+
+    def _unit_disc_mesh(self, segments: int) -> InstancedMesh:
+        """Triangle fan of radius 1 at z = 0 facing +Z for the emission shader"""
+        mesh = self._disc_meshes.get(segments)
+        if mesh is None:
+            ring = [
+                (math.cos(2.0 * math.pi * i / segments), math.sin(2.0 * math.pi * i / segments))
+                for i in range(segments + 1)
+            ]
+            vertices = [
+                vertex
+                for i in range(segments)
+                for vertex in ((0.0, 0.0, 0.0), (*ring[i], 0.0), (*ring[i + 1], 0.0))
+            ]
+            mesh = InstancedMesh(
+                self.emission_shader,
+                np.array(vertices, dtype=np.float32),
+                "3f",
+                ("in_unit",),
+                "16f 4f 3f",
+                ("in_model", "in_color", "in_shape"),
+            )
+            self._disc_meshes[segments] = mesh
+        return mesh
+
+    def _unit_cone_mesh(self, segments: int) -> InstancedMesh:
+        """Open cone side from a unit ring at z = 0 to one at z = 1 for the
+        emission shader; radii come from the instance"""
+        mesh = self._cone_meshes.get(segments)
+        if mesh is None:
+            ring = [
+                (math.cos(2.0 * math.pi * i / segments), math.sin(2.0 * math.pi * i / segments))
+                for i in range(segments + 1)
+            ]
+            vertices = []
+            for i in range(segments):
+                start, start_next = (*ring[i], 0.0), (*ring[i + 1], 0.0)
+                end, end_next = (*ring[i], 1.0), (*ring[i + 1], 1.0)
+                vertices += [start, end, start_next, start_next, end, end_next]
+            mesh = InstancedMesh(
+                self.emission_shader,
+                np.array(vertices, dtype=np.float32),
+                "3f",
+                ("in_unit",),
+                "16f 4f 3f",
+                ("in_model", "in_color", "in_shape"),
+            )
+            self._cone_meshes[segments] = mesh
+        return mesh
 
-        cube_vertices = []
-        cube_normals = []
-        for face, normal in [
-            (front, front_normal),
-            (back, back_normal),
-            (left, left_normal),
-            (right, right_normal),
-            (top, top_normal),
-            (bottom, bottom_normal),
-        ]:
-            for vertex in face:
-                cube_vertices.extend(vertex)
-                cube_normals.extend(normal)
-
-        vertices_array = np.array(cube_vertices, dtype=np.float32)
-        normals_array = np.array(cube_normals, dtype=np.float32)
+    @staticmethod
+    def _translation_matrix(x: float, y: float, z: float) -> np.ndarray:
+        return np.array(
+            [[1, 0, 0, x], [0, 1, 0, y], [0, 0, 1, z], [0, 0, 0, 1]],
+            dtype=np.float32,
+        )
 
-        vbo = self.ctx.buffer(vertices_array.tobytes())
-        normal_vbo = self.ctx.buffer(normals_array.tobytes())
+    @staticmethod
+    def _align_z_matrix(direction: tuple[float, float, float]) -> np.ndarray:
+        """Rotation taking +Z onto ``direction`` (+Z if it is degenerate)"""
+        nx, ny, nz = direction
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        if length < 0.001:
+            return np.eye(4, dtype=np.float32)
+        nx, ny, nz = nx / length, ny / length, nz / length
+        if abs(nz - 1.0) < 0.001:
+            return np.eye(4, dtype=np.float32)
 
-        # Create a per-vertex color VBO that will be updated per render
-        num_vertices = len(cube_vertices) // 3
-        color_vbo = self.ctx.buffer(
-            reserve=num_vertices * 4 * 4
-        )  # 4 floats (RGBA) per vertex
+        # Create perpendicular vectors
+        if abs(nx) < 0.9:
+            perp1 = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        else:
+            perp1 = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+        normal_vec = np.array([nx, ny, nz], dtype=np.float32)
+        perp1 = perp1 - normal_vec * np.dot(perp1, normal_vec)
+        perp1 = perp1 / np.linalg.norm(perp1)
+        perp2 = np.cross(normal_vec, perp1)
+        perp2 = perp2 / np.linalg.norm(perp2)
 
-        vao = self.ctx.vertex_array(
-            self.shader,
+        return np.array(
             [
-                (vbo, "3f", "position"),
-                (color_vbo, "4f", "color"),
-                (normal_vbo, "3f", "normal"),
+                [perp1[0], perp2[0], nx, 0],
+                [perp1[1], perp2[1], ny, 0],
+                [perp1[2], perp2[2], nz, 0],
+                [0, 0, 0, 1],
             ],
+            dtype=np.float32,
         )
 
-        return vbo, normal_vbo, color_vbo, vao, num_vertices
+    @staticmethod
+    def _instance_row(model: np.ndarray, *values: float) -> np.ndarray:
+        """Column-major model matrix followed by the given per-instance values"""
+        return np.concatenate(
+            [model.T.ravel(), np.asarray(values, dtype=np.float32)]
+        ).astype(np.float32)
+
+    def _view_position(self) -> tuple[float, float, float]:
+        horizontal_distance = self.camera_distance * math.cos(self.camera_tilt)
+        cam_x = horizontal_distance * math.sin(self.camera_angle)
+        cam_z = horizontal_distance * math.cos(self.camera_angle)
+        cam_y = self.camera_height + self.camera_distance * math.sin(self.camera_tilt)
+        return (cam_x, cam_y, cam_z)
+
+    @contextmanager
+    def batched(self):
+        """Queue bodies, bulbs, beams and labels and draw them on exit
+
+        Usage:
+            with room_renderer.batched():
+                for renderer in renderers:
+                    renderer.render_emissive(context, canvas_size, frame)
+
+        Everything queued is drawn with the GL state current when the
+        outermost block exits: bodies first, then bulb discs, then beams,
+        then labels. Outside a batch each call draws immediately.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def _queued(self) -> None:
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Draw everything queued since the last flush"""
+        draw_calls = 0
+        view_proj = self._get_mvp_matrix().T.flatten()
+
+        if self._queued_bodies:
+            shader = self.instanced_shader
+            shader["view_proj"] = view_proj
+            shader["viewPos"] = self._view_position()
+            shader["dirLightDir"] = tuple(self.directional_light_dir)
+            shader["dirLightColor"] = tuple(self.directional_light_color)
+            shader["ambientColor"] = tuple(self.ambient_light_color)
+            shader["ambientStrength"] = self.ambient_strength
+            shader["specularStrength"] = self.specular_strength
+            shader["shininess"] = self.shininess
+            shader["emission"] = 0.0  # Fixture bodies use normal lighting
+            self._set_dynamic_lights_uniforms(shader)
+            self._unit_box_mesh().draw(np.stack(self._queued_bodies))
+            self._queued_bodies.clear()
+            draw_calls += 1
+
+        if self._queued_discs or self._queued_cones:
+            self.emission_shader["view_proj"] = view_proj
+
+        if self._queued_discs:
+            # Emission circles live in the emissive pass, where everything has to
+            # blend additively so overlapping luminous things (bulbs, beams) only
+            # brighten each other. Blending with `SRC_ALPHA, ONE_MINUS_SRC_ALPHA`
+            # (or not at all when ``alpha == 1``) let a bulb *overwrite* pixels
+            # that earlier additive beams had lit, e.g. a mirrorball beam
+            # appearing to darken a moving-head beam where they crossed the bulb
+            # disc. Keep additive (``SRC_ALPHA, ONE``) unconditionally.
+            self.ctx.enable(mgl.BLEND)
+            self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE
+            for segments, rows in self._queued_discs.items():
+                self._unit_disc_mesh(segments).draw(np.stack(rows))
+                draw_calls += 1
+            self._queued_discs.clear()
+            self.ctx.disable(mgl.BLEND)
+
+        if self._queued_cones:
+            # Cull back-faces to avoid double-rendering at the cone's edges
+            self.ctx.enable(mgl.CULL_FACE)
+            self.ctx.front_face = "ccw"
+            self.ctx.cull_face = "back"
+            # Additive so overlapping beams brighten each other
+            self.ctx.enable(mgl.BLEND)
+            self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE
+            # Keep depth writes off so beams never occlude each other, but leave
+            # the depth-test state as the caller configured it. The caller enables
+            # depth-test against the opaque depth buffer so that solid geometry
+            # (floor, fixture bodies, DJ booth) occludes beam fragments that lie
+            # behind them, while beam-on-beam overlap still blends additively
+            # because no beam writes into the depth buffer.
+            self.ctx.depth_mask = False
+            for segments, rows in self._queued_cones.items():
+                self._unit_cone_mesh(segments).draw(np.stack(rows))
+                draw_calls += 1
+            self._queued_cones.clear()
+            # Restore state (don't restore depth test - let caller manage it)
+            self.ctx.depth_mask = True
+            self.ctx.disable(mgl.BLEND)
+            self.ctx.disable(mgl.CULL_FACE)
+
+        if self._queued_labels:
+            self._draw_text_labels(view_proj)
+            self._queued_labels.clear()
+            draw_calls += 1
+
+        if draw_calls:
+            self.last_batch_draw_calls = draw_calls
 
     def render_cube(
         self,
@@ -1232,54 +1424,7 @@ class Room3DRenderer:
             color: RGB color tuple
             size: Size of the cube
         """
-        # Get or create cached geometry
-        if size not in self._cube_cache:
-            self._cube_cache[size] = self._create_cube_geometry(size)
-
-        vbo, normal_vbo, color_vbo, vao, num_vertices = self._cube_cache[size]
-
-        # Update color buffer with current color
-        cube_colors = []
-        for _ in range(num_vertices):
-            cube_colors.extend([color[0], color[1], color[2], 1.0])
-        colors_array = np.array(cube_colors, dtype=np.float32)
-        color_vbo.write(colors_array.tobytes())
-
-        # Create translation matrix for position
-        x, y, z = position
-        local_model = np.array(
-            [[1, 0, 0, x], [0, 1, 0, y], [0, 0, 1, z], [0, 0, 0, 1]],
-            dtype=np.float32,
-        )
-
-        # Combine with current transform stack
-        model = self._get_current_model_matrix() @ local_model
-
-        horizontal_distance = self.camera_distance * math.cos(self.camera_tilt)
-        cam_x = horizontal_distance * math.sin(self.camera_angle)
-        cam_z = horizontal_distance * math.cos(self.camera_angle)
-        cam_y = self.camera_height + self.camera_distance * math.sin(self.camera_tilt)
-        view_pos = np.array([cam_x, cam_y, cam_z], dtype=np.float32)
-
-        # Compute MVP with model transform
-        mvp_with_model = self._get_mvp_matrix() @ model
-
-        self.shader["mvp"] = mvp_with_model.T.flatten()
-        self.shader["model"] = model.T.flatten()
-        self.shader["viewPos"] = tuple(view_pos)
-        self.shader["dirLightDir"] = tuple(self.directional_light_dir)
-        self.shader["dirLightColor"] = tuple(self.directional_light_color)
-        self.shader["ambientColor"] = tuple(self.ambient_light_color)
-        self.shader["ambientStrength"] = self.ambient_strength
-        self.shader["specularStrength"] = self.specular_strength
-        self.shader["shininess"] = self.shininess
-        self.shader["emission"] = 0.0  # Fixture bodies use normal lighting
-
-        # Set dynamic lights
-        self._set_dynamic_lights_uniforms()
-
-        # Render cube (no cleanup - buffers are cached)
-        vao.render(mgl.TRIANGLES)
+        self.render_rectangular_box(*position, color, size, size, size)
 
     # Backward compatibility alias
     def render_fixture_cube(
@@ -1304,247 +1449,16 @@ class Room3DRenderer:
         height: float,
         depth: float,
     ):
-        """Render a rectangular box (not a cube) with custom dimensions"""
-        half_width = width / 2.0
-        half_height = height / 2.0
-        half_depth = depth / 2.0
-
-        # Define box faces with normals (similar to cube but with custom dimensions)
-        # Front face (normal: 0, 0, -1)
-        front = [
-            [x - half_width, y, z - half_depth],
-            [x + half_width, y, z - half_depth],
-            [x - half_width, y + height, z - half_depth],
-            [x + half_width, y, z - half_depth],
-            [x + half_width, y + height, z - half_depth],
-            [x - half_width, y + height, z - half_depth],
-        ]
-        front_normal = [0.0, 0.0, -1.0]
-
-        # Back face (normal: 0, 0, 1)
-        back = [
-            [x - half_width, y, z + half_depth],
-            [x - half_width, y + height, z + half_depth],
-            [x + half_width, y, z + half_depth],
-            [x + half_width, y, z + half_depth],
-            [x - half_width, y + height, z + half_depth],
-            [x + half_width, y + height, z + half_depth],
-        ]
-        back_normal = [0.0, 0.0, 1.0]
-
-        # Left face (normal: -1, 0, 0)
-        left = [
-            [x - half_width, y, z - half_depth],
-            [x - half_width, y + height, z - half_depth],
-            [x - half_width, y, z + half_depth],
-            [x - half_width, y, z + half_depth],
-            [x - half_width, y + height, z - half_depth],
-            [x - half_width, y + height, z + half_depth],
-        ]
-        left_normal = [-1.0, 0.0, 0.0]
-
-        # Right face (normal: 1, 0, 0)
-        right = [
-            [x + half_width, y, z - half_depth],
-            [x + half_width, y, z + half_depth],
-            [x + half_width, y + height, z - half_depth],
-            [x + half_width, y + height, z - half_depth],
-            [x + half_width, y, z + half_depth],
-            [x + half_width, y + height, z + half_depth],
-        ]
-        right_normal = [1.0, 0.0, 0.0]
-
-        # Top face (normal: 0, 1, 0)
-        top = [
-            [x - half_width, y + height, z - half_depth],
-            [x + half_width, y + height, z - half_depth],
-            [x - half_width, y + height, z + half_depth],
-            [x + half_width, y + height, z - half_depth],
-            [x + half_width, y + height, z + half_depth],
-            [x - half_width, y + height, z + half_depth],
-        ]
-        top_normal = [0.0, 1.0, 0.0]
-
-        # Bottom face (normal: 0, -1, 0)
-        bottom = [
-            [x - half_width, y, z - half_depth],
-            [x - half_width, y, z + half_depth],
-            [x + half_width, y, z - half_depth],
-            [x + half_width, y, z - half_depth],
-            [x - half_width, y, z + half_depth],
-            [x + half_width, y, z + half_depth],
-        ]
-        bottom_normal = [0.0, -1.0, 0.0]
-
-        # Combine all faces
-        box_vertices = []
-        box_normals = []
-        for face, normal in [
-            (front, front_normal),
-            (back, back_normal),
-            (left, left_normal),
-            (right, right_normal),
-            (top, top_normal),
-            (bottom, bottom_normal),
-        ]:
-            for vertex in face:
-                box_vertices.extend(vertex)
-                box_normals.extend(normal)
-
-        # Create colors (same color for all vertices) with alpha=1.0
-        num_vertices = len(box_vertices) // 3
-        box_colors = []
-        for _ in range(num_vertices):
-            box_colors.extend([color[0], color[1], color[2], 1.0])
-
-        # Create VBOs
-        vertices_array = np.array(box_vertices, dtype=np.float32)
-        normals_array = np.array(box_normals, dtype=np.float32)
-        colors_array = np.array(box_colors, dtype=np.float32)
-
-        vbo = self.ctx.buffer(vertices_array.tobytes())
-        normal_vbo = self.ctx.buffer(normals_array.tobytes())
-        color_vbo = self.ctx.buffer(colors_array.tobytes())
-
-        vao = self.ctx.vertex_array(
-            self.shader,
-            [
-                (vbo, "3f", "position"),
-                (color_vbo, "4f", "color"),
-                (normal_vbo, "3f", "normal"),
-            ],
-        )
-
-        # Set uniforms using current model matrix from transform stack
-        model = self._get_current_model_matrix()
-        mvp_with_model = self._get_mvp_matrix() @ model
-
-        horizontal_distance = self.camera_distance * math.cos(self.camera_tilt)
-        cam_x = horizontal_distance * math.sin(self.camera_angle)
-        cam_z = horizontal_distance * math.cos(self.camera_angle)
-        cam_y = self.camera_height + self.camera_distance * math.sin(self.camera_tilt)
-        view_pos = np.array([cam_x, cam_y, cam_z], dtype=np.float32)
-
-        self.shader["mvp"] = mvp_with_model.T.flatten()
-        self.shader["model"] = model.T.flatten()
-        self.shader["viewPos"] = tuple(view_pos)
-        self.shader["dirLightDir"] = tuple(self.directional_light_dir)
-        self.shader["dirLightColor"] = tuple(self.directional_light_color)
-        self.shader["ambientColor"] = tuple(self.ambient_light_color)
-        self.shader["ambientStrength"] = self.ambient_strength
-        self.shader["specularStrength"] = self.specular_strength
-        self.shader["shininess"] = self.shininess
-        self.shader["emission"] = 0.0  # Rectangular boxes use normal lighting
-
-        # Set dynamic lights
-        self._set_dynamic_lights_uniforms()
-
-        # Render box
-        vao.render(mgl.TRIANGLES)
-
-        # Cleanup
-        vbo.release()
-        normal_vbo.release()
-        color_vbo.release()
-        vao.release()
-
-    def _create_circle_geometry(self, radius: float, segments: int):
-        """Create reusable circle geometry at origin facing +Z (for Blinn-Phong shader)"""
-        circle_vertices = []
-        circle_normals = []
-
-        # Center point at origin
-        center = [0.0, 0.0, 0.0]
-        normal = [0.0, 0.0, 1.0]  # Facing +Z
-
-        # Generate circle points and triangles
-        for i in range(segments):
-            angle1 = 2.0 * math.pi * i / segments
-            angle2 = 2.0 * math.pi * ((i + 1) % segments) / segments
-
-            cos1, sin1 = math.cos(angle1), math.sin(angle1)
-            cos2, sin2 = math.cos(angle2), math.sin(angle2)
-
-            # Point 1 on circle (in XY plane)
-            point1 = [cos1 * radius, sin1 * radius, 0.0]
-            # Point 2 on circle
-            point2 = [cos2 * radius, sin2 * radius, 0.0]
-
-            # Triangle: center -> point1 -> point2
-            circle_vertices.extend(center)
-            circle_vertices.extend(point1)
-            circle_vertices.extend(point2)
-
-            # All normals point in +Z direction
-            for _ in range(3):
-                circle_normals.extend(normal)
-
-        vertices_array = np.array(circle_vertices, dtype=np.float32)
-        normals_array = np.array(circle_normals, dtype=np.float32)
-
-        vbo = self.ctx.buffer(vertices_array.tobytes())
-        normal_vbo = self.ctx.buffer(normals_array.tobytes())
-
-        # Create a per-vertex color VBO that will be updated per render
-        num_vertices = len(circle_vertices) // 3
-        color_vbo = self.ctx.buffer(
-            reserve=num_vertices * 4 * 4
-        )  # 4 floats (RGBA) per vertex
-
-        vao = self.ctx.vertex_array(
-            self.shader,
-            [
-                (vbo, "3f", "position"),
-                (color_vbo, "4f", "color"),
-                (normal_vbo, "3f", "normal"),
-            ],
+        """Render a rectangular box spanning x ± width/2, y to y + height and
+        z ± depth/2 in local coordinates (front face normal −Z)"""
+        scale = np.diag([width, height, depth, 1.0]).astype(np.float32)
+        model = (
+            self._get_current_model_matrix()
+            @ self._translation_matrix(x, y, z)
+            @ scale
         )
-
-        return vbo, normal_vbo, color_vbo, vao, num_vertices
-
-    def _create_emission_circle_geometry(self, radius: float, segments: int):
-        """Create reusable circle geometry at origin facing +Z (for emission shader, no normals)"""
-        circle_vertices = []
-
-        # Center point at origin
-        center = [0.0, 0.0, 0.0]
-
-        # Generate circle points and triangles
-        for i in range(segments):
-            angle1 = 2.0 * math.pi * i / segments
-            angle2 = 2.0 * math.pi * ((i + 1) % segments) / segments
-
-            cos1, sin1 = math.cos(angle1), math.sin(angle1)
-            cos2, sin2 = math.cos(angle2), math.sin(angle2)
-
-            # Point 1 on circle (in XY plane)
-            point1 = [cos1 * radius, sin1 * radius, 0.0]
-            # Point 2 on circle
-            point2 = [cos2 * radius, sin2 * radius, 0.0]
-
-            # Triangle: center -> point1 -> point2
-            circle_vertices.extend(center)
-            circle_vertices.extend(point1)
-            circle_vertices.extend(point2)
-
-        vertices_array = np.array(circle_vertices, dtype=np.float32)
-        vbo = self.ctx.buffer(vertices_array.tobytes())
-
-        # Create a per-vertex color VBO that will be updated per render
-        num_vertices = len(circle_vertices) // 3
-        color_vbo = self.ctx.buffer(
-            reserve=num_vertices * 4 * 4
-        )  # 4 floats (RGBA) per vertex
-
-        vao = self.ctx.vertex_array(
-            self.emission_shader,
-            [
-                (vbo, "3f", "position"),
-                (color_vbo, "4f", "color"),
-            ],
-        )
-
-        return vbo, color_vbo, vao, num_vertices
+        self._queued_bodies.append(self._instance_row(model, *color, 1.0))
+        self._queued()
 
     def render_circle(
         self,
@@ -1557,6 +1471,9 @@ class Room3DRenderer:
     ):
         """Render a flat circular disc in local coordinates
 
+        Unlike ``render_emission_circle`` this blends over what is already
+        drawn and is never batched.
+
         Args:
             position: Local position (x, y, z) relative to current transform
             color: RGB color tuple
@@ -1565,88 +1482,22 @@ class Room3DRenderer:
             alpha: Alpha transparency (0.0 = fully transparent, 1.0 = fully opaque)
             segments: Number of segments around the circle
         """
-        # Get or create cached geometry
-        cache_key = (radius, segments)
-        if cache_key not in self._circle_cache:
-            self._circle_cache[cache_key] = self._create_circle_geometry(
-                radius, segments
-            )
-
-        vbo, normal_vbo, color_vbo, vao, num_vertices = self._circle_cache[cache_key]
-
-        # Update color buffer with current color and alpha
-        circle_colors = []
-        for _ in range(num_vertices):
-            circle_colors.extend([color[0], color[1], color[2], alpha])
-        colors_array = np.array(circle_colors, dtype=np.float32)
-        color_vbo.write(colors_array.tobytes())
-
-        # Create transform to orient circle to face the desired normal
-        x, y, z = position
-        nx, ny, nz = normal
-
-        # Normalize the normal vector
-        normal_length = math.sqrt(nx * nx + ny * ny + nz * nz)
-        if normal_length < 0.001:
-            nx, ny, nz = 0.0, 0.0, 1.0
-        else:
-            nx, ny, nz = nx / normal_length, ny / normal_length, nz / normal_length
-
-        # Build rotation matrix to align +Z to desired normal
-        # Simple approach: if normal is close to +Z, use identity
-        if abs(nz - 1.0) < 0.001:
-            # Already facing +Z
-            rotation = np.eye(4, dtype=np.float32)
-        else:
-            # Create perpendicular vectors
-            if abs(nx) < 0.9:
-                perp1 = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-            else:
-                perp1 = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-
-            normal_vec = np.array([nx, ny, nz], dtype=np.float32)
-            perp1 = perp1 - normal_vec * np.dot(perp1, normal_vec)
-            perp1 = perp1 / np.linalg.norm(perp1)
-
-            perp2 = np.cross(normal_vec, perp1)
-            perp2 = perp2 / np.linalg.norm(perp2)
-
-            # Build rotation matrix from basis vectors
-            rotation = np.array(
-                [
-                    [perp1[0], perp2[0], nx, 0],
-                    [perp1[1], perp2[1], ny, 0],
-                    [perp1[2], perp2[2], nz, 0],
-                    [0, 0, 0, 1],
-                ],
-                dtype=np.float32,
-            )
-
-        # Create translation matrix
-        translation = np.array(
-            [[1, 0, 0, x], [0, 1, 0, y], [0, 0, 1, z], [0, 0, 0, 1]],
-            dtype=np.float32,
+        model = (
+            self._get_current_model_matrix()
+            @ self._translation_matrix(*position)
+            @ self._align_z_matrix(normal)
         )
-
-        # Combine transforms
-        local_model = translation @ rotation
-        model = self._get_current_model_matrix() @ local_model
-
-        # Render circle with emission (bulbs glow independently)
-        mvp_with_model = self._get_mvp_matrix() @ model
-
-        self.shader["mvp"] = mvp_with_model.T.flatten()
-        self.shader["model"] = model.T.flatten()
-        self.shader["emission"] = 1.0  # Bulbs are emissive - not affected by lighting
+        row = self._instance_row(model, *color, alpha, radius, radius, 0.0)
+        self.emission_shader["view_proj"] = self._get_mvp_matrix().T.flatten()
 
         # Enable blending for transparency if alpha < 1.0
         if alpha < 1.0:
             self.ctx.enable(mgl.BLEND)
             self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
 
-        vao.render(mgl.TRIANGLES)
+        # Bulbs are emissive - not affected by lighting
+        self._unit_disc_mesh(segments).draw(row[np.newaxis])
 
-        # Disable blending
         if alpha < 1.0:
             self.ctx.disable(mgl.BLEND)
 
@@ -1671,92 +1522,15 @@ class Room3DRenderer:
             alpha: Alpha transparency (0.0 = fully transparent, 1.0 = fully opaque)
             segments: Number of segments around the circle
         """
-        # Get or create cached geometry (emission version, no normals)
-        cache_key = (radius, segments)
-        if cache_key not in self._emission_circle_cache:
-            self._emission_circle_cache[cache_key] = (
-                self._create_emission_circle_geometry(radius, segments)
-            )
-
-        vbo, color_vbo, vao, num_vertices = self._emission_circle_cache[cache_key]
-
-        # Update color buffer with current color and alpha
-        circle_colors = []
-        for _ in range(num_vertices):
-            circle_colors.extend([color[0], color[1], color[2], alpha])
-        colors_array = np.array(circle_colors, dtype=np.float32)
-        color_vbo.write(colors_array.tobytes())
-
-        # Create transform to orient circle to face the desired normal
-        x, y, z = position
-        nx, ny, nz = normal
-
-        # Normalize the normal vector
-        normal_length = math.sqrt(nx * nx + ny * ny + nz * nz)
-        if normal_length < 0.001:
-            nx, ny, nz = 0.0, 0.0, 1.0
-        else:
-            nx, ny, nz = nx / normal_length, ny / normal_length, nz / normal_length
-
-        # Build rotation matrix to align +Z to desired normal
-        # Simple approach: if normal is close to +Z, use identity
-        if abs(nz - 1.0) < 0.001:
-            # Already facing +Z
-            rotation = np.eye(4, dtype=np.float32)
-        else:
-            # Create perpendicular vectors
-            if abs(nx) < 0.9:
-                perp1 = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-            else:
-                perp1 = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-
-            normal_vec = np.array([nx, ny, nz], dtype=np.float32)
-            perp1 = perp1 - normal_vec * np.dot(perp1, normal_vec)
-            perp1 = perp1 / np.linalg.norm(perp1)
-
-            perp2 = np.cross(normal_vec, perp1)
-            perp2 = perp2 / np.linalg.norm(perp2)
-
-            # Build rotation matrix from basis vectors
-            rotation = np.array(
-                [
-                    [perp1[0], perp2[0], nx, 0],
-                    [perp1[1], perp2[1], ny, 0],
-                    [perp1[2], perp2[2], nz, 0],
-                    [0, 0, 0, 1],
-                ],
-                dtype=np.float32,
-            )
-
-        # Create translation matrix
-        translation = np.array(
-            [[1, 0, 0, x], [0, 1, 0, y], [0, 0, 1, z], [0, 0, 0, 1]],
-            dtype=np.float32,
+        model = (
+            self._get_current_model_matrix()
+            @ self._translation_matrix(*position)
+            @ self._align_z_matrix(normal)
         )
-
-        # Combine transforms
-        local_model = translation @ rotation
-        model = self._get_current_model_matrix() @ local_model
-
-        # Render with pure emission shader (no lighting)
-        mvp_with_model = self._get_mvp_matrix() @ model
-
-        self.emission_shader["mvp"] = mvp_with_model.T.flatten()
-
-        # Emission circles live in the emissive pass, where everything has to
-        # blend additively so overlapping luminous things (bulbs, beams) only
-        # brighten each other. The previous `SRC_ALPHA, ONE_MINUS_SRC_ALPHA`
-        # here (and the no-blend path when ``alpha == 1``) let a bulb draw
-        # *overwrite* pixels that earlier additive beams had lit, which
-        # manifested in the desktop preview as e.g. a mirrorball beam
-        # appearing to darken a moving-head beam where they crossed the bulb
-        # disc. Keep additive (``SRC_ALPHA, ONE``) unconditionally.
-        self.ctx.enable(mgl.BLEND)
-        self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE
-
-        vao.render(mgl.TRIANGLES)
-
-        self.ctx.disable(mgl.BLEND)
+        self._queued_discs.setdefault(segments, []).append(
+            self._instance_row(model, *color, alpha, radius, radius, 0.0)
+        )
+        self._queued()
 
     def render_sphere(
         self,
@@ -1934,66 +1708,6 @@ class Room3DRenderer:
                 alpha=beam_alpha * alpha,  # Scale beam alpha with bulb alpha
             )
 
-    def _create_cone_geometry(
-        self, start_radius: float, end_radius: float, segments: int
-    ):
-        """Create reusable cone geometry along +Z axis from origin to (0, 0, 1)"""
-        cone_vertices = []
-
-        # Generate circle points at start (z=0) and end (z=1)
-        start_circle = []
-        end_circle = []
-
-        for i in range(segments):
-            angle = 2.0 * math.pi * i / segments
-            cos_a = math.cos(angle)
-            sin_a = math.sin(angle)
-
-            # Start circle point (at z=0)
-            start_point = [cos_a * start_radius, sin_a * start_radius, 0.0]
-            start_circle.append(start_point)
-
-            # End circle point (at z=1, will be scaled by length later)
-            end_point = [cos_a * end_radius, sin_a * end_radius, 1.0]
-            end_circle.append(end_point)
-
-        # Build triangles for cone surface
-        for i in range(segments):
-            next_i = (i + 1) % segments
-
-            # Two triangles per segment
-            # Triangle 1: start[i], end[i], start[next_i]
-            cone_vertices.extend(start_circle[i])
-            cone_vertices.extend(end_circle[i])
-            cone_vertices.extend(start_circle[next_i])
-
-            # Triangle 2: start[next_i], end[i], end[next_i]
-            cone_vertices.extend(start_circle[next_i])
-            cone_vertices.extend(end_circle[i])
-            cone_vertices.extend(end_circle[next_i])
-
-        vertices_array = np.array(cone_vertices, dtype=np.float32)
-        vbo = self.ctx.buffer(vertices_array.tobytes())
-
-        # Create a per-vertex color VBO that will be updated per render
-        num_vertices = len(cone_vertices) // 3
-        color_vbo = self.ctx.buffer(
-            reserve=num_vertices * 4 * 4
-        )  # 4 floats (RGBA) per vertex
-
-        # Extract z-coordinates for gradient calculation (normalized 0.0 to 1.0)
-        vertex_z_coords = vertices_array[2::3].copy()  # Extract z-coordinates
-
-        vao = self.ctx.vertex_array(
-            self.emission_shader,
-            [
-                (vbo, "3f", "position"),
-                (color_vbo, "4f", "color"),
-            ],
-        )
-
-        return vbo, color_vbo, vao, num_vertices, vertex_z_coords
-
     def render_cone_beam(
         self,
         start_x: float,
@@ -2009,6 +1723,9 @@ class Room3DRenderer:
     ):
         """Render a cone-shaped light beam projecting in a direction
 
+        The beam darkens to 30% and fades to 10% alpha towards its end, with a
+        subtle hot core at the source (see the emission shader).
+
         Args:
             start_x, start_y, start_z: Starting position of the beam
             direction: Normalized direction vector (dx, dy, dz)
@@ -2030,131 +1747,18 @@ class Room3DRenderer:
             (start_x, start_y, start_z), (dx, dy, dz), length
         )
 
-        # Get or create cached geometry
-        cache_key = (start_radius, end_radius, segments)
-        if cache_key not in self._cone_cache:
-            self._cone_cache[cache_key] = self._create_cone_geometry(
-                start_radius, end_radius, segments
-            )
-
-        vbo, color_vbo, vao, num_vertices, vertex_z_coords = self._cone_cache[cache_key]
-
-        # Update color buffer with gradient colors based on vertex position
-        # z=0.0 is start (full brightness/alpha), z=1.0 is end (reduced brightness/alpha)
-        cone_colors = []
-        for i in range(num_vertices):
-            z_normalized = vertex_z_coords[i]  # 0.0 at start, 1.0 at end
-            
-            # Interpolate brightness: start=1.0, end=0.3
-            brightness_factor = 1.0 - z_normalized * 0.7  # 1.0 to 0.3
-            
-            # Interpolate alpha: start=alpha, end=alpha*0.1
-            alpha_factor = 1.0 - z_normalized * 0.9  # 1.0 to 0.1
-            
-            # Subtle "hot core" near the source. Previously this mixed up to 80%
-            # towards white over the first third of the beam, which washed out
-            # saturated colors (e.g. red reading as pink/white at the lens). Keep
-            # just enough of a highlight to feel luminous without losing hue.
-            _WHITE_CLIP_PEAK = 0.2  # was 0.8
-            _WHITE_CLIP_EXTENT = 0.15  # was 0.33
-            if z_normalized < _WHITE_CLIP_EXTENT:
-                white_clip_amount = (
-                    1.0 - z_normalized / _WHITE_CLIP_EXTENT
-                ) * _WHITE_CLIP_PEAK
-            else:
-                white_clip_amount = 0.0
-
-            r = color[0] * brightness_factor
-            g = color[1] * brightness_factor
-            b = color[2] * brightness_factor
-
-            r = r + (1.0 - r) * white_clip_amount
-            g = g + (1.0 - g) * white_clip_amount
-            b = b + (1.0 - b) * white_clip_amount
-            
-            # Apply alpha gradient
-            vertex_alpha = alpha * alpha_factor
-            
-            cone_colors.extend([r, g, b, vertex_alpha])
-        colors_array = np.array(cone_colors, dtype=np.float32)
-        color_vbo.write(colors_array.tobytes())
-
-        # DEBUG: Verify all vertices have the same color
-        # unique_colors = np.unique(colors_array.reshape(-1, 4), axis=0)
-        # print(f"DEBUG render_cone_beam: Setting {num_vertices} vertices to RGBA={color + (alpha,)}, unique colors: {len(unique_colors)}")
-
-        # Build transform to orient cone from origin along +Z to desired position/direction
-        # Create perpendicular vectors for the cone orientation
-        if abs(dx) < 0.9:
-            perp1 = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        else:
-            perp1 = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-
-        direction_vec = np.array([dx, dy, dz], dtype=np.float32)
-        perp1 = perp1 - direction_vec * np.dot(perp1, direction_vec)
-        perp1 = perp1 / np.linalg.norm(perp1)
-
-        perp2 = np.cross(direction_vec, perp1)
-        perp2 = perp2 / np.linalg.norm(perp2)
-
-        # Build rotation matrix to align +Z to beam direction
-        rotation = np.array(
-            [
-                [perp1[0], perp2[0], dx, 0],
-                [perp1[1], perp2[1], dy, 0],
-                [perp1[2], perp2[2], dz, 0],
-                [0, 0, 0, 1],
-            ],
-            dtype=np.float32,
-        )
-
-        # Scale matrix for length
-        scale = np.array(
-            [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, length, 0], [0, 0, 0, 1]],
-            dtype=np.float32,
+        # Translate * rotate +Z onto the beam * stretch the unit cone to length
+        scale = np.diag([1.0, 1.0, length, 1.0]).astype(np.float32)
+        model = (
+            self._get_current_model_matrix()
+            @ self._translation_matrix(start_x, start_y, start_z)
+            @ self._align_z_matrix((dx, dy, dz))
+            @ scale
         )
-
-        # Translation matrix
-        translation = np.array(
-            [[1, 0, 0, start_x], [0, 1, 0, start_y], [0, 0, 1, start_z], [0, 0, 0, 1]],
-            dtype=np.float32,
+        self._queued_cones.setdefault(segments, []).append(
+            self._instance_row(model, *color, alpha, start_radius, end_radius, 1.0)
         )
-
-        # Combine transforms: translate * rotate * scale
-        local_model = translation @ rotation @ scale
-        model = self._get_current_model_matrix() @ local_model
-
-        # Set uniforms using current model matrix from transform stack
-        mvp_with_model = self._get_mvp_matrix() @ model
-
-        # Only need MVP for emission shader (no lighting, no model matrix needed)
-        self.emission_shader["mvp"] = mvp_with_model.T.flatten()
-
-        # Enable face culling to avoid rendering back-faces (prevents double-rendering at edges)
-        self.ctx.enable(mgl.CULL_FACE)
-        self.ctx.front_face = "ccw"  # Counter-clockwise front faces
-        self.ctx.cull_face = "back"  # Cull back faces
-
-        # Enable blending for semi-transparent beams
-        self.ctx.enable(mgl.BLEND)
-        # Use additive blending so overlapping beams brighten each other
-        self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE
-
-        # Keep depth writes off so beams never occlude each other, but leave
-        # the depth-test state as the caller configured it. The caller enables
-        # depth-test against the opaque depth buffer so that solid geometry
-        # (floor, fixture bodies, DJ booth) occludes beam fragments that lie
-        # behind them, while beam-on-beam overlap still blends additively
-        # because no beam writes into the depth buffer.
-        self.ctx.depth_mask = False
-
-        # Render cone (no cleanup - buffers are cached)
-        vao.render(mgl.TRIANGLES)
-
-        # Restore state (don't restore depth test - let caller manage it)
-        self.ctx.depth_mask = True
-        self.ctx.disable(mgl.BLEND)
-        self.ctx.disable(mgl.CULL_FACE)
+        self._queued()
 
     def render_text_label(
         self,
@@ -2171,104 +1775,54 @@ class Room3DRenderer:
             color: RGB color tuple (0-1 range)
             size: Size of the text quad
         """
-        if not self._text_font:
+        if self._text_font is None:
             return
-
-        # Create or get cached texture for this text
-        cache_key = text
-        if cache_key not in self._text_texture_cache:
-            # Create PIL image with text
-            # Use a small image size for text labels
-            img_width, img_height = 64, 16
-            image = Image.new(
-                "L", (img_width, img_height), 0
-            )  # Grayscale, black background
-            draw = ImageDraw.Draw(image)
-
-            # Draw white text
-            draw.text((2, 2), text, fill=255, font=self._text_font)
-
-            # Convert to numpy and flip vertically to match OpenGL texture coordinates
-            img_array = np.array(image, dtype=np.uint8)
-            img_array = np.flipud(img_array)  # Flip to match OpenGL coords
-            texture = self.ctx.texture((img_width, img_height), 1, img_array.tobytes())
-            texture.filter = (mgl.LINEAR, mgl.LINEAR)
-            self._text_texture_cache[cache_key] = texture
-
-        texture = self._text_texture_cache[cache_key]
-
-        # Create a quad to display the text
-        x, y, z = position
-        aspect = 64.0 / 16.0  # Text texture aspect ratio
-        width = size * aspect
-        height = size
-
-        # Create quad vertices (billboard facing camera would be ideal, but for now just face forward)
-        vertices = [
-            [x - width / 2, y, z],
-            [x + width / 2, y, z],
-            [x - width / 2, y + height, z],
-            [x + width / 2, y, z],
-            [x + width / 2, y + height, z],
-            [x - width / 2, y + height, z],
-        ]
-
-        # Texture coordinates
-        texcoords = [
-            [0.0, 0.0],
-            [1.0, 0.0],
-            [0.0, 1.0],
-            [1.0, 0.0],
-            [1.0, 1.0],
-            [0.0, 1.0],
-        ]
-
-        # Flatten arrays
-        vertices_flat = []
-        texcoords_flat = []
-        for vert, tc in zip(vertices, texcoords):
-            vertices_flat.extend(vert)
-            texcoords_flat.extend(tc)
-
-        # Create VBOs
-        vertices_array = np.array(vertices_flat, dtype=np.float32)
-        texcoords_array = np.array(texcoords_flat, dtype=np.float32)
-
-        vbo = self.ctx.buffer(vertices_array.tobytes())
-        texcoord_vbo = self.ctx.buffer(texcoords_array.tobytes())
-
-        vao = self.ctx.vertex_array(
-            self.text_shader,
-            [
-                (vbo, "3f", "position"),
-                (texcoord_vbo, "2f", "texcoord"),
-            ],
+        self._queued_labels.append(
+            (text, position, color, size, self._get_current_model_matrix())
         )
+        self._queued()
+
+    def _draw_text_labels(self, view_proj: np.ndarray):
+        """Draw every queued label's glyphs in one instanced call"""
+        atlas = glyph_atlas(self.ctx, self._text_font)
+        rows = []
+        for text, position, color, size, model in self._queued_labels:
+            quads = self._text_label_cache.get((text, size))
+            if quads is None:
+                quads = self._label_quads(atlas, text, size)
+                self._text_label_cache[(text, size)] = quads
+            label = self._instance_row(model, *position, *color)
+            rows.append(
+                np.hstack([quads, np.broadcast_to(label, (len(quads), label.size))])
+            )
+        rows = np.concatenate(rows)
+        if not len(rows):
+            return
 
-        # Set uniforms
-        model = self._get_current_model_matrix()
-        mvp_with_model = self._get_mvp_matrix() @ model
-
-        self.text_shader["mvp"] = mvp_with_model.T.flatten()
-        self.text_shader["text_color"] = color
-
-        # Bind texture and render
-        texture.use(0)
-        self.text_shader["text_texture"] = 0
+        self.text_shader["view_proj"] = view_proj
+        # Bound after layout, which may have grown the atlas
+        atlas.texture.use(0)
+        self.text_shader["glyph_atlas"] = 0
 
         # Enable blending for text transparency
         self.ctx.enable(mgl.BLEND)
         self.ctx.blend_func = mgl.SRC_ALPHA, mgl.ONE_MINUS_SRC_ALPHA
-
-        vao.render(mgl.TRIANGLES)
-
-        # Disable blending
+        self._label_mesh.draw(rows, mgl.TRIANGLE_STRIP)
         self.ctx.disable(mgl.BLEND)
 
-        # Cleanup
-        vbo.release()
-        texcoord_vbo.release()
-        vao.release()
+    @staticmethod
+    def _label_quads(atlas: GlyphAtlas, text: str, size: float) -> np.ndarray:
+        """Glyph quads in label space: a size*4 x size box centred on x with
+        its bottom at y = 0, text left-aligned 2/16 of the height in"""
+        layout = atlas.layout(text)
+        # The label box is 16 font pixels tall; world y grows upwards
+        scale = size / 16.0
+        quads = layout.quads.copy()
+        quads[:, [0, 2]] = (
+            quads[:, [0, 2]] + layout.width / 2 + 2
+        ) * scale - size * 2.0
+        quads[:, [1, 3]] = size - (quads[:, [1, 3]] + 2 + atlas.ascent) * scale
+        return quads
 
     def render_billboard(
         self,
@@ -2430,31 +1984,19 @@ class Room3DRenderer:
 
     def cleanup(self):
         """Clean up OpenGL resources"""
-        # Cleanup text textures
-        for texture in self._text_texture_cache.values():
-            texture.release()
-        self._text_texture_cache.clear()
-
-        # Cleanup geometry caches
-        for vbo, normal_vbo, color_vbo, vao, _ in self._cube_cache.values():
-            vbo.release()
-            normal_vbo.release()
-            color_vbo.release()
-            vao.release()
-        self._cube_cache.clear()
-
-        for vbo, normal_vbo, color_vbo, vao, _ in self._circle_cache.values():
-            vbo.release()
-            normal_vbo.release()
-            color_vbo.release()
-            vao.release()
-        self._circle_cache.clear()
-
-        for vbo, color_vbo, vao, _, _ in self._cone_cache.values():
-            vbo.release()
-            color_vbo.release()
-            vao.release()
-        self._cone_cache.clear()
+        # Cleanup text label geometry (the glyph atlas is shared per context)
+        self._label_mesh.release()
+        self._text_label_cache.clear()
+
+        # Cleanup instanced meshes
+        meshes = [*self._disc_meshes.values(), *self._cone_meshes.values()]
+        if self._box_mesh is not None:
+            meshes.append(self._box_mesh)
+        for mesh in meshes:
+            mesh.release()
+        self._box_mesh = None
+        self._disc_meshes.clear()
+        self._cone_meshes.clear()
 
         if self.show_floor:
             self._release_floor_geometry()
@@ -635,3 +635,40 @@ def test_room_renderer_floor_optional():
     room_no_floor.cleanup()
     room_with_floor.cleanup()
     ctx.release()
+
+
+def test_batched_fixtures_render_in_a_handful_of_draws():
+    """100 pars and movers queue instance rows and draw per mesh, not per fixture"""
+    import numpy as np
+    from parrot.vj.renderers.room_3d import Room3DRenderer
+
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    room = Room3DRenderer(ctx, 200, 150)
+    tex = ctx.texture((200, 150), 3)
+    fbo = ctx.framebuffer(color_attachments=[tex])
+    fbo.use()
+    ctx.clear(0.0, 0.0, 0.0)
+
+    renderers = []
+    for i in range(100):
+        fixture = ParRGB(1 + i * 3) if i % 2 else ChauvetSpot160_12Ch(patch=1 + i * 12)
+        fixture.set_color(Color("red"))
+        fixture.set_dimmer(255)
+        renderer = create_renderer(fixture, room)
+        renderer.set_position(50.0 + (i % 10) * 40, 100.0 + (i // 10) * 30, 3.0)
+        renderers.append(renderer)
+
+    frame = Frame({signal: 0.0 for signal in FrameSignal})
+    frame.time = 0.0
+    with room.batched():
+        for renderer in renderers:
+            renderer.render_emissive(ctx, (500.0, 500.0), frame)
+
+    assert room.last_batch_draw_calls <= 4
+    assert np.frombuffer(tex.read(), dtype=np.uint8).max() > 0
+    fbo.release()
+    room.cleanup()
+    ctx.release()
@@ -0,0 +1,135 @@
+"""Scale the internal resolution of expensive VJ nodes to hold a frame rate."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Optional
+
+import moderngl as mgl
+from beartype import beartype
+
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode
+from parrot.vj.constants import HIGH_FPS
+from parrot.vj.nodes.mode_switch import ModeSwitch
+from parrot.vj.profiler import gpu_timer, vj_profiler
+
+# Linear scale moves in these steps; cost follows the pixel count (scale²)
+SCALE_STEP = 0.125
+DEFAULT_MIN_SCALE = 0.5
+# Frames to wait after a change before judging the new resolution
+SETTLE_FRAMES = 30
+# Weight of the newest sample in the smoothed frame time
+SMOOTHING = 0.1
+# Only scale back up when the predicted cost leaves this much of the budget
+UPSCALE_MARGIN = 0.9
+
+
+@beartype
+class ScalableResolution:
+    """Mixin for nodes that may render below their nominal ``width`` x
+    ``height``. Consumers sample the output by uv, so a smaller target is
+    upscaled wherever it is composited."""
+
+    render_scale = 1.0
+
+    def scaled_size(self) -> tuple[int, int]:
+        return (
+            max(1, round(self.width * self.render_scale)),
+            max(1, round(self.height * self.render_scale)),
+        )
+
+
+@beartype
+def scalable_nodes(root: BaseInterpretationNode) -> list[ScalableResolution]:
+    """Every ScalableResolution node under ``root``, inactive modes included."""
+    found: list[ScalableResolution] = []
+    seen: set[int] = set()
+
+    def visit(node: BaseInterpretationNode) -> None:
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        if isinstance(node, ScalableResolution):
+            found.append(node)
+        children = list(node.all_inputs)
+        if isinstance(node, ModeSwitch):
+            children += list(node.mode_nodes.values())
+        for child in children:
+            visit(child)
+
+    visit(root)
+    return found
+
+
+@beartype
+class ResolutionGovernor:
+    """Holds the VJ render under ``1 / target_fps`` seconds per frame.
+
+    ``measure`` times each frame's render as a ``vj_render`` section of the
+    context's ``GpuTimer``; a frame costs the longer of its CPU and GPU time,
+    read back a couple of frames later instead of calling ``finish``. When the
+    smoothed cost runs over budget, every attached ``ScalableResolution``
+    node drops one ``SCALE_STEP`` (down to ``min_scale``); when a step up is
+    predicted to fit, they go back up. ``target_fps <= 0`` only measures.
+    """
+
+    def __init__(
+        self,
+        target_fps: float | int = HIGH_FPS,
+        min_scale: float = DEFAULT_MIN_SCALE,
+        settle_frames: int = SETTLE_FRAMES,
+    ):
+        self.target_fps = float(target_fps)
+        self.min_scale = min_scale
+        self.settle_frames = settle_frames
+        self.scale = 1.0
+        self.frame_seconds: Optional[float] = None
+        self._frames_since_change = 0
+        self._nodes: list[ScalableResolution] = []
+
+    @property
+    def budget_seconds(self) -> float:
+        return 1.0 / self.target_fps if self.target_fps > 0 else float("inf")
+
+    def attach(self, root: BaseInterpretationNode) -> None:
+        """Govern the scalable nodes under ``root`` at the current scale."""
+        self._nodes = scalable_nodes(root)
+        self._apply_scale()
+
+    @contextmanager
+    def measure(self, context: mgl.Context):
+        timer = gpu_timer(context)
+        with timer.section("vj_render"):
+            yield
+        for frame in timer.collect():
+            vj_profiler.record_gpu_frame(frame)
+            self.observe(max(frame.cpu_seconds, frame.gpu_seconds))
+
+    def observe(self, frame_seconds: float) -> None:
+        """Feed one frame's cost and rescale if it calls for it."""
+        if self.frame_seconds is None:
+            self.frame_seconds = frame_seconds
+        else:
+            self.frame_seconds += SMOOTHING * (frame_seconds - self.frame_seconds)
+        self._frames_since_change += 1
+        if self.target_fps <= 0 or self._frames_since_change < self.settle_frames:
+            return
+
+        budget = self.budget_seconds
+        if self.frame_seconds > budget and self.scale > self.min_scale:
+            self._set_scale(max(self.min_scale, self.scale - SCALE_STEP))
+        elif self.scale < 1.0:
+            larger = min(1.0, self.scale + SCALE_STEP)
+            predicted = self.frame_seconds * (larger / self.scale) ** 2
+            if predicted < budget * UPSCALE_MARGIN:
+                self._set_scale(larger)
+
+    def _set_scale(self, scale: float) -> None:
+        self.scale = scale
+        self.frame_seconds = None
+        self._frames_since_change = 0
+        self._apply_scale()
+
+    def _apply_scale(self) -> None:
+        for node in self._nodes:
+            node.render_scale = self.scale
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Dual Kawase blur shaders for bloom.
+Each downsample pass halves the resolution with a 5-tap filter; each
+upsample pass doubles it with an 8-tap tent, so a wide glow costs a few
+cheap passes over ever smaller targets instead of many full-size ones.
+"""
+
+from beartype import beartype
+
+
+@beartype
+def get_vertex_shader() -> str:
+    """Vertex shader for fullscreen quad (uv derived from position)"""
+    return """
+    #version 330 core
+    in vec2 in_position;
+    out vec2 uv;
+
+    void main() {
+        gl_Position = vec4(in_position, 0.0, 1.0);
+        uv = in_position * 0.5 + 0.5;
+    }
+    """
+
+
+@beartype
+def get_downsample_shader() -> str:
+    """Fragment shader for one downsample step, with an optional bright-pass"""
+    return """
+    #version 330 core
+    in vec2 uv;
+    out vec3 fragColor;
+
+    uniform sampler2D inputTexture;
+    uniform vec2 halfPixel;   // 0.5 / input size, scaled by the spread
+    uniform float threshold;  // Luminance bright-pass; <= 0 keeps everything
+
+    vec3 sampleInput(vec2 position) {
+        // Clamp rather than rely on the wrap mode of pooled targets
+        vec2 edge = 0.5 / vec2(textureSize(inputTexture, 0));
+        vec3 color = texture(inputTexture, clamp(position, edge, 1.0 - edge)).rgb;
+        if (threshold > 0.0) {
+            // Smooth falloff near threshold for a gentle transition
+            float luminance = dot(color, vec3(0.299, 0.587, 0.114));
+            color *= smoothstep(threshold - 0.1, threshold + 0.1, luminance);
+        }
+        return color;
+    }
+
+    void main() {
+        vec3 sum = sampleInput(uv) * 4.0;
+        sum += sampleInput(uv - halfPixel);
+        sum += sampleInput(uv + halfPixel);
+        sum += sampleInput(uv + vec2(halfPixel.x, -halfPixel.y));
+        sum += sampleInput(uv - vec2(halfPixel.x, -halfPixel.y));
+        fragColor = sum / 8.0;
+    }
+    """
+
+
+@beartype
+def get_upsample_shader() -> str:
+    """Fragment shader for one upsample step"""
+    return """
+    #version 330 core
+    in vec2 uv;
+    out vec3 fragColor;
+
+    uniform sampler2D inputTexture;
+    uniform vec2 halfPixel;  // 0.5 / input size, scaled by the spread
+
+    vec3 sampleInput(vec2 position) {
+        vec2 edge = 0.5 / vec2(textureSize(inputTexture, 0));
+        return texture(inputTexture, clamp(position, edge, 1.0 - edge)).rgb;
+    }
+
+    void main() {
+        vec3 sum = sampleInput(uv + vec2(-halfPixel.x * 2.0, 0.0));
+        sum += sampleInput(uv + vec2(-halfPixel.x, halfPixel.y)) * 2.0;
+        sum += sampleInput(uv + vec2(0.0, halfPixel.y * 2.0));
+        sum += sampleInput(uv + vec2(halfPixel.x, halfPixel.y)) * 2.0;
+        sum += sampleInput(uv + vec2(halfPixel.x * 2.0, 0.0));
+        sum += sampleInput(uv + vec2(halfPixel.x, -halfPixel.y)) * 2.0;
+        sum += sampleInput(uv + vec2(0.0, -halfPixel.y * 2.0));
+        sum += sampleInput(uv + vec2(-halfPixel.x, -halfPixel.y)) * 2.0;
+        fragColor = sum / 12.0;
+    }
+    """
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Output fit shader for multi-output VJ rendering.
+Samples one rectangle of the shared render into an output's framebuffer;
+the fit mode is resolved on the CPU into that rectangle and the viewport.
+"""
+
+from beartype import beartype
+
+
+@beartype
+def get_vertex_shader() -> str:
+    """Vertex shader for fullscreen quad (uv derived from position)"""
+    return """
+    #version 330 core
+    in vec2 in_position;
+    out vec2 uv;
+
+    void main() {
+        gl_Position = vec4(in_position, 0.0, 1.0);
+        uv = in_position * 0.5 + 0.5;
+    }
+    """
+
+
+@beartype
+def get_fragment_shader() -> str:
+    """Fragment shader sampling ``uvOffset + uv * uvScale`` of the source"""
+    return """
+    #version 330 core
+    in vec2 uv;
+    out vec3 fragColor;
+
+    uniform sampler2D inputTexture;
+    uniform vec2 uvOffset;
+    uniform vec2 uvScale;
+
+    void main() {
+        fragColor = texture(inputTexture, uvOffset + uv * uvScale).rgb;
+    }
+    """
@@ -0,0 +1,192 @@
+"""Publish VJ frames to a shared-memory ring: GPU conversion, async readback."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import moderngl as mgl
+import numpy as np
+from beartype import beartype
+
+from parrot.vj.program_cache import program_cache, release_program
+from parrot.vj.shared_frame_ring import DEFAULT_SLOTS, PixelFormat, SharedFrameRing
+
+_VERTEX_SHADER = """
+#version 330 core
+in vec2 in_position;
+out vec2 uv;
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+    uv = in_position * 0.5 + 0.5;
+}
+"""
+
+_RGBA_SHADER = """
+#version 330 core
+in vec2 uv;
+out vec4 color;
+uniform sampler2D source_texture;
+void main() {
+    color = vec4(texture(source_texture, uv).rgb, 1.0);
+}
+"""
+
+# Packs I420 into one R8 target of width x height * 3 / 2: the Y rows, then
+# the U and then the V plane, each half size and laid out row after row.
+# Chroma samples the centre of each 2x2 block, which bilinear filtering
+# averages.
+_YUV420_SHADER = """
+#version 330 core
+out float value;
+uniform sampler2D source_texture;
+uniform ivec2 frame_size;
+
+const vec3 Y_WEIGHTS = vec3(0.299, 0.587, 0.114);
+const vec3 U_WEIGHTS = vec3(-0.168736, -0.331264, 0.5);
+const vec3 V_WEIGHTS = vec3(0.5, -0.418688, -0.081312);
+
+void main() {
+    ivec2 texel = ivec2(gl_FragCoord.xy);
+    int width = frame_size.x;
+    int height = frame_size.y;
+    if (texel.y < height) {
+        vec3 rgb = texture(source_texture, (vec2(texel) + 0.5) / vec2(frame_size)).rgb;
+        value = (16.0 + 219.0 * dot(rgb, Y_WEIGHTS)) / 255.0;
+        return;
+    }
+    int plane_size = (width / 2) * (height / 2);
+    int index = (texel.y - height) * width + texel.x;
+    int plane = index / plane_size;
+    int i = index - plane * plane_size;
+    vec2 block = vec2(i % (width / 2), i / (width / 2));
+    vec3 rgb = texture(source_texture, (2.0 * block + 1.0) / vec2(frame_size)).rgb;
+    float chroma = dot(rgb, plane == 0 ? U_WEIGHTS : V_WEIGHTS);
+    value = (128.0 + 224.0 * chroma) / 255.0;
+}
+"""
+
+
+@dataclass(eq=False)
+class _ReadbackSlot:
+    texture: Any
+    framebuffer: Any
+    pixel_buffer: Any
+    timestamp: float = 0.0
+
+
+@beartype
+class SharedFrameOutput:
+    """Streams VJ output textures into a ``SharedFrameRing`` named ``name``.
+
+    ``capture`` scales (and for ``yuv420`` converts) the texture into a
+    target of the ring's size on the GPU and starts an asynchronous
+    readback into a pixel buffer. ``poll`` (once per frame, before the next
+    ``capture``) copies readbacks started on an earlier frame straight into
+    the ring's next slot: one copy, no encoding, nothing waits on the GPU.
+    Two readback slots ping-pong; a capture with both in flight is skipped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        width: int,
+        height: int,
+        pixel_format: PixelFormat = "rgba",
+        slots: int = DEFAULT_SLOTS,
+    ):
+        self.ring = SharedFrameRing(name, width, height, pixel_format, slots)
+        self.size = (width, height)
+        self.pixel_format = pixel_format
+        self.skipped_captures = 0
+        self._context: Optional[mgl.Context] = None
+        self._program: Optional[mgl.Program] = None
+        self._vbo: Optional[mgl.Buffer] = None
+        self._vao: Optional[mgl.VertexArray] = None
+        self._slots: list[_ReadbackSlot] = []
+        self._in_flight: deque[_ReadbackSlot] = deque()
+
+    def capture(
+        self, context: mgl.Context, texture: Any, timestamp: Optional[float] = None
+    ) -> bool:
+        """Start reading back ``texture``; ``timestamp`` defaults to now."""
+        if context is not self._context:
+            self._release_gl()
+            self._create_resources(context)
+        slot = next((s for s in self._slots if s not in self._in_flight), None)
+        if slot is None:
+            self.skipped_captures += 1
+            return False
+
+        previous_framebuffer, previous_viewport = context.fbo, context.viewport
+        slot.framebuffer.use()
+        context.viewport = (0, 0, *slot.texture.size)
+        texture.use(0)
+        self._program["source_texture"] = 0
+        if self.pixel_format == "yuv420":
+            self._program["frame_size"] = self.size
+        self._vao.render(mgl.TRIANGLE_STRIP)
+        components = 4 if self.pixel_format == "rgba" else 1
+        slot.framebuffer.read_into(
+            slot.pixel_buffer, components=components, alignment=1
+        )
+        slot.timestamp = time.perf_counter() if timestamp is None else timestamp
+        # Standalone (headless) contexts have no bound default framebuffer
+        if previous_framebuffer is not None:
+            previous_framebuffer.use()
+        context.viewport = previous_viewport
+        self._in_flight.append(slot)
+        return True
+
+    def poll(self) -> None:
+        """Publish finished readbacks to the ring."""
+        while self._in_flight:
+            slot = self._in_flight.popleft()
+            slot.pixel_buffer.read_into(self.ring.begin_write())
+            self.ring.end_write(slot.timestamp)
+
+    def release(self) -> None:
+        self._release_gl()
+        self.ring.close()
+
+    def _create_resources(self, context: mgl.Context) -> None:
+        self._context = context
+        fragment = _RGBA_SHADER if self.pixel_format == "rgba" else _YUV420_SHADER
+        self._program = program_cache(context).acquire(
+            vertex_shader=_VERTEX_SHADER, fragment_shader=fragment
+        )
+        quad = np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype="f4")
+        self._vbo = context.buffer(quad.tobytes())
+        self._vao = context.vertex_array(
+            self._program, [(self._vbo, "2f", "in_position")]
+        )
+        width, height = self.size
+        if self.pixel_format == "rgba":
+            target_size, components = (width, height), 4
+        else:
+            target_size, components = (width, height * 3 // 2), 1
+        for _ in range(2):
+            texture = context.texture(target_size, components)
+            self._slots.append(
+                _ReadbackSlot(
+                    texture=texture,
+                    framebuffer=context.framebuffer(color_attachments=[texture]),
+                    pixel_buffer=context.buffer(reserve=self.ring.layout.slot_bytes),
+                )
+            )
+
+    def _release_gl(self) -> None:
+        for slot in self._slots:
+            slot.framebuffer.release()
+            slot.texture.release()
+            slot.pixel_buffer.release()
+        for resource in (self._vao, self._vbo):
+            if resource is not None:
+                resource.release()
+        release_program(self._program)
+        self._slots = []
+        self._in_flight.clear()
+        self._vao = self._vbo = self._program = None
+        self._context = None
@@ -0,0 +1,256 @@
+"""Fixed-slot ring of video frames in shared memory, for local processes.
+
+Layout (little endian), all offsets 8-byte aligned:
+
+    ring header   magic "PPVR", version, format, width, height, slot count,
+                  slot bytes, latest sequence
+    slot header   begin sequence, end sequence, timestamp     (x slot count)
+    slot pixels   ``slot bytes`` each                          (x slot count)
+
+Frame ``n`` (sequences start at 1) lives in slot ``n % slot count``. The
+writer stamps ``begin``, fills the pixels, stamps ``end``, then publishes
+``latest``; a reader copying a slot checks ``end`` before and ``begin``
+after, so a slot overwritten mid-copy is detected (a sequence lock) and
+nobody ever blocks. Pixels are top-down rows: ``rgba`` is 4 bytes per
+pixel; ``yuv420`` is planar I420 (Y, then U and V at half resolution,
+BT.601 video range), as ffmpeg's ``yuv420p``.
+
+Readers need only this module, numpy and the ring's name::
+
+    reader = SharedFrameReader("party-parrot-vj")
+    frame = reader.latest()
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Literal, Optional
+
+import numpy as np
+from beartype import beartype
+
+PixelFormat = Literal["rgba", "yuv420"]
+
+RING_MAGIC = b"PPVR"
+RING_VERSION = 1
+DEFAULT_SLOTS = 3
+_FORMAT_CODES: dict[str, int] = {"rgba": 0, "yuv420": 1}
+_RING_HEADER = struct.Struct("<4sIIIIIQQ")
+_SLOT_HEADER = struct.Struct("<QQd")
+_LATEST_OFFSET = _RING_HEADER.size - 8
+# Rings created by this process; their readers share the writer's tracker entry
+_OWNED_NAMES: set[str] = set()
+# Retries of a read that raced the writer before giving up on this frame
+_READ_ATTEMPTS = 4
+
+
+@beartype
+def frame_bytes(width: int, height: int, pixel_format: PixelFormat) -> int:
+    if pixel_format == "rgba":
+        return width * height * 4
+    if width % 2 or height % 2:
+        raise ValueError(f"yuv420 needs an even frame size, got {width}x{height}")
+    return width * height * 3 // 2
+
+
+@beartype
+@dataclass(frozen=True)
+class SharedFrame:
+    """One frame read from a ring; ``pixels`` is ``(height, width, 4)`` for
+    rgba and the flat I420 planes for yuv420."""
+
+    sequence: int
+    timestamp: float
+    width: int
+    height: int
+    pixel_format: PixelFormat
+    pixels: np.ndarray
+
+
+@beartype
+class _RingLayout:
+    def __init__(
+        self, pixel_format: PixelFormat, width: int, height: int, slots: int
+    ):
+        self.pixel_format = pixel_format
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self.slot_bytes = frame_bytes(width, height, pixel_format)
+        self.slot_headers_offset = _RING_HEADER.size
+        self.pixels_offset = self.slot_headers_offset + slots * _SLOT_HEADER.size
+
+    @property
+    def total_bytes(self) -> int:
+        return self.pixels_offset + self.slots * self.slot_bytes
+
+    def slot_header_offset(self, slot: int) -> int:
+        return self.slot_headers_offset + slot * _SLOT_HEADER.size
+
+    def pixels(self, buf: memoryview, slot: int) -> memoryview:
+        start = self.pixels_offset + slot * self.slot_bytes
+        return buf[start : start + self.slot_bytes]
+
+
+def _create_replacing_stale(name: str, size: int) -> shared_memory.SharedMemory:
+    """Create the block; one left behind by a crashed writer is unlinked first."""
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        stale = shared_memory.SharedMemory(name=name)
+        stale.close()
+        stale.unlink()
+    return shared_memory.SharedMemory(name=name, create=True, size=size)
+
+
+@beartype
+class SharedFrameRing:
+    """Writer side: creates the shared memory block and owns its lifetime.
+
+    Single writer. ``begin_write`` returns the next slot's pixel memory to
+    fill in place (e.g. with a GPU readback), ``end_write`` publishes it;
+    ``write`` does both from a buffer.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        width: int,
+        height: int,
+        pixel_format: PixelFormat = "rgba",
+        slots: int = DEFAULT_SLOTS,
+    ):
+        if slots < 2:
+            raise ValueError("a frame ring needs at least two slots")
+        self.layout = _RingLayout(pixel_format, width, height, slots)
+        self.name = name
+        self.sequence = 0
+        self._writing: Optional[int] = None
+        self._shm = _create_replacing_stale(name, self.layout.total_bytes)
+        _OWNED_NAMES.add(name)
+        _RING_HEADER.pack_into(
+            self._shm.buf,
+            0,
+            RING_MAGIC,
+            RING_VERSION,
+            _FORMAT_CODES[pixel_format],
+            width,
+            height,
+            slots,
+            self.layout.slot_bytes,
+            0,
+        )
+
+    def begin_write(self) -> memoryview:
+        sequence = self.sequence + 1
+        slot = sequence % self.layout.slots
+        offset = self.layout.slot_header_offset(slot)
+        struct.pack_into("<Q", self._shm.buf, offset, sequence)
+        self._writing = sequence
+        return self.layout.pixels(self._shm.buf, slot)
+
+    def end_write(self, timestamp: float) -> int:
+        sequence = self._writing
+        assert sequence is not None, "end_write without begin_write"
+        offset = self.layout.slot_header_offset(sequence % self.layout.slots)
+        struct.pack_into("<Qd", self._shm.buf, offset + 8, sequence, timestamp)
+        struct.pack_into("<Q", self._shm.buf, _LATEST_OFFSET, sequence)
+        self.sequence = sequence
+        self._writing = None
+        return sequence
+
+    def write(
+        self, pixels: bytes | bytearray | memoryview | np.ndarray, timestamp: float
+    ) -> int:
+        target = self.begin_write()
+        target[:] = memoryview(pixels).cast("B")
+        return self.end_write(timestamp)
+
+    def close(self) -> None:
+        """Detach and remove the block; readers keep their mappings."""
+        self._shm.close()
+        self._shm.unlink()
+        _OWNED_NAMES.discard(self.name)
+
+
+@beartype
+class SharedFrameReader:
+    """Reader side, usable from any local process that knows the ring's name."""
+
+    def __init__(self, name: str):
+        self._shm = shared_memory.SharedMemory(name=name)
+        if sys.platform != "win32" and name not in _OWNED_NAMES:
+            # Only the writer may unlink the block; 3.12 registers every attach
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        (
+            magic,
+            version,
+            format_code,
+            width,
+            height,
+            slots,
+            _slot_bytes,
+            _latest,
+        ) = _RING_HEADER.unpack_from(self._shm.buf, 0)
+        if magic != RING_MAGIC or version != RING_VERSION:
+            self._shm.close()
+            raise ValueError(f"{name} is not a version {RING_VERSION} frame ring")
+        pixel_format = next(
+            fmt for fmt, code in _FORMAT_CODES.items() if code == format_code
+        )
+        self.layout = _RingLayout(pixel_format, width, height, slots)
+
+    @property
+    def latest_sequence(self) -> int:
+        return struct.unpack_from("<Q", self._shm.buf, _LATEST_OFFSET)[0]
+
+    def latest(self, copy: bool = True) -> Optional[SharedFrame]:
+        """The newest complete frame, or None if there is none yet.
+
+        With ``copy=False`` the pixels are a view into shared memory with no
+        copy at all; check ``still_valid`` after using them, since the writer
+        reuses the slot ``slot count`` frames later.
+        """
+        for _ in range(_READ_ATTEMPTS):
+            sequence = self.latest_sequence
+            if sequence == 0:
+                return None
+            slot = sequence % self.layout.slots
+            offset = self.layout.slot_header_offset(slot)
+            _begin, end, timestamp = _SLOT_HEADER.unpack_from(self._shm.buf, offset)
+            if end != sequence:
+                continue
+            view = np.frombuffer(self.layout.pixels(self._shm.buf, slot), np.uint8)
+            pixels = view.copy() if copy else view
+            if copy and not self._slot_holds(slot, sequence):
+                continue
+            return SharedFrame(
+                sequence,
+                timestamp,
+                self.layout.width,
+                self.layout.height,
+                self.layout.pixel_format,
+                self._shape(pixels),
+            )
+        return None
+
+    def still_valid(self, frame: SharedFrame) -> bool:
+        """True while ``frame``'s slot has not been overwritten."""
+        return self._slot_holds(frame.sequence % self.layout.slots, frame.sequence)
+
+    def close(self) -> None:
+        """Detach; drop any ``copy=False`` frames first."""
+        self._shm.close()
+
+    def _slot_holds(self, slot: int, sequence: int) -> bool:
+        offset = self.layout.slot_header_offset(slot)
+        begin, end, _timestamp = _SLOT_HEADER.unpack_from(self._shm.buf, offset)
+        return begin == sequence and end == sequence
+
+    def _shape(self, pixels: np.ndarray) -> np.ndarray:
+        if self.layout.pixel_format == "rgba":
+            return pixels.reshape(self.layout.height, self.layout.width, 4)
+        return pixels
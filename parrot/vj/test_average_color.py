@@ -0,0 +1,33 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.vj.average_color import AverageColorProbe
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def test_average_lands_one_frame_later_and_is_reused(gl_context):
+    pixels = np.zeros((90, 160, 4), dtype=np.uint8)
+    pixels[:, :80] = (255, 0, 0, 255)  # left half red, right half blue
+    pixels[:, 80:] = (0, 0, 255, 255)
+    texture = gl_context.texture((160, 90), 4, pixels.tobytes())
+    probe = AverageColorProbe(interval_frames=3)
+
+    assert probe.sample(gl_context, texture) is None
+    average = probe.sample(gl_context, texture)
+    np.testing.assert_allclose(average, [0.5, 0.0, 0.5], atol=0.02)
+
+    texture.write(np.zeros_like(pixels).tobytes())
+    assert probe.sample(gl_context, texture) is average  # reused between captures
+    probe.sample(gl_context, texture)  # captures the black frame
+    np.testing.assert_allclose(probe.sample(gl_context, texture), 0.0, atol=0.01)
+    probe.release()
@@ -0,0 +1,51 @@
+import moderngl as mgl
+import pytest
+
+from parrot.director.mode import Mode
+from parrot.graph.BaseInterpretationNode import Vibe
+from parrot.vj.benchmark import (
+    NODE_FACTORIES,
+    benchmark_node,
+    benchmark_nodes,
+    format_table,
+)
+from parrot.vj.nodes.black import Black
+from parrot.vj.render_target_pool import render_target_pool
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+class _AllocatingBlack(Black):
+    def render(self, frame, scheme, context):
+        context.buffer(reserve=16).release()
+        return super().render(frame, scheme, context)
+
+
+def test_nodes_report_time_memory_and_allocations_per_size(gl_context):
+    results = benchmark_nodes(
+        gl_context, sizes=((64, 36), (128, 72)), frames=3, only="BloomFilter"
+    )
+    assert [(r.name, r.width, r.height) for r in results] == [
+        ("BloomFilter", 64, 36),
+        ("BloomFilter", 128, 72),
+    ]
+    assert all(r.ms_per_frame > 0 and r.gpu_ms_per_frame > 0 for r in results)
+    assert results[1].texture_bytes > results[0].texture_bytes
+    assert all(r.allocations_per_frame == 0 for r in results)
+    assert render_target_pool(gl_context).stats()["allocated_bytes"] == 0
+    assert "BloomFilter" in format_table(results)
+
+    leaky = benchmark_node(
+        gl_context, "leaky", _AllocatingBlack(64, 36), Vibe(Mode.rave), frames=4
+    )
+    assert leaky.allocations_per_frame == 1.0
+    assert "texture" not in vars(gl_context)  # counting hooks removed
+    assert set(NODE_FACTORIES) >= {"NyancatBackground", "CircleRainbowBackground"}
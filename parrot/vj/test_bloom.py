@@ -0,0 +1,39 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.vj.bloom import DualKawaseBloom
+from parrot.vj.render_target_pool import render_target_pool
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def test_glow_spreads_at_half_resolution_and_returns_its_targets(gl_context):
+    pixels = np.zeros((128, 256, 3), dtype=np.uint8)
+    pixels[56:72, 120:136] = 255  # white square
+    pixels[8:24, 8:24] = 60  # dim square, below the threshold
+    source = gl_context.texture((256, 128), 3, pixels.tobytes())
+    bloom = DualKawaseBloom(levels=3)
+    pool = render_target_pool(gl_context)
+
+    glow = bloom.blur(gl_context, source, threshold=0.5)
+    assert glow.size == (128, 64)
+    assert pool.stats()["in_use"] == 1
+    result = np.frombuffer(glow.read(components=3), dtype=np.uint8).reshape(64, 128, 3)
+    assert result[32, 64].min() > 100
+    assert result[32, 53:60].min() > 0  # light reaches past the square's edge
+    assert result[4:12, 4:12].max() == 0
+    pool.release(glow)
+
+    target = gl_context.simple_framebuffer((256, 128), components=3)
+    assert bloom.blur(gl_context, source, target=target) is target
+    assert pool.stats()["in_use"] == 0
+    bloom.release()
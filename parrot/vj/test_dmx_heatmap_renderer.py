@@ -1,9 +1,23 @@
 """Headless smoke test for DMX heatmap + header."""
 
 import moderngl as mgl
+import numpy as np
 import pytest
+from PIL import ImageFont
 
-from parrot.vj.dmx_heatmap_renderer import DmxHeatmapRenderer
+from parrot.vj import dmx_heatmap_renderer
+from parrot.vj.dmx_heatmap_renderer import DmxHeatmapRenderer, heatmap_layout
+from parrot.vj.program_cache import program_cache
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
 
 
 @pytest.mark.skipif(
@@ -16,8 +30,69 @@ def test_dmx_heatmap_render_includes_header():
         r = DmxHeatmapRenderer()
         r.enter(ctx)
         snap = [0] * 512
-        fbo = r.render(ctx, snap, 640, 480)
+        fbo = r.render(ctx, {"default": snap}, 640, 480)
         assert fbo is not None
         assert fbo.color_attachments[0].size == (640, 480)
     finally:
         ctx.release()
+
+
+def test_layout_fits_many_universes():
+    assert heatmap_layout(1, 1920, 1080).columns == 1
+    layout = heatmap_layout(12, 1920, 1080)
+    assert layout.columns * layout.rows >= 12
+    assert layout.origin[0] + layout.columns * layout.block[0] <= 1920
+    assert layout.origin[1] + layout.rows * layout.block[1] <= 1080
+
+
+def test_cells_are_coloured_per_universe_on_the_gpu(gl_context):
+    r = DmxHeatmapRenderer()
+    r.enter(gl_context)
+    universes = {f"u{i}": [255 if i == 1 else 0] * 512 for i in range(12)}
+    fbo = r.render(gl_context, universes, 1280, 720)
+    pixels = np.frombuffer(fbo.read(components=3), dtype=np.uint8)
+    pixels = pixels.reshape(720, 1280, 3)[::-1]  # top row first
+    layout = heatmap_layout(12, 1280, 720)
+
+    def first_cell_corner(universe):
+        x = layout.origin[0] + (universe % layout.columns) * layout.block[0]
+        y = layout.origin[1] + (universe // layout.columns) * layout.block[1]
+        x += layout.gutter_width + layout.cell[0] * 0.2
+        y += layout.title_height + layout.cell[1] * 0.2
+        return pixels[int(y), int(x)].tolist()
+
+    # 255 is the warm end of the ramp, 0 the dim blue end
+    assert first_cell_corner(1) == pytest.approx([255, 46, 46], abs=2)
+    assert first_cell_corner(0) == pytest.approx([7, 18, 38], abs=2)
+
+
+def test_programs_come_from_the_shared_cache(gl_context):
+    cache = program_cache(gl_context)
+    first, second = DmxHeatmapRenderer(), DmxHeatmapRenderer()
+    first.enter(gl_context)
+    second.enter(gl_context)
+    assert second._prog is first._prog
+    assert cache.stats()["programs"] == 3
+
+    first.exit()
+    second.render(gl_context, {"u0": [0] * 512}, 320, 180)
+    second.exit()
+    assert cache.stats()["programs"] == 0
+
+
+def test_labels_use_a_bitmap_font_when_no_truetype_font_is_found(
+    gl_context, monkeypatch
+):
+    monkeypatch.setattr(
+        dmx_heatmap_renderer,
+        "_pick_font",
+        lambda size: ImageFont.load_default_imagefont(),
+    )
+    renderer = DmxHeatmapRenderer()
+    renderer.enter(gl_context)
+    try:
+        assert renderer._atlas is not None
+        renderer.render(gl_context, {"u0": [0] * 512}, 320, 180)
+        assert renderer._labels is not None and renderer._labels.count > 0
+    finally:
+        renderer.exit()
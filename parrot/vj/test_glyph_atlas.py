@@ -0,0 +1,62 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+from PIL import ImageFont
+
+from parrot.vj.glyph_atlas import glyph_atlas
+from parrot.vj.renderers.room_3d import Room3DRenderer
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def test_layout_uses_shared_atlas_and_keeps_rects_when_growing(gl_context):
+    font = ImageFont.load_default(24)
+    atlas = glyph_atlas(gl_context, font)
+    assert glyph_atlas(gl_context, ImageFont.load_default(24)) is atlas
+
+    quads = atlas.layout("A B").quads
+    assert quads.shape == (2, 8)  # the space has no quad
+    assert quads[0, 0] < quads[1, 0]
+    atlas_pixels = np.frombuffer(atlas.texture.read(), dtype=np.uint8)
+    u0, v0, u1, v1 = quads[0, 4:].astype(int)
+    assert atlas_pixels.reshape(atlas.size[1], -1)[v0:v1, u0:u1].max() == 255
+
+    before = atlas.glyph("A")
+    atlas.glyph("é")
+    assert atlas.glyph("A") == before
+
+
+def test_room_text_label_draws_from_atlas(gl_context):
+    room = Room3DRenderer(gl_context, 200, 150)
+    target = gl_context.framebuffer(
+        color_attachments=[gl_context.texture((200, 150), 3)]
+    )
+    target.use()
+    gl_context.clear(0.0, 0.0, 0.0)
+    with room.batched(), room.local_position((0.0, 0.5, 0.0)):
+        room.render_text_label("512", (0.0, 0.0, 0.0), size=0.5)
+        room.render_text_label("512", (0.0, 0.0, 0.0), size=0.5)
+        room.render_text_label("7", (0.5, 0.0, 0.0), color=(1.0, 0.0, 0.0))
+
+    pixels = np.frombuffer(target.read(components=3), dtype=np.uint8)
+    assert pixels.max() > 100
+    assert len(room._text_label_cache) == 2
+    assert room.last_batch_draw_calls == 1  # every label in one draw
+    room.cleanup()
+
+
+def test_bitmap_fallback_font_draws_from_atlas(gl_context):
+    atlas = glyph_atlas(gl_context, ImageFont.load_default_imagefont())
+    quads = atlas.layout("Hi").quads
+    assert len(quads) == 2
+    # The bitmap font's cell bottom is the baseline: ink sits above it
+    assert (quads[:, 1] < 0).all() and (quads[:, 3] <= 0).all()
+    assert atlas.glyph(" ").atlas_rect is None
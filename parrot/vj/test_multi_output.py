@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame, FrameSignal
+from parrot.graph.BaseInterpretationNode import BaseInterpretationNode
+from parrot.state import State
+from parrot.utils.colour import Color
+from parrot.vj.multi_output import (
+    MultiOutputRenderer,
+    VJOutput,
+    fit_output,
+    parse_vj_output,
+)
+from parrot.vj.nodes.layer_compose import LayerCompose, LayerSpec
+from parrot.vj.nodes.shared_node import SharedNode
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.vj_director import VJDirector
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+class _CountingRed(BaseInterpretationNode[mgl.Context, None, mgl.Framebuffer]):
+    def __init__(self):
+        super().__init__([])
+        self.renders = 0
+
+    def render(self, frame, scheme, context):
+        self.renders += 1
+        framebuffer = render_target_pool(context).acquire(160, 90)
+        framebuffer.use()
+        context.clear(1.0, 0.0, 0.0)
+        return framebuffer
+
+
+def test_fit_trims_for_cover_and_letterboxes_for_contain():
+    square = VJOutput("square", 100, 100, fit="cover")
+    offset, scale, viewport = fit_output(square, (1600, 900))
+    assert offset == pytest.approx((0.21875, 0.0))
+    assert scale == pytest.approx((0.5625, 1.0))
+    assert viewport == (0, 0, 100, 100)
+
+    boxed = VJOutput("boxed", 100, 100, fit="contain")
+    assert fit_output(boxed, (1600, 900))[2] == (0, 22, 100, 56)
+    left = VJOutput("left", 90, 160, crop=(0.0, 0.0, 0.5, 1.0), fit="contain")
+    assert fit_output(left, (1600, 900)) == ((0.0, 0.0), (0.5, 1.0), (0, 29, 90, 101))
+
+
+def test_outputs_parse_from_the_command_line_and_name_known_sources():
+    assert parse_vj_output("wall:1024x256:scene:contain:0,0.25,1,0.5") == VJOutput(
+        "wall", 1024, 256, source="scene", crop=(0.0, 0.25, 1.0, 0.5), fit="contain"
+    )
+    assert parse_vj_output("side:800x600") == VJOutput("side", 800, 600)
+    for bad in ("wall", "wall:1024", "wall:0x10", "wall:10x10:stage:zoom"):
+        with pytest.raises(ValueError):
+            parse_vj_output(bad)
+    for crop in ("0,0,0,1", "0,0,1,-0.5", "-0.1,0,1,1", "0,0,1.5,1", "0,nan,1,1"):
+        with pytest.raises(ValueError, match="crop values must be within 0..1"):
+            parse_vj_output(f"wall:10x10:stage:cover:{crop}")
+    with pytest.raises(ValueError, match="unknown source 'backdrop'"):
+        MultiOutputRenderer([VJOutput("wall", 64, 32, source="backdrop")])
+
+
+def test_outputs_share_one_render_of_each_subtree(gl_context):
+    frame = Frame({signal: 0.0 for signal in FrameSignal})
+    scheme = ColorScheme(Color("white"), Color("black"), Color("red"))
+    red = _CountingRed()
+    scene = SharedNode(red)
+    stage = LayerCompose(LayerSpec(scene), width=320, height=180)
+    stage.enter_recursive(gl_context)
+    renderer = MultiOutputRenderer(
+        [
+            VJOutput("wall", 256, 64, source="scene"),
+            VJOutput("projector", 320, 180),
+            VJOutput("side", 90, 160, crop=(0.0, 0.0, 0.5, 1.0), fit="contain"),
+        ]
+    )
+    pool = render_target_pool(gl_context)
+
+    sources = {"stage": stage, "scene": scene}
+    outputs = renderer.render(frame, scheme, gl_context, sources)
+    assert red.renders == 1
+    assert {name: fb.size for name, fb in outputs.items()} == {
+        "wall": (256, 64),
+        "projector": (320, 180),
+        "side": (90, 160),
+    }
+    side = np.frombuffer(outputs["side"].read(components=3), dtype=np.uint8)
+    side = side.reshape(160, 90, 3)
+    assert side[80, 45].tolist() == [255, 0, 0]
+    assert side[2, 45].tolist() == [0, 0, 0]  # letterbox bar
+
+    for framebuffer in outputs.values():
+        pool.release(framebuffer)
+    scene.release_frame()
+    stage.exit_recursive()
+    renderer.release()
+    assert pool.stats()["in_use"] == 0
+
+
+def test_director_renders_outputs_in_its_one_measured_pass(gl_context):
+    frame = Frame({signal: 0.3 for signal in FrameSignal})
+    scheme = ColorScheme(Color("white"), Color("black"), Color("red"))
+    director = VJDirector(
+        State(),
+        prewarm_budget_bytes=0,
+        outputs=[VJOutput("wall", 64, 32, source="scene"), VJOutput("side", 32, 64)],
+    )
+    director.setup(gl_context)
+    measure = director.resolution_governor.measure
+    measured = []
+
+    @contextmanager
+    def counting_measure(context):
+        measured.append(context)
+        with measure(context):
+            yield
+
+    director.resolution_governor.measure = counting_measure
+    stage = director.render(gl_context, frame, scheme)
+    assert stage.size == (1280, 720)
+    assert {name: fb.size for name, fb in director.output_frames.items()} == {
+        "wall": (64, 32),
+        "side": (32, 64),
+    }
+    assert len(measured) == 1
+    director.cleanup()
@@ -0,0 +1,88 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.fixtures.chauvet.colorband_pix import ChauvetColorBandPiX_36Ch
+from parrot.fixtures.motionstrip import Motionstrip38
+from parrot.state import State
+from parrot.utils.dmx_utils import SwitchController, Universe
+from parrot.utils.mock_controller import MockDmxController
+from parrot.vj.pixel_map import PixelMapper, build_pixel_map
+from parrot.vj.program_cache import program_cache
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def _place(fixture, x, z):
+    fixture.x, fixture.y, fixture.z = x, 0.0, z
+    fixture.orientation = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+    return fixture
+
+
+def test_bulbs_map_along_the_fixture_onto_the_back_wall():
+    strip = _place(Motionstrip38(1), 0.0, 5.0)
+    layout = build_pixel_map([strip], 20.0, 10.0)
+    assert len(layout) == 8
+    assert layout.channels[0] == (Universe.default, 7, 4)
+    assert layout.targets[:, 0].mean() == pytest.approx(0.5)
+    assert layout.targets[0, 0] < layout.targets[-1, 0]
+    assert layout.targets[:, 1] == pytest.approx(0.5)
+    assert build_pixel_map([Motionstrip38(1)], 20.0, 10.0).channels == ()
+
+
+def test_capture_drives_bulb_channels(gl_context):
+    band = _place(ChauvetColorBandPiX_36Ch(1), -5.0, 5.0)
+    band.set_dimmer(255)
+    strip = _place(Motionstrip38(100), 5.0, 5.0)
+    source = gl_context.texture((64, 32), 3)
+    row = np.array([[255, 0, 0]] * 32 + [[255, 255, 255]] * 32, dtype=np.uint8)
+    source.write(np.tile(row, (32, 1, 1)).tobytes())
+    mapper = PixelMapper(State())
+    mapper.layout = build_pixel_map([band, strip], 20.0, 10.0)
+    dmx = SwitchController({Universe.default: MockDmxController()})
+
+    assert mapper.apply(dmx) == 0  # nothing read back yet
+    assert mapper.capture(gl_context, source)
+    mapper.poll()
+    assert mapper.apply(dmx) == 12 + 8
+    universe = dmx.snapshot_universe()
+    assert universe[0:36] == [255, 0, 0] * 12
+    assert universe[105:137] == [0, 0, 0, 255] * 8
+    assert program_cache(gl_context).stats()["programs"] == 1
+
+    mapper.release()
+    source.release()
+    assert program_cache(gl_context).stats()["programs"] == 0
+
+
+def test_colorband_colours_follow_its_dimmer(gl_context):
+    # COLORband PiX has no dimmer channel; blackout reaches it only via colour
+    band = _place(ChauvetColorBandPiX_36Ch(1), 0.0, 5.0)
+    strip = _place(Motionstrip38(100), 5.0, 5.0)
+    source = gl_context.texture((8, 8), 3)
+    source.write(np.full((8, 8, 3), 255, dtype=np.uint8).tobytes())
+    mapper = PixelMapper(State())
+    mapper.layout = build_pixel_map([band, strip], 20.0, 10.0)
+    dmx = SwitchController({Universe.default: MockDmxController()})
+    mapper.capture(gl_context, source)
+    mapper.poll()
+
+    band.set_dimmer(0)
+    mapper.apply(dmx)
+    assert dmx.snapshot_universe()[0:36] == [0] * 36
+    assert dmx.snapshot_universe()[105:137] == [0, 0, 0, 255] * 8
+
+    band.set_dimmer(127.5)
+    mapper.apply(dmx)
+    assert dmx.snapshot_universe()[0:36] == [128] * 36
+
+    mapper.release()
+    source.release()
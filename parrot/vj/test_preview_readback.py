@@ -0,0 +1,60 @@
+import io
+import time
+
+import moderngl as mgl
+import numpy as np
+import pytest
+from PIL import Image
+
+from parrot.vj.preview_readback import PreviewReadback
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def _wait_for(jpegs, count=1):
+    deadline = time.perf_counter() + 5.0
+    while len(jpegs) < count and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    assert len(jpegs) >= count
+
+
+def test_capture_downsamples_on_gpu_and_encodes_off_thread(gl_context):
+    pixels = np.zeros((64, 128, 4), dtype=np.uint8)
+    pixels[:32] = (255, 0, 0, 255)  # first rows red, rest blue
+    pixels[32:] = (0, 0, 255, 255)
+    texture = gl_context.texture((128, 64), 4, pixels.tobytes())
+    jpegs = []
+    readback = PreviewReadback(jpegs.append, max_width=32)
+
+    assert readback.capture(gl_context, texture)
+    assert jpegs == []  # nothing is read until the next frame's poll
+    readback.poll()
+    _wait_for(jpegs)
+    readback.release()
+
+    decoded = np.asarray(Image.open(io.BytesIO(jpegs[0])).convert("RGB"))
+    assert decoded.shape == (16, 32, 3)
+    assert decoded[2, 16, 0] > 200 and decoded[2, 16, 2] < 60
+    assert decoded[13, 16, 2] > 200 and decoded[13, 16, 0] < 60
+
+
+def test_capture_skips_when_both_slots_are_in_flight(gl_context):
+    texture = gl_context.texture((16, 16), 3)
+    readback = PreviewReadback(lambda jpeg: None)
+
+    assert readback.capture(gl_context, texture)
+    assert readback.capture(gl_context, texture)
+    assert not readback.capture(gl_context, texture)
+    assert readback.skipped_captures == 1
+
+    readback.poll()
+    assert readback.capture(gl_context, texture)
+    readback.release()
@@ -1,5 +1,13 @@
+import json
+import threading
+from collections import deque
+
+import moderngl as mgl
+
 from parrot.graph.BaseInterpretationNode import BaseInterpretationNode
 from parrot.vj.profiler import (
+    GPU_QUERY_LATENCY_FRAMES,
+    gpu_timer,
     vj_profiler,
     _node_ids,
     _render_stack_local,
@@ -65,3 +73,80 @@ def test_render_profiling_records_each_node():
     assert any(name.startswith("node_render:_LeafNode") for name in stats)
 
     vj_profiler.enabled = False
+
+
+def test_threads_nest_operations_independently():
+    _clear_profiler_state()
+    vj_profiler.enabled = True
+    inside_lighting = threading.Event()
+    render_done = threading.Event()
+    seen = {}
+
+    def lighting_step():
+        with vj_profiler.profile("director_step", track="lighting"):
+            inside_lighting.set()
+            render_done.wait(5.0)
+            seen["lighting"] = list(vj_profiler.operation_stack)
+
+    thread = threading.Thread(target=lighting_step)
+    thread.start()
+    inside_lighting.wait(5.0)
+    with vj_profiler.profile("vj_director_render"):
+        seen["render"] = list(vj_profiler.operation_stack)
+    render_done.set()
+    thread.join()
+
+    assert seen == {"lighting": ["director_step"], "render": ["vj_director_render"]}
+    assert vj_profiler.operation_stack == []
+    vj_profiler.enabled = False
+
+
+class _ClearNode(BaseInterpretationNode[mgl.Context, None, None]):
+    def __init__(self, children):
+        super().__init__(children)
+
+    def render(self, frame, scheme, context):
+        for child in self.children:
+            child.render(frame, scheme, context)
+        context.clear(0.5, 0.5, 0.5)
+
+
+def test_gpu_node_timings_nest_and_export_as_chrome_trace(tmp_path):
+    _clear_profiler_state()
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    framebuffer = ctx.simple_framebuffer((256, 256))
+    framebuffer.use()
+    vj_profiler.enabled = True
+    vj_profiler.trace_events = deque()
+    root = _ClearNode([_ClearNode([]), _ClearNode([])])
+    timer = gpu_timer(ctx)
+
+    frames = []
+    for _ in range(GPU_QUERY_LATENCY_FRAMES + 2):
+        with timer.section("frame"):
+            root.render(_FrameStub(), _SchemeStub(), ctx)
+        frames += timer.collect()
+    assert len(frames) == 2
+
+    spans = frames[0].spans
+    assert [span.depth for span in spans] == [2, 2, 1, 0]
+    assert spans[-1].name == "frame"
+    assert spans[0].start + spans[0].duration <= spans[1].start
+    assert spans[2].duration >= spans[0].duration + spans[1].duration
+    assert frames[0].gpu_seconds == spans[-1].duration
+
+    vj_profiler.record_gpu_frame(frames[0])
+    with open(vj_profiler.write_trace(str(tmp_path / "trace.json"))) as f:
+        events = json.load(f)["traceEvents"]
+    gpu_names = {e["name"] for e in events if e["tid"] == 2 and e["ph"] == "X"}
+    cpu_names = {e["name"] for e in events if e["tid"] == 1 and e["ph"] == "X"}
+    assert "frame" in gpu_names
+    assert sum(name.startswith("node_render:_ClearNode") for name in gpu_names) == 3
+    assert cpu_names == gpu_names - {"frame"}
+
+    vj_profiler.enabled = False
+    vj_profiler.trace_events = None
+    ctx.release()
@@ -0,0 +1,60 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame
+from parrot.utils.colour import Color
+from parrot.vj.nodes.sepia_effect import SepiaEffect
+from parrot.vj.nodes.static_color import StaticColor
+from parrot.vj.program_cache import ProgramCache, program_cache
+
+VERTEX = """
+#version 330 core
+in vec2 in_position;
+void main() { gl_Position = vec4(in_position, 0.0, 1.0); }
+"""
+FRAGMENT = """
+#version 330 core
+out vec3 color;
+void main() { color = vec3(1.0); }
+"""
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def test_identical_sources_share_one_refcounted_program(gl_context):
+    cache = ProgramCache(gl_context)
+    first = cache.acquire(VERTEX, FRAGMENT)
+    assert cache.acquire(VERTEX, fragment_shader=FRAGMENT) is first
+    assert cache.stats() == {"programs": 1, "compiled": 1, "hits": 1}
+
+    cache.release(first)
+    assert cache.owns(first)
+    cache.release(first)
+    assert not cache.owns(first)
+    assert cache.acquire(VERTEX, FRAGMENT) is not first
+
+
+def test_duplicate_effects_compile_once_and_survive_a_sibling_exit(gl_context):
+    frame = Frame({})
+    scheme = ColorScheme(Color("red"), Color("green"), Color("blue"))
+    first = SepiaEffect(StaticColor((1.0, 0.0, 0.0), width=8, height=8))
+    second = SepiaEffect(StaticColor((1.0, 0.0, 0.0), width=8, height=8))
+    first.enter_recursive(gl_context)
+    second.enter_recursive(gl_context)
+    assert first.shader_program is second.shader_program
+
+    first.exit_recursive()
+    result = second.render(frame, scheme, gl_context)
+    assert np.frombuffer(result.read(components=3), dtype=np.uint8).max() > 0
+    second.exit_recursive()
+    assert not program_cache(gl_context).owns(second.shader_program)
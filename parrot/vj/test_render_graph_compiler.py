@@ -0,0 +1,103 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame, FrameSignal
+from parrot.utils.colour import Color
+from parrot.vj.nodes.brightness_pulse import BrightnessPulse
+from parrot.vj.nodes.canvas_effect_base import GenerativeEffectBase
+from parrot.vj.nodes.rgb_shift_effect import RGBShiftEffect
+from parrot.vj.nodes.saturation_pulse import SaturationPulse
+from parrot.vj.nodes.sepia_effect import SepiaEffect
+from parrot.vj import render_graph_compiler
+from parrot.vj.render_graph_compiler import compile_render_graph
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+class _Gradient(GenerativeEffectBase):
+    def generate(self, vibe):
+        pass
+
+    def _get_fragment_shader(self):
+        return """
+        #version 330 core
+        in vec2 uv;
+        out vec3 color;
+        void main() { color = vec3(uv.x, uv.y, 1.0 - uv.x); }
+        """
+
+    def _set_effect_uniforms(self, frame, scheme):
+        pass
+
+
+def _chain():
+    source = _Gradient(64, 32)
+    sepia = SepiaEffect(source, base_intensity=0.5, max_intensity=0.5)
+    saturation = SaturationPulse(sepia, intensity=0.0, base_saturation=1.5)
+    return BrightnessPulse(saturation, intensity=0.0, base_brightness=1.6)
+
+
+def _render(node, ctx):
+    frame = Frame({signal: 0.0 for signal in FrameSignal})
+    scheme = ColorScheme(Color("red"), Color("green"), Color("blue"))
+    result = node.render(frame, scheme, ctx)
+    return np.frombuffer(result.read(components=3), dtype=np.uint8).astype(int)
+
+
+def test_fused_chain_matches_multipass(gl_context):
+    multipass = _chain()
+    multipass.enter_recursive(gl_context)
+    expected = _render(multipass, gl_context)
+
+    fused = _chain()
+    fused.enter_recursive(gl_context)
+    chains = compile_render_graph(fused)
+
+    assert len(chains) == 1 and len(chains[0].stages) == 3
+    assert np.abs(_render(fused, gl_context) - expected).max() <= 3
+    # Inner stages never drew into a target of their own
+    assert fused.input_node.framebuffer is None
+    assert fused.input_node.input_node.framebuffer is None
+
+
+def test_neighbour_sampling_effect_splits_the_chain():
+    source = _Gradient(64, 32)
+    inner = BrightnessPulse(SepiaEffect(source))
+    shifted = RGBShiftEffect(inner)
+    outer = SaturationPulse(SepiaEffect(shifted))
+
+    chains = compile_render_graph(outer)
+
+    assert [len(chain.stages) for chain in chains] == [2, 2]
+    assert chains[0].stages[0] is outer and chains[1].stages[0] is inner
+    assert shifted.fused_chain is None
+
+
+def test_rewired_chain_falls_back_to_multipass():
+    head = _chain()
+    (chain,) = compile_render_graph(head)
+
+    head.input_node = head.input_node.input_node
+
+    assert not chain.is_current()
+
+
+def test_current_chain_is_checked_without_reinspecting_stages(monkeypatch):
+    head = _chain()
+    (chain,) = compile_render_graph(head)
+
+    def inspected(node):
+        raise AssertionError("is_current re-inspected a stage")
+
+    monkeypatch.setattr(render_graph_compiler, "fusable_stage", inspected)
+    assert chain.is_current()
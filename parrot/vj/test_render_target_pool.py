@@ -0,0 +1,120 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame
+from parrot.utils.colour import Color
+from parrot.vj.nodes.canvas_effect_base import (
+    GenerativeEffectBase,
+    PostProcessEffectBase,
+)
+from parrot.vj.render_target_pool import RenderTargetPool, render_target_pool
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+class _Red(GenerativeEffectBase):
+    def generate(self, vibe):
+        pass
+
+    def _get_fragment_shader(self):
+        return """
+        #version 330 core
+        in vec2 uv;
+        out vec3 color;
+        void main() { color = vec3(step(0.0, uv.x), 0.0, 0.0); }
+        """
+
+    def _set_effect_uniforms(self, frame, scheme):
+        pass
+
+
+class _Halve(PostProcessEffectBase):
+    def generate(self, vibe):
+        pass
+
+    def _get_fragment_shader(self):
+        return """
+        #version 330 core
+        in vec2 uv;
+        out vec3 color;
+        uniform sampler2D input_texture;
+        void main() { color = texture(input_texture, uv).rgb * 0.5; }
+        """
+
+    def _set_effect_uniforms(self, frame, scheme):
+        pass
+
+
+def test_released_targets_are_reused_by_key(gl_context):
+    pool = RenderTargetPool(gl_context)
+    first = pool.acquire(64, 32)
+    pool.release(first)
+
+    assert pool.acquire(64, 32) is first
+    assert pool.acquire(64, 32, 4) is not first
+    assert pool.acquire(64, 32) is not first
+
+
+def test_retained_target_survives_one_release(gl_context):
+    pool = RenderTargetPool(gl_context)
+    target = pool.acquire(16, 16)
+    pool.retain(target)
+
+    pool.release(target)
+    assert pool.owns(target)
+    pool.release(target)
+    assert not pool.owns(target)
+
+
+def test_end_frame_reclaims_leaks_and_trims_idle_targets(gl_context):
+    pool = RenderTargetPool(gl_context, max_idle_frames=2)
+    pool.acquire(16, 16)
+    pool.end_frame()
+    assert pool.stats()["in_use"] == 1
+
+    pool.end_frame()
+    assert pool.stats() == {"in_use": 0, "free": 1, "allocated_bytes": 768, "leaked": 1}
+
+    pool.end_frame()
+    pool.end_frame()
+    assert pool.stats()["free"] == 0
+
+
+def test_post_process_chain_shares_two_targets(gl_context):
+    node = _Red(64, 32)
+    for _ in range(4):
+        node = _Halve(node)
+    node.enter_recursive(gl_context)
+    frame = Frame({})
+    scheme = ColorScheme(Color("red"), Color("green"), Color("blue"))
+
+    result = node.render(frame, scheme, gl_context)
+
+    pixels = np.frombuffer(result.read(components=3), dtype=np.uint8)
+    assert abs(int(pixels[0]) - 16) <= 1
+    assert render_target_pool(gl_context).stats()["in_use"] == 1
+    assert render_target_pool(gl_context).stats()["free"] == 1
+    node.exit_recursive()
+
+
+def test_pinned_target_outlives_frames_until_unpinned(gl_context):
+    pool = RenderTargetPool(gl_context)
+    target = pool.acquire(16, 16)
+    pool.pin(target)
+    pool.release(target)
+    for _ in range(3):
+        pool.end_frame()
+    assert pool.is_pinned(target) and pool.stats()["leaked"] == 0
+
+    pool.unpin(target)
+    assert not pool.owns(target)
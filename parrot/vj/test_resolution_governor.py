@@ -0,0 +1,72 @@
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.director.color_scheme import ColorScheme
+from parrot.director.frame import Frame, FrameSignal
+from parrot.utils.colour import Color
+from parrot.vj.nodes.circle_rainbow_background import CircleRainbowBackground
+from parrot.vj.nodes.layer_compose import LayerCompose, LayerSpec
+from parrot.vj.nodes.mode_switch import ModeSwitch
+from parrot.vj.nodes.nyancat_background import NyancatBackground
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.resolution_governor import ResolutionGovernor
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+def test_scale_drops_over_budget_and_recovers_with_headroom():
+    backdrop = CircleRainbowBackground(width=64, height=48)
+    stage = ModeSwitch(a=LayerCompose(LayerSpec(backdrop)), b=NyancatBackground())
+    governor = ResolutionGovernor(target_fps=100, settle_frames=3)
+    governor.attach(stage)
+
+    for _ in range(12):
+        governor.observe(0.02)  # twice the 10 ms budget
+    assert governor.scale == 0.5
+    assert backdrop.render_scale == 0.5
+    assert backdrop.scaled_size() == (32, 24)
+    assert stage.mode_nodes["b"].render_scale == 0.5
+
+    for _ in range(3):
+        governor.observe(0.0045)  # a step up would cost ~7 ms
+    assert governor.scale == 0.625
+    for _ in range(3):
+        governor.observe(0.008)  # a step up would cost ~11.5 ms
+    assert governor.scale == 0.625
+
+
+def test_scaled_backdrops_are_upscaled_at_composition(gl_context):
+    frame = Frame({signal: 0.3 for signal in FrameSignal})
+    scheme = ColorScheme(Color("white"), Color("black"), Color("red"))
+    nyancat = NyancatBackground(width=128, height=72)
+    rainbow = CircleRainbowBackground(width=128, height=72)
+    compose = LayerCompose(LayerSpec(nyancat), width=128, height=72)
+    compose.enter_recursive(gl_context)
+    rainbow.enter(gl_context)
+    governor = ResolutionGovernor(target_fps=0)
+    governor.attach(compose)
+    nyancat.render_scale = rainbow.render_scale = 0.5
+
+    for _ in range(4):
+        with governor.measure(gl_context):
+            output = compose.render(frame, scheme, gl_context)
+            rainbow_output = rainbow.render(frame, scheme, gl_context)
+        render_target_pool(gl_context).release(output)
+    assert governor.frame_seconds is not None
+    assert nyancat.framebuffer.size == (64, 36)
+    assert rainbow_output.size == (64, 36)
+    assert output.size == (128, 72)
+    pixels = np.frombuffer(output.read(components=3), dtype=np.uint8).reshape(72, 128, 3)
+    assert pixels[:, 96:].max() > 0  # the right half is covered, not just 64 px
+
+    compose.exit_recursive()
+    rainbow.exit()
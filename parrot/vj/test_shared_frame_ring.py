@@ -0,0 +1,97 @@
+import os
+from multiprocessing import shared_memory
+
+import moderngl as mgl
+import numpy as np
+import pytest
+
+from parrot.vj.shared_frame_output import SharedFrameOutput
+from parrot.vj.shared_frame_ring import SharedFrameReader, SharedFrameRing
+
+
+@pytest.fixture
+def gl_context():
+    try:
+        ctx = mgl.create_context(standalone=True, backend="egl")
+    except Exception:
+        ctx = mgl.create_context(standalone=True)
+    yield ctx
+    ctx.release()
+
+
+@pytest.fixture
+def ring_name(request):
+    return f"pp-test-{os.getpid()}-{request.node.name[-24:]}"
+
+
+def test_reader_sees_latest_frame_and_detects_overwrite(ring_name):
+    ring = SharedFrameRing(ring_name, 4, 2, slots=2)
+    reader = SharedFrameReader(ring_name)
+    assert reader.latest() is None
+
+    ring.write(np.full((2, 4, 4), 7, dtype=np.uint8), timestamp=1.5)
+    frame = reader.latest(copy=False)
+    assert (frame.sequence, frame.timestamp) == (1, 1.5)
+    assert frame.pixels.shape == (2, 4, 4) and frame.pixels[1, 3, 0] == 7
+
+    ring.write(bytes(32), timestamp=2.0)
+    assert reader.still_valid(frame)
+    ring.begin_write()  # reuses frame 1's slot
+    assert not reader.still_valid(frame)
+    assert reader.latest().sequence == 2
+
+    del frame  # views into shared memory must go before close
+    reader.close()
+    ring.close()
+
+
+def test_ring_replaces_block_left_by_crashed_writer(ring_name):
+    # A writer that died without close() leaves its block behind
+    stale = shared_memory.SharedMemory(name=ring_name, create=True, size=16)
+    stale.close()
+
+    ring = SharedFrameRing(ring_name, 4, 2)
+    reader = SharedFrameReader(ring_name)
+    assert reader.layout.width == 4 and reader.latest() is None
+
+    reader.close()
+    ring.close()
+
+
+def test_captures_land_in_ring_after_poll(gl_context, ring_name):
+    source = gl_context.texture((64, 32), 4)
+    source.write(np.tile([255, 128, 0, 255], 64 * 32).astype(np.uint8).tobytes())
+    output = SharedFrameOutput(ring_name, 16, 8)
+    reader = SharedFrameReader(ring_name)
+
+    assert output.capture(gl_context, source, timestamp=3.0)
+    assert reader.latest() is None
+    output.poll()
+    frame = reader.latest()
+    assert (frame.sequence, frame.timestamp) == (1, 3.0)
+    assert frame.pixels[4, 8].tolist() == [255, 128, 0, 255]
+
+    reader.close()
+    output.release()
+    source.release()
+
+
+def test_yuv420_output_is_packed_i420(gl_context, ring_name):
+    source = gl_context.texture((8, 4), 3)
+    source.write(np.tile([255, 0, 0], 8 * 4).astype(np.uint8).tobytes())
+    output = SharedFrameOutput(ring_name, 8, 4, pixel_format="yuv420")
+    reader = SharedFrameReader(ring_name)
+
+    output.capture(gl_context, source)
+    output.poll()
+    pixels = reader.latest().pixels.astype(int)
+    assert pixels.shape == (8 * 4 * 3 // 2,)
+    y, u, v = pixels[:32], pixels[32:40], pixels[40:]
+    # BT.601 video range red is (81, 90, 240)
+    assert np.abs(y - 81).max() <= 1
+    assert np.abs(u - 90).max() <= 1
+    assert np.abs(v - 240).max() <= 1
+
+    reader.close()
+    output.release()
+    source.release()
@@ -0,0 +1,67 @@
+import os
+
+import cv2
+import numpy as np
+
+from parrot.vj.build_video_cache import build_video_cache
+from parrot.vj.utils.video_cache import VideoCache
+from parrot.vj.utils.video_decoder import open_video
+
+
+def _write_video(path, frames=10, fps=30):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (64, 32))
+    for _ in range(frames):
+        frame = np.zeros((32, 64, 3), dtype=np.uint8)
+        frame[:, :32, 2] = 200  # red left half
+        frame[:, 32:, 0] = 200  # blue right half
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def test_build_is_incremental_and_resolution_matched(tmp_path):
+    videos, cache_root = str(tmp_path / "videos"), str(tmp_path / "cache")
+    source = _write_video(os.path.join(videos, "bg", "group", "clip.avi"))
+    kwargs = dict(width=32, height=32, fps=15, video_root=videos, cache_root=cache_root)
+
+    assert build_video_cache(**kwargs)["built"] == 1
+    assert build_video_cache(**kwargs)["skipped"] == 1
+
+    cache = VideoCache(videos, cache_root)
+    assert cache.lookup(source, 64, 32) is None
+    cached = cache.lookup(source, 32, 32)
+    assert cached.frames.shape == (5, 32, 32, 3)
+    # Cover-cropped to the centre, where the red and blue halves meet
+    assert cached.frame(0)[16, 4, 0] > 150 and cached.frame(0)[16, 28, 2] > 150
+
+    os.utime(source, ns=(0, 0))
+    assert cache.lookup(source, 32, 32) is None
+    assert build_video_cache(**kwargs)["built"] == 1
+
+
+def test_open_video_prefers_cache_and_falls_back_to_cv2(tmp_path):
+    videos, cache_root = str(tmp_path / "videos"), str(tmp_path / "cache")
+    source = _write_video(os.path.join(videos, "bg", "group", "clip.avi"), frames=3)
+    cache = VideoCache(videos, cache_root)
+
+    uncached = open_video(source, cache, (32, 32))
+    assert uncached.cached is None and uncached.read().shape == (32, 64, 3)
+    uncached.release()
+
+    cache.build(source, 32, 32, 30)
+    video = open_video(source, cache, (32, 32))
+    assert [video.read().shape for _ in range(3)] == [(32, 32, 3)] * 3
+    assert video.read() is None
+
+
+def test_prune_removes_entries_for_deleted_clips(tmp_path):
+    videos, cache_root = str(tmp_path / "videos"), str(tmp_path / "cache")
+    source = _write_video(os.path.join(videos, "bg", "group", "clip.avi"), frames=2)
+    cache = VideoCache(videos, cache_root)
+    cache.build(source, 16, 16, 30)
+
+    os.remove(source)
+
+    assert cache.prune() == [source]
+    assert not os.path.exists(cache.entry_paths(source)[0])
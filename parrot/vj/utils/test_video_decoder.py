@@ -0,0 +1,51 @@
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from parrot.vj.utils.video_decoder import VideoDecoder
+
+
+def _write_video(path, bgr, frames=6):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (32, 16))
+    for _ in range(frames):
+        writer.write(np.full((16, 32, 3), bgr, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+def _poll(decoder, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        decoded = decoder.poll()
+        if decoded is not None:
+            return decoded
+        time.sleep(0.005)
+    pytest.fail("decoder produced no frame")
+
+
+def test_decodes_rgb_frames_into_bounded_queue(tmp_path):
+    red = _write_video(tmp_path / "red.avi", (0, 0, 200))
+    decoder = VideoDecoder(max_queued_frames=2)
+    decoder.play(red)
+    try:
+        decoded = _poll(decoder)
+        time.sleep(0.1)
+        assert decoded.rgb.shape == (16, 32, 3)
+        assert decoded.rgb[0, 0, 0] > 150 and decoded.rgb[0, 0, 2] < 50
+        assert len(decoder._frames) <= 2
+    finally:
+        decoder.stop()
+
+
+def test_continues_with_next_file_at_end_of_stream(tmp_path):
+    red = _write_video(tmp_path / "red.avi", (0, 0, 200), frames=3)
+    blue = _write_video(tmp_path / "blue.avi", (200, 0, 0))
+    decoder = VideoDecoder()
+    decoder.play(red, next_path=blue)
+    try:
+        paths = [_poll(decoder).path for _ in range(5)]
+        assert paths == [red, red, red, blue, blue]
+    finally:
+        decoder.stop()
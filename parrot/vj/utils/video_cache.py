@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Iterator, Optional
+
+import cv2
+import numpy as np
+from beartype import beartype
+
+from parrot.vj.constants import DEFAULT_FPS, DEFAULT_HEIGHT, DEFAULT_WIDTH
+
+VIDEO_ROOT = os.path.join("media", "videos")
+CACHE_ROOT = os.path.join("media", "video_cache")
+VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".webm"}
+# Bumped whenever the on-disk layout changes so old entries are rebuilt.
+CACHE_FORMAT_VERSION = 1
+
+
+@beartype
+@dataclass(frozen=True)
+class CacheIndex:
+    """Sidecar JSON describing one transcoded clip."""
+
+    source: str
+    source_size: int
+    source_mtime_ns: int
+    width: int
+    height: int
+    fps: float
+    frame_count: int
+    version: int = CACHE_FORMAT_VERSION
+
+    def matches_source(self, source: str) -> bool:
+        if self.version != CACHE_FORMAT_VERSION or not os.path.exists(source):
+            return False
+        stat = os.stat(source)
+        return (
+            self.source_size == stat.st_size
+            and self.source_mtime_ns == stat.st_mtime_ns
+        )
+
+
+@beartype
+class CachedVideo:
+    """Memory-mapped RGB frames of a cached clip; reading one is a page-in."""
+
+    def __init__(self, index: CacheIndex, frames_path: str):
+        self.index = index
+        self.frames = np.memmap(
+            frames_path,
+            dtype=np.uint8,
+            mode="r",
+            shape=(index.frame_count, index.height, index.width, 3),
+        )
+
+    @property
+    def fps(self) -> float:
+        return self.index.fps
+
+    @property
+    def frame_count(self) -> int:
+        return self.index.frame_count
+
+    def frame(self, position: int) -> np.ndarray:
+        return self.frames[position % self.frame_count]
+
+
+@beartype
+class VideoCache:
+    """
+    Pre-transcoded clips under ``cache_root``, mirroring ``video_root``.
+
+    Each clip becomes ``<name>.rgb`` (raw frames already scaled and cropped
+    to the output size and resampled to ``fps``) plus ``<name>.json``. An
+    entry is only used while its source file's size and mtime are unchanged
+    and its size matches the requesting player; otherwise callers decode the
+    source with cv2 as before.
+    """
+
+    def __init__(self, video_root: str = VIDEO_ROOT, cache_root: str = CACHE_ROOT):
+        self.video_root = video_root
+        self.cache_root = cache_root
+
+    def entry_paths(self, source: str) -> tuple[str, str]:
+        relative = os.path.relpath(source, self.video_root)
+        base = os.path.join(self.cache_root, os.path.splitext(relative)[0])
+        return base + ".rgb", base + ".json"
+
+    def read_index(self, source: str) -> Optional[CacheIndex]:
+        frames_path, index_path = self.entry_paths(source)
+        if not os.path.exists(index_path) or not os.path.exists(frames_path):
+            return None
+        with open(index_path) as f:
+            return CacheIndex(**json.load(f))
+
+    def lookup(self, source: str, width: int, height: int) -> Optional[CachedVideo]:
+        index = self.read_index(source)
+        if index is None or not index.matches_source(source):
+            return None
+        if (index.width, index.height) != (width, height) or index.frame_count == 0:
+            return None
+        return CachedVideo(index, self.entry_paths(source)[0])
+
+    def sources(self, groups: Optional[list[str]] = None) -> Iterator[str]:
+        for fn_group in groups or sorted(os.listdir(self.video_root)):
+            group_path = os.path.join(self.video_root, fn_group)
+            for directory, _, files in sorted(os.walk(group_path)):
+                for name in sorted(files):
+                    if os.path.splitext(name.lower())[1] in VIDEO_EXTENSIONS:
+                        yield os.path.join(directory, name)
+
+    def is_current(
+        self, source: str, width: int, height: int, fps: float | int
+    ) -> bool:
+        index = self.read_index(source)
+        return (
+            index is not None
+            and index.matches_source(source)
+            and (index.width, index.height, index.fps) == (width, height, fps)
+        )
+
+    def build(
+        self,
+        source: str,
+        width: int = DEFAULT_WIDTH,
+        height: int = DEFAULT_HEIGHT,
+        fps: float | int = DEFAULT_FPS,
+        max_seconds: Optional[float] = None,
+    ) -> Optional[CacheIndex]:
+        """Transcode ``source`` into the cache; returns None if it can't be read."""
+        capture = cv2.VideoCapture(source)
+        if not capture.isOpened():
+            capture.release()
+            return None
+        source_fps = capture.get(cv2.CAP_PROP_FPS) or fps
+        stat = os.stat(source)
+
+        frames_path, index_path = self.entry_paths(source)
+        os.makedirs(os.path.dirname(frames_path), exist_ok=True)
+        partial_path = frames_path + ".partial"
+        frame_count = 0
+        source_index = -1
+        bgr = None
+        with open(partial_path, "wb") as out:
+            while max_seconds is None or frame_count < max_seconds * fps:
+                # Resample by holding/skipping source frames to hit ``fps``
+                wanted = int(frame_count * source_fps / fps)
+                while source_index < wanted:
+                    ok, bgr = capture.read()
+                    if not ok:
+                        bgr = None
+                        break
+                    source_index += 1
+                if bgr is None:
+                    break
+                out.write(cover_resize(bgr, width, height).tobytes())
+                frame_count += 1
+        capture.release()
+
+        index = CacheIndex(
+            source=source,
+            source_size=stat.st_size,
+            source_mtime_ns=stat.st_mtime_ns,
+            width=width,
+            height=height,
+            fps=float(fps),
+            frame_count=frame_count,
+        )
+        os.replace(partial_path, frames_path)
+        with open(index_path, "w") as f:
+            json.dump(asdict(index), f, indent=2)
+        return index
+
+    def prune(self) -> list[str]:
+        """Delete cache entries whose source clip no longer exists."""
+        removed = []
+        if not os.path.exists(self.cache_root):
+            return removed
+        for directory, _, files in os.walk(self.cache_root):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                index_path = os.path.join(directory, name)
+                with open(index_path) as f:
+                    source = json.load(f).get("source", "")
+                if not os.path.exists(source):
+                    os.remove(index_path)
+                    frames_path = index_path[: -len(".json")] + ".rgb"
+                    if os.path.exists(frames_path):
+                        os.remove(frames_path)
+                    removed.append(source)
+        return removed
+
+
+@beartype
+def cover_resize(bgr: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Scale to cover ``width``x``height``, centre-crop, and convert to RGB."""
+    source_height, source_width = bgr.shape[:2]
+    scale = max(width / source_width, height / source_height)
+    scaled_width = max(width, round(source_width * scale))
+    scaled_height = max(height, round(source_height * scale))
+    scaled = cv2.resize(
+        bgr, (scaled_width, scaled_height), interpolation=cv2.INTER_AREA
+    )
+    x = (scaled_width - width) // 2
+    y = (scaled_height - height) // 2
+    return cv2.cvtColor(scaled[y : y + height, x : x + width], cv2.COLOR_BGR2RGB)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+from beartype import beartype
+
+from parrot.vj.utils.video_cache import CachedVideo, VideoCache
+
+# Videos longer than this start at a random point at least this far from the end.
+RANDOM_START_MIN_DURATION_SECONDS = 60.0
+
+
+@beartype
+@dataclass(frozen=True)
+class DecodedFrame:
+    path: str
+    rgb: np.ndarray  # (height, width, 3) uint8, RGB order
+    fps: float
+
+
+@dataclass
+class _OpenVideo:
+    path: str
+    fps: float
+    capture: Optional[cv2.VideoCapture] = None
+    cached: Optional[CachedVideo] = None
+    position: int = 0
+
+    def read(self) -> Optional[np.ndarray]:
+        """Next RGB frame, or None at end of stream."""
+        if self.cached is not None:
+            if self.position >= self.cached.frame_count:
+                return None
+            # Copy here so page-ins happen on the decoder thread, not in upload
+            rgb = np.array(self.cached.frames[self.position])
+            self.position += 1
+            return rgb
+        ok, bgr = self.capture.read()
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB) if ok else None
+
+    def release(self) -> None:
+        if self.capture is not None:
+            self.capture.release()
+
+
+def _random_start_frame(total_frames: int, fps: float) -> int:
+    duration_seconds = total_frames / fps
+    if duration_seconds <= RANDOM_START_MIN_DURATION_SECONDS:
+        return 0
+    max_start = duration_seconds - RANDOM_START_MIN_DURATION_SECONDS
+    return int(random.uniform(0.0, max_start) * fps)
+
+
+@beartype
+def open_video(
+    path: str,
+    cache: Optional[VideoCache] = None,
+    output_size: Optional[tuple[int, int]] = None,
+) -> Optional[_OpenVideo]:
+    """Open ``path`` (from ``cache`` when it has a matching entry) and seek
+    long videos to a random start point."""
+    if cache is not None and output_size is not None:
+        cached = cache.lookup(path, *output_size)
+        if cached is not None:
+            start = _random_start_frame(cached.frame_count, cached.fps)
+            return _OpenVideo(path, cached.fps, cached=cached, position=start)
+
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        print(f"Error: Could not open video {path}")
+        capture.release()
+        return None
+
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+    total_frames = int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) or 0
+    start_frame = _random_start_frame(total_frames, fps) if total_frames > 0 else 0
+    if start_frame:
+        # Seek by frame for better accuracy across codecs/containers
+        capture.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+    return _OpenVideo(path, float(fps), capture=capture)
+
+
+@beartype
+class VideoDecoder:
+    """
+    Decodes video on a worker thread into a small queue of RGB frames.
+
+    ``play`` switches files (dropping queued frames of the old one) and
+    ``set_next`` names the file to continue with at end of stream; the worker
+    opens and seeks it ahead of time so the switch costs nothing on the GL
+    thread. ``poll`` never blocks. Given a ``cache`` and ``output_size``,
+    clips with a matching pre-transcoded entry are read from it without
+    decoding.
+    """
+
+    def __init__(
+        self,
+        max_queued_frames: int = 4,
+        cache: Optional[VideoCache] = None,
+        output_size: Optional[tuple[int, int]] = None,
+    ):
+        self.max_queued_frames = max_queued_frames
+        self.cache = cache
+        self.output_size = output_size
+        self._cond = threading.Condition()
+        self._frames: deque[DecodedFrame] = deque()
+        self._path: Optional[str] = None
+        self._next_path: Optional[str] = None
+        self._generation = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def play(self, path: str, next_path: Optional[str] = None) -> None:
+        with self._cond:
+            self._path = path
+            self._next_path = next_path
+            self._generation += 1
+            self._frames.clear()
+            self._cond.notify_all()
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="video-decoder"
+            )
+            self._thread.start()
+
+    def set_next(self, next_path: Optional[str]) -> None:
+        with self._cond:
+            self._next_path = next_path
+            self._cond.notify_all()
+
+    def poll(self) -> Optional[DecodedFrame]:
+        with self._cond:
+            if not self._frames:
+                return None
+            decoded = self._frames.popleft()
+            self._cond.notify_all()
+            return decoded
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._frames.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        current: Optional[_OpenVideo] = None
+        upcoming: Optional[_OpenVideo] = None
+        # Last next-path we tried to open, so a broken file is tried only once.
+        upcoming_path: Optional[str] = None
+        frames_since_open = 0
+        generation = -1
+
+        while True:
+            with self._cond:
+                while not self._stopping and not self._has_work(
+                    generation, current, upcoming_path
+                ):
+                    self._cond.wait(timeout=0.1)
+                if self._stopping:
+                    break
+                switch_to = self._path if self._generation != generation else None
+                generation = self._generation
+                next_path = self._next_path
+                want_frame = len(self._frames) < self.max_queued_frames
+
+            if switch_to is not None:
+                if current is not None:
+                    current.release()
+                if upcoming is not None and upcoming.path == switch_to:
+                    current, upcoming, upcoming_path = upcoming, None, None
+                else:
+                    current = self._open(switch_to)
+                frames_since_open = 0
+
+            if next_path is not None and upcoming_path != next_path:
+                if upcoming is not None:
+                    upcoming.release()
+                upcoming_path = next_path
+                upcoming = self._open(next_path)
+
+            if current is None or not want_frame:
+                continue
+
+            rgb = current.read()
+            if rgb is None:
+                # End of stream: continue with the pre-opened file, else loop
+                # (unless the file yielded nothing, which would spin forever).
+                current.release()
+                if upcoming is not None:
+                    current, upcoming, upcoming_path = upcoming, None, None
+                    with self._cond:
+                        if self._generation == generation:
+                            self._path = current.path
+                            self._next_path = None
+                elif frames_since_open > 0:
+                    current = self._open(current.path)
+                else:
+                    current = None
+                frames_since_open = 0
+                continue
+
+            frames_since_open += 1
+            with self._cond:
+                if self._generation == generation:
+                    self._frames.append(DecodedFrame(current.path, rgb, current.fps))
+
+        for video in (current, upcoming):
+            if video is not None:
+                video.release()
+
+    def _open(self, path: str) -> Optional[_OpenVideo]:
+        return open_video(path, self.cache, self.output_size)
+
+    def _has_work(
+        self,
+        generation: int,
+        current: Optional[_OpenVideo],
+        upcoming_path: Optional[str],
+    ) -> bool:
+        if self._generation != generation:
+            return True
+        if self._next_path is not None and upcoming_path != self._next_path:
+            return True
+        return current is not None and len(self._frames) < self.max_queued_frames
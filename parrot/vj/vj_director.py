@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 
+import threading
 import time
+from collections import deque
+from typing import Sequence
+
+import moderngl as mgl
 from beartype import beartype
 
 from parrot.director.frame import Frame, FrameSignal
@@ -8,8 +13,21 @@ from parrot.director.color_scheme import ColorScheme
 from parrot.vj.vj_mode import VJMode
 from parrot.graph.BaseInterpretationNode import Vibe
 from parrot.vj.nodes.concert_stage import ConcertStage
+from parrot.vj.nodes.mode_switch import DEFAULT_PREWARM_BUDGET_BYTES, mode_switches
+from parrot.vj.nodes.shared_node import shared_nodes
+from parrot.vj.multi_output import MultiOutputRenderer, VJOutput
 from parrot.vj.profiler import vj_profiler
+from parrot.vj.resolution_governor import ResolutionGovernor
+from parrot.vj.constants import HIGH_FPS
+from parrot.vj.render_target_pool import render_target_pool
+from parrot.vj.render_graph_compiler import compile_render_graph
 from parrot.state import State
+from parrot.utils.latency import (
+    STAGE_VJ_RENDER,
+    DelayLine,
+    latency_tracker,
+    output_delays_seconds,
+)
 
 
 @beartype
@@ -19,53 +37,146 @@ class VJDirector:
     Handles the visual composition and effects that respond to audio and lighting.
     """
 
-    def __init__(self, state: State):
+    def __init__(
+        self,
+        state: State,
+        prewarm_budget_bytes: int = DEFAULT_PREWARM_BUDGET_BYTES,
+        target_fps: float | int = HIGH_FPS,
+        outputs: Sequence[VJOutput] = (),
+    ):
         # Create the complete concert stage with 2D canvas and 3D lighting
         self.concert_stage = ConcertStage()
 
+        # Inactive modes are kept entered within this budget (per ModeSwitch)
+        # so remote mode changes don't allocate mid-show.
+        self._mode_switches = mode_switches(self.concert_stage)
+        for mode_switch in self._mode_switches:
+            mode_switch.prewarm_budget_bytes = prewarm_budget_bytes
+
+        # Expensive generative backdrops drop resolution to hold target_fps
+        # (0 only measures); LayerCompose upscales them when compositing.
+        self.resolution_governor = ResolutionGovernor(target_fps)
+        self.resolution_governor.attach(self.concert_stage)
+
+        # Displays fed from the same pass over the stage as render's result
+        self.output_renderer = MultiOutputRenderer(outputs)
+        self.output_frames: dict[str, mgl.Framebuffer] = {}
+        self._shared_nodes = shared_nodes(self.concert_stage)
+
         self.last_shift_time = time.time()
         self.shift_count = 0
         self.window = None  # Will be set by the window manager
         self.state = state
 
-        # Latest frame data from director
+        # Latest frame data from director. Frames wait in the delay line for
+        # VJ_OUTPUT_OFFSET_MS so visuals can be aligned with DMX output.
         self._latest_frame = None
         self._latest_scheme = None
+        self._frame_delay: DelayLine[tuple[Frame, ColorScheme]] = DelayLine(
+            output_delays_seconds()["vj"]
+        )
+
+        # Pooled outputs of the last render, released at the start of the next.
+        self._last_outputs: list = []
+
+        # The tree may only change on the render (GL) thread; shifts asked for
+        # on another one, e.g. by a director stepping on the lighting thread,
+        # wait here for the next render.
+        self._render_thread = threading.get_ident()
+        self._pending_shifts: deque[tuple[VJMode, float]] = deque()
 
         # Subscribe to VJ mode changes
         self.state.events.on_vj_mode_change += self._on_vj_mode_change
 
     def setup(self, context):
         """Setup the concert stage with GL context and generate initial state"""
+        self._render_thread = threading.get_ident()
         with vj_profiler.profile("vj_director_setup"):
             self.concert_stage.enter_recursive(context)
 
             vibe = Vibe(self.state.vj_mode)
             self.concert_stage.generate_recursive(vibe)
+            compile_render_graph(self.concert_stage)
 
             # Print the tree structure after initialization
             # print("VJ Concert Stage Tree (after initialization):")
             # print(self.concert_stage.print_tree())
 
+        # Startup may take the time; afterwards render tops up one per frame
+        with vj_profiler.profile("vj_director_prewarm"):
+            while self.prewarm_step():
+                pass
+
     def step(self, frame: Frame, scheme: ColorScheme):
         """Step method called by director - stores latest frame data for rendering"""
-        self._latest_frame = frame
-        self._latest_scheme = scheme
+        self._frame_delay.push((frame, scheme))
 
     def get_latest_frame_data(self):
-        """Get latest frame data for rendering"""
+        """Get latest frame data for rendering (after the configured VJ delay)"""
+        due = self._frame_delay.pop_due()
+        if due is not None:
+            self._latest_frame, self._latest_scheme = due
         return self._latest_frame, self._latest_scheme
 
     def render(self, context, frame: Frame, scheme: ColorScheme):
-        """Render the complete concert stage"""
+        """Render the complete concert stage, and every configured output
+        from the same pass into ``output_frames``"""
+        self._begin_render(context)
         with vj_profiler.profile("vj_director_render"):
-            return self.concert_stage.render(frame, scheme, context)
+            # One measured section per presented frame, outputs included
+            with self.resolution_governor.measure(context):
+                result = self.concert_stage.render(frame, scheme, context)
+                self.output_frames = (
+                    self.output_renderer.render(
+                        frame,
+                        scheme,
+                        context,
+                        self.concert_stage.output_sources(),
+                        rendered={"stage": result},
+                    )
+                    if self.output_renderer.outputs
+                    else {}
+                )
+        self._end_render(context, frame, [result, *self.output_frames.values()])
+        return result
+
+    def render_outputs(
+        self, context, frame: Frame, scheme: ColorScheme
+    ) -> dict[str, mgl.Framebuffer]:
+        """Render every configured output, by name, from one pass over the stage"""
+        self.render(context, frame, scheme)
+        return self.output_frames
+
+    def _begin_render(self, context) -> None:
+        while self._pending_shifts:
+            self.shift(*self._pending_shifts.popleft())
+        # The previous outputs stayed valid for display/preview until now.
+        pool = render_target_pool(context)
+        for output in self._last_outputs:
+            pool.release(output)
+
+    def _end_render(self, context, frame: Frame, outputs: list) -> None:
+        self._last_outputs = outputs
+        for shared in self._shared_nodes:
+            shared.release_frame()
+        render_target_pool(context).end_frame()
+        latency_tracker.record(STAGE_VJ_RENDER, frame.capture_time)
+        # After the frame's work, so a pre-warm never delays this frame's output
+        self.prewarm_step()
+
+    def prewarm_step(self) -> bool:
+        """Enter at most one inactive mode subtree; True if one was entered."""
+        return any(mode_switch.prewarm_next() for mode_switch in self._mode_switches)
 
     def shift(self, vj_mode: VJMode, threshold: float = 1.0):
         """Shift the visual mode and update the concert stage"""
+        if threading.get_ident() != self._render_thread:
+            self._pending_shifts.append((vj_mode, threshold))
+            return
         with vj_profiler.profile("vj_director_shift"):
             vibe = Vibe(vj_mode)
             self.concert_stage.generate_recursive(vibe, threshold)
+            compile_render_graph(self.concert_stage)
 
             self.last_shift_time = time.time()
             self.shift_count += 1
@@ -95,8 +206,12 @@ class VJDirector:
     def _on_vj_mode_change(self, vj_mode: VJMode):
         """Handle VJ mode changes by regenerating the visual tree"""
         print(f"🎬 VJ Mode changed to: {vj_mode.name}, regenerating visuals...")
+        if threading.get_ident() != self._render_thread:
+            self._pending_shifts.append((vj_mode, 1.0))
+            return
         vibe = Vibe(vj_mode)
         self.concert_stage.generate_recursive(vibe, threshold=1.0)
+        compile_render_graph(self.concert_stage)
 
         # Print the tree structure after mode change
         # print(f"VJ Concert Stage Tree (after mode change to {vj_mode.name}):")
@@ -108,4 +223,5 @@ class VJDirector:
         self.state.events.on_vj_mode_change -= self._on_vj_mode_change
 
         # Clean up concert stage
+        self.output_renderer.release()
         self.concert_stage.exit_recursive()